@@ -0,0 +1,49 @@
+"""Metadata of aigverse's NetworkX backend.
+
+NetworkX loads this module via the ``networkx.backend_info`` entry point while it is
+being imported, so it must not import NetworkX or any of aigverse's native modules.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+FUNCTIONS: tuple[str, ...] = (
+    "ancestors",
+    "dag_longest_path",
+    "dag_longest_path_length",
+    "descendants",
+    "in_degree_centrality",
+    "is_directed_acyclic_graph",
+    "out_degree_centrality",
+    "topological_generations",
+    "topological_sort",
+)
+"""Names of the NetworkX functions the backend implements."""
+
+_LONGEST_PATH_DOCS: dict[str, str] = {
+    "additional_docs": "Supports positive ``default_weight`` values only, since AIG edges carry no weights."
+}
+
+ADDITIONAL_DOCS: dict[str, dict[str, str]] = {
+    "dag_longest_path": _LONGEST_PATH_DOCS,
+    "dag_longest_path_length": _LONGEST_PATH_DOCS,
+}
+"""Notes on the NetworkX functions whose backend implementation is restricted."""
+
+
+def get_info() -> dict[str, Any]:
+    """Describes aigverse's NetworkX backend.
+
+    Returns:
+        The backend information NetworkX expects from a ``networkx.backend_info`` entry
+        point.
+    """
+    return {
+        "backend_name": "aigverse",
+        "project": "aigverse",
+        "package": "aigverse",
+        "url": "https://github.com/marcelwa/aigverse",
+        "short_summary": "Graph algorithms on the native storage of AIGs.",
+        "functions": {name: ADDITIONAL_DOCS.get(name, {}) for name in FUNCTIONS},
+    }
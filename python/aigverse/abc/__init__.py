@@ -1,7 +1,8 @@
 """Bridge to the external ABC logic synthesis system.
 
 `aigverse` does not ship ABC. This module drives an ABC executable that is
-already installed on the machine, transferring networks as binary AIGER files.
+already installed on the machine, transferring networks as binary AIGER files
+through a reusable scratch directory (see :func:`set_abc_scratch`).
 Point it at an executable with the ``AIGVERSE_ABC`` environment variable or
 :func:`set_abc_binary`, or put ``abc`` on ``PATH``.
 
@@ -39,7 +40,9 @@ from ._binary import (
 from ._commands import balance, orchestrate, refactor, resub, rewrite
 from ._errors import AbcError, AbcExecutionError, AbcNotFoundError, AbcTimeoutError
 from ._runner import run_commands, run_script
+from ._scratch import ABC_SCRATCH_ENV_VAR, abc_scratch, set_abc_scratch
 from ._scripts import SCRIPTS, expand_script
+from ._search import SEARCH_COMMANDS, SearchResult, search
 from ._stats import AbcStats, stats
 from ._wrappers import (
     compress,
@@ -56,15 +59,19 @@ from .gia import CecStatus
 __all__ = [
     "ABC_ENV_VAR",
     "ABC_RC_ENV_VAR",
+    "ABC_SCRATCH_ENV_VAR",
     "SCRIPTS",
+    "SEARCH_COMMANDS",
     "AbcError",
     "AbcExecutionError",
     "AbcNotFoundError",
     "AbcStats",
     "AbcTimeoutError",
     "CecStatus",
+    "SearchResult",
     "abc_binary",
     "abc_rc",
+    "abc_scratch",
     "abc_version",
     "balance",
     "compress",
@@ -85,7 +92,9 @@ __all__ = [
     "rewrite",
     "run_commands",
     "run_script",
+    "search",
     "set_abc_binary",
     "set_abc_rc",
+    "set_abc_scratch",
     "stats",
 ]
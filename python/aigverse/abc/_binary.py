@@ -5,10 +5,10 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
 from ._errors import AbcExecutionError, AbcNotFoundError, AbcTimeoutError
+from ._scratch import scratch_directory
 
 __all__ = [
     "ABC_ENV_VAR",
@@ -182,7 +182,7 @@ def abc_version(*, timeout: float | None = 10.0) -> str:
     # ABC drops an `abc.history` file into its working directory on every run,
     # so keep it out of whatever directory the caller happens to be in.
     try:
-        with tempfile.TemporaryDirectory(prefix="aigverse-abc-") as scratch:
+        with scratch_directory() as scratch:
             completed = subprocess.run(
                 [str(binary), "-s", "-q", "version"],
                 cwd=scratch,
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import shlex
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar, cast
 
 from ..networks import Aig, NamedAig, SequentialAig
 from ._binary import abc_binary, abc_rc, validate_binary
 from ._errors import AbcExecutionError, AbcTimeoutError
+from ._scratch import scratch_directory
 
 if TYPE_CHECKING:
     import os
@@ -179,10 +179,11 @@ def run_commands(
             install. Set to ``True`` to let ABC pick up an ``abc.rc`` from the
             working directory. Prefer :func:`~aigverse.abc.set_abc_rc`, which
             loads one specific file and keeps the isolation.
-        cwd: Working directory for the ABC process. Defaults to a fresh
-            temporary directory, because ABC writes an ``abc.history`` file into
-            wherever it runs. Pass a directory explicitly if the commands refer
-            to files by relative path.
+        cwd: Working directory for the ABC process. Defaults to an empty
+            scratch directory (see :func:`~aigverse.abc.set_abc_scratch`),
+            because ABC writes an ``abc.history`` file into wherever it runs.
+            Pass a directory explicitly if the commands refer to files by
+            relative path.
         binary: Overrides the resolved ABC executable for this call only.
 
     Returns:
@@ -198,7 +199,7 @@ def run_commands(
     executable = resolve_binary(binary)
 
     if cwd is None:
-        with tempfile.TemporaryDirectory(prefix="aigverse-abc-") as scratch:
+        with scratch_directory() as scratch:
             return run_commands(
                 command,
                 timeout=timeout,
@@ -265,7 +266,8 @@ def run_script(
 ) -> AigT:
     """Optimizes a network by piping it through an external ABC process.
 
-    The network is written to a temporary binary AIGER file, ABC is invoked with
+    The network is written to a binary AIGER file in a scratch directory (see
+    :func:`~aigverse.abc.set_abc_scratch`), ABC is invoked with
     a read command, the given commands, and a write command, and the result is
     read back. The returned network has the same type as ``ntk``: an ``Aig``
     yields an ``Aig``, a ``NamedAig`` yields a ``NamedAig`` with its input and
@@ -322,17 +324,16 @@ def run_script(
 
     from ..io import read_aiger_into_aig, write_aiger
 
-    with tempfile.TemporaryDirectory(prefix="aigverse-abc-") as tmpdir:
-        directory = Path(tmpdir)
+    with scratch_directory() as directory:
         write_aiger(ntk, directory / _INPUT_FILE)
 
         # `write_aiger` drops the symbol table unless -s is given, while `&write`
         # always keeps it.
         read_cmd, write_cmd = ("&read", "&write") if gia else ("read_aiger", "write_aiger -s")
 
-        # ABC tokenizes the command string itself, so a temporary directory
+        # ABC tokenizes the command string itself, so a scratch directory
         # containing a space would break the file names. Running with cwd set to
-        # the temporary directory keeps them bare and relative.
+        # the scratch directory keeps them bare and relative.
         script = f"{read_cmd} {_INPUT_FILE}; {command}; {write_cmd} {_OUTPUT_FILE}"
         output = run_commands(
             script,
@@ -0,0 +1,244 @@
+"""Scratch space for the files exchanged with the ABC process.
+
+Every call hands ABC its network through AIGER files in a working directory, and
+ABC drops an ``abc.history`` file next to them. Where those files live matters
+more than it seems: the platform's default temporary directory can sit on a
+network filesystem, where creating, writing and deleting a directory per call
+costs more than the optimization itself on small networks.
+
+The bridge therefore keeps a small pool of working directories below one base
+directory and reuses them. A directory is handed to one call at a time, emptied
+when the call returns, and removed when the interpreter exits. Concurrent calls
+from several threads each draw their own directory, so the pool grows to the
+number of calls in flight and no further.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+__all__ = [
+    "ABC_SCRATCH_ENV_VAR",
+    "abc_scratch",
+    "scratch_directory",
+    "set_abc_scratch",
+]
+
+# Name of the environment variable pointing at the scratch base directory.
+ABC_SCRATCH_ENV_VAR = "AIGVERSE_ABC_SCRATCH"
+
+# RAM-backed on Linux, so nothing exchanged with ABC ever reaches a disk.
+_SHARED_MEMORY = Path("/dev/shm")  # ruff: ignore[hardcoded-temp-file]
+
+_PREFIX = "aigverse-abc-"
+
+_scratch_override: Path | None = None
+
+# Idle working directories, keyed by the base directory they were created in so
+# that changing the base never hands out a directory from the old one.
+_pool: dict[Path, list[Path]] = {}
+# Every directory the pool created and has not removed yet, idle or in use.
+_owned: set[Path] = set()
+_lock = threading.Lock()
+# The process the pool belongs to. A forked child inherits the parent's pool,
+# and two processes sharing one working directory would overwrite each other's
+# files, so a child starts over with a pool of its own.
+_owner_pid = os.getpid()
+
+
+def _is_usable(path: Path) -> bool:
+    """Checks whether a directory can host scratch files.
+
+    Args:
+        path: The candidate directory.
+
+    Returns:
+        ``True`` if ``path`` is an existing, writable directory.
+    """
+    return path.is_dir() and os.access(path, os.W_OK | os.X_OK)
+
+
+def set_abc_scratch(path: str | os.PathLike[str] | None) -> Path | None:
+    """Sets or clears the directory the bridge exchanges files with ABC in.
+
+    The bridge creates its working directories below this one and reuses them
+    across calls. Pointing it at a RAM-backed filesystem keeps the transfers off
+    slow or network-mounted disks. Idle working directories below the previous
+    base are removed.
+
+    It applies process-wide and is intended to be called once during setup; it is
+    not thread-safe.
+
+    Args:
+        path: An existing, writable directory, or ``None`` to clear a previously
+            set one and fall back to the environment and the default.
+
+    Returns:
+        The resolved absolute path, or ``None`` if the override was cleared.
+
+    Raises:
+        NotADirectoryError: If ``path`` is not an existing, writable directory.
+    """
+    global _scratch_override  # ruff: ignore[global-statement]
+
+    if path is None:
+        _scratch_override = None
+        _release_pool()
+        return None
+
+    resolved = Path(path).expanduser()
+    if not _is_usable(resolved):
+        msg = f"set_abc_scratch() points to '{path}', which is not an existing, writable directory."
+        raise NotADirectoryError(msg)
+
+    _scratch_override = resolved.resolve()
+    _release_pool()
+    return _scratch_override
+
+
+def abc_scratch() -> Path:
+    """Resolves the directory the bridge exchanges files with ABC in.
+
+    Resolution order: an explicit directory set via :func:`set_abc_scratch`, then
+    the ``AIGVERSE_ABC_SCRATCH`` environment variable, then ``/dev/shm`` where it
+    exists, and finally the platform's default temporary directory. A configured
+    directory that has since disappeared falls through to the next candidate
+    rather than failing the call.
+
+    Returns:
+        The resolved absolute path.
+    """
+    if _scratch_override is not None and _is_usable(_scratch_override):
+        return _scratch_override
+
+    env_value = os.environ.get(ABC_SCRATCH_ENV_VAR)
+    if env_value:
+        candidate = Path(env_value).expanduser()
+        if _is_usable(candidate):
+            return candidate.resolve()
+
+    if _is_usable(_SHARED_MEMORY):
+        return _SHARED_MEMORY
+
+    return Path(tempfile.gettempdir()).resolve()
+
+
+def _clear(directory: Path) -> None:
+    """Removes everything inside a working directory, keeping the directory.
+
+    Args:
+        directory: The working directory to empty.
+    """
+    for entry in directory.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+
+def _acquire() -> Path:
+    """Takes an idle working directory from the pool, or creates one.
+
+    Returns:
+        An empty working directory reserved for the caller.
+    """
+    global _owner_pid  # ruff: ignore[global-statement]
+
+    base = abc_scratch()
+    with _lock:
+        if _owner_pid != os.getpid():
+            # inherited from the parent, which still uses these directories
+            _pool.clear()
+            _owned.clear()
+            _owner_pid = os.getpid()
+
+        idle = _pool.get(base)
+        while idle:
+            directory = idle.pop()
+            if directory.is_dir():
+                return directory
+            # removed behind the pool's back, e.g. by a tmpfs cleaner
+            _owned.discard(directory)
+
+    directory = Path(tempfile.mkdtemp(prefix=_PREFIX, dir=base))
+    with _lock:
+        _owned.add(directory)
+    return directory
+
+
+def _release(directory: Path) -> None:
+    """Empties a working directory and returns it to the pool.
+
+    A directory that cannot be emptied is removed instead, so the next call
+    never finds stale files from this one.
+
+    Args:
+        directory: A working directory obtained from :func:`_acquire`.
+    """
+    try:
+        _clear(directory)
+    except OSError:
+        shutil.rmtree(directory, ignore_errors=True)
+        with _lock:
+            _owned.discard(directory)
+        return
+
+    base = abc_scratch()
+    with _lock:
+        if directory not in _owned or directory.parent != base:
+            # the pool was reset, or the base changed, while the call ran
+            shutil.rmtree(directory, ignore_errors=True)
+            _owned.discard(directory)
+            return
+        _pool.setdefault(base, []).append(directory)
+
+
+def _release_pool() -> None:
+    """Removes every idle working directory this process created."""
+    with _lock:
+        if _owner_pid != os.getpid():
+            return
+        for idle in _pool.values():
+            for directory in idle:
+                shutil.rmtree(directory, ignore_errors=True)
+                _owned.discard(directory)
+        _pool.clear()
+
+
+def _remove_all() -> None:
+    """Removes every working directory this process created, idle or not."""
+    with _lock:
+        if _owner_pid != os.getpid():
+            return
+        for directory in _owned:
+            shutil.rmtree(directory, ignore_errors=True)
+        _owned.clear()
+        _pool.clear()
+
+
+atexit.register(_remove_all)
+
+
+@contextmanager
+def scratch_directory() -> Generator[Path, None, None]:
+    """Lends out an empty working directory for the duration of one ABC call.
+
+    Yields:
+        An empty directory below :func:`abc_scratch` that no other call uses
+        until this one returns.
+    """
+    directory = _acquire()
+    try:
+        yield directory
+    finally:
+        _release(directory)
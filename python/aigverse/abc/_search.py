@@ -0,0 +1,276 @@
+"""Time-budgeted search for a good sequence of ABC commands.
+
+Which order of ``balance``, ``rewrite``, ``refactor`` and ``resub`` works best is
+design-dependent, and no canonical script is best everywhere. Rather than trying
+every permutation, :func:`search` grows sequences one command at a time and keeps
+only the most promising ones, which is a beam search over ABC's command space.
+
+Every sequence is extended from the network its prefix already produced, so a
+shared prefix is computed once no matter how many sequences continue from it. The
+extensions of one round are independent of each other and run as concurrent ABC
+processes.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic
+
+from ..networks import DepthAig
+from ._errors import AbcTimeoutError
+from ._runner import AigT, check_supported, resolve_binary, run_script
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from _typeshed import SupportsRichComparison
+
+    from ..networks import Aig
+
+__all__ = ["SEARCH_COMMANDS", "SearchResult", "search"]
+
+#: The commands :func:`search` chooses from unless told otherwise: ABC's four
+#: atomic transformations, their zero-cost variants, which perturb the structure
+#: and can unlock later gains, and the ``&``-space's heavy rewriting.
+SEARCH_COMMANDS: tuple[str, ...] = (
+    "balance",
+    "rewrite",
+    "rewrite -z",
+    "refactor",
+    "refactor -z",
+    "resub",
+    "resub -z",
+    "&dc2",
+)
+
+
+@dataclass(frozen=True)
+class SearchResult(Generic[AigT]):
+    """The outcome of a :func:`search`."""
+
+    #: The best network found, of the same type as the input.
+    network: AigT
+    #: The commands that produced :attr:`network` from the input, in order. Empty
+    #: if nothing improved on the input.
+    trajectory: tuple[str, ...]
+    #: The cost of :attr:`network` under the cost function the search used.
+    cost: SupportsRichComparison
+    #: Number of ABC invocations the search made.
+    evaluations: int
+    #: Wall-clock seconds the search took.
+    elapsed: float
+    #: Whether the search was cut short by its budget rather than running out of
+    #: improvements or reaching its maximum sequence length.
+    budget_exhausted: bool
+
+
+@dataclass(frozen=True)
+class _Node(Generic[AigT]):
+    """One explored sequence and the network it produced."""
+
+    network: AigT
+    trajectory: tuple[str, ...]
+    cost: SupportsRichComparison
+
+
+def _size_then_depth(ntk: Aig) -> tuple[int, int]:
+    """The default cost: AND gates first, depth as the tie-breaker.
+
+    Args:
+        ntk: The network to rate.
+
+    Returns:
+        The number of AND gates and the number of levels.
+    """
+    return ntk.num_gates, DepthAig(ntk).num_levels
+
+
+def search(
+    ntk: AigT,
+    *,
+    budget: float,
+    commands: Sequence[str] = SEARCH_COMMANDS,
+    beam_width: int = 4,
+    max_length: int = 12,
+    cost: Callable[[Aig], SupportsRichComparison] = _size_then_depth,
+    workers: int | None = None,
+    binary: str | os.PathLike[str] | None = None,
+) -> SearchResult[AigT]:
+    """Searches for a sequence of ABC commands that optimizes a network.
+
+    The search proceeds in rounds. Each round extends every sequence in the beam
+    by every command, runs the extensions as concurrent ABC processes, and keeps
+    the ``beam_width`` cheapest networks as the next beam. A ``beam_width`` of 1
+    is a greedy search. The search ends when a round finds nothing cheaper than
+    the best network so far, when sequences reach ``max_length``, or when
+    ``budget`` seconds have passed -- whichever comes first. In every case the
+    best network found up to then is returned.
+
+    Each extension starts from the network its sequence already produced, so
+    shared prefixes are never recomputed. A command is never repeated back to
+    back, since ABC's commands are close to idempotent and doing so only spends
+    the budget.
+
+    ``&``-prefixed commands run on ABC's GIA store and all others on the classic
+    store, each transferring the network the way it needs.
+
+    Args:
+        ntk: The combinational network to optimize.
+        budget: Wall-clock seconds the search may take. ABC processes still
+            running when it expires are terminated and their results discarded.
+        commands: The ABC commands to choose from. Each must be a single step
+            that leaves an AIG behind; the read and write steps are added
+            automatically.
+        beam_width: Number of sequences kept per round. Must be at least 1.
+        max_length: Maximum number of commands in a sequence. Must be at least 1.
+        cost: Rates a network; lower is better. Any comparable value works, and
+            tuples compare lexicographically. Defaults to the number of AND gates,
+            with depth as the tie-breaker.
+        workers: Maximum number of concurrent ABC processes, or ``None`` for the
+            number of CPUs.
+        binary: Overrides the resolved ABC executable for this search only.
+
+    Returns:
+        The best network found, the command sequence that produced it, and how
+        the search went.
+
+    Raises:
+        TypeError: If ``ntk`` is a ``SequentialAig`` or not an ``Aig`` at all.
+        ValueError: If ``budget``, ``beam_width``, ``max_length`` or ``workers``
+            is out of range, or ``commands`` is empty.
+        AbcNotFoundError: If no ABC executable could be located.
+        AbcExecutionError: If ABC rejected a command or produced no usable
+            output.
+    """
+    check_supported(ntk)
+    if budget <= 0:
+        msg = f"budget must be positive, got {budget}"
+        raise ValueError(msg)
+    if beam_width < 1:
+        msg = f"beam_width must be at least 1, got {beam_width}"
+        raise ValueError(msg)
+    if max_length < 1:
+        msg = f"max_length must be at least 1, got {max_length}"
+        raise ValueError(msg)
+    if workers is not None and workers < 1:
+        msg = f"workers must be at least 1, got {workers}"
+        raise ValueError(msg)
+    candidates = tuple(commands)
+    if not candidates or any(not command.strip() for command in candidates):
+        msg = "commands must be a non-empty sequence of non-empty ABC commands"
+        raise ValueError(msg)
+
+    executable = resolve_binary(binary)
+    start = time.monotonic()
+    deadline = start + budget
+
+    best = _Node(ntk, (), cost(ntk))
+    beam = [best]
+    evaluations = 0
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        for _ in range(max_length):
+            pending = {
+                pool.submit(_extend, node, command, deadline, executable)
+                for node in beam
+                for command in candidates
+                if not node.trajectory or node.trajectory[-1] != command
+            }
+            children, exhausted, done = _collect(pending, deadline, cost)
+            evaluations += done
+
+            if not children:
+                break
+            # the trajectory breaks ties, so the outcome does not depend on which
+            # process happened to finish first
+            children.sort(key=lambda child: (child.cost, child.trajectory))
+            beam = children[:beam_width]
+            if not beam[0].cost < best.cost:
+                break
+            best = beam[0]
+            if exhausted:
+                break
+
+    return SearchResult(
+        network=best.network,
+        trajectory=best.trajectory,
+        cost=best.cost,
+        evaluations=evaluations,
+        elapsed=time.monotonic() - start,
+        budget_exhausted=exhausted,
+    )
+
+
+def _extend(node: _Node[AigT], command: str, deadline: float, executable: Path) -> tuple[AigT, tuple[str, ...]] | None:
+    """Runs one command on the network a sequence produced.
+
+    Args:
+        node: The sequence to extend.
+        command: The command to append.
+        deadline: Monotonic time at which the search budget expires.
+        executable: The ABC executable to run.
+
+    Returns:
+        The resulting network and its sequence, or ``None`` if the budget ran
+        out before or while the command ran.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    try:
+        result = run_script(
+            node.network,
+            command,
+            timeout=remaining,
+            gia=command.lstrip().startswith("&"),
+            binary=executable,
+        )
+    except AbcTimeoutError:
+        return None
+    return result, (*node.trajectory, command)
+
+
+def _collect(
+    pending: set[Future[tuple[AigT, tuple[str, ...]] | None]],
+    deadline: float,
+    cost: Callable[[Aig], SupportsRichComparison],
+) -> tuple[list[_Node[AigT]], bool, int]:
+    """Waits for the extensions of one round and rates them.
+
+    Args:
+        pending: The submitted extensions.
+        deadline: Monotonic time at which the search budget expires.
+        cost: The cost function.
+
+    Returns:
+        The rated extensions that finished in time, whether the budget ran out,
+        and how many ABC invocations completed.
+    """
+    children: list[_Node[AigT]] = []
+    exhausted = False
+    completed = 0
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0.0), return_when=FIRST_COMPLETED)
+            if not done:
+                exhausted = True
+                break
+            for future in done:
+                extension = future.result()
+                if extension is None:
+                    exhausted = True
+                    continue
+                completed += 1
+                network, trajectory = extension
+                children.append(_Node(network, trajectory, cost(network)))
+    finally:
+        # anything not started yet would only find the budget gone
+        for future in pending:
+            future.cancel()
+    return children, exhausted, completed
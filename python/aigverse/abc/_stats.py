@@ -9,13 +9,12 @@ what ABC measured against what ``aigverse`` measures without scraping text.
 from __future__ import annotations
 
 import re
-import tempfile
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ._errors import AbcExecutionError
 from ._runner import check_supported, resolve_binary, run_commands
+from ._scratch import scratch_directory
 
 if TYPE_CHECKING:
     import os
@@ -133,8 +132,7 @@ def collect_stats(
 
     from ..io import write_aiger
 
-    with tempfile.TemporaryDirectory(prefix="aigverse-abc-") as tmpdir:
-        directory = Path(tmpdir)
+    with scratch_directory() as directory:
         write_aiger(ntk, directory / _INPUT_FILE)
 
         command = f"{read_command} {_INPUT_FILE}; {stats_command}"
@@ -30,15 +30,14 @@ where it was, while ``resyn2`` beats it on both counts. Neither family dominates
 
 from __future__ import annotations
 
-import tempfile
 from enum import Enum
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ._errors import AbcExecutionError, AbcTimeoutError
 from ._options import check_option
 from ._runner import AigT, budgeted_timeout, check_supported, resolve_binary, run_commands
 from ._runner import run_script as _base_run_script
+from ._scratch import scratch_directory
 from ._stats import AbcStats, collect_stats
 
 if TYPE_CHECKING:
@@ -710,8 +709,7 @@ def cec(
 
     from ..io import write_aiger
 
-    with tempfile.TemporaryDirectory(prefix="aigverse-abc-") as tmpdir:
-        directory = Path(tmpdir)
+    with scratch_directory() as directory:
         write_aiger(ntk, directory / _CEC_LEFT)
         write_aiger(other, directory / _CEC_RIGHT)
 
@@ -19,8 +19,23 @@ except ImportError:
 
 else:
     from ..networks import Aig
-    from .networkx import to_networkx
+    from .networkx import from_networkx, to_networkx  # ruff:ignore[unused-import]
+    from .networkx_backend import AigGraph  # ruff:ignore[unused-import]
 
     Aig.to_networkx = to_networkx  # type: ignore[method-assign]
 
     del to_networkx
+
+    # SciPy is not part of the 'adapters' extra, so its adapter is only added when it is installed
+    try:
+        import scipy.sparse  # ruff:ignore[unused-import]
+
+    except ImportError:
+        pass
+
+    else:
+        from .scipy import to_scipy_sparse
+
+        Aig.to_scipy_sparse = to_scipy_sparse  # type: ignore[method-assign]
+
+        del to_scipy_sparse
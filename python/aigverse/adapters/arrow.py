@@ -0,0 +1,405 @@
+"""AIG to Apache Arrow and Parquet adapter for network corpora.
+
+Networks are stored one per row, with list columns holding their node and edge rows.
+Node rows follow the layout of :meth:`~aigverse.networks.Aig.to_graph_tensors`: the nodes
+in index order, followed by one synthetic node per primary output. Networks with dead
+nodes are stored as the copy :func:`~aigverse.algorithms.cleanup_dangling` returns, which
+also drops dangling gates. Edge rows refer to node rows by position. The schema is:
+
+- ``graph_id`` (``int64``): Identifier of the network.
+- ``num_pis``, ``num_pos``, ``num_gates`` (``int64``): Interface size and gate count.
+- ``node_type`` (``list<int8>``): Type label of each node row, ``0`` for the constant,
+  ``1`` for primary inputs, ``2`` for gates, and ``3`` for primary outputs.
+- ``edge_source``, ``edge_target`` (``list<int64>``): Node rows connected by each edge.
+- ``edge_inverted`` (``list<int8>``): ``1`` for complemented edges and ``0`` otherwise.
+- ``node_level``, ``node_fanouts`` (``list<int32>``, optional): Level and fanout count of
+  each node row.
+- ``node_tt`` (``list<binary>``, optional): Truth table of each node row, packed in
+  little-endian bit order, so that bit ``j`` is the value under input assignment ``j``.
+
+All numeric list columns use fixed-width types, so their values can be viewed as NumPy
+arrays without copying after reading a file, e.g., with ``memory_map=True``.
+"""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..algorithms import cleanup_dangling
+from ..networks import EdgeTensorEncoding, NodeTensorEncoding, SequentialAig, from_graph_tensors
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from ..networks import Aig
+
+
+def schema(*, levels: bool = False, fanouts: bool = False, node_tts: bool = False) -> pa.Schema:
+    """Returns the Arrow schema of network corpora.
+
+    Args:
+        levels: Whether to include the ``node_level`` column.
+        fanouts: Whether to include the ``node_fanouts`` column.
+        node_tts: Whether to include the ``node_tt`` column.
+
+    Returns:
+        The schema of the record batches written by this module.
+    """
+    fields = [
+        pa.field("graph_id", pa.int64(), nullable=False),
+        pa.field("num_pis", pa.int64(), nullable=False),
+        pa.field("num_pos", pa.int64(), nullable=False),
+        pa.field("num_gates", pa.int64(), nullable=False),
+        pa.field("node_type", pa.list_(pa.int8()), nullable=False),
+        pa.field("edge_source", pa.list_(pa.int64()), nullable=False),
+        pa.field("edge_target", pa.list_(pa.int64()), nullable=False),
+        pa.field("edge_inverted", pa.list_(pa.int8()), nullable=False),
+    ]
+    if levels:
+        fields.append(pa.field("node_level", pa.list_(pa.int32()), nullable=False))
+    if fanouts:
+        fields.append(pa.field("node_fanouts", pa.list_(pa.int32()), nullable=False))
+    if node_tts:
+        fields.append(pa.field("node_tt", pa.list_(pa.binary()), nullable=False))
+    return pa.schema(fields)
+
+
+def _graph_rows(aig: Aig, *, levels: bool, fanouts: bool, node_tts: bool) -> dict[str, np.ndarray]:
+    """Collects the node and edge rows of one network from a single graph-tensor export.
+
+    Args:
+        aig: The combinational AIG, which must not have dead nodes.
+        levels: Whether to collect node levels.
+        fanouts: Whether to collect node fanout counts.
+        node_tts: Whether to collect packed node truth tables.
+
+    Returns:
+        The arrays of the list columns, keyed by column name.
+    """
+    tensors = aig.to_graph_tensors(
+        NodeTensorEncoding.INTEGER, EdgeTensorEncoding.BINARY, levels=levels, fanouts=fanouts, node_tts=node_tts
+    )
+    sources, targets = tensors["edge_index"]
+    node_attr = tensors["node_attr"]
+
+    rows = {
+        "node_type": node_attr[:, 0].astype(np.int8),
+        "edge_source": sources,
+        "edge_target": targets,
+        "edge_inverted": tensors["edge_attr"][:, 0].astype(np.int8),
+    }
+    column = 1
+    if levels:
+        rows["node_level"] = node_attr[:, column].astype(np.int32)
+        column += 1
+    if fanouts:
+        rows["node_fanouts"] = node_attr[:, column].astype(np.int32)
+        column += 1
+    if node_tts:
+        rows["node_tt"] = np.packbits(node_attr[:, column:] != 0, axis=1, bitorder="little")
+    return rows
+
+
+_MAX_OFFSET = np.iinfo(np.int32).max
+"""Largest offset of the 32-bit offsets of Arrow list and binary arrays."""
+
+
+def _list_array(name: str, values: list[np.ndarray], value_type: pa.DataType) -> pa.ListArray:
+    """Concatenates per-graph arrays into one list array.
+
+    Args:
+        name: Name of the column, for error messages.
+        values: One array per graph.
+        value_type: Arrow type of the list elements.
+
+    Returns:
+        The list array with one list per graph.
+
+    Raises:
+        ValueError: If the list offsets or the byte offsets of binary values would
+            overflow their 32-bit range.
+    """
+    # the totals are computed in 64 bits, as 32-bit offsets would silently wrap around
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(v) for v in values), dtype=np.int64, count=len(values)), out=offsets[1:])
+    totals = {"values": int(offsets[-1])}
+    if value_type == pa.binary():
+        totals["bytes"] = sum(v.size for v in values)
+    for what, total in totals.items():
+        if total > _MAX_OFFSET:
+            msg = (
+                f"the {name} column would hold {total} {what}, but its 32-bit offsets can address at most "
+                f"{_MAX_OFFSET}; convert fewer networks per record batch"
+            )
+            raise ValueError(msg)
+    if value_type == pa.binary():
+        # every row of a packed truth-table matrix becomes one binary value; the matrices are
+        # contiguous, so their bytes can be concatenated with one offset per row
+        widths = np.concatenate(
+            [np.full(len(v), v.shape[1], dtype=np.int32) for v in values] or [np.empty(0, np.int32)]
+        )
+        byte_offsets = np.zeros(len(widths) + 1, dtype=np.int32)
+        np.cumsum(widths, out=byte_offsets[1:])
+        data = np.concatenate([v.ravel() for v in values] or [np.empty(0, np.uint8)])
+        flat = pa.BinaryArray.from_buffers(
+            value_type, len(widths), [None, pa.py_buffer(byte_offsets), pa.py_buffer(data)]
+        )
+    else:
+        flat = pa.array(np.concatenate(values) if values else np.empty(0, value_type.to_pandas_dtype()))
+    return pa.ListArray.from_arrays(pa.array(offsets.astype(np.int32)), flat)
+
+
+def to_record_batch(
+    aigs: Iterable[Aig],
+    graph_ids: Iterable[int] | None = None,
+    *,
+    levels: bool = False,
+    fanouts: bool = False,
+    node_tts: bool = False,
+) -> pa.RecordBatch:
+    """Converts networks to an Arrow record batch with one row per network.
+
+    Networks with dead nodes are converted as the copy
+    :func:`~aigverse.algorithms.cleanup_dangling` returns.
+
+    Args:
+        aigs: The combinational AIGs to convert.
+        graph_ids: Identifier of each network. Defaults to the networks' positions.
+        levels: Whether to include the ``node_level`` column.
+        fanouts: Whether to include the ``node_fanouts`` column.
+        node_tts: Whether to include the ``node_tt`` column, which is limited to
+            networks with at most 16 primary inputs.
+
+    Returns:
+        A record batch with the schema returned by :func:`schema`.
+
+    Raises:
+        ValueError: If the number of identifiers does not match the number of networks, or
+            if a list column would hold more values or bytes than its 32-bit offsets can
+            address (``2**31 - 1``).
+    """
+    # in-place substitutions leave dead nodes behind and can make gates depend on nodes of
+    # higher index, which the exporter cannot simulate in index order; sequential AIGs are
+    # passed on for the exporter to reject rather than losing their registers in a cleanup
+    aigs = [
+        cleanup_dangling(aig) if len(aig.nodes()) != aig.size and not isinstance(aig, SequentialAig) else aig
+        for aig in aigs
+    ]
+    ids = list(range(len(aigs))) if graph_ids is None else list(graph_ids)
+    if len(ids) != len(aigs):
+        msg = f"got {len(ids)} graph ids for {len(aigs)} networks"
+        raise ValueError(msg)
+
+    target = schema(levels=levels, fanouts=fanouts, node_tts=node_tts)
+    graphs = [_graph_rows(aig, levels=levels, fanouts=fanouts, node_tts=node_tts) for aig in aigs]
+
+    columns: list[pa.Array] = [
+        pa.array(ids, type=pa.int64()),
+        pa.array([aig.num_pis for aig in aigs], type=pa.int64()),
+        pa.array([aig.num_pos for aig in aigs], type=pa.int64()),
+        pa.array([aig.num_gates for aig in aigs], type=pa.int64()),
+    ]
+    columns.extend(
+        _list_array(field.name, [graph[field.name] for graph in graphs], field.type.value_type)
+        for field in list(target)[len(columns) :]
+    )
+    return pa.RecordBatch.from_arrays(columns, schema=target)
+
+
+def from_record_batch(batch: pa.RecordBatch | pa.Table) -> list[Aig]:
+    """Rebuilds the networks stored in a record batch or table.
+
+    Only the ``node_type`` and edge columns are read. Their values are viewed without
+    copying and sliced per network before being handed to
+    :func:`~aigverse.networks.from_graph_tensors`.
+
+    Args:
+        batch: Rows with the schema returned by :func:`schema`.
+
+    Returns:
+        One AIG per row.
+
+    Raises:
+        ValueError: If a row does not describe a valid AIG.
+    """
+    if isinstance(batch, pa.Table):
+        return [aig for chunk in batch.to_batches() for aig in from_record_batch(chunk)]
+
+    def flat(name: str) -> tuple[np.ndarray, np.ndarray]:
+        column = batch.column(name)
+        offsets = column.offsets.to_numpy()
+        # sliced batches share the values of their parent, so offsets need not start at zero
+        return offsets, column.values.to_numpy()
+
+    node_offsets, node_types = flat("node_type")
+    edge_offsets, sources = flat("edge_source")
+    _, targets = flat("edge_target")
+    _, inverted = flat("edge_inverted")
+
+    aigs = []
+    for row in range(batch.num_rows):
+        nodes = slice(node_offsets[row], node_offsets[row + 1])
+        edges = slice(edge_offsets[row], edge_offsets[row + 1])
+        imported = from_graph_tensors(
+            np.stack([sources[edges], targets[edges]]),
+            inverted[edges, np.newaxis].astype(np.float32),
+            node_types[nodes, np.newaxis].astype(np.float32),
+            NodeTensorEncoding.INTEGER,
+            EdgeTensorEncoding.BINARY,
+        )
+        if imported["problems"]:
+            kind, index = imported["problems"][0]
+            msg = f"row {row} does not describe a valid AIG: {kind} at {index}"
+            raise ValueError(msg)
+        aigs.append(imported["ntk"])
+    return aigs
+
+
+class ParquetCorpusWriter:
+    """Streams networks into a Parquet file, one row group per batch.
+
+    Networks are buffered until ``batch_size`` of them are collected and then written
+    as a row group, so corpora larger than memory can be written incrementally.
+
+    Example:
+        >>> with ParquetCorpusWriter("corpus.parquet", levels=True) as writer:  # doctest: +SKIP
+        ...     for aig in generate():
+        ...         writer.write(aig)
+    """
+
+    def __init__(
+        self,
+        where: str | os.PathLike[str] | IO[bytes],
+        *,
+        levels: bool = False,
+        fanouts: bool = False,
+        node_tts: bool = False,
+        batch_size: int = 1024,
+        **kwargs: object,
+    ) -> None:
+        """Opens the file.
+
+        Args:
+            where: Path or writable file-like object, as accepted by
+                :class:`~pyarrow.parquet.ParquetWriter`.
+            levels: Whether to include the ``node_level`` column.
+            fanouts: Whether to include the ``node_fanouts`` column.
+            node_tts: Whether to include the ``node_tt`` column.
+            batch_size: Number of networks per row group.
+            **kwargs: Further options for :class:`~pyarrow.parquet.ParquetWriter`, such as
+                ``compression``.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+        """
+        if batch_size < 1:
+            msg = f"batch_size must be positive, got {batch_size}"
+            raise ValueError(msg)
+
+        self._options = {"levels": levels, "fanouts": fanouts, "node_tts": node_tts}
+        self._batch_size = batch_size
+        self._aigs: list[Aig] = []
+        self._ids: list[int] = []
+        self._next_id = 0
+        self._writer = pq.ParquetWriter(where, schema(**self._options), **kwargs)
+
+        self.num_written = 0
+        """Number of networks written to the file so far, excluding buffered ones."""
+
+    def write(self, aig: Aig, graph_id: int | None = None) -> None:
+        """Adds a network to the corpus.
+
+        Args:
+            aig: The combinational AIG to add.
+            graph_id: Identifier of the network. Defaults to one more than the last
+                identifier, starting at 0.
+        """
+        self._ids.append(self._next_id if graph_id is None else graph_id)
+        self._next_id = self._ids[-1] + 1
+        self._aigs.append(aig)
+        if len(self._aigs) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered networks as a row group."""
+        if not self._aigs:
+            return
+        self._writer.write_batch(to_record_batch(self._aigs, self._ids, **self._options))
+        self.num_written += len(self._aigs)
+        self._aigs, self._ids = [], []
+
+    def close(self) -> None:
+        """Writes the buffered networks and closes the file."""
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> Self:
+        """Returns the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the file."""
+        self.close()
+
+
+def write_parquet(
+    aigs: Iterable[Aig],
+    where: str | os.PathLike[str] | IO[bytes],
+    *,
+    levels: bool = False,
+    fanouts: bool = False,
+    node_tts: bool = False,
+    batch_size: int = 1024,
+    **kwargs: object,
+) -> int:
+    """Writes networks to a Parquet file, consuming ``aigs`` lazily.
+
+    Args:
+        aigs: The combinational AIGs to write, e.g., a generator. They are numbered
+            consecutively from 0.
+        where: Path or writable file-like object.
+        levels: Whether to include the ``node_level`` column.
+        fanouts: Whether to include the ``node_fanouts`` column.
+        node_tts: Whether to include the ``node_tt`` column.
+        batch_size: Number of networks per row group.
+        **kwargs: Further options for :class:`~pyarrow.parquet.ParquetWriter`.
+
+    Returns:
+        The number of networks written.
+    """
+    with ParquetCorpusWriter(
+        where, levels=levels, fanouts=fanouts, node_tts=node_tts, batch_size=batch_size, **kwargs
+    ) as writer:
+        for aig in aigs:
+            writer.write(aig)
+    return writer.num_written
+
+
+def read_parquet(source: str | os.PathLike[str] | IO[bytes], *, batch_size: int = 1024) -> Iterator[tuple[int, Aig]]:
+    """Reads networks from a Parquet file batch by batch.
+
+    Only the columns needed to rebuild the networks are read.
+
+    Args:
+        source: Path or readable file-like object.
+        batch_size: Maximum number of networks decoded at once.
+
+    Yields:
+        The identifier and network of each row.
+    """
+    columns = ["graph_id", "node_type", "edge_source", "edge_target", "edge_inverted"]
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size, columns=columns):
+        yield from zip(batch.column("graph_id").to_pylist(), from_record_batch(batch), strict=True)
@@ -2,18 +2,120 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
 import networkx as nx
 import numpy as np
 
 from ..algorithms import simulate, simulate_nodes
-from ..networks import AigSignal, DepthAig, NamedAig
+from ..networks import (
+    DepthAig,
+    EdgeTensorEncoding,
+    NamedAig,
+    NodeTensorEncoding,
+    SequentialAig,
+    from_graph_tensors,
+)
 
 if TYPE_CHECKING:
     from ..networks import Aig
 
 
+class _Topology(NamedTuple):
+    """Node and edge arrays of an AIG in the layout :func:`to_networkx` adds to the graph."""
+
+    nodes: np.ndarray
+    """Indices of the regular nodes."""
+    node_types: np.ndarray
+    """Type label of each regular node, indexing ``[const, pi, gate]``."""
+    node_levels: np.ndarray | None
+    """Level of each regular node, if requested."""
+    node_fanouts: np.ndarray | None
+    """Fanout count of each regular node, if requested."""
+    num_levels: int
+    """Depth of the network."""
+    sources: np.ndarray
+    """Source node of each edge."""
+    targets: np.ndarray
+    """Target node of each edge, with synthetic PO nodes numbered from ``size`` onwards."""
+    inverted: np.ndarray
+    """Whether each edge is complemented."""
+
+
+def _combinational_topology(aig: Aig, *, levels: bool, fanouts: bool) -> _Topology:
+    """Collects the topology of a combinational AIG from a single graph-tensor export.
+
+    Args:
+        aig: The combinational AIG.
+        levels: Whether to collect node levels.
+        fanouts: Whether to collect node fanout counts.
+
+    Returns:
+        The node and edge arrays of the AIG.
+    """
+    tensors = aig.to_graph_tensors(
+        NodeTensorEncoding.INTEGER, EdgeTensorEncoding.BINARY, levels=levels, fanouts=fanouts
+    )
+    sources, targets = tensors["edge_index"]
+    inverted = tensors["edge_attr"][:, 0] != 0
+
+    nodes = np.asarray(aig.nodes(), dtype=np.int64)
+    size = aig.size
+    if len(nodes) != size:
+        # the exporter numbers the rows of live nodes consecutively and skips dead ones,
+        # leaving the rows between them and the PO rows unset
+        targets = np.where(targets < size, nodes[np.minimum(targets, len(nodes) - 1)], targets)
+    # all exported features are small integers, which float32 represents exactly
+    node_rows = tensors["node_attr"][: len(nodes)].astype(np.int64)
+    po_rows = tensors["node_attr"][size:].astype(np.int64)
+
+    column = 1
+    node_levels = None
+    num_levels = 0
+    if levels:
+        node_levels = node_rows[:, column]
+        num_levels = int(po_rows[:, column].max()) - 1 if len(po_rows) else 0
+        column += 1
+
+    return _Topology(
+        nodes=nodes,
+        node_types=node_rows[:, 0],
+        node_levels=node_levels,
+        node_fanouts=node_rows[:, column] if fanouts else None,
+        num_levels=num_levels,
+        sources=sources,
+        targets=targets,
+        inverted=inverted,
+    )
+
+
+def _sequential_topology(aig: SequentialAig, *, levels: bool, fanouts: bool) -> _Topology:
+    """Collects the topology of a sequential AIG, including its register feedback edges, node by node.
+
+    Args:
+        aig: The sequential AIG.
+        levels: Whether to collect node levels.
+        fanouts: Whether to collect node fanout counts.
+
+    Returns:
+        The node and edge arrays of the AIG.
+    """
+    nodes = aig.nodes()
+    depth_aig = DepthAig(aig) if levels else None
+    edges = aig.to_edge_list()
+
+    return _Topology(
+        nodes=np.asarray(nodes, dtype=np.int64),
+        node_types=np.array([0 if aig.is_constant(n) else 1 if aig.is_pi(n) else 2 for n in nodes], dtype=np.int64),
+        node_levels=np.array([depth_aig.level(n) for n in nodes], dtype=np.int64) if depth_aig is not None else None,
+        node_fanouts=np.array([aig.fanout_size(n) for n in nodes], dtype=np.int64) if fanouts else None,
+        num_levels=depth_aig.num_levels if depth_aig is not None else 0,
+        sources=edges.sources,
+        targets=edges.targets,
+        inverted=edges.weights.astype(bool),
+    )
+
+
 def to_networkx(
     self: Aig,
     *,
@@ -87,6 +189,7 @@ def to_networkx(
     node_type_pi: Final[np.ndarray[Any, np.dtype[np.generic]]] = np.array([0, 1, 0, 0], dtype=dtype)
     node_type_gate: Final[np.ndarray[Any, np.dtype[np.generic]]] = np.array([0, 0, 1, 0], dtype=dtype)
     node_type_po: Final[np.ndarray[Any, np.dtype[np.generic]]] = np.array([0, 0, 0, 1], dtype=dtype)
+    node_types = (node_type_const, node_type_pi, node_type_gate)
 
     # one-hot encodings for edge types: [regular, inverted]
     edge_type_regular: Final[np.ndarray[Any, np.dtype[np.generic]]] = np.array([1, 0], dtype=dtype)
@@ -95,9 +198,13 @@ def to_networkx(
     # Check if this is a NamedAig
     self_named = self if isinstance(self, NamedAig) else None
 
-    # Conditionally compute levels if requested
-    if levels:
-        depth_aig = DepthAig(self)
+    # Collect all node and edge data in bulk. Graph tensors cover combinational
+    # networks only, so sequential networks, whose register feedback edges they
+    # lack, are still collected node by node.
+    if isinstance(self, SequentialAig):
+        topology = _sequential_topology(self, levels=bool(levels), fanouts=bool(fanouts))
+    else:
+        topology = _combinational_topology(self, levels=bool(levels), fanouts=bool(fanouts))
 
     node_funcs = {}
     graph_funcs = []
@@ -120,78 +227,116 @@ def to_networkx(
     g.graph["num_pos"] = self.num_pos
     g.graph["num_gates"] = self.num_gates
     if levels:
-        g.graph["levels"] = depth_aig.num_levels + 1  # + 1 for the PO level
+        g.graph["levels"] = topology.num_levels + 1  # + 1 for the PO level
     if graph_tts:
         g.graph["function"] = graph_funcs
     if self_named is not None and (network_name := self_named.get_network_name()):
         g.graph["name"] = network_name
 
-    # Iterate over all regular nodes in the AIG
-    for node in self.nodes():
-        # Prepare node attributes dictionary
-        # node is AigNode
-        attrs: dict[str, Any] = {"index": node}
-
-        if self.is_constant(node):
-            type_vec = node_type_const
-        elif self.is_pi(node):
-            type_vec = node_type_pi
-        else:  # is gate
-            type_vec = node_type_gate
-
-        if levels:
-            attrs["level"] = depth_aig.level(node)
-        if fanouts:
-            attrs["fanouts"] = self.fanout_size(node)
-        if node_tts:
+    # Attribute dictionaries of all regular nodes, built from plain Python lists
+    nodes = topology.nodes.tolist()
+    node_attrs: list[dict[str, Any]] = [{"index": node} for node in nodes]
+    if levels and topology.node_levels is not None:
+        for attrs, level in zip(node_attrs, topology.node_levels.tolist(), strict=True):
+            attrs["level"] = level
+    if fanouts and topology.node_fanouts is not None:
+        for attrs, fanout in zip(node_attrs, topology.node_fanouts.tolist(), strict=True):
+            attrs["fanouts"] = fanout
+    if node_tts:
+        for attrs, node in zip(node_attrs, nodes, strict=True):
             attrs["function"] = node_funcs[node]
+    for attrs, node_type in zip(node_attrs, topology.node_types.tolist(), strict=True):
+        attrs["type"] = node_types[node_type]
 
-        attrs["type"] = type_vec
-        g.add_node(node, **attrs)
-
-    # Iterate over synthetic PO nodes
-    for po_idx, _po in enumerate(self.pos()):
-        synth_node = po_idx + self.size
-        attrs = {"index": synth_node}
+    g.add_nodes_from(zip(nodes, node_attrs, strict=True))
 
-        # Synthetic PO attributes
-        type_vec = node_type_po
+    # Attribute dictionaries of all synthetic PO nodes
+    po_nodes = range(self.size, self.size + self.num_pos)
+    po_attrs: list[dict[str, Any]] = [{"index": synth_node} for synth_node in po_nodes]
+    for po_idx, attrs in enumerate(po_attrs):
         if levels:
-            attrs["level"] = depth_aig.num_levels + 1
+            attrs["level"] = topology.num_levels + 1
         if fanouts:
             attrs["fanouts"] = 0
         if node_tts:
             attrs["function"] = graph_funcs[po_idx]
+        attrs["type"] = node_type_po
 
-        attrs["type"] = type_vec
-        g.add_node(synth_node, **attrs)
+    g.add_nodes_from(zip(po_nodes, po_attrs, strict=True))
 
-    # Export the AIG as an edge list
-    edges = self.to_edge_list()
+    # Attribute dictionaries of all edges with one-hot encoded edge types
+    inverted = topology.inverted.tolist()
+    edge_attrs: list[dict[str, Any]] = [
+        {"type": edge_type_inverted if weight else edge_type_regular} for weight in inverted
+    ]
 
-    # Iterate over all edges and add them to the graph
-    for src, tgt, weight in [(e.source, e.target, e.weight) for e in edges]:
-        # Assign one-hot encoded edge type based on inversion
-        edge_type = edge_type_inverted if weight else edge_type_regular
-        edge_attrs: dict[str, Any] = {"type": edge_type}
+    if self_named is not None:
+        # Add signal names, looked up in bulk by signal literal (edges represent signals)
+        signal_names = {signal.data: name for signal, name in self_named.get_signal_names().items()}
+        if signal_names:
+            literals = 2 * topology.sources + topology.inverted
+            named = np.isin(literals, np.fromiter(signal_names, dtype=np.int64, count=len(signal_names)))
+            for edge_idx in np.flatnonzero(named).tolist():
+                edge_attrs[edge_idx]["signal_name"] = signal_names[int(literals[edge_idx])]
+
+        # Add PO names as attributes on edges going to synthetic PO nodes, which
+        # are emitted in PO order
+        po_edges = np.flatnonzero(topology.targets >= self.size).tolist()
+        for po_idx, po_output_name in self_named.get_output_names().items():
+            if po_output_name:
+                edge_attrs[po_edges[po_idx]]["output_name"] = po_output_name
+
+    g.add_edges_from(
+        zip(topology.sources.tolist(), topology.targets.tolist(), edge_attrs, strict=True),
+    )
 
-        # Add signal name if available (edges represent signals)
-        if self_named is not None:
-            sig = AigSignal(src, bool(weight))
-            if self_named.has_name(sig):
-                edge_attrs["signal_name"] = self_named.get_name(sig)
+    return g
 
-        g.add_edge(src, tgt, **edge_attrs)
 
-    # Add PO names as attributes on edges going to synthetic PO nodes
-    if self_named is not None:
-        for po_idx, _ in enumerate(self_named.pos()):
-            synth_node = po_idx + self_named.size
-            po_output_name = self_named.get_output_name(po_idx) if self_named.has_output_name(po_idx) else None
+def from_networkx(graph: nx.DiGraph) -> dict[str, Any]:
+    """Builds an :class:`~aigverse.Aig` from a :class:`~networkx.DiGraph` shaped like :func:`to_networkx` output.
 
-            # Find all edges going into this synthetic PO node
-            for pred in g.predecessors(synth_node):
-                if po_output_name:
-                    g.edges[pred, synth_node]["output_name"] = po_output_name
+    Every node needs a one-hot ``type`` attribute in ``[const, pi, gate, po]`` order and
+    every edge a one-hot ``type`` attribute in ``[regular, inverted]`` order; all other
+    attributes are ignored. The graph is converted to graph tensors with one row per node
+    in ``graph.nodes`` order and handed to
+    :func:`~aigverse.networks.from_graph_tensors`, which validates, orders, and builds it
+    natively. Primary inputs and outputs are therefore created in node order, so a graph
+    produced by :func:`to_networkx` yields the original network.
 
-    return g
+    Args:
+        graph: The graph to convert. Its node keys can be any hashable objects.
+
+    Returns:
+        The dictionary returned by :func:`~aigverse.networks.from_graph_tensors`, whose
+        ``literals`` and node or edge indices in ``problems`` refer to positions in
+        ``graph.nodes`` and ``graph.edges``, respectively.
+
+    Raises:
+        ValueError: If a node or edge has no ``type`` attribute.
+    """
+    rows = {node: row for row, node in enumerate(graph.nodes)}
+
+    node_types = []
+    for node, node_type in graph.nodes(data="type"):
+        if node_type is None:
+            msg = f"node {node!r} has no 'type' attribute"
+            raise ValueError(msg)
+        node_types.append(node_type)
+
+    sources, targets, edge_types = [], [], []
+    for u, v, edge_type in graph.edges(data="type"):
+        if edge_type is None:
+            msg = f"edge ({u!r}, {v!r}) has no 'type' attribute"
+            raise ValueError(msg)
+        sources.append(rows[u])
+        targets.append(rows[v])
+        edge_types.append(edge_type)
+
+    return from_graph_tensors(
+        np.array([sources, targets], dtype=np.int64).reshape(2, len(sources)),
+        np.asarray(edge_types, dtype=np.float32).reshape(len(edge_types), 2),
+        np.asarray(node_types, dtype=np.float32).reshape(len(node_types), 4),
+        NodeTensorEncoding.ONE_HOT,
+        EdgeTensorEncoding.ONE_HOT,
+    )
@@ -0,0 +1,350 @@
+"""NetworkX backend that runs graph algorithms on the native storage of AIGs.
+
+NetworkX dispatches calls such as :func:`networkx.ancestors` to this module whenever
+they receive an :class:`AigGraph`, which is registered under the ``networkx.backends``
+entry point as the ``aigverse`` backend. An :class:`AigGraph` presents an AIG in the
+node layout of :func:`~aigverse.adapters.networkx.to_networkx` without materializing a
+:class:`~networkx.DiGraph`: traversals run natively on the AIG, and degrees and
+generations come from a single graph-tensor export and one leveling pass.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+import networkx as nx
+import numpy as np
+
+from ..algorithms import node_levels, topological_order, transitive_fanin, transitive_fanout
+from ..networks import SequentialAig
+from .networkx import _combinational_topology, from_networkx, to_networkx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ..networks import Aig
+
+
+class _DegreeView:
+    """Read-only in- or out-degree view of an :class:`AigGraph`, like NetworkX's ``DiDegreeView``."""
+
+    def __init__(self, graph: AigGraph, degrees: np.ndarray, positions: np.ndarray | None = None) -> None:
+        self._graph = graph
+        self._degrees = degrees
+        self._positions = positions if positions is not None else np.arange(len(degrees))
+
+    def __call__(self, nbunch: object = None) -> int | _DegreeView:
+        """Returns the view restricted to the nodes in ``nbunch``, or the degree of ``nbunch`` if it is a node."""
+        if nbunch is None:
+            return self
+        if nbunch in self._graph:
+            return self[cast("int", nbunch)]
+        positions = [self._graph._position(node) for node in cast("Iterable[int]", nbunch) if node in self._graph]
+        return _DegreeView(self._graph, self._degrees, np.asarray(positions, dtype=np.int64))
+
+    def __getitem__(self, node: int) -> int:
+        """Returns the degree of a node."""
+        return int(self._degrees[self._graph._position(node)])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Returns an iterator over ``(node, degree)`` pairs."""
+        return zip(self._graph._nodes[self._positions].tolist(), self._degrees[self._positions].tolist(), strict=True)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the view."""
+        return len(self._positions)
+
+
+class AigGraph:
+    """Directed graph view of a combinational :class:`~aigverse.Aig` for NetworkX's backend dispatch.
+
+    The graph has the nodes and edges of :func:`~aigverse.adapters.networkx.to_networkx`:
+    one node per live node of the AIG, keyed by its index, one synthetic node per
+    primary output, keyed by ``size + k`` for output ``k``, and one edge per fanin. It
+    carries no attributes and reflects the AIG at the time of construction.
+
+    Passing it to a NetworkX function that the ``aigverse`` backend implements runs that
+    function on the AIG itself.
+
+    """
+
+    __networkx_backend__ = "aigverse"
+
+    def __init__(self, aig: Aig) -> None:
+        """Initializes the view.
+
+        Args:
+            aig: The combinational AIG to view.
+
+        Raises:
+            TypeError: If ``aig`` is a :class:`~aigverse.SequentialAig`, whose register
+                feedback edges make the graph cyclic.
+        """
+        if isinstance(aig, SequentialAig):
+            msg = "sequential AIGs are not supported, as their register feedback edges make the graph cyclic"
+            raise TypeError(msg)
+
+        self.aig = aig
+        """The viewed AIG."""
+
+        topology = _combinational_topology(aig, levels=False, fanouts=True)
+        assert topology.node_fanouts is not None
+
+        size, num_pos = aig.size, aig.num_pos
+        self._size = size
+        self._num_edges = len(topology.sources)
+        self._nodes = np.concatenate([topology.nodes, np.arange(size, size + num_pos, dtype=np.int64)])
+        self._positions = np.full(size + num_pos, -1, dtype=np.int64)
+        self._positions[self._nodes] = np.arange(len(self._nodes))
+
+        # synthetic PO nodes are the targets of the PO edges, which are emitted in PO order
+        self._drivers = topology.sources[topology.targets >= size]
+        self._in_degrees = np.concatenate([np.array([0, 0, 2])[topology.node_types], np.ones(num_pos, dtype=np.int64)])
+        self._out_degrees = np.concatenate([topology.node_fanouts, np.zeros(num_pos, dtype=np.int64)])
+        # the graph-tensor levels leave dangling gates at level 0, so the levels are computed separately
+        self._levels = node_levels(aig)
+        self._generations = np.concatenate([self._levels[topology.nodes], self._levels[self._drivers] + 1])
+
+    def _position(self, node: int) -> int:
+        """Looks up the position of a node in ``_nodes``.
+
+        Args:
+            node: The node to look up.
+
+        Returns:
+            The position of the node.
+
+        Raises:
+            networkx.NetworkXError: If the node is not in the graph.
+        """
+        if node not in self:
+            msg = f"The node {node} is not in the graph."
+            raise nx.NetworkXError(msg)
+        return int(self._positions[node])
+
+    @staticmethod
+    def is_directed() -> bool:
+        """Returns True, as AIGs are directed."""
+        return True
+
+    @staticmethod
+    def is_multigraph() -> bool:
+        """Returns False, as no two edges of an AIG connect the same nodes."""
+        return False
+
+    def __contains__(self, node: object) -> bool:
+        """Returns whether ``node`` is a node of the graph."""
+        return (
+            isinstance(node, int | np.integer)
+            and not isinstance(node, bool)
+            and 0 <= node < len(self._positions)
+            and self._positions[node] >= 0
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        """Returns an iterator over the nodes in ascending order, followed by the synthetic PO nodes."""
+        return iter(self._nodes.tolist())
+
+    def __len__(self) -> int:
+        """Returns the number of nodes."""
+        return len(self._nodes)
+
+    def number_of_nodes(self) -> int:
+        """Returns the number of nodes."""
+        return len(self._nodes)
+
+    def number_of_edges(self) -> int:
+        """Returns the number of edges."""
+        return self._num_edges
+
+    @property
+    def in_degree(self) -> _DegreeView:
+        """Number of fanins of each node: 0 for the constant and primary inputs, 2 for gates, and 1 for outputs."""
+        return _DegreeView(self, self._in_degrees)
+
+    @property
+    def out_degree(self) -> _DegreeView:
+        """Number of fanouts of each node, counting primary outputs."""
+        return _DegreeView(self, self._out_degrees)
+
+
+def _roots(nodes: Iterable[int]) -> np.ndarray:
+    """Returns node indices packed into the array type the native traversals expect."""
+    return np.fromiter(nodes, dtype=np.int64)
+
+
+def ancestors(G: AigGraph, source: int) -> set[int]:
+    """Returns all nodes having a path to ``source``, i.e., its transitive fanin."""
+    G._position(source)
+    if source >= G._size:
+        return set(transitive_fanin(G.aig, _roots([G._drivers[source - G._size]])).tolist())
+    nodes = set(transitive_fanin(G.aig, _roots([source])).tolist())
+    nodes.discard(source)
+    return nodes
+
+
+def descendants(G: AigGraph, source: int) -> set[int]:
+    """Returns all nodes reachable from ``source``, i.e., its transitive fanout."""
+    G._position(source)
+    if source >= G._size:
+        return set()
+    fanout = transitive_fanout(G.aig, _roots([source]))
+    nodes = set(fanout["nodes"].tolist())
+    nodes.discard(source)
+    nodes.update((fanout["outputs"] + G._size).tolist())
+    return nodes
+
+
+def topological_generations(G: AigGraph) -> Iterator[list[int]]:
+    """Yields the nodes level by level, with each primary output one level above its driver."""
+    order = np.argsort(G._generations, kind="stable")
+    bounds = np.flatnonzero(np.diff(G._generations[order])) + 1
+    for generation in np.split(G._nodes[order], bounds):
+        yield generation.tolist()
+
+
+def topological_sort(G: AigGraph) -> Iterator[int]:
+    """Yields the nodes in topological order, followed by the synthetic PO nodes.
+
+    Index order is not topological after in-place substitutions, so the order is computed
+    by :func:`~aigverse.algorithms.topological_order`.
+    """
+    yield from topological_order(G.aig).tolist()
+    yield from G._nodes[len(G._nodes) - G.aig.num_pos :].tolist()
+
+
+def is_directed_acyclic_graph(G: AigGraph) -> bool:
+    """Returns True, as combinational AIGs are acyclic."""
+    return True
+
+
+def dag_longest_path(
+    G: AigGraph,
+    weight: str | None = "weight",
+    default_weight: float = 1,
+    topo_order: Iterable[int] | None = None,
+) -> list[int]:
+    """Returns a longest path, which ends at a node without fanouts, e.g., a synthetic PO node or a dangling gate."""
+    node = int(G._nodes[np.argmax(G._generations)])
+    path = [node]
+    if node >= G._size:
+        node = int(G._drivers[node - G._size])
+        path.append(node)
+    # trace the path back through the first fanin one level below
+    while (level := G._levels[node]) > 0:
+        node = next(
+            fanin
+            for fanin in (G.aig.get_node(signal) for signal in G.aig.fanins(node))
+            if G._levels[fanin] == level - 1
+        )
+        path.append(node)
+    return path[::-1]
+
+
+def dag_longest_path_length(
+    G: AigGraph,
+    weight: str | None = "weight",
+    default_weight: float = 1,
+) -> float:
+    """Returns the length of a longest path, with every edge weighing ``default_weight``."""
+    return (len(dag_longest_path(G, weight, default_weight)) - 1) * default_weight
+
+
+def _degree_centrality(G: AigGraph, degrees: np.ndarray) -> dict[int, float]:
+    """Returns degrees normalized by the maximum possible degree ``len(G) - 1``."""
+    if len(G) <= 1:
+        return dict.fromkeys(G, 1)
+    return dict(zip(G._nodes.tolist(), (degrees * (1.0 / (len(G) - 1))).tolist(), strict=True))
+
+
+def in_degree_centrality(G: AigGraph) -> dict[int, float]:
+    """Returns the in-degree centrality of each node."""
+    return _degree_centrality(G, G._in_degrees)
+
+
+def out_degree_centrality(G: AigGraph) -> dict[int, float]:
+    """Returns the out-degree centrality of each node."""
+    return _degree_centrality(G, G._out_degrees)
+
+
+def can_run(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool | str:
+    """Tells NetworkX whether the backend supports a call.
+
+    Args:
+        name: Name of the called function.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        True if the backend can run the call, and the reason why not otherwise.
+    """
+    if name in {"dag_longest_path", "dag_longest_path_length"}:
+        default_weight = kwargs.get("default_weight", args[2] if len(args) > 2 else 1)
+        if not default_weight > 0:
+            return "only positive `default_weight` values are supported"
+    return True
+
+
+def convert_from_nx(
+    graph: nx.DiGraph,
+    *args: object,
+    **kwargs: object,
+) -> AigGraph:
+    """Converts a graph shaped like :func:`~aigverse.adapters.networkx.to_networkx` output to an :class:`AigGraph`.
+
+    The graph is imported with :func:`~aigverse.adapters.networkx.from_networkx`, which
+    only reads the ``type`` attributes of nodes and edges. All other arguments NetworkX
+    passes are ignored, since an :class:`AigGraph` carries no attributes.
+
+    Args:
+        graph: The graph to convert.
+        *args: Ignored.
+        **kwargs: Ignored.
+
+    Returns:
+        The graph as an :class:`AigGraph`.
+
+    Raises:
+        NotImplementedError: If the graph is not a valid AIG or the imported AIG numbers
+            its nodes differently, in which case results would refer to other nodes.
+    """
+    try:
+        imported = from_networkx(graph)
+    except ValueError as e:
+        raise NotImplementedError(str(e)) from e
+    if imported["problems"]:
+        msg = f"the graph is not a valid AIG: {imported['problems'][0]}"
+        raise NotImplementedError(msg)
+
+    aig_graph = AigGraph(imported["ntk"])
+    # every row must have become the node of the same key, with outputs numbered after the nodes
+    size, outputs = aig_graph._size, 0
+    for node, literal in zip(graph.nodes, imported["literals"].tolist(), strict=True):
+        if literal < 0:
+            expected = size + outputs
+            outputs += 1
+        else:
+            expected = literal // 2 if literal % 2 == 0 else -1
+        if node != expected:
+            msg = f"node {node!r} does not keep its key in the imported AIG"
+            raise NotImplementedError(msg)
+    if len(aig_graph) != len(graph):
+        msg = "the graph lacks the constant node"
+        raise NotImplementedError(msg)
+    return aig_graph
+
+
+def convert_to_nx(obj: object, *, name: str | None = None) -> object:
+    """Converts an :class:`AigGraph` to a :class:`~networkx.DiGraph` and passes other results through.
+
+    Args:
+        obj: The graph or result to convert.
+        name: Name of the function that produced ``obj``. Ignored.
+
+    Returns:
+        The output of :func:`~aigverse.adapters.networkx.to_networkx` for an
+        :class:`AigGraph`, and ``obj`` itself otherwise.
+    """
+    if isinstance(obj, AigGraph):
+        return to_networkx(obj.aig)
+    return obj
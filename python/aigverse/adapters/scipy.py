@@ -0,0 +1,41 @@
+"""AIG to SciPy sparse adapter."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import scipy.sparse as sp
+
+from ..networks import EdgeTensorEncoding, SparseLayout
+
+if TYPE_CHECKING:
+    from ..networks import Aig
+
+
+def to_scipy_sparse(
+    self: Aig,
+    layout: SparseLayout = SparseLayout.CSR,
+    edge_encoding: EdgeTensorEncoding = EdgeTensorEncoding.SIGNED,
+) -> sp.csr_array | sp.csc_array:
+    """Converts an :class:`~aigverse.Aig` to a SciPy sparse adjacency matrix.
+
+    The matrix wraps the arrays of :meth:`~aigverse.networks.Aig.to_sparse_adjacency`
+    without copying them, so row ``u`` of a CSR matrix lists the fanouts of node ``u``
+    and column ``v`` of a CSC matrix lists the fanins of node ``v``. Synthetic primary
+    output nodes follow the regular nodes, as in :func:`to_networkx`.
+
+    Args:
+        self: The AIG object to convert.
+        layout: The compressed layout, which also determines the matrix type.
+            Defaults to :attr:`~aigverse.networks.SparseLayout.CSR`.
+        edge_encoding: Encoding of the edge polarity in the stored values, either
+            ``SIGNED`` (+1 for regular, -1 for inverted edges) or ``BINARY`` (explicit
+            zeros for regular and ones for inverted edges). Defaults to ``SIGNED``.
+
+    Returns:
+        A :class:`~scipy.sparse.csr_array` or :class:`~scipy.sparse.csc_array` of
+        shape ``(N, N)`` with ``float32`` values and ``int64`` indices.
+    """
+    adjacency = self.to_sparse_adjacency(layout, edge_encoding)
+    matrix_type = sp.csr_array if layout == SparseLayout.CSR else sp.csc_array
+    return matrix_type((adjacency["data"], adjacency["indices"], adjacency["indptr"]), shape=adjacency["shape"])
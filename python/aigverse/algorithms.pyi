@@ -1,11 +1,174 @@
 """Provides synthesis and optimization algorithms for logic network types."""
 
-from collections.abc import Sequence
-from typing import Literal
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Literal, overload
+
+from typing_extensions import Self
 
 import aigverse.networks
 import aigverse.utils
 
+if TYPE_CHECKING:
+    import numpy as np
+
+class CancellationToken:
+    """Lets any Python thread ask long-running algorithms to stop early.
+
+    Pass the token to one or more calls, e.g., running on worker threads, and call
+    :meth:`cancel` to stop them all. Each algorithm checks the token periodically and then
+    returns as documented for its ``cancellation_token`` argument. A cancelled token stays
+    cancelled until :meth:`reset` is called.
+    """
+
+    def __init__(self) -> None:
+        """Creates a token that is not cancelled."""
+
+    def cancel(self) -> None:
+        """Asks every algorithm observing this token to stop. Safe to call from any thread."""
+
+    def reset(self) -> None:
+        """Clears the cancellation so that the token can be reused."""
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel` has been called since the token was created or last reset."""
+
+class PassStatistics:
+    """Describes what an optimization pass did and where it spent its time.
+
+    Pass an instance as the ``statistics`` argument of :func:`aig_resubstitution`,
+    :func:`sop_refactoring`, :func:`aig_cut_rewriting`, or :func:`balancing` to have it
+    filled after the pass. The keys of :attr:`times` and :attr:`counts` depend on the pass
+    and are listed in its documentation.
+    """
+
+    def __init__(self) -> None:
+        """Creates empty statistics, to be filled by a pass."""
+
+    @property
+    def name(self) -> str:
+        """Name of the pass, e.g., ``"aig_resubstitution"``."""
+
+    @property
+    def num_runs(self) -> int:
+        """Number of runs these statistics cover.
+
+        1 after a single pass, 0 if no pass has filled them yet, and more for the aggregates
+        of :meth:`StatisticsCollector.summary`.
+        """
+
+    @property
+    def runtime(self) -> float:
+        """Seconds the pass took in total."""
+
+    @property
+    def num_gates_before(self) -> int:
+        """Number of AND gates before the pass."""
+
+    @property
+    def num_gates_after(self) -> int:
+        """Number of AND gates after the pass."""
+
+    @property
+    def times(self) -> dict[str, float]:
+        """Seconds spent in each phase of the pass, by phase."""
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Event counters of the pass, e.g., the number of candidates tried."""
+
+class StatisticsCollector:
+    """Records the statistics of every optimization pass run while it is active.
+
+    Activate a collector process-wide with :func:`set_statistics_collector` or for the
+    duration of a ``with`` block. While active, it records every run of
+    :func:`aig_resubstitution`, :func:`sop_refactoring`, :func:`aig_cut_rewriting`, and
+    :func:`balancing`, including those run by :func:`run_pipeline`, :func:`run_portfolio`,
+    and :func:`run_until_convergence`, from any thread. Recording is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty collector that is not active."""
+
+    @property
+    def records(self) -> list[PassStatistics]:
+        """Statistics of every recorded pass, oldest first."""
+
+    def summary(self) -> dict[str, PassStatistics]:
+        """Sums up the recorded statistics per pass.
+
+        Returns:
+            One aggregate per pass name, whose ``num_runs`` tells how many runs it covers.
+        """
+
+    def clear(self) -> None:
+        """Removes all recorded statistics."""
+
+    def __len__(self) -> int: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(self, *args: object) -> None: ...
+
+def set_statistics_collector(collector: StatisticsCollector | None) -> None:
+    """Activates a statistics collector process-wide.
+
+    Args:
+        collector: The collector to record every subsequent pass to, or ``None`` to stop
+            recording.
+    """
+
+class CounterexampleCache:
+    """Stores input assignments that told networks apart, for reuse across checks.
+
+    Pass the same cache to successive calls of :func:`equivalence_checking` or
+    :func:`per_output_equivalence_checking` against one specification. Every counterexample
+    a check finds is added, and every check simulates the stored patterns before any random
+    one, so an implementation that fails like an earlier one is rejected without SAT solving.
+
+    All patterns assign the same number of primary inputs, which the first pattern fixes.
+    Once ``capacity`` patterns are stored, adding another evicts the oldest.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Creates an empty cache.
+
+        Args:
+            capacity: Maximum number of patterns kept.
+
+        Raises:
+            ValueError: If ``capacity`` is 0.
+        """
+
+    def add(self, pattern: Sequence[bool]) -> None:
+        """Stores a pattern, or marks it as the most recent one if it is already stored.
+
+        Args:
+            pattern: One value per primary input, in input order.
+
+        Raises:
+            ValueError: If ``pattern`` assigns a different number of inputs than the stored ones.
+        """
+
+    def clear(self) -> None:
+        """Removes all patterns and forgets their number of primary inputs."""
+
+    @property
+    def patterns(self) -> list[list[bool]]:
+        """The stored patterns, oldest first."""
+
+    @property
+    def last(self) -> list[bool] | None:
+        """The pattern stored most recently, or ``None`` if the cache is empty."""
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of patterns kept."""
+
+    @property
+    def num_pis(self) -> int | None:
+        """Number of primary inputs every pattern assigns, or ``None`` if the cache is empty."""
+
+    def __len__(self) -> int: ...
+
 def equivalence_checking(
     spec: aigverse.networks.Aig,
     impl: aigverse.networks.Aig,
@@ -13,22 +176,140 @@ def equivalence_checking(
     conflict_limit: int = 0,
     functional_reduction: bool = True,
     verbose: bool = False,
+    num_random_patterns: int = 1024,
+    seed: int = 1,
+    counterexample_cache: CounterexampleCache | None = None,
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
 ) -> bool | None:
     """Checks functional equivalence between a specification and implementation network using SAT solving.
 
+    Before building a SAT instance, the miter is simulated bit-parallel on the patterns in
+    ``counterexample_cache``, if given, and on ``num_random_patterns`` random patterns. If any
+    pattern tells the networks apart, they are reported as not equivalent right away. SAT
+    solving only runs when simulation cannot separate them.
+
+    Functional reduction and SAT solving can be stopped early by ``time_limit``,
+    ``cancellation_token``, or Ctrl-C. The SAT solver is checked every 1000 conflicts.
+
     Args:
         spec: The specification network.
         impl: The implementation network.
         conflict_limit: SAT conflict limit. A value of ``0`` means no limit.
         functional_reduction: Whether to perform functional reduction of the miter before checking.
         verbose: Whether to print verbose progress output.
+        num_random_patterns: Number of random input patterns to simulate before SAT solving.
+            ``0`` skips random simulation.
+        seed: Seed of the random patterns.
+        counterexample_cache: A cache whose patterns are simulated first and to which a
+            counterexample found by this check is added, or ``None``. After a ``False``
+            result, its ``last`` pattern tells the networks apart.
+        time_limit: Wall-clock seconds after which the check stops, or ``None`` for no limit.
+        cancellation_token: A token that stops the check once cancelled, or ``None``.
 
     Returns:
         ``True`` if equivalent, ``False`` if not equivalent, or ``None`` if the
-        procedure did not finish before the configured limit.
+        procedure did not finish before the configured limit or was stopped.
+
+    Raises:
+        ValueError: If the patterns in ``counterexample_cache`` assign a different number of
+            inputs than the networks have, or ``time_limit`` is not positive.
+        RuntimeError: If miter construction fails due to incompatible interfaces (PI/PO count mismatch).
+        KeyboardInterrupt: If interrupted by Ctrl-C.
+    """
+
+class OutputEquivalenceResult:
+    """Represents the outcome of :func:`per_output_equivalence_checking`.
+
+    ``verdicts[i]`` is ``True`` if output ``i`` of the two networks is equivalent, ``False`` if
+    it is not, and ``None`` if its SAT call hit the conflict limit or never started because the
+    time budget ran out. Every output whose verdict is ``False`` has an entry in
+    ``counterexamples``.
+    """
+
+    @property
+    def verdicts(self) -> list[bool | None]:
+        """One verdict per primary output, in output order."""
+
+    @property
+    def counterexamples(self) -> dict[int, list[bool]]:
+        """Input assignments under which the networks differ, keyed by output.
+
+        Each assignment holds one value per primary input, in input order.
+        """
+
+    @property
+    def equivalent(self) -> bool | None:
+        """The overall verdict.
+
+        ``False`` if any output differs, ``None`` if none differs but some are undecided, and
+        ``True`` otherwise.
+        """
+
+    @property
+    def failing_outputs(self) -> list[int]:
+        """Positions of the outputs that differ, in ascending order."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the check took."""
+
+    def __len__(self) -> int: ...
+
+def per_output_equivalence_checking(
+    spec: aigverse.networks.Aig,
+    impl: aigverse.networks.Aig,
+    *,
+    conflict_limit: int = 0,
+    time_budget: float | None = None,
+    workers: int | None = None,
+    functional_reduction: bool = True,
+    num_random_patterns: int = 1024,
+    seed: int = 1,
+    counterexample_cache: CounterexampleCache | None = None,
+    cancellation_token: CancellationToken | None = None,
+) -> OutputEquivalenceResult:
+    """Checks functional equivalence between a specification and implementation network output by output.
+
+    Where :func:`equivalence_checking` solves a single miter over all outputs,
+    this function checks every output pair on its own cone of logic. The checks run on a
+    native thread pool without holding the GIL, so a hard output no longer holds up the
+    others, and the result tells which outputs differ and under which input assignment.
+
+    Before any SAT solving, all outputs are simulated at once, bit-parallel, on the
+    patterns in ``counterexample_cache``, if given, and on ``num_random_patterns`` random
+    patterns. Outputs that simulation separates, as well as outputs whose two sides are
+    structurally identical or complementary, are decided without SAT solving.
+
+    ``conflict_limit`` applies to every output on its own. Once ``time_budget`` has passed
+    or ``cancellation_token`` is cancelled, running SAT calls stop within 1000 conflicts and
+    no further ones start, leaving their outputs undecided. Ctrl-C stops the check the same
+    way and then raises ``KeyboardInterrupt``.
+
+    Args:
+        spec: The specification network.
+        impl: The implementation network.
+        conflict_limit: SAT conflict limit per output. A value of ``0`` means no limit.
+        time_budget: Wall-clock seconds after which SAT solving stops, or ``None`` for no
+            limit.
+        workers: Maximum number of threads, or ``None`` for the number of CPUs.
+        functional_reduction: Whether to perform functional reduction of each output's
+            miter before checking.
+        num_random_patterns: Number of random input patterns to simulate before SAT solving.
+            ``0`` skips random simulation.
+        seed: Seed of the random patterns.
+        counterexample_cache: A cache whose patterns are simulated first and to which every
+            counterexample found by this check is added, or ``None``.
+        cancellation_token: A token that stops SAT solving once cancelled, or ``None``.
+
+    Returns:
+        A verdict per output and a counterexample for every output that differs.
 
     Raises:
+        ValueError: If ``time_budget`` is not positive, ``workers`` is 0, or the patterns in
+            ``counterexample_cache`` assign a different number of inputs than the networks have.
         RuntimeError: If miter construction fails due to incompatible interfaces (PI/PO count mismatch).
+        KeyboardInterrupt: If interrupted by Ctrl-C.
     """
 
 def cleanup_dangling(
@@ -57,9 +338,17 @@ def sop_refactoring(
     consider_inverter_cost: bool = False,
     verbose: bool = False,
     inplace: bool = False,
+    cleanup: bool = True,
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
 ) -> aigverse.networks.Aig | None:
     """Performs SOP-based network refactoring.
 
+    The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+    all of which are checked before each node is visited. Every replacement keeps the
+    network's function, so a pass stopped early still yields a valid network.
+
     Args:
         ntk: The input logic network.
         max_pis: Maximum number of leaves used in local windows.
@@ -71,12 +360,25 @@ def sop_refactoring(
         consider_inverter_cost: Whether inverter cost is included in optimization.
         verbose: Whether to print verbose progress output.
         inplace: Whether to mutate ``ntk`` in place.
+        cleanup: Whether to remove the dangling nodes the pass leaves behind from the
+            returned network. Skipping this saves building a second copy of the network.
+            Has no effect with ``inplace``, which never removes them.
+        time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+            limit.
+        cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+        statistics: If given, filled with the statistics of this run. Its ``times`` hold
+            ``"mffc"``, ``"simulation"``, and ``"resynthesis"``. Its ``counts`` hold
+            ``"candidates"``, the number of windows resynthesized.
 
     Returns:
-        The refactored network if ``inplace`` is ``False``. Otherwise ``None``.
+        The refactored network if ``inplace`` is ``False``. Otherwise ``None``. If the pass
+        stopped early, the network holds the replacements made until then.
 
     Raises:
+        ValueError: If ``time_limit`` is not positive.
         RuntimeError: If refactoring fails in the underlying synthesis engine.
+        KeyboardInterrupt: If interrupted by Ctrl-C. With ``inplace``, ``ntk`` keeps the
+            replacements made until then.
     """
 
 def aig_resubstitution(
@@ -92,9 +394,17 @@ def aig_resubstitution(
     window_size: int = 12,
     preserve_depth: bool = False,
     inplace: bool = False,
+    cleanup: bool = True,
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
 ) -> aigverse.networks.Aig | None:
     """Performs AIG resubstitution-based optimization.
 
+    The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+    all of which are checked before each node is visited. Every replacement keeps the
+    network's function, so a pass stopped early still yields a valid network.
+
     Args:
         ntk: The input logic network.
         max_pis: Maximum number of leaves in a local window.
@@ -107,11 +417,75 @@ def aig_resubstitution(
         window_size: Window size used for don't-care computation.
         preserve_depth: Whether replacements must preserve depth.
         inplace: Whether to mutate ``ntk`` in place.
+        cleanup: Whether to remove the dangling nodes the pass leaves behind from the
+            returned network. Skipping this saves building a second copy of the network.
+            Has no effect with ``inplace``, which never removes them.
+        time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+            limit.
+        cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+        statistics: If given, filled with the statistics of this run. Its ``times`` hold
+            ``"cuts"``, ``"mffc"``, ``"divisor_collection"``, ``"simulation"``,
+            ``"dont_cares"``, ``"resynthesis"``, and ``"substitution"``. Its ``counts`` hold
+            ``"leaves"``, ``"divisors"``, ``"estimated_gain"``, and ``"accepted"``, also
+            broken down by kind, e.g., ``"accepted_1_resub"``.
+
+    Returns:
+        The optimized network if ``inplace`` is ``False``. Otherwise ``None``. If the pass
+        stopped early, the network holds the replacements made until then.
+
+    Raises:
+        ValueError: If ``time_limit`` is not positive.
+        KeyboardInterrupt: If interrupted by Ctrl-C. With ``inplace``, ``ntk`` keeps the
+            replacements made until then.
+    """
+
+class NpnDatabaseInfo:
+    """Describes the NPN resynthesis database shared by all cut rewriting calls."""
+
+    @property
+    def built(self) -> bool:
+        """Whether the database has been built."""
+
+    @property
+    def build_time(self) -> float:
+        """Wall-clock seconds building the database took, or ``0.0`` if it is not built."""
+
+    @property
+    def num_classes(self) -> int:
+        """Number of NPN classes of four-input functions the database holds implementations for."""
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the database network."""
+
+    @property
+    def memory(self) -> int:
+        """Approximate memory footprint in bytes, ignoring allocator overhead."""
+
+def prewarm_npn_database() -> NpnDatabaseInfo:
+    """Builds the NPN resynthesis database used by cut rewriting ahead of time.
+
+    :func:`aig_cut_rewriting` resynthesizes cuts from a database of optimal
+    implementations of all four-input functions. The database is built on first use,
+    which takes noticeably longer than rewriting a small network, and is then shared
+    by every later call in the process, from any thread. Calling this function during
+    setup moves that one-time cost out of the first rewriting call.
+
+    Calling it again once the database is built returns immediately.
+
+    Returns:
+        The state of the database after building it.
+    """
+
+def npn_database_info() -> NpnDatabaseInfo:
+    """Describes the NPN resynthesis database used by cut rewriting without building it.
 
     Returns:
-        The optimized network if ``inplace`` is ``False``. Otherwise ``None``.
+        Whether the database is built, and if so, how long building it took, its size, and
+        its approximate memory footprint.
     """
 
+@overload
 def aig_cut_rewriting(
     ntk: aigverse.networks.Aig,
     *,
@@ -125,9 +499,46 @@ def aig_cut_rewriting(
     preserve_depth: bool = False,
     verbose: bool = False,
     very_verbose: bool = False,
-) -> aigverse.networks.Aig:
+    inplace: Literal[False] = False,
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
+) -> aigverse.networks.Aig: ...
+@overload
+def aig_cut_rewriting(
+    ntk: aigverse.networks.Aig,
+    *,
+    cut_size: int = 4,
+    cut_limit: int = 8,
+    minimize_truth_table: bool = True,
+    allow_zero_gain: bool = False,
+    use_dont_cares: bool = False,
+    min_cand_cut_size: int = 3,
+    min_cand_cut_size_override: int | None = None,
+    preserve_depth: bool = False,
+    verbose: bool = False,
+    very_verbose: bool = False,
+    inplace: Literal[True],
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
+) -> None:
     """Rewrites an AIG network using cut-based NPN resynthesis.
 
+    Cuts are replaced by optimal implementations from a database covering all
+    four-input functions. The database is built on the first call and shared by all
+    later ones; see :func:`prewarm_npn_database`.
+
+    The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+    all of which are checked before each cut is resynthesized. Since the rewritten network
+    is only assembled once all nodes are processed, a pass stopped early returns a copy of
+    ``ntk``.
+
+    Cut rewriting always builds a new network. With ``inplace``, ``ntk`` takes it over
+    instead of a new object being returned, which frees the memory of the original
+    network during the call unless another network still shares it. A pass stopped early
+    then leaves ``ntk`` unchanged without copying it.
+
     Args:
         ntk: The input logic network.
         cut_size: Maximum cut size used during cut enumeration.
@@ -140,11 +551,24 @@ def aig_cut_rewriting(
         preserve_depth: Whether replacements must preserve network depth.
         verbose: Whether to print verbose progress output.
         very_verbose: Whether to print highly detailed progress output.
+        inplace: Whether to replace ``ntk`` by the rewritten network.
+        time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+            limit.
+        cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+        statistics: If given, filled with the statistics of this run. Its ``times`` hold
+            ``"cut_enumeration"`` and ``"resynthesis"``, which stay 0 if the pass stopped
+            early. Its ``counts`` hold ``"candidates"``, the number of cuts resynthesized.
 
     Returns:
-        A rewritten network.
+        The rewritten network, or a copy of ``ntk`` if the pass stopped early, if
+        ``inplace`` is ``False``. Otherwise ``None``.
+
+    Raises:
+        ValueError: If ``time_limit`` is not positive.
+        KeyboardInterrupt: If interrupted by Ctrl-C.
     """
 
+@overload
 def balancing(
     ntk: aigverse.networks.Aig,
     *,
@@ -155,9 +579,39 @@ def balancing(
     rebalance_function: Literal["sop", "esop"] = "sop",
     sop_both_phases: bool = True,
     verbose: bool = False,
-) -> aigverse.networks.Aig:
+    inplace: Literal[False] = False,
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
+) -> aigverse.networks.Aig: ...
+@overload
+def balancing(
+    ntk: aigverse.networks.Aig,
+    *,
+    cut_size: int = 4,
+    cut_limit: int = 8,
+    minimize_truth_table: bool = True,
+    only_on_critical_path: bool = False,
+    rebalance_function: Literal["sop", "esop"] = "sop",
+    sop_both_phases: bool = True,
+    verbose: bool = False,
+    inplace: Literal[True],
+    time_limit: float | None = None,
+    cancellation_token: CancellationToken | None = None,
+    statistics: PassStatistics | None = None,
+) -> None:
     """Balances a network using SOP or ESOP-based local restructuring.
 
+    The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+    all of which are checked before each cut is rebalanced. Since the balanced network is
+    only assembled once all nodes are processed, a pass stopped early returns a copy of
+    ``ntk``.
+
+    Balancing always builds a new network. With ``inplace``, ``ntk`` takes it over instead
+    of a new object being returned, which frees the memory of the original network during
+    the call unless another network still shares it. A pass stopped early then leaves
+    ``ntk`` unchanged without copying it.
+
     Args:
         ntk: The input logic network.
         cut_size: Maximum cut size used during cut enumeration.
@@ -168,12 +622,22 @@ def balancing(
             ``"sop"`` and ``"esop"``.
         sop_both_phases: Whether to consider both phases in SOP/ESOP balancing.
         verbose: Whether to print verbose progress output.
+        inplace: Whether to replace ``ntk`` by the balanced network.
+        time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+            limit.
+        cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+        statistics: If given, filled with the statistics of this run. Its ``times`` hold
+            ``"cut_enumeration"`` and ``"truth_tables"``, which stay 0 if the pass stopped
+            early. Its ``counts`` hold ``"candidates"``, the number of cuts rebalanced.
 
     Returns:
-        A new balanced network.
+        The balanced network, or a copy of ``ntk`` if the pass stopped early, if ``inplace``
+        is ``False``. Otherwise ``None``.
 
     Raises:
-        ValueError: If ``rebalance_function`` is not one of the supported values.
+        ValueError: If ``rebalance_function`` is not one of the supported values or
+            ``time_limit`` is not positive.
+        KeyboardInterrupt: If interrupted by Ctrl-C.
     """
 
 def simulate(ntk: aigverse.networks.Aig) -> list[aigverse.utils.TruthTable]:
@@ -268,3 +732,599 @@ def simulate_sequential(
     Raises:
         ValueError: If an assignment in ``stimulus`` does not have one value per primary input.
     """
+
+def enumerate_cuts(
+    ntk: aigverse.networks.Aig,
+    *,
+    cut_size: int = 4,
+    cut_limit: int = 8,
+    compute_truth: bool = True,
+    minimize_truth_table: bool = False,
+) -> dict:
+    """Enumerates the cuts of every node of the network.
+
+    A cut of a node is a set of nodes, its leaves, such that every path from a primary
+    input to the node passes through a leaf. The cuts are computed bottom-up by merging
+    the cuts of the fanins and keeping the best ``cut_limit - 1`` per node. Every node
+    additionally has its trivial cut consisting of itself, and the constant node has a
+    single cut without leaves.
+
+    The cuts are returned packed into flat NumPy arrays rather than as Python objects,
+    which keeps the call cheap on large networks. The cuts of node ``n`` are the rows
+    ``node_offsets[n]`` to ``node_offsets[n + 1]``, and the leaves of cut ``c`` are
+    ``leaves[cut_offsets[c]:cut_offsets[c + 1]]`` in ascending order::
+
+        cuts = enumerate_cuts(aig)
+        for c in range(cuts["node_offsets"][n], cuts["node_offsets"][n + 1]):
+            leaves = cuts["leaves"][cuts["cut_offsets"][c] : cuts["cut_offsets"][c + 1]]
+
+    The enumeration runs without holding the GIL.
+
+    Args:
+        ntk: The network to enumerate the cuts of. It is not modified.
+        cut_size: Maximum number of leaves of a cut, at most 16, or at most 6 if
+            ``compute_truth`` is set.
+        cut_limit: Maximum number of cuts retained per node, at most 25.
+        compute_truth: Also computes the function of each cut in terms of its leaves.
+        minimize_truth_table: Removes leaves the function of a cut does not depend on.
+            Only has an effect if ``compute_truth`` is set.
+
+    Returns:
+        A dictionary with ``node_offsets`` (shape ``(N + 1,)``), ``cut_offsets`` (shape
+        ``(C + 1,)``), and ``leaves`` (shape ``(L,)``), all of dtype ``int64``, where ``N``
+        is the number of nodes, ``C`` the total number of cuts, and ``L`` the total number
+        of leaves. If ``compute_truth`` is set, it also contains ``functions`` (shape
+        ``(C,)``, dtype ``uint64``), the truth table of each cut as a 64-bit word in which
+        leaf ``i`` is variable ``i`` and bits beyond ``2**k`` of a ``k``-leaf cut are 0.
+
+    Raises:
+        ValueError: If ``cut_size`` or ``cut_limit`` is out of range.
+    """
+
+def extract_cuts(
+    ntk: aigverse.networks.Aig,
+    roots: np.ndarray,
+    leaves: np.ndarray,
+    leaf_offsets: np.ndarray,
+    *,
+    compute_truth: bool = False,
+    compute_npn: bool = False,
+    workers: int | None = None,
+) -> dict:
+    """Encodes many cuts of a network as index lists in a single call.
+
+    This is the batch version of constructing an :class:`~aigverse.networks.AigCut` for
+    every cut and calling its ``to_index_list`` method, but it neither creates Python
+    objects per cut nor touches the network's visited flags. The cuts are encoded on a
+    native thread pool without holding the GIL.
+
+    Cut ``c`` is rooted at node ``roots[c]`` and has the leaves
+    ``leaves[leaf_offsets[c]:leaf_offsets[c + 1]]``, which is the layout
+    :func:`enumerate_cuts` returns its cuts in::
+
+        cuts = enumerate_cuts(aig)
+        roots = np.repeat(np.arange(len(cuts["node_offsets"]) - 1), np.diff(cuts["node_offsets"]))
+        encoded = extract_cuts(aig, roots, cuts["leaves"], cuts["cut_offsets"])
+
+    The results are packed the same way: the raw values of the index list of cut ``c``,
+    as returned by ``AigCut.to_index_list().raw()``, are
+    ``index_lists[index_list_offsets[c]:index_list_offsets[c + 1]]``.
+
+    Args:
+        ntk: The network the cuts belong to. It is not modified.
+        roots: Root node of each cut.
+        leaves: Leaf nodes of all cuts, concatenated.
+        leaf_offsets: Offsets of the leaves of each cut into ``leaves``, one more than there
+            are cuts.
+        compute_truth: Also computes the function of each cut in terms of its leaves, for
+            cuts of up to 16 leaves.
+        compute_npn: Also computes the NPN-canonical representative of the function of each
+            cut, for cuts of up to 6 leaves.
+        workers: Number of threads to encode the cuts on. Defaults to the number of hardware
+            threads.
+
+    Returns:
+        A dictionary with ``index_lists`` (dtype ``uint32``) and ``index_list_offsets``
+        (shape ``(C + 1,)``, dtype ``int64``). If ``compute_truth`` is set, it also contains
+        ``functions`` (dtype ``uint64``) and ``function_offsets`` (shape ``(C + 1,)``, dtype
+        ``int64``), the truth table of cut ``c`` being the 64-bit blocks
+        ``functions[function_offsets[c]:function_offsets[c + 1]]`` in which leaf ``i`` is
+        variable ``i``. If ``compute_npn`` is set, it also contains ``npn_classes`` (shape
+        ``(C,)``, dtype ``uint64``), the truth table of the canonical representative of each
+        cut's function.
+
+    Raises:
+        IndexError: If a root or leaf is not a node of the network.
+        ValueError: If ``leaf_offsets`` does not match ``roots`` and ``leaves``, if a cut has
+            too many leaves for the requested functions, or if a root depends on a primary
+            input that is not one of its leaves.
+    """
+
+def mffc_sizes(ntk: aigverse.networks.Aig) -> np.ndarray:
+    """Computes the size of the maximum fanout-free cone (MFFC) of every node.
+
+    The MFFC of a node consists of the node and all gates in its transitive fanin whose
+    every path to a primary output passes through the node, i.e., the gates that become
+    dangling once the node is removed. Its size is thus the number of AND gates an
+    optimization saves by replacing the node with an existing signal.
+
+    The sizes of all nodes are computed in a single call without holding the GIL, which
+    takes time proportional to the sum of the sizes rather than one traversal per node
+    from Python.
+
+    Args:
+        ntk: The network to compute the MFFC sizes of. It is not modified.
+
+    Returns:
+        The MFFC size of each node by node index (shape ``(N,)``, dtype ``int64``), which is
+        0 for the constant, the primary inputs, and dead nodes.
+    """
+
+def compute_windows(
+    ntk: aigverse.networks.Aig,
+    roots: np.ndarray | None = None,
+    *,
+    max_pis: int = 8,
+    max_divisors: int = 150,
+    skip_fanout_limit_for_roots: int = 1000,
+    skip_fanout_limit_for_divisors: int = 100,
+    preserve_depth: bool = False,
+) -> dict:
+    """Computes the reconvergence-driven windows :func:`aig_resubstitution` optimizes.
+
+    The window of a root gate consists of
+
+    - its leaves, a reconvergence-driven cut of at most ``max_pis`` nodes,
+    - its divisors, the leaves followed by the nodes between the leaves and the root that
+      are not in the root's MFFC, extended by nodes in the fanout of the divisors whose
+      fanins are all divisors, and
+    - its MFFC, the gates of the root's maximum fanout-free cone within the leaves, which
+      ends with the root.
+
+    A resubstitution re-expresses the root in terms of divisors, which frees its MFFC.
+
+    All windows are computed in a single call without holding the GIL and returned packed
+    into flat NumPy arrays: window ``w`` belongs to ``roots[w]``, its leaves are
+    ``leaves[leaf_offsets[w]:leaf_offsets[w + 1]]``, and its divisors and MFFC are laid
+    out in the same way.
+
+    The windows are computed by the divisor collector of :func:`aig_resubstitution`, which
+    keeps its marks in the network itself: the call overwrites the values and traversal
+    marks of the nodes, and it temporarily decrements the fanout reference counts of the
+    MFFC gates while collecting them. The fanout counts are restored before the call
+    returns, and the network's structure, i.e., its nodes, fanins, and outputs, is not
+    modified. As all of this happens without holding the GIL, the call is not
+    thread-safe: no other call, e.g., :class:`~aigverse.networks.AigCut` or
+    :func:`mffc_sizes`, may use the same network concurrently.
+
+    Args:
+        ntk: The network to compute windows in. Its structure is not modified.
+        roots: Gates to compute windows for. Defaults to all gates in topological order.
+        max_pis: Maximum number of leaves of a window.
+        max_divisors: Maximum number of divisors and MFFC gates of a window. Roots whose
+            window exceeds this before its fanout extension get no window.
+        skip_fanout_limit_for_roots: Roots with more fanouts get no window.
+        skip_fanout_limit_for_divisors: Divisors with more fanouts are not extended.
+        preserve_depth: Extends the divisors only by nodes whose level does not exceed the
+            root's.
+
+    Returns:
+        A dictionary with ``roots``, ``leaves``, ``leaf_offsets``, ``divisors``,
+        ``divisor_offsets``, ``mffcs``, and ``mffc_offsets``, all of dtype ``int64``. Roots
+        that get no window are left out of ``roots``.
+
+    Raises:
+        IndexError: If a root is not a node of the network.
+        ValueError: If a root is not a gate, ``max_pis`` is 0, or ``max_divisors`` is less
+            than ``max_pis``.
+    """
+
+def topological_order(ntk: aigverse.networks.Aig) -> np.ndarray:
+    """Orders the live nodes of a network topologically.
+
+    Node indices are topological for networks built gate by gate, but not after nodes were
+    substituted in place, e.g., by :func:`aig_resubstitution` or :func:`sop_refactoring`
+    with ``cleanup=False``, which can make gates depend on nodes of higher index. The order
+    is computed by a depth-first search without holding the GIL and coincides with index
+    order whenever that is topological.
+
+    Args:
+        ntk: The network to order.
+
+    Returns:
+        The indices of all live nodes, including the constant and the primary inputs, with
+        every node after its fanins, as an ``int64`` array.
+    """
+
+def node_levels(ntk: aigverse.networks.Aig) -> np.ndarray:
+    """Computes the level of every node.
+
+    The level of a node is the length of a longest path to it from a primary input or the
+    constant, i.e., the number of gates on that path including the node itself. Unlike
+    :class:`~aigverse.networks.DepthAig`, which only levels the nodes in the transitive fanin
+    of the outputs, this also levels dangling gates. The levels are computed in a single
+    pass over the nodes in topological order without holding the GIL.
+
+    Args:
+        ntk: The network to level.
+
+    Returns:
+        The level of each node by node index (shape ``(N,)``, dtype ``int64``), which is 0
+        for the constant, the primary inputs, and dead nodes.
+    """
+
+def transitive_fanin(ntk: aigverse.networks.Aig, roots: np.ndarray) -> np.ndarray:
+    """Computes the transitive fanin of a set of nodes.
+
+    The transitive fanin consists of the roots and all nodes they depend on, down to the
+    constant and primary inputs. It is collected without holding the GIL.
+
+    Args:
+        ntk: The network to traverse.
+        roots: Indices of the nodes to start from.
+
+    Returns:
+        The indices of the nodes in the transitive fanin, including the roots, in ascending
+        order as an ``int64`` array. Index order is only topological if no nodes were
+        substituted in place; see :func:`topological_order`.
+
+    Raises:
+        IndexError: If a root is not a node of the network.
+        ValueError: If a root is dead.
+    """
+
+def transitive_fanout(ntk: aigverse.networks.Aig, roots: np.ndarray) -> dict:
+    """Computes the transitive fanout of a set of nodes.
+
+    The transitive fanout consists of the roots and all gates that depend on them, together
+    with the primary outputs those nodes drive. It is collected in a single pass over the
+    nodes in topological order without holding the GIL and without a fanout view.
+
+    Args:
+        ntk: The network to traverse.
+        roots: Indices of the nodes to start from.
+
+    Returns:
+        A dictionary with ``nodes``, the indices of the nodes in the transitive fanout,
+        including the roots, in ascending order, and ``outputs``, the indices of the primary
+        outputs driven by any of them in ascending order, both of dtype ``int64``.
+
+    Raises:
+        IndexError: If a root is not a node of the network.
+        ValueError: If a root is dead.
+    """
+
+def critical_path(ntk: aigverse.networks.Aig) -> dict:
+    """Computes a longest path from a primary input or the constant to a primary output.
+
+    The levels of all nodes are computed in a single pass over the nodes in topological
+    order without holding the GIL, and the path is traced back from the driver of the
+    first output of maximum level through the first fanin one level below, so that every
+    step goes through a gate.
+
+    Args:
+        ntk: The network to traverse.
+
+    Returns:
+        A dictionary with ``nodes``, the indices of the nodes on the path from its source to
+        the output driver (dtype ``int64``), whose length is the depth of the network plus
+        one, and ``output``, the index of the primary output the path ends at. If the network
+        has no primary outputs, the path ends at the first node of maximum level instead and
+        ``output`` is -1.
+    """
+
+class PipelineStep:
+    """Records the network after one pass of a :func:`run_pipeline` recipe."""
+
+    @property
+    def name(self) -> str:
+        """Name of the pass."""
+
+    @property
+    def num_gates(self) -> int:
+        """Number of AND gates after the pass."""
+
+    @property
+    def depth(self) -> int:
+        """Number of levels after the pass."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the pass took."""
+
+class PipelineResult:
+    """Represents the outcome of running a recipe with :func:`run_pipeline`.
+
+    ``steps`` holds one entry per recipe entry, in order, so ``steps[-1]`` describes the
+    network after the last pass. Size and depth are measured on the live logic only, which
+    is what the final ``network`` ends up with once its dangling nodes are removed.
+    """
+
+    @property
+    def network(self) -> aigverse.networks.Aig:
+        """The optimized network."""
+
+    @property
+    def steps(self) -> list[PipelineStep]:
+        """One record per pass, in recipe order."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the whole recipe took, including the final cleanup."""
+
+    def __len__(self) -> int: ...
+
+def run_pipeline(
+    ntk: aigverse.networks.Aig, recipe: Sequence[str | tuple[str, Mapping[str, object]]]
+) -> PipelineResult:
+    """Runs a sequence of optimization passes on a network in a single native call.
+
+    Chaining :func:`aig_cut_rewriting`, :func:`aig_resubstitution`, :func:`sop_refactoring`,
+    :func:`balancing`, and :func:`cleanup_dangling` from Python copies and cleans up the
+    network after every step and returns to the interpreter in between. This function
+    instead runs all passes back to back on one working network without holding the GIL,
+    copies the input at most once, and removes dangling nodes once at the end. The only
+    other cleanups happen ahead of :func:`aig_cut_rewriting` and :func:`balancing`, which
+    need a clean network, and only if an in-place pass ran since the last one.
+
+    Each recipe entry is either the name of one of these functions or a ``(name, params)``
+    tuple, where ``params`` is a mapping of that function's keyword arguments. ``inplace``
+    and ``cleanup`` are not accepted, and parameters that are not given take the
+    function's defaults.
+
+    Args:
+        ntk: The input logic network. It is left unchanged.
+        recipe: The passes to run, in order.
+
+    Returns:
+        The optimized network together with the size, depth, and runtime after every pass.
+
+    Raises:
+        TypeError: If an entry is not a name or a ``(name, params)`` tuple, or a parameter
+            has the wrong type.
+        ValueError: If an entry names an unknown pass or parameter, or an unknown
+            ``rebalance_function``.
+        RuntimeError: If a pass fails in the underlying synthesis engine.
+    """
+
+class PortfolioCandidate:
+    """Records how one recipe of a :func:`run_portfolio` call went."""
+
+    @property
+    def index(self) -> int:
+        """Position of the recipe in the portfolio."""
+
+    @property
+    def steps(self) -> list[PipelineStep]:
+        """One record per pass that ran, in recipe order.
+
+        Shorter than the recipe if the candidate was cancelled.
+        """
+
+    @property
+    def num_gates(self) -> int:
+        """Number of AND gates the candidate ended with, or had when it was cancelled."""
+
+    @property
+    def depth(self) -> int:
+        """Number of levels the candidate ended with, or had when it was cancelled."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the candidate took."""
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the candidate was cancelled before finishing its recipe."""
+
+class PortfolioResult:
+    """Represents the outcome of running several recipes with :func:`run_portfolio`.
+
+    ``candidates`` holds one entry per recipe, in portfolio order, and ``candidates[best]``
+    describes the recipe that produced ``network``.
+    """
+
+    @property
+    def network(self) -> aigverse.networks.Aig:
+        """The network produced by the best recipe."""
+
+    @property
+    def best(self) -> int:
+        """Position of the best recipe in the portfolio."""
+
+    @property
+    def candidates(self) -> list[PortfolioCandidate]:
+        """One record per recipe, in portfolio order."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the whole portfolio took."""
+
+    def __len__(self) -> int: ...
+
+def run_portfolio(
+    ntk: aigverse.networks.Aig,
+    recipes: Sequence[Sequence[str | tuple[str, Mapping[str, object]]]],
+    *,
+    cost: Literal["size", "depth", "size_then_depth", "depth_then_size"] = "size_then_depth",
+    margin: float | None = None,
+    workers: int | None = None,
+) -> PortfolioResult:
+    """Runs several recipes on a network concurrently and keeps the best result.
+
+    Each recipe is a list of passes in the format :func:`run_pipeline` accepts. Every
+    candidate works on its own copy of ``ntk`` and runs on a native thread pool without
+    holding the GIL, so trying several parameter sets costs no Python-side orchestration.
+
+    Candidates are ranked by ``cost``. ``"size"`` and ``"depth"`` compare the number of AND
+    gates or levels alone, while ``"size_then_depth"`` and ``"depth_then_size"`` break ties
+    on the other criterion. Remaining ties go to the recipe listed first, so the winner
+    does not depend on which thread finished first.
+
+    With ``margin`` set, a running candidate is cancelled between two of its passes once
+    its primary criterion exceeds that of the best finished candidate by more than
+    ``margin`` (relative), since it is then unlikely to win. This is a heuristic: a later
+    pass may recover such a gap, so pruning trades the guarantee of finding the best
+    recipe for time. Without ``margin``, every candidate runs to completion.
+
+    Args:
+        ntk: The input logic network. It is left unchanged.
+        recipes: The candidate recipes.
+        cost: How candidates are ranked. Supported values are ``"size"``, ``"depth"``,
+            ``"size_then_depth"``, and ``"depth_then_size"``.
+        margin: Relative gap to the best finished candidate past which a running
+            candidate is cancelled, e.g., ``0.1`` for 10%. ``None`` disables cancellation.
+        workers: Maximum number of threads, or ``None`` for the number of CPUs.
+
+    Returns:
+        The best network, the position of its recipe, and a record of every candidate.
+
+    Raises:
+        TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+        ValueError: If ``recipes`` is empty, a recipe names an unknown pass or parameter,
+            ``cost`` is unknown, ``margin`` is negative, or ``workers`` is 0.
+        RuntimeError: If a pass fails in the underlying synthesis engine.
+    """
+
+class PartitionedResult:
+    """Represents the outcome of optimizing a network with :func:`run_partitioned`."""
+
+    @property
+    def network(self) -> aigverse.networks.Aig:
+        """The optimized network."""
+
+    @property
+    def num_partitions(self) -> int:
+        """Number of partitions the network was split into."""
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the whole call took, including partitioning and stitching."""
+
+def run_partitioned(
+    ntk: aigverse.networks.Aig,
+    recipe: Sequence[str | tuple[str, Mapping[str, object]]],
+    *,
+    max_partition_size: int = 10000,
+    max_partition_inputs: int = 1000,
+    workers: int | None = None,
+) -> PartitionedResult:
+    """Optimizes a network partition by partition on a native thread pool.
+
+    The optimization passes are single-threaded, so on very large networks this function
+    splits the live logic into partitions, runs ``recipe`` on every partition concurrently
+    without holding the GIL, and stitches the optimized partitions back together with
+    structural hashing. ``recipe`` takes the format :func:`run_pipeline` accepts, so a single
+    pass is a one-entry recipe such as ``["aig_resubstitution"]``.
+
+    Partitions are formed from consecutive gates in topological order and hold at most
+    ``max_partition_size`` gates and ``max_partition_inputs`` signals entering from
+    outside. Passes cannot optimize across partition boundaries, so smaller partitions
+    parallelize better but leave more optimization potential on the table. A network
+    within both limits forms a single partition.
+
+    Every pass that runs on a partition is recorded by an active
+    :class:`StatisticsCollector` as a run of its own.
+
+    Args:
+        ntk: The input logic network. It is left unchanged.
+        recipe: The passes to run on every partition, in order.
+        max_partition_size: Maximum number of AND gates per partition.
+        max_partition_inputs: Maximum number of signals entering a partition.
+        workers: Maximum number of threads, or ``None`` for the number of CPUs.
+
+    Returns:
+        The optimized network and the number of partitions.
+
+    Raises:
+        TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+        ValueError: If a recipe entry names an unknown pass or parameter, a
+            ``cleanup_dangling`` entry removes primary inputs or outputs,
+            ``max_partition_size`` is 0, ``max_partition_inputs`` is less than 2, or
+            ``workers`` is 0.
+        RuntimeError: If a pass fails in the underlying synthesis engine.
+    """
+
+class ConvergenceResult:
+    """Represents the outcome of repeating a recipe with :func:`run_until_convergence`.
+
+    ``num_gates`` starts with the size of the input and holds one more entry per iteration,
+    so ``gains[i]`` is the relative reduction from ``num_gates[i]`` to ``num_gates[i + 1]``.
+    """
+
+    @property
+    def network(self) -> aigverse.networks.Aig:
+        """The smallest network found.
+
+        This is the network after the last iteration that reduced the number of AND gates.
+        """
+
+    @property
+    def num_gates(self) -> list[int]:
+        """Number of AND gates of the input, followed by the number after every iteration."""
+
+    @property
+    def gains(self) -> list[float]:
+        """Relative reduction in AND gates achieved by every iteration.
+
+        Negative if an iteration grew the network.
+        """
+
+    @property
+    def num_iterations(self) -> int:
+        """Number of iterations run."""
+
+    @property
+    def stop_reason(self) -> Literal["converged", "max_iterations", "time_budget"]:
+        """Why the loop ended.
+
+        ``"converged"`` if an iteration gained less than ``min_gain``, ``"max_iterations"``
+        if the iteration limit was reached, or ``"time_budget"`` if the budget was spent.
+        """
+
+    @property
+    def runtime(self) -> float:
+        """Wall-clock seconds the loop took."""
+
+    def __len__(self) -> int: ...
+
+def run_until_convergence(
+    ntk: aigverse.networks.Aig,
+    recipe: Sequence[str | tuple[str, Mapping[str, object]]],
+    *,
+    max_iterations: int = 10,
+    min_gain: float = 0.0,
+    time_budget: float | None = None,
+) -> ConvergenceResult:
+    """Repeats a recipe on a network until it stops reducing the number of AND gates.
+
+    The loop runs natively without holding the GIL. Unlike repeating individual passes
+    from Python, no iteration crosses the binding, and each copies the network at most
+    once and cleans it up once rather than after every pass.
+
+    Every iteration runs the whole ``recipe`` on the best network so far. The loop ends
+    when an iteration removes no gates or less than ``min_gain`` of them, after
+    ``max_iterations`` iterations, or once ``time_budget`` has passed, whichever comes
+    first. The budget is checked between iterations, so the one in progress when it
+    runs out still finishes.
+
+    Args:
+        ntk: The input logic network. It is left unchanged.
+        recipe: The passes to repeat, in the format :func:`run_pipeline` accepts.
+        max_iterations: Maximum number of iterations.
+        min_gain: Minimum relative reduction in AND gates, e.g., ``0.01`` for 1%, an
+            iteration must achieve for the loop to continue.
+        time_budget: Wall-clock seconds after which no further iteration is started, or
+            ``None`` for no limit.
+
+    Returns:
+        The smallest network found, together with its size and the relative gain after
+        every iteration.
+
+    Raises:
+        TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+        ValueError: If ``recipe`` is empty or names an unknown pass or parameter,
+            ``max_iterations`` is 0, ``min_gain`` is negative, or ``time_budget`` is not
+            positive.
+        RuntimeError: If a pass fails in the underlying synthesis engine.
+    """
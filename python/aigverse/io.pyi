@@ -4,8 +4,11 @@ The module contains readers and writers for common file formats in the domain.
 """
 
 import os
+import pathlib
 from typing import overload
 
+from typing_extensions import Self
+
 import aigverse.networks
 
 def read_aiger_into_aig(filename: str | os.PathLike) -> aigverse.networks.NamedAig:
@@ -112,3 +115,178 @@ def write_dot(ntk: aigverse.networks.Aig, filename: str | os.PathLike) -> None:
             ntk: The network to serialize.
             filename: Destination path for the DOT file.
     """
+
+class CorpusWriter:
+    """Appends networks to a memory-mappable corpus.
+
+    A corpus packs many networks as index lists into one data file, ``filename``, and keeps
+    an offset table with their metadata in a second file, ``filename + ".idx"``, from which
+    :class:`CorpusReader` accesses any network in constant time. Opening an existing corpus
+    appends to it; records are only ever appended, so any number of processes can read a
+    corpus while one writer extends it. Written networks become visible to readers after
+    :meth:`flush` or :meth:`close` and a :meth:`CorpusReader.refresh`.
+
+    Only one writer may append to a corpus at a time.
+    """
+
+    def __init__(self, filename: str | os.PathLike, *, truth_table_hashes: bool = False) -> None:
+        """Creates a corpus or opens an existing one for appending.
+
+        Args:
+            filename: Path to the data file of the corpus.
+            truth_table_hashes: Whether to store a hash of the output truth tables of each
+                network with at most 16 primary inputs. Networks are simulated to compute it.
+
+        Raises:
+            ValueError: If only one of the two corpus files exists or they are not corpus files.
+            RuntimeError: If the files cannot be opened.
+        """
+
+    def append(self, ntk: aigverse.networks.Aig, name: str | None = None) -> int:
+        """Appends a network to the corpus.
+
+        Only the combinational structure is stored, as by :meth:`~aigverse.networks.Aig.to_index_list`.
+
+        Args:
+            ntk: The network to append.
+            name: Name to store with the network. Defaults to the network name of a
+                :class:`~aigverse.networks.NamedAig` and to no name otherwise.
+
+        Returns:
+            The index of the network in the corpus.
+
+        Raises:
+            TypeError: If ``ntk`` is a :class:`~aigverse.networks.SequentialAig`.
+            ValueError: If the writer is closed or ``ntk`` has dead nodes or primary inputs
+                created after gates, which index lists cannot represent.
+            RuntimeError: If writing to the corpus fails.
+        """
+
+    def flush(self) -> None:
+        """Writes all buffered networks to the corpus files.
+
+        Raises:
+            ValueError: If the writer is closed.
+            RuntimeError: If writing to the corpus fails.
+        """
+
+    def close(self) -> None:
+        """Writes all buffered networks and closes the corpus files.
+
+        Closing a closed writer has no effect.
+
+        Raises:
+            RuntimeError: If writing to the corpus fails.
+        """
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer is closed."""
+
+    @property
+    def filename(self) -> pathlib.Path:
+        """Path to the data file of the corpus."""
+
+    def __len__(self) -> int:
+        """Returns the number of networks in the corpus."""
+
+    def __enter__(self) -> Self: ...
+    def __exit__(self, *args: object) -> None: ...
+
+class CorpusReader:
+    """Reads networks from a memory-mapped corpus written by :class:`CorpusWriter`.
+
+    Both corpus files are memory-mapped, so opening a corpus is cheap regardless of its
+    size, any network is decoded in constant time, and processes that read the same corpus
+    share its pages in the operating system's cache. Readers can be pickled, e.g., to pass
+    them to the worker processes of a data loader, which then map the corpus themselves.
+
+    A reader sees the networks that were written when it was opened or last refreshed.
+    """
+
+    def __init__(self, filename: str | os.PathLike) -> None:
+        """Opens a corpus for reading.
+
+        Args:
+            filename: Path to the data file of the corpus.
+
+        Raises:
+            ValueError: If the files are not corpus files.
+            RuntimeError: If the files cannot be opened or mapped.
+        """
+
+    def refresh(self) -> int:
+        """Maps the corpus files anew to see the networks appended since they were mapped.
+
+        This also reopens a closed reader.
+
+        Returns:
+            The number of networks in the corpus.
+
+        Raises:
+            ValueError: If the files are not corpus files.
+            RuntimeError: If the files cannot be opened or mapped.
+        """
+
+    def close(self) -> None:
+        """Unmaps the corpus files."""
+
+    def __getitem__(self, index: int) -> aigverse.networks.Aig:
+        """Decodes one network of the corpus.
+
+        Args:
+            index: Index of the network. Negative indices are supported.
+
+        Returns:
+            The decoded network.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If the reader is closed or the record of the network is corrupted.
+        """
+
+    def index_list(self, index: int) -> aigverse.networks.AigIndexList:
+        """Returns the index list of one network of the corpus without decoding it.
+
+        Args:
+            index: Index of the network. Negative indices are supported.
+
+        Returns:
+            The index list of the network.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If the reader is closed or the record of the network is corrupted.
+        """
+
+    def metadata(self, index: int) -> dict:
+        """Returns the metadata of one network of the corpus without decoding it.
+
+        Args:
+            index: Index of the network. Negative indices are supported.
+
+        Returns:
+            A dictionary with the ``name`` of the network, or ``None`` if it has none, its
+            ``num_pis``, ``num_pos``, and ``num_gates``, and its ``truth_table_hash``, a 64-bit
+            FNV-1a hash of the bits of its output truth tables, or ``None`` if the writer did not
+            compute one.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If the reader is closed or the record of the network is corrupted.
+        """
+
+    @property
+    def filename(self) -> pathlib.Path:
+        """Path to the data file of the corpus."""
+
+    def __len__(self) -> int:
+        """Returns the number of networks in the corpus."""
+
+    def __enter__(self) -> Self: ...
+    def __exit__(self, *args: object) -> None: ...
+    def __getstate__(self) -> tuple[pathlib.Path]:
+        """Returns pickle state as a tuple holding the path of the corpus."""
+
+    def __setstate__(self, state: tuple[pathlib.Path]) -> None:
+        """Opens the corpus at the pickled path."""
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, NoReturn, overload
 if TYPE_CHECKING:
     import networkx as nx
     import numpy as np
+    import scipy.sparse as sp
 
 class NodeTensorEncoding(enum.Enum):
     """Node encoding mode for exported graph tensors.
@@ -46,6 +47,20 @@ class EdgeTensorEncoding(enum.Enum):
     ONE_HOT = 2
     """One-hot edge labels in [regular, inverted] order."""
 
+class SparseLayout(enum.Enum):
+    """Compressed layout of exported sparse adjacency matrices.
+
+    Both layouts describe the matrix whose entry `(u, v)` is the edge from node `u` to node `v`.
+    - `CSR`: Rows are compressed, so row `u` lists the fanouts of node `u`.
+    - `CSC`: Columns are compressed, so column `v` lists the fanins of node `v`.
+    """
+
+    CSR = 0
+    """Compressed sparse rows, i.e., fanout lists."""
+
+    CSC = 1
+    """Compressed sparse columns, i.e., fanin lists."""
+
 class AigSignal:
     """Represents a signal in an AIG.
 
@@ -395,6 +410,31 @@ class Aig:
                     PO nodes (only for :class:`~aigverse.NamedAig`).
             """
 
+        def to_scipy_sparse(
+            self,
+            layout: SparseLayout = ...,
+            edge_encoding: EdgeTensorEncoding = ...,
+        ) -> sp.csr_array | sp.csc_array:
+            """Converts an :class:`~aigverse.Aig` to a SciPy sparse adjacency matrix.
+
+            The matrix wraps the arrays of :meth:`~aigverse.networks.Aig.to_sparse_adjacency`
+            without copying them, so row ``u`` of a CSR matrix lists the fanouts of node ``u``
+            and column ``v`` of a CSC matrix lists the fanins of node ``v``. Synthetic primary
+            output nodes follow the regular nodes, as in :func:`to_networkx`.
+
+            Args:
+                self: The AIG object to convert.
+                layout: The compressed layout, which also determines the matrix type.
+                    Defaults to :attr:`~aigverse.networks.SparseLayout.CSR`.
+                edge_encoding: Encoding of the edge polarity in the stored values, either
+                    ``SIGNED`` (+1 for regular, -1 for inverted edges) or ``BINARY`` (explicit
+                    zeros for regular and ones for inverted edges). Defaults to ``SIGNED``.
+
+            Returns:
+                A :class:`~scipy.sparse.csr_array` or :class:`~scipy.sparse.csc_array` of
+                shape ``(N, N)`` with ``float32`` values and ``int64`` indices.
+            """
+
     def to_graph_tensors(
         self,
         node_encoding: NodeTensorEncoding = ...,
@@ -430,6 +470,32 @@ class Aig:
             (shape ``(N, D_node)``, dtype ``float32``).
         """
 
+    def to_sparse_adjacency(self, layout: SparseLayout = ..., edge_encoding: EdgeTensorEncoding = ...) -> dict:
+        """Exports the adjacency matrix in a compressed sparse layout.
+
+        Entry ``(u, v)`` of the ``(N, N)`` matrix is the edge from node ``u`` to node ``v``,
+        where ``N`` is ``size`` plus the number of primary outputs: rows and columns below
+        ``size`` are node indices, in which dead nodes have no entries, and ``size + k`` is the
+        synthetic node of output ``k``, as in :meth:`to_graph_tensors`. The arrays follow the
+        conventions of ``scipy.sparse`` and are filled directly from the network rather than
+        converted from COO: ``CSC`` columns are the fanin lists, and ``CSR`` rows are the
+        fanout lists, counted first and then scattered. The indices of every row or column are
+        sorted.
+
+        Args:
+            layout: Compressed layout as :class:`~aigverse.networks.SparseLayout`.
+            edge_encoding: Encoding of the edge polarity in ``data``, ``SIGNED`` or ``BINARY``.
+                ``BINARY`` stores regular edges as explicit zeros.
+
+        Returns:
+            A dictionary with ``indptr`` (shape ``(N + 1,)``, dtype ``int64``), ``indices``
+            (shape ``(E,)``, dtype ``int64``), ``data`` (shape ``(E,)``, dtype ``float32``), and
+            ``shape``, the tuple ``(N, N)``.
+
+        Raises:
+            ValueError: If ``edge_encoding`` is ``ONE_HOT``.
+        """
+
     def __len__(self) -> int:
         """Returns the number of nodes."""
 
@@ -518,6 +584,23 @@ class NamedAig(Aig):
     def get_output_name(self, index: int) -> str:
         """Returns the name of output ``index``."""
 
+    def get_signal_names(self) -> dict[AigSignal, str]:
+        """Returns the names of all named signals.
+
+        Looks up every node in both polarities in a single call, which is considerably faster
+        than calling :meth:`has_name` and :meth:`get_name` for each signal from Python.
+
+        Returns:
+            A dictionary mapping each named signal to its name.
+        """
+
+    def get_output_names(self) -> dict[int, str]:
+        """Returns the names of all named primary outputs.
+
+        Returns:
+            A dictionary mapping the index of each named primary output to its name.
+        """
+
 class DepthAig(Aig):
     """Extends a network with depth information."""
 
@@ -824,6 +907,9 @@ class SequentialAig(Aig):
     ) -> NoReturn:
         """Sequential networks cannot be exported as combinational graph tensors."""
 
+    def to_sparse_adjacency(self, layout: SparseLayout = ..., edge_encoding: EdgeTensorEncoding = ...) -> NoReturn:
+        """Sequential networks cannot be exported as combinational adjacency matrices."""
+
     def __getstate__(self) -> NoReturn:
         """Sequential networks are not pickleable via combinational index-list state."""
 
@@ -955,6 +1041,19 @@ class AigEdgeList:
             edges: Initial edge collection.
         """
 
+    @overload
+    def __init__(self, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray | None = None) -> None:
+        """Creates an edge list from columns of edge data.
+
+        Args:
+            sources: Source node identifier of each edge.
+            targets: Target node identifier of each edge.
+            weights: Weight of each edge. Defaults to ``0`` for all edges.
+
+        Raises:
+            ValueError: If the arrays differ in length or an endpoint is negative.
+        """
+
     @property
     def ntk(self) -> Aig:
         """Underlying network associated with this list."""
@@ -967,6 +1066,22 @@ class AigEdgeList:
 
     @edges.setter
     def edges(self, arg: Sequence[AigEdge], /) -> None: ...
+    @property
+    def sources(self) -> np.ndarray:
+        """Source node identifier of each edge as a new ``int64`` array.
+
+        Unlike :attr:`edges`, which creates one Python object per edge, this gathers the field
+        of all edges natively. The array is a copy, so it stays valid when the list changes.
+        """
+
+    @property
+    def targets(self) -> np.ndarray:
+        """Target node identifier of each edge as a new ``int64`` array."""
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Weight of each edge as a new ``int64`` array."""
+
     def append(self, edge: AigEdge) -> None:
         """Appends an edge to the list.
 
@@ -1008,7 +1123,11 @@ class AigEdgeList:
         """
 
 class AigIndexList:
-    """Represents an index-list encoding of an AIG network."""
+    """Represents an index-list encoding of an AIG network.
+
+    Index lists implement NumPy's array protocol, so ``numpy.asarray(index_list)``
+    returns their raw values as a ``uint32`` array.
+    """
 
     @overload
     def __init__(self, num_pis: int = 0) -> None:
@@ -1018,6 +1137,14 @@ class AigIndexList:
             num_pis: Number of primary inputs to initialize.
         """
 
+    @overload
+    def __init__(self, values: np.ndarray) -> None:
+        """Creates an index list from an array of raw values.
+
+        Args:
+            values: Raw index-list encoding values as a ``uint32`` array.
+        """
+
     @overload
     def __init__(self, values: Sequence[int]) -> None:
         """Creates an index list from raw integer values.
@@ -1132,3 +1259,113 @@ class AigIndexList:
 
     def __len__(self) -> int:
         """Returns the number of raw encoding entries."""
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        """Returns the raw encoding values as a new NumPy array.
+
+        Args:
+            dtype: Data type of the array. Defaults to ``uint32``.
+            copy: Must not be ``False``, since the values are always copied.
+
+        Returns:
+            The raw values of the index list.
+
+        Raises:
+            ValueError: If ``copy`` is ``False``.
+        """
+
+def encode_index_lists(ntks: Sequence[Aig], *, workers: int | None = None) -> dict:
+    """Encodes many networks as index lists in a single call.
+
+    This is the batch version of :meth:`~aigverse.networks.Aig.to_index_list`. The networks
+    are encoded on a pool of threads without holding the GIL, and the raw values of all
+    index lists are concatenated into one buffer, in the layout that
+    :func:`~aigverse.algorithms.extract_cuts` uses as well.
+
+    Args:
+        ntks: The networks to encode.
+        workers: Maximum number of threads. Defaults to the number of hardware threads.
+
+    Returns:
+        A dictionary with ``index_lists``, the raw values of all index lists (dtype
+        ``uint32``), and ``index_list_offsets`` (shape ``(len(ntks) + 1,)``, dtype
+        ``int64``), such that the index list of network ``i`` is
+        ``index_lists[index_list_offsets[i]:index_list_offsets[i + 1]]``.
+
+    Raises:
+        TypeError: If a network is a :class:`~aigverse.networks.SequentialAig`.
+        ValueError: If ``workers`` is 0 or a network has dead nodes or primary inputs
+            created after gates, which index lists cannot represent.
+    """
+
+def decode_index_lists(
+    index_lists: np.ndarray, index_list_offsets: np.ndarray, *, workers: int | None = None
+) -> list[Aig]:
+    """Decodes many index lists stored in one buffer into networks in a single call.
+
+    This is the batch version of :meth:`~aigverse.networks.AigIndexList.to_aig` and the
+    inverse of :func:`encode_index_lists`. The index lists are validated and decoded on a
+    pool of threads without holding the GIL.
+
+    Args:
+        index_lists: The raw values of all index lists (dtype ``uint32``).
+        index_list_offsets: Offsets of the index lists in ``index_lists`` (dtype ``int64``),
+            one more than there are index lists.
+        workers: Maximum number of threads. Defaults to the number of hardware threads.
+
+    Returns:
+        One decoded network per index list.
+
+    Raises:
+        ValueError: If ``workers`` is 0, the offsets are inconsistent, or an index list is
+            malformed, e.g., refers to a literal that is not defined before it.
+    """
+
+def from_graph_tensors(
+    edge_index: np.ndarray,
+    edge_attr: np.ndarray,
+    node_attr: np.ndarray,
+    node_encoding: NodeTensorEncoding = ...,
+    edge_encoding: EdgeTensorEncoding = ...,
+) -> dict:
+    """Builds an AIG from graph tensors in the layout of :meth:`Aig.to_graph_tensors`.
+
+    Every row of ``node_attr`` is a node whose type is read from its leading columns:
+    the rounded label with ``INTEGER`` encoding, or the largest positive entry among the
+    first four columns with ``ONE_HOT`` encoding. Every column of ``edge_index`` is an edge
+    from a source row to a target row whose polarity is read from ``edge_attr``: above
+    0.5 with ``BINARY``, negative with ``SIGNED``, and a larger inverted than regular
+    entry with ``ONE_HOT`` encoding. Any further feature columns are ignored, so the
+    output of a model that predicts scores rather than exact labels can be passed as is.
+
+    The rows may come in any order. Constant rows map to the constant-0 node, primary
+    input and output rows become primary inputs and outputs in row order, and gate rows
+    become AND gates, which are created in topological order with structural hashing.
+
+    The graph is validated in a single pass without holding the GIL. Structural
+    problems do not raise; instead, each is reported with the index of the offending node
+    row or edge column, and no network is built:
+
+    - ``"edge_out_of_range"``: an edge (edge index) has an endpoint that is not a row.
+    - ``"node_type"``: a row's type cannot be decoded.
+    - ``"fanin_count"``: a row does not have exactly two fanins as a gate, one as a
+      primary output, or none as a constant or primary input.
+    - ``"po_fanout"``: a primary output row drives another row.
+    - ``"cycle"``: a row lies on a cycle or on a path between two cycles.
+
+    Args:
+        edge_index: Source and target rows of the edges (shape ``(2, E)``).
+        edge_attr: Edge features (shape ``(E, D_edge)``).
+        node_attr: Node features (shape ``(N, D_node)``).
+        node_encoding: Node encoding of ``node_attr`` as :class:`~aigverse.networks.NodeTensorEncoding`.
+        edge_encoding: Edge encoding of ``edge_attr`` as :class:`~aigverse.networks.EdgeTensorEncoding`.
+
+    Returns:
+        A dictionary with ``ntk``, the built :class:`~aigverse.networks.Aig`, ``literals``,
+        the literal ``2 * node + complemented`` of the signal each row became (shape
+        ``(N,)``, dtype ``int64``, -1 for primary output rows), and ``problems``, a list of
+        ``(kind, index)`` pairs. ``ntk`` and ``literals`` are ``None`` if there are problems.
+
+    Raises:
+        ValueError: If the arrays' shapes do not match each other or the encodings.
+    """
@@ -1,9 +1,17 @@
 """Provides utility data structures and functions."""
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, overload
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class TruthTable:
-    """Represents a dynamic Boolean truth table."""
+    """Represents a dynamic Boolean truth table.
+
+    Truth tables implement NumPy's array protocol, so ``numpy.asarray(tt)`` returns one
+    Boolean per bit, and :attr:`blocks` views their 64-bit storage blocks without copying.
+    """
 
     def __init__(self, num_vars: int) -> None:
         """Creates a truth table with all bits initialized to ``0``.
@@ -12,6 +20,42 @@ class TruthTable:
             num_vars: Number of Boolean variables.
         """
 
+    @staticmethod
+    def from_bits(bits: np.ndarray) -> TruthTable:
+        """Creates a truth table from one value per bit.
+
+        Args:
+            bits: The bits in ascending order of their index, i.e., bit ``j`` is the value
+                under input assignment ``j``, as a Boolean array (shape ``(2**num_vars,)``).
+
+        Returns:
+            A truth table with ``log2(len(bits))`` variables.
+
+        Raises:
+            ValueError: If the number of bits is not a power of two.
+        """
+
+    @staticmethod
+    def from_blocks(blocks: np.ndarray, num_vars: int | None = None) -> TruthTable:
+        """Creates a truth table from its 64-bit storage blocks.
+
+        This is the inverse of :attr:`blocks`. Bit ``j`` of the truth table is bit ``j % 64``
+        of block ``j // 64``.
+
+        Args:
+            blocks: The blocks as a ``uint64`` array.
+            num_vars: Number of variables. Defaults to the number that fills all blocks, which
+                is at least 6; tables with fewer variables use only the lowest bits of their
+                single block, and the other bits are ignored.
+
+        Returns:
+            The truth table.
+
+        Raises:
+            ValueError: If the number of blocks does not match ``num_vars`` or, if it is not
+                given, is not a power of two.
+        """
+
     def __eq__(self, other: object) -> bool:
         """Checks equality with another truth table."""
 
@@ -86,6 +130,9 @@ class TruthTable:
 
         Returns:
             The updated truth table.
+
+        Raises:
+            ValueError: If ``other`` has a different number of variables.
         """
 
     def __hash__(self) -> int:
@@ -216,9 +263,45 @@ class TruthTable:
     def to_binary(self) -> str:
         """Returns the truth table as a binary string."""
 
+    @property
+    def blocks(self) -> np.ndarray:
+        """Read-only view of the 64-bit storage blocks, without copying them.
+
+        Bit ``j`` of the truth table is bit ``j % 64`` of block ``j // 64``. Tables with fewer
+        than 6 variables use only the lowest ``num_bits`` bits of their single block. The view
+        reflects later changes to the truth table and keeps it alive.
+        """
+
+    def to_numpy(self, bits: bool = True) -> np.ndarray:
+        """Returns the truth table as a new NumPy array.
+
+        Args:
+            bits: Whether to unpack the bits into one Boolean per bit (shape ``(num_bits,)``),
+                in ascending order of their index. Otherwise, returns a copy of :attr:`blocks`
+                (shape ``(num_blocks,)``, dtype ``uint64``). Defaults to ``True``.
+
+        Returns:
+            The bits or the blocks of the truth table.
+        """
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        """Returns the bits as a new NumPy array, one Boolean per bit.
+
+        Args:
+            dtype: Data type of the array. Defaults to ``bool``.
+            copy: Must not be ``False``, since the bits are always unpacked.
+
+        Returns:
+            The bits of the truth table in ascending order of their index.
+
+        Raises:
+            ValueError: If ``copy`` is ``False``.
+        """
+
     def to_hex(self) -> str:
         """Returns the truth table as a hexadecimal string."""
 
+@overload
 def ternary_majority(a: TruthTable, b: TruthTable, c: TruthTable) -> TruthTable:
     """Computes the ternary majority of three truth tables.
 
@@ -231,6 +314,27 @@ def ternary_majority(a: TruthTable, b: TruthTable, c: TruthTable) -> TruthTable:
         The bitwise majority truth table.
     """
 
+@overload
+def ternary_majority(
+    a: TruthTableArray | TruthTable, b: TruthTableArray | TruthTable, c: TruthTableArray | TruthTable
+) -> TruthTableArray:
+    """Computes the elementwise ternary majority of three truth table arrays.
+
+    The arrays broadcast, and single truth tables count as arrays of length 1.
+
+    Args:
+        a: First truth tables.
+        b: Second truth tables.
+        c: Third truth tables.
+
+    Returns:
+        The bitwise majority truth tables.
+
+    Raises:
+        ValueError: If the arrays differ in their number of variables or cannot be broadcast.
+    """
+
+@overload
 def cofactor0(tt: TruthTable, var_index: int) -> TruthTable:
     """Computes the cofactor with respect to assigning one variable to ``0``.
 
@@ -245,6 +349,22 @@ def cofactor0(tt: TruthTable, var_index: int) -> TruthTable:
         ValueError: If ``var_index`` is out of range.
     """
 
+@overload
+def cofactor0(tt: TruthTableArray, var_index: int) -> TruthTableArray:
+    """Computes the cofactors of an array of truth tables with respect to assigning one variable to ``0``.
+
+    Args:
+        tt: Input truth tables.
+        var_index: Index of the variable to cofactor.
+
+    Returns:
+        The cofactored truth tables with ``var_index`` fixed to ``0``.
+
+    Raises:
+        ValueError: If ``var_index`` is out of range.
+    """
+
+@overload
 def cofactor1(tt: TruthTable, var_index: int) -> TruthTable:
     """Computes the cofactor with respect to assigning one variable to ``1``.
 
@@ -258,3 +378,225 @@ def cofactor1(tt: TruthTable, var_index: int) -> TruthTable:
     Raises:
         ValueError: If ``var_index`` is out of range.
     """
+
+@overload
+def cofactor1(tt: TruthTableArray, var_index: int) -> TruthTableArray:
+    """Computes the cofactors of an array of truth tables with respect to assigning one variable to ``1``.
+
+    Args:
+        tt: Input truth tables.
+        var_index: Index of the variable to cofactor.
+
+    Returns:
+        The cofactored truth tables with ``var_index`` fixed to ``1``.
+
+    Raises:
+        ValueError: If ``var_index`` is out of range.
+    """
+
+class TruthTableArray:
+    """Represents a batch of truth tables with the same number of variables.
+
+    The truth tables are stored in one contiguous ``(len(self), num_blocks)`` matrix of
+    64-bit blocks, and all operations process the whole batch in native code without
+    holding the GIL. The bitwise operators ``&``, ``|``, ``^``, and ``~`` work elementwise
+    and broadcast like one-dimensional NumPy arrays: both operands have the same length,
+    or one of them has length 1 or is a single :class:`TruthTable`.
+
+    Like truth tables, arrays implement NumPy's array protocol, so ``numpy.asarray(tts)``
+    returns one row of Booleans per truth table.
+    """
+
+    @overload
+    def __init__(self, num_vars: int, size: int = 0) -> None:
+        """Creates an array of truth tables with all bits initialized to ``0``.
+
+        Args:
+            num_vars: Number of Boolean variables of each truth table.
+            size: Number of truth tables.
+        """
+
+    @overload
+    def __init__(self, tt: TruthTable) -> None:
+        """Creates an array that holds a single truth table.
+
+        Functions and operators that take arrays also accept single truth tables this way, which
+        broadcast against arrays of any length.
+
+        Args:
+            tt: The truth table.
+        """
+
+    @overload
+    def __init__(self, tts: Sequence[TruthTable]) -> None:
+        """Creates an array from a sequence of truth tables.
+
+        Args:
+            tts: Truth tables with the same number of variables, e.g., the values of
+                :func:`~aigverse.algorithms.simulate_nodes`.
+
+        Raises:
+            ValueError: If ``tts`` is empty or the truth tables differ in their number of variables.
+        """
+
+    @staticmethod
+    def from_blocks(blocks: np.ndarray, num_vars: int | None = None) -> TruthTableArray:
+        """Creates an array from a matrix of 64-bit blocks.
+
+        This is the inverse of :attr:`blocks`.
+
+        Args:
+            blocks: One row of blocks per truth table as a ``uint64`` array of shape
+                ``(N, num_blocks)``.
+            num_vars: Number of variables. Defaults to the number that fills all blocks, which
+                is at least 6; tables with fewer variables use only the lowest bits of their
+                single block, and the other bits are ignored.
+
+        Returns:
+            The array of truth tables.
+
+        Raises:
+            ValueError: If the number of blocks per row does not match ``num_vars`` or, if it
+                is not given, is not a power of two.
+        """
+
+    def num_vars(self) -> int:
+        """Returns the number of variables of each truth table."""
+
+    def num_blocks(self) -> int:
+        """Returns the number of storage blocks of each truth table."""
+
+    def num_bits(self) -> int:
+        """Returns the number of bits of each truth table."""
+
+    def __len__(self) -> int:
+        """Returns the number of truth tables."""
+
+    def __getitem__(self, index: int) -> TruthTable:
+        """Returns a copy of one truth table.
+
+        Args:
+            index: Index of the truth table. Negative indices are supported.
+
+        Returns:
+            The truth table.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+        """
+
+    def __setitem__(self, index: int, tt: TruthTable) -> None:
+        """Replaces one truth table.
+
+        Args:
+            index: Index of the truth table. Negative indices are supported.
+            tt: Replacement truth table with the same number of variables.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If ``tt`` has a different number of variables.
+        """
+
+    @property
+    def blocks(self) -> np.ndarray:
+        """Read-only view of the ``(len(self), num_blocks)`` block matrix, without copying it.
+
+        Bit ``j`` of truth table ``i`` is bit ``j % 64`` of ``blocks[i, j // 64]``, as in
+        :attr:`TruthTable.blocks`. The view reflects later changes to the array and keeps it
+        alive.
+        """
+
+    def to_numpy(self, bits: bool = True) -> np.ndarray:
+        """Returns the truth tables as a new NumPy array.
+
+        Args:
+            bits: Whether to unpack the bits into one row of Booleans per truth table (shape
+                ``(len(self), num_bits)``), in ascending order of their index. Otherwise, returns
+                a copy of :attr:`blocks`. Defaults to ``True``.
+
+        Returns:
+            The bits or the blocks of the truth tables.
+        """
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        """Returns the bits as a new NumPy array, one row of Booleans per truth table.
+
+        Args:
+            dtype: Data type of the array. Defaults to ``bool``.
+            copy: Must not be ``False``, since the bits are always unpacked.
+
+        Returns:
+            The bits of the truth tables in ascending order of their index.
+
+        Raises:
+            ValueError: If ``copy`` is ``False``.
+        """
+
+    def __and__(self, other: TruthTableArray | TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise AND."""
+
+    def __or__(self, other: TruthTableArray | TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise OR."""
+
+    def __xor__(self, other: TruthTableArray | TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise XOR."""
+
+    def __rand__(self, other: TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise AND with a truth table on the left."""
+
+    def __ror__(self, other: TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise OR with a truth table on the left."""
+
+    def __rxor__(self, other: TruthTable) -> TruthTableArray:
+        """Computes the elementwise bitwise XOR with a truth table on the left."""
+
+    def __invert__(self) -> TruthTableArray:
+        """Computes the bitwise NOT."""
+
+    def count_ones(self) -> np.ndarray:
+        """Returns the number of set bits of every truth table.
+
+        Returns:
+            The counts (shape ``(len(self),)``, dtype ``int64``).
+        """
+
+    def count_zeroes(self) -> np.ndarray:
+        """Returns the number of unset bits of every truth table.
+
+        Returns:
+            The counts (shape ``(len(self),)``, dtype ``int64``).
+        """
+
+    def hashes(self) -> np.ndarray:
+        """Returns a 64-bit hash of every truth table.
+
+        Equal truth tables have equal hashes, also across arrays.
+
+        Returns:
+            The hashes (shape ``(len(self),)``, dtype ``uint64``).
+        """
+
+    def unique(self) -> dict[str, TruthTableArray | np.ndarray]:
+        """Removes duplicate truth tables.
+
+        Returns:
+            A dictionary with ``tables``, the distinct truth tables in the order of their first
+            occurrence, ``indices``, the index of the first occurrence of each (shape
+            ``(U,)``, dtype ``int64``), and ``inverse``, the index in ``tables`` of every
+            truth table (shape ``(len(self),)``, dtype ``int64``), such that ``tables[inverse[i]]``
+            equals ``self[i]``.
+        """
+
+    def __getstate__(self) -> tuple:
+        """Returns pickle state as ``(num_vars, size, words)``."""
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restores an array of truth tables from pickle state.
+
+        Args:
+            state: Tuple ``(num_vars, size, words)``.
+
+        Raises:
+            RuntimeError: If the serialized state is malformed.
+            TypeError: If nanobind cannot convert the pickle payload to the expected C++ types.
+        """
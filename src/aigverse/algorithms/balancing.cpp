@@ -2,18 +2,25 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/algorithms/interrupt.hpp"
+#include "aigverse/algorithms/statistics.hpp"
+#include "aigverse/algorithms/transform_helpers.hpp"
 #include "aigverse/types.hpp"
 
 #include <fmt/format.h>
 #include <mockturtle/algorithms/balancing.hpp>
 #include <mockturtle/algorithms/balancing/esop_balancing.hpp>
 #include <mockturtle/algorithms/balancing/sop_balancing.hpp>
+#include <mockturtle/utils/stopwatch.hpp>
 #include <nanobind/nanobind.h>
-#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
 
 #include <cstdint>
+#include <optional>
 #include <stdexcept>
 #include <string>
+#include <type_traits>
 
 namespace aigverse
 {
@@ -30,8 +37,12 @@ void balancing(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
         "balancing",
         [](Ntk& ntk, const uint32_t cut_size = 4, const uint32_t cut_limit = 8, const bool minimize_truth_table = true,
            const bool only_on_critical_path = false, const std::string& rebalance_function = "sop",
-           const bool sop_both_phases = true, const bool verbose = false) -> Ntk
+           const bool sop_both_phases = true, const bool verbose = false, const bool inplace = false,
+           const std::optional<double> time_limit = std::nullopt, const cancellation_token* token = nullptr,
+           pass_statistics* statistics = nullptr) -> std::optional<Ntk>
         {
+            interrupt_check check{token, time_limit};
+
             mockturtle::balancing_params ps{};
             ps.cut_enumeration_ps.cut_size             = cut_size;
             ps.cut_enumeration_ps.cut_limit            = cut_limit;
@@ -39,19 +50,60 @@ void balancing(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
             ps.only_on_critical_path                   = only_on_critical_path;
             ps.verbose                                 = verbose;
 
+            const auto balance = [&ntk, &ps, &check, inplace, statistics](const auto& rebalance_fn)
+            {
+                using rebalance_fn_t = counting_resynthesis<std::decay_t<decltype(rebalance_fn)>>;
+
+                mockturtle::balancing_stats       balancing_st{};
+                mockturtle::stopwatch<>::duration elapsed{};
+                uint64_t                          num_candidates = 0;
+
+                const rebalance_fn_t counted{rebalance_fn, num_candidates};
+
+                return run_functional_transform(
+                    ntk, inplace,
+                    [&](const Ntk& source) -> std::optional<Ntk>
+                    {
+                        auto balanced = [&]() -> std::optional<Ntk>
+                        {
+                            try
+                            {
+                                const mockturtle::stopwatch<> t{elapsed};
+                                return mockturtle::balancing(
+                                    source, {interruptible_resynthesis<rebalance_fn_t>{counted, check}}, ps,
+                                    &balancing_st);
+                            }
+                            catch (const operation_interrupted&)
+                            {
+                                // the balanced network is only assembled at the end, so nothing better than the
+                                // input exists
+                                balancing_st.time_total = elapsed;
+                                return std::nullopt;
+                            }
+                        }();
+                        check.rethrow_signal();
+                        publish_statistics(
+                            make_statistics(balancing_st, num_candidates, source.num_gates(),
+                                            balanced.has_value() ? balanced->num_gates() : source.num_gates()),
+                            statistics);
+
+                        return balanced;
+                    });
+            };
+
             if (rebalance_function == "sop")
             {
                 mockturtle::sop_rebalancing<Ntk> rebalance_fn{};
                 rebalance_fn.both_phases_ = sop_both_phases;
 
-                return mockturtle::balancing(ntk, {rebalance_fn}, ps);
+                return balance(rebalance_fn);
             }
             if (rebalance_function == "esop")
             {
                 mockturtle::esop_rebalancing<Ntk> rebalance_fn{};
                 rebalance_fn.both_phases = sop_both_phases;
 
-                return mockturtle::balancing(ntk, {rebalance_fn}, ps);
+                return balance(rebalance_fn);
             }
 
             throw std::invalid_argument(fmt::format(
@@ -60,8 +112,20 @@ void balancing(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
         nb::arg("ntk"), nb::kw_only(), nb::arg("cut_size") = 4, nb::arg("cut_limit") = 8,
         nb::arg("minimize_truth_table") = true, nb::arg("only_on_critical_path") = false,
         nb::arg("rebalance_function") = "sop", nb::arg("sop_both_phases") = true, nb::arg("verbose") = false,
+        nb::arg("inplace") = false, nb::arg("time_limit") = std::nullopt, nb::arg("cancellation_token") = nb::none(),
+        nb::arg("statistics") = nb::none(),
         R"pb(Balances a network using SOP or ESOP-based local restructuring.
 
+The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+all of which are checked before each cut is rebalanced. Since the balanced network is
+only assembled once all nodes are processed, a pass stopped early returns a copy of
+``ntk``.
+
+Balancing always builds a new network. With ``inplace``, ``ntk`` takes it over instead
+of a new object being returned, which frees the memory of the original network during
+the call unless another network still shares it. A pass stopped early then leaves
+``ntk`` unchanged without copying it.
+
 Args:
     ntk: The input logic network.
     cut_size: Maximum cut size used during cut enumeration.
@@ -72,12 +136,22 @@ Args:
         ``"sop"`` and ``"esop"``.
     sop_both_phases: Whether to consider both phases in SOP/ESOP balancing.
     verbose: Whether to print verbose progress output.
+    inplace: Whether to replace ``ntk`` by the balanced network.
+    time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+        limit.
+    cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+    statistics: If given, filled with the statistics of this run. Its ``times`` hold
+        ``"cut_enumeration"`` and ``"truth_tables"``, which stay 0 if the pass stopped
+        early. Its ``counts`` hold ``"candidates"``, the number of cuts rebalanced.
 
 Returns:
-    A new balanced network.
+    The balanced network, or a copy of ``ntk`` if the pass stopped early, if ``inplace``
+    is ``False``. Otherwise ``None``.
 
 Raises:
-    ValueError: If ``rebalance_function`` is not one of the supported values.)pb",
+    ValueError: If ``rebalance_function`` is not one of the supported values or
+        ``time_limit`` is not positive.
+    KeyboardInterrupt: If interrupted by Ctrl-C.)pb",
         nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
 }
 
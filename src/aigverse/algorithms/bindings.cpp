@@ -2,6 +2,8 @@
 
 namespace aigverse
 {
+void bind_interrupt(nanobind::module_& m);
+void bind_statistics(nanobind::module_& m);
 void bind_equivalence_checking(nanobind::module_& m);
 void bind_cleanup_dangling(nanobind::module_& m);
 void bind_refactoring(nanobind::module_& m);
@@ -10,6 +12,14 @@ void bind_rewriting(nanobind::module_& m);
 void bind_balancing(nanobind::module_& m);
 void bind_simulation(nanobind::module_& m);
 void bind_sequential_simulation(nanobind::module_& m);
+void bind_cut_enumeration(nanobind::module_& m);
+void bind_cut_extraction(nanobind::module_& m);
+void bind_windowing(nanobind::module_& m);
+void bind_traversal(nanobind::module_& m);
+void bind_pipeline(nanobind::module_& m);
+void bind_portfolio(nanobind::module_& m);
+void bind_partitioning(nanobind::module_& m);
+void bind_convergence(nanobind::module_& m);
 }  // namespace aigverse
 
 NB_MODULE(algorithms, m)
@@ -17,6 +27,8 @@ NB_MODULE(algorithms, m)
     m.doc() = R"pb(Provides synthesis and optimization algorithms for logic network types.)pb";
     nanobind::module_::import_("aigverse.networks");  // ensure network types are registered
     nanobind::module_::import_("aigverse.utils");     // ensure truth-table types are registered
+    aigverse::bind_interrupt(m);
+    aigverse::bind_statistics(m);
     aigverse::bind_equivalence_checking(m);
     aigverse::bind_cleanup_dangling(m);
     aigverse::bind_refactoring(m);
@@ -25,4 +37,12 @@ NB_MODULE(algorithms, m)
     aigverse::bind_balancing(m);
     aigverse::bind_simulation(m);
     aigverse::bind_sequential_simulation(m);
+    aigverse::bind_cut_enumeration(m);
+    aigverse::bind_cut_extraction(m);
+    aigverse::bind_windowing(m);
+    aigverse::bind_traversal(m);
+    aigverse::bind_pipeline(m);
+    aigverse::bind_portfolio(m);
+    aigverse::bind_partitioning(m);
+    aigverse::bind_convergence(m);
 }
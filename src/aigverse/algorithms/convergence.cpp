@@ -0,0 +1,206 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/recipe.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
+
+#include <chrono>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief The outcome of repeating a recipe until it stops paying off.
+ */
+template <typename Ntk>
+struct convergence_result
+{
+    Ntk                   network;
+    std::vector<uint32_t> num_gates;
+    std::vector<double>   gains;
+    std::string           stop_reason;
+    double                runtime;
+};
+
+template <typename Ntk>
+void convergence(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using result_t = convergence_result<Ntk>;
+
+    nb::class_<result_t>(m, "ConvergenceResult",
+                         R"pb(Represents the outcome of repeating a recipe with :func:`run_until_convergence`.
+
+``num_gates`` starts with the size of the input and holds one more entry per iteration,
+so ``gains[i]`` is the relative reduction from ``num_gates[i]`` to ``num_gates[i + 1]``.)pb")
+        .def_ro("network", &result_t::network,
+                R"pb(The smallest network found.
+
+This is the network after the last iteration that reduced the number of AND gates.)pb")
+        .def_ro("num_gates", &result_t::num_gates,
+                R"pb(Number of AND gates of the input, followed by the number after every iteration.)pb")
+        .def_ro("gains", &result_t::gains,
+                R"pb(Relative reduction in AND gates achieved by every iteration.
+
+Negative if an iteration grew the network.)pb")
+        .def_prop_ro(
+            "num_iterations", [](const result_t& self) { return self.gains.size(); },
+            R"pb(Number of iterations run.)pb")
+        .def_ro("stop_reason", &result_t::stop_reason,
+                R"pb(Why the loop ended.
+
+``"converged"`` if an iteration gained less than ``min_gain``, ``"max_iterations"``
+if the iteration limit was reached, or ``"time_budget"`` if the budget was spent.)pb")
+        .def_ro("runtime", &result_t::runtime, R"pb(Wall-clock seconds the loop took.)pb")
+        .def("__len__", [](const result_t& self) { return self.gains.size(); })
+        .def("__repr__",
+             [](const result_t& self)
+             {
+                 return fmt::format("ConvergenceResult(num_iterations={}, num_gates={}, stop_reason='{}', "
+                                    "runtime={:.6f})",
+                                    self.gains.size(), self.network.num_gates(), self.stop_reason, self.runtime);
+             });
+
+    m.def(
+        "run_until_convergence",
+        [](const Ntk& ntk, const std::vector<nb::object>& recipe, const uint32_t max_iterations = 10,
+           const double min_gain = 0.0, const std::optional<double> time_budget = std::nullopt) -> result_t
+        {
+            if (recipe.empty())
+            {
+                throw std::invalid_argument("recipe must contain at least one pass");
+            }
+            if (max_iterations == 0)
+            {
+                throw std::invalid_argument("max_iterations must be at least 1, got 0");
+            }
+            if (!(min_gain >= 0.0))
+            {
+                throw std::invalid_argument(fmt::format("min_gain must be non-negative, got {}", min_gain));
+            }
+            if (time_budget.has_value() && !(*time_budget > 0.0))
+            {
+                throw std::invalid_argument(fmt::format("time_budget must be positive, got {}", *time_budget));
+            }
+
+            const auto configs = parse_recipe(recipe);
+
+            nb::gil_scoped_release release{};
+
+            const auto start = std::chrono::steady_clock::now();
+            const auto deadline =
+                time_budget.has_value() ?
+                    std::optional{start + std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+                                              std::chrono::duration<double>{*time_budget})} :
+                    std::nullopt;
+
+            result_t result{ntk, {ntk.num_gates()}, {}, "max_iterations", 0.0};
+            bool     improved = false;
+
+            for (uint32_t iteration = 0; iteration < max_iterations; ++iteration)
+            {
+                if (deadline.has_value() && std::chrono::steady_clock::now() >= *deadline)
+                {
+                    result.stop_reason = "time_budget";
+                    break;
+                }
+
+                // an iteration that does not pay off falls back to the network it started from, so that one must
+                // stay untouched: it is cloned, but only once an in-place pass is about to modify it, which includes
+                // passes after cut rewriting that returned it unchanged; in the first iteration, it is the caller's
+                auto candidate = *run_recipe(result.network, true, configs, [](const pass_step&) { return true; });
+
+                const auto before = result.num_gates.back();
+                const auto after  = candidate.num_gates();
+                const auto gain   = before == 0 ? 0.0 :
+                                                  (static_cast<double>(before) - static_cast<double>(after)) /
+                                                      static_cast<double>(before);
+
+                result.num_gates.push_back(after);
+                result.gains.push_back(gain);
+
+                if (after < before)
+                {
+                    result.network = std::move(candidate);
+                    improved       = true;
+                }
+                if (after >= before || gain < min_gain)
+                {
+                    result.stop_reason = "converged";
+                    break;
+                }
+            }
+
+            if (!improved)
+            {
+                result.network = result.network.clone();
+            }
+
+            const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - start;
+            result.runtime                              = runtime.count();
+
+            return result;
+        },
+        nb::arg("ntk"), nb::arg("recipe"), nb::kw_only(), nb::arg("max_iterations") = 10, nb::arg("min_gain") = 0.0,
+        nb::arg("time_budget") = std::nullopt,
+        R"pb(Repeats a recipe on a network until it stops reducing the number of AND gates.
+
+The loop runs natively without holding the GIL. Unlike repeating individual passes
+from Python, no iteration crosses the binding, and each copies the network at most
+once and cleans it up once rather than after every pass.
+
+Every iteration runs the whole ``recipe`` on the best network so far. The loop ends
+when an iteration removes no gates or less than ``min_gain`` of them, after
+``max_iterations`` iterations, or once ``time_budget`` has passed, whichever comes
+first. The budget is checked between iterations, so the one in progress when it
+runs out still finishes.
+
+Args:
+    ntk: The input logic network. It is left unchanged.
+    recipe: The passes to repeat, in the format :func:`run_pipeline` accepts.
+    max_iterations: Maximum number of iterations.
+    min_gain: Minimum relative reduction in AND gates, e.g., ``0.01`` for 1%, an
+        iteration must achieve for the loop to continue.
+    time_budget: Wall-clock seconds after which no further iteration is started, or
+        ``None`` for no limit.
+
+Returns:
+    The smallest network found, together with its size and the relative gain after
+    every iteration.
+
+Raises:
+    TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+    ValueError: If ``recipe`` is empty or names an unknown pass or parameter,
+        ``max_iterations`` is 0, ``min_gain`` is negative, or ``time_budget`` is not
+        positive.
+    RuntimeError: If a pass fails in the underlying synthesis engine.)pb");
+}
+
+// Explicit instantiation for AIG
+template void convergence<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_convergence(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::convergence<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
@@ -0,0 +1,224 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include <fmt/format.h>
+#include <kitty/partial_truth_table.hpp>
+#include <mockturtle/algorithms/simulation.hpp>
+#include <mockturtle/networks/aig.hpp>
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <mutex>
+#include <optional>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief A bounded, thread-safe store of input assignments that told two networks apart.
+ *
+ * Patterns that distinguished a specification from one implementation are likely to distinguish it from the next
+ * faulty one as well, so they are simulated before any random pattern. Every pattern assigns the same number of
+ * primary inputs, which is fixed by the first pattern stored. Once the store is full, the oldest pattern is evicted.
+ */
+class counterexample_cache
+{
+  public:
+    /**
+     * @brief Creates an empty store.
+     *
+     * @param capacity The maximum number of patterns kept.
+     */
+    explicit counterexample_cache(const std::size_t capacity) : max_size{capacity}
+    {
+        if (capacity == 0)
+        {
+            throw std::invalid_argument("capacity must be at least 1, got 0");
+        }
+    }
+
+    /**
+     * @brief Stores a pattern as the most recent one.
+     *
+     * A pattern that is already stored is not stored twice but moved to the back, so that it is evicted last.
+     * Otherwise, the oldest pattern is evicted first if the store is full.
+     *
+     * @param pattern One value per primary input.
+     * @throws std::invalid_argument If the pattern assigns a different number of primary inputs than the stored ones.
+     */
+    void add(std::vector<bool> pattern)
+    {
+        const std::scoped_lock lock{mutex};
+
+        check_num_pis(pattern.size());
+        width = static_cast<uint32_t>(pattern.size());
+
+        if (const auto it = std::find(entries.cbegin(), entries.cend(), pattern); it != entries.cend())
+        {
+            // a pattern found again moves to the back, so that it is evicted last
+            entries.erase(it);
+        }
+        else if (entries.size() == max_size)
+        {
+            entries.pop_front();
+        }
+        entries.push_back(std::move(pattern));
+    }
+
+    /**
+     * @brief Returns all stored patterns, oldest first.
+     *
+     * @param num_pis If given, the number of primary inputs the caller is about to simulate.
+     * @return A copy of the stored patterns.
+     */
+    [[nodiscard]] std::vector<std::vector<bool>> patterns(const std::optional<std::size_t> num_pis = std::nullopt) const
+    {
+        const std::scoped_lock lock{mutex};
+
+        if (num_pis.has_value())
+        {
+            check_num_pis(*num_pis);
+        }
+        return {entries.cbegin(), entries.cend()};
+    }
+
+    /**
+     * @brief Returns the pattern stored last.
+     *
+     * @return The pattern, or `std::nullopt` if the store is empty.
+     */
+    [[nodiscard]] std::optional<std::vector<bool>> last() const
+    {
+        const std::scoped_lock lock{mutex};
+
+        if (entries.empty())
+        {
+            return std::nullopt;
+        }
+        return entries.back();
+    }
+
+    /**
+     * @brief Removes all patterns and forgets their number of primary inputs.
+     */
+    void clear()
+    {
+        const std::scoped_lock lock{mutex};
+
+        entries.clear();
+        width.reset();
+    }
+
+    [[nodiscard]] std::size_t size() const
+    {
+        const std::scoped_lock lock{mutex};
+        return entries.size();
+    }
+
+    [[nodiscard]] std::size_t capacity() const noexcept
+    {
+        return max_size;
+    }
+
+    [[nodiscard]] std::optional<uint32_t> num_pis() const
+    {
+        const std::scoped_lock lock{mutex};
+        return width;
+    }
+
+  private:
+    mutable std::mutex            mutex{};
+    std::deque<std::vector<bool>> entries{};
+    std::size_t                   max_size;
+    std::optional<uint32_t>       width{};
+
+    void check_num_pis(const std::size_t num_pis) const
+    {
+        if (width.has_value() && *width != num_pis)
+        {
+            throw std::invalid_argument(fmt::format(
+                "the counterexample cache holds patterns over {} primary inputs, but {} were given", *width, num_pis));
+        }
+    }
+};
+
+/**
+ * @brief Searches for input assignments that set the outputs of a miter by bit-parallel simulation.
+ *
+ * The known patterns are simulated first, followed by `num_random_patterns` random ones. Since every pattern is an
+ * actual input assignment, an output found to be set is proven to be satisfiable; an output that no pattern sets
+ * remains undecided.
+ *
+ * @param miter The miter, whose outputs are 1 wherever the compared networks differ.
+ * @param known Previously found patterns, each with one value per primary input of the miter.
+ * @param num_random_patterns The number of random patterns to simulate after the known ones.
+ * @param seed The seed of the random patterns.
+ * @return Per miter output, the first pattern that sets it, if any.
+ */
+inline std::vector<std::optional<std::vector<bool>>> find_counterexamples(const mockturtle::aig_network&        miter,
+                                                                          const std::vector<std::vector<bool>>& known,
+                                                                          const uint32_t num_random_patterns,
+                                                                          const uint32_t seed)
+{
+    std::vector<std::optional<std::vector<bool>>> counterexamples(miter.num_pos());
+
+    const auto num_pis      = miter.num_pis();
+    const auto num_patterns = known.size() + num_random_patterns;
+    if (num_pis == 0 || num_patterns == 0)
+    {
+        return counterexamples;
+    }
+
+    std::vector<kitty::partial_truth_table> patterns{};
+    patterns.reserve(num_pis);
+    for (auto i = 0U; i < num_pis; ++i)
+    {
+        auto& pattern = patterns.emplace_back(static_cast<uint32_t>(num_patterns));
+        kitty::create_random(pattern, seed + i);
+
+        // the known patterns replace the first random ones, so that they are preferred as counterexamples
+        for (std::size_t p = 0; p < known.size(); ++p)
+        {
+            if (known[p][i])
+            {
+                kitty::set_bit(pattern, p);
+            }
+            else
+            {
+                kitty::clear_bit(pattern, p);
+            }
+        }
+    }
+
+    const mockturtle::partial_simulator sim{patterns};
+    const auto                          outputs = mockturtle::simulate<kitty::partial_truth_table>(miter, sim);
+
+    for (std::size_t o = 0; o < outputs.size(); ++o)
+    {
+        // bits past the last pattern are padding and may be set by complemented signals
+        const auto bit = kitty::find_first_one_bit(outputs[o]);
+        if (bit < 0 || static_cast<std::size_t>(bit) >= num_patterns)
+        {
+            continue;
+        }
+
+        std::vector<bool> counterexample(num_pis);
+        for (auto i = 0U; i < num_pis; ++i)
+        {
+            counterexample[i] = kitty::get_bit(patterns[i], static_cast<uint64_t>(bit));
+        }
+        counterexamples[o] = std::move(counterexample);
+    }
+
+    return counterexamples;
+}
+
+}  // namespace aigverse::detail
@@ -0,0 +1,212 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/algorithms/cut_enumeration.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief The cuts of all nodes of a network, packed into flat arrays.
+ *
+ * The cuts of node `n` are the rows `node_offsets[n]` to `node_offsets[n + 1]`, and the leaves of cut `c` are
+ * `leaves[cut_offsets[c]]` to `leaves[cut_offsets[c + 1]]`.
+ */
+struct packed_cuts
+{
+    std::size_t                           num_nodes;
+    std::size_t                           num_cuts;
+    std::size_t                           num_leaves;
+    owned_buffer<int64_t>                 node_offsets;
+    owned_buffer<int64_t>                 cut_offsets;
+    owned_buffer<int64_t>                 leaves;
+    std::optional<owned_buffer<uint64_t>> functions;
+};
+
+/**
+ * @brief Enumerates the cuts of all nodes of a network and packs them into flat arrays.
+ *
+ * Does not touch any Python object, so it may run without holding the GIL.
+ *
+ * @tparam Ntk Network type.
+ * @tparam ComputeTruth Whether to compute the function of each cut, which requires cuts of at most 6 leaves.
+ * @param ntk Network to enumerate the cuts of.
+ * @param ps Cut enumeration parameters.
+ * @return The packed cuts.
+ */
+template <typename Ntk, bool ComputeTruth>
+packed_cuts pack_cuts(const Ntk& ntk, const mockturtle::cut_enumeration_params& ps)
+{
+    const auto cuts = mockturtle::cut_enumeration<Ntk, ComputeTruth>(ntk, ps);
+
+    const std::size_t num_nodes  = ntk.size();
+    std::size_t       num_cuts   = 0;
+    std::size_t       num_leaves = 0;
+    for (std::size_t n = 0; n < num_nodes; ++n)
+    {
+        for (const auto* cut : cuts.cuts(static_cast<uint32_t>(n)))
+        {
+            ++num_cuts;
+            num_leaves += cut->size();
+        }
+    }
+
+    packed_cuts packed{num_nodes,
+                       num_cuts,
+                       num_leaves,
+                       owned_buffer<int64_t>{num_nodes + 1},
+                       owned_buffer<int64_t>{num_cuts + 1},
+                       owned_buffer<int64_t>{num_leaves},
+                       std::nullopt};
+    if constexpr (ComputeTruth)
+    {
+        packed.functions.emplace(num_cuts);
+    }
+
+    std::size_t c = 0;
+    std::size_t l = 0;
+    for (std::size_t n = 0; n < num_nodes; ++n)
+    {
+        packed.node_offsets[n] = static_cast<int64_t>(c);
+        for (const auto* cut : cuts.cuts(static_cast<uint32_t>(n)))
+        {
+            packed.cut_offsets[c] = static_cast<int64_t>(l);
+            for (const auto leaf : *cut)
+            {
+                packed.leaves[l++] = static_cast<int64_t>(leaf);
+            }
+            if constexpr (ComputeTruth)
+            {
+                const auto tt = cuts.truth_table(*cut);
+                // cuts of fewer than 6 leaves occupy the low 2^k bits of the word
+                const auto mask =
+                    tt.num_vars() < 6u ? (uint64_t{1} << (uint64_t{1} << tt.num_vars())) - 1u : ~uint64_t{0};
+                (*packed.functions)[c] = *tt.cbegin() & mask;
+            }
+            ++c;
+        }
+    }
+    packed.node_offsets[num_nodes] = static_cast<int64_t>(c);
+    packed.cut_offsets[num_cuts]   = static_cast<int64_t>(l);
+
+    return packed;
+}
+
+template <typename Ntk>
+void cut_enumeration(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    m.def(
+        "enumerate_cuts",
+        [](const Ntk& ntk, const uint32_t cut_size, const uint32_t cut_limit, const bool compute_truth,
+           const bool minimize_truth_table) -> nb::dict
+        {
+            if (cut_size == 0 || cut_size > mockturtle::max_cut_size)
+            {
+                throw std::invalid_argument(
+                    fmt::format("cut_size must be between 1 and {}, got {}", mockturtle::max_cut_size, cut_size));
+            }
+            if (compute_truth && cut_size > 6)
+            {
+                throw std::invalid_argument(
+                    fmt::format("cut_size must be at most 6 to pack cut functions into 64 bits, got {}", cut_size));
+            }
+            constexpr auto max_cut_limit =
+                mockturtle::network_cuts<Ntk, false, mockturtle::empty_cut_data>::max_cut_num - 1;
+            if (cut_limit == 0 || cut_limit > max_cut_limit)
+            {
+                throw std::invalid_argument(
+                    fmt::format("cut_limit must be between 1 and {}, got {}", max_cut_limit, cut_limit));
+            }
+
+            mockturtle::cut_enumeration_params ps{};
+            ps.cut_size             = cut_size;
+            ps.cut_limit            = cut_limit;
+            ps.minimize_truth_table = minimize_truth_table;
+
+            auto packed = [&]
+            {
+                const nb::gil_scoped_release release{};
+                return compute_truth ? pack_cuts<Ntk, true>(ntk, ps) : pack_cuts<Ntk, false>(ntk, ps);
+            }();
+
+            auto result            = nb::dict();
+            result["node_offsets"] = packed.node_offsets.release_into_ndarray({packed.num_nodes + 1});
+            result["cut_offsets"]  = packed.cut_offsets.release_into_ndarray({packed.num_cuts + 1});
+            result["leaves"]       = packed.leaves.release_into_ndarray({packed.num_leaves});
+            if (packed.functions)
+            {
+                result["functions"] = packed.functions->release_into_ndarray({packed.num_cuts});
+            }
+
+            return result;
+        },
+        nb::arg("ntk"), nb::kw_only(), nb::arg("cut_size") = 4, nb::arg("cut_limit") = 8,
+        nb::arg("compute_truth") = true, nb::arg("minimize_truth_table") = false,
+        R"pb(Enumerates the cuts of every node of the network.
+
+A cut of a node is a set of nodes, its leaves, such that every path from a primary
+input to the node passes through a leaf. The cuts are computed bottom-up by merging
+the cuts of the fanins and keeping the best ``cut_limit - 1`` per node. Every node
+additionally has its trivial cut consisting of itself, and the constant node has a
+single cut without leaves.
+
+The cuts are returned packed into flat NumPy arrays rather than as Python objects,
+which keeps the call cheap on large networks. The cuts of node ``n`` are the rows
+``node_offsets[n]`` to ``node_offsets[n + 1]``, and the leaves of cut ``c`` are
+``leaves[cut_offsets[c]:cut_offsets[c + 1]]`` in ascending order::
+
+    cuts = enumerate_cuts(aig)
+    for c in range(cuts["node_offsets"][n], cuts["node_offsets"][n + 1]):
+        leaves = cuts["leaves"][cuts["cut_offsets"][c] : cuts["cut_offsets"][c + 1]]
+
+The enumeration runs without holding the GIL.
+
+Args:
+    ntk: The network to enumerate the cuts of. It is not modified.
+    cut_size: Maximum number of leaves of a cut, at most 16, or at most 6 if
+        ``compute_truth`` is set.
+    cut_limit: Maximum number of cuts retained per node, at most 25.
+    compute_truth: Also computes the function of each cut in terms of its leaves.
+    minimize_truth_table: Removes leaves the function of a cut does not depend on.
+        Only has an effect if ``compute_truth`` is set.
+
+Returns:
+    A dictionary with ``node_offsets`` (shape ``(N + 1,)``), ``cut_offsets`` (shape
+    ``(C + 1,)``), and ``leaves`` (shape ``(L,)``), all of dtype ``int64``, where ``N``
+    is the number of nodes, ``C`` the total number of cuts, and ``L`` the total number
+    of leaves. If ``compute_truth`` is set, it also contains ``functions`` (shape
+    ``(C,)``, dtype ``uint64``), the truth table of each cut as a 64-bit word in which
+    leaf ``i`` is variable ``i`` and bits beyond ``2**k`` of a ``k``-leaf cut are 0.
+
+Raises:
+    ValueError: If ``cut_size`` or ``cut_limit`` is out of range.)pb");
+}
+
+// Explicit instantiation for AIG
+template void cut_enumeration<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_cut_enumeration(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::cut_enumeration<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
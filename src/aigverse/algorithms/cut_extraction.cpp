@@ -0,0 +1,459 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/thread_pool.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <kitty/dynamic_truth_table.hpp>
+#include <kitty/npn.hpp>
+#include <kitty/operations.hpp>
+#include <mockturtle/traits.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/// Truth tables of the first six variables.
+constexpr std::array<uint64_t, 6> projection_words{0xaaaaaaaaaaaaaaaaULL, 0xccccccccccccccccULL, 0xf0f0f0f0f0f0f0f0ULL,
+                                                   0xff00ff00ff00ff00ULL, 0xffff0000ffff0000ULL, 0xffffffff00000000ULL};
+
+/**
+ * @brief Encodes cuts of a network as index lists without modifying the network.
+ *
+ * Produces exactly what `mockturtle::encode` produces for a `mockturtle::cut_view` of the same cut, but keeps the
+ * traversal marks in its own arrays instead of the network's visited flags, so that several encoders can work on the
+ * same network concurrently.
+ *
+ * @tparam Ntk Network type.
+ */
+template <typename Ntk>
+class cut_encoder
+{
+  public:
+    explicit cut_encoder(const Ntk& network) : ntk{network}, stamps(network.size(), 0), indices(network.size(), 0) {}
+
+    /**
+     * @brief Appends the raw index list of the cut of @p root with the given leaves to @p values.
+     *
+     * @param root Root node of the cut.
+     * @param leaves_begin Pointer to the first leaf.
+     * @param leaves_end Pointer past the last leaf.
+     * @param values Raw index list values to append to.
+     * @throws std::invalid_argument If the root depends on a combinational input that is not a leaf.
+     */
+    void encode(const uint64_t root, const int64_t* leaves_begin, const int64_t* leaves_end,
+                std::vector<uint32_t>& values)
+    {
+        ++stamp;
+
+        const auto constant = ntk.get_node(ntk.get_constant(false));
+        stamps[constant]    = stamp;
+        indices[constant]   = 0;
+
+        uint32_t next_index = 1;
+        for (const auto* leaf = leaves_begin; leaf != leaves_end; ++leaf)
+        {
+            const auto n = static_cast<mockturtle::node<Ntk>>(*leaf);
+            if (stamps[n] != stamp)
+            {
+                stamps[n]  = stamp;
+                indices[n] = next_index++;
+            }
+        }
+
+        const auto header = values.size();
+        values.insert(values.end(), {next_index - 1, 1, 0});
+
+        // post-order traversal that visits the fanins in the same order as the recursive traversal of cut_view
+        stack.clear();
+        stack.emplace_back(static_cast<mockturtle::node<Ntk>>(root), false);
+        while (!stack.empty())
+        {
+            const auto [n, expanded] = stack.back();
+            if (stamps[n] == stamp)
+            {
+                stack.pop_back();
+                continue;
+            }
+            if (ntk.is_ci(n))
+            {
+                throw std::invalid_argument(
+                    fmt::format("the cut of node {} is not bounded by its leaves: it depends on input {}", root, n));
+            }
+            if (!expanded)
+            {
+                stack.back().second = true;
+                fanins.clear();
+                ntk.foreach_fanin(n, [this](const auto& f) { fanins.push_back(ntk.get_node(f)); });
+                std::for_each(fanins.rbegin(), fanins.rend(), [this](const auto& f) { stack.emplace_back(f, false); });
+                continue;
+            }
+            stack.pop_back();
+
+            std::array<uint32_t, 2> lits{};
+            ntk.foreach_fanin(n,
+                              [this, &lits](const auto& f, const auto i)
+                              {
+                                  lits[static_cast<std::size_t>(i)] =
+                                      2 * indices[ntk.get_node(f)] + (ntk.is_complemented(f) ? 1 : 0);
+                              });
+            values.push_back(std::min(lits[0], lits[1]));
+            values.push_back(std::max(lits[0], lits[1]));
+            ++values[header + 2];
+
+            stamps[n]  = stamp;
+            indices[n] = next_index++;
+        }
+
+        values.push_back(2 * indices[root]);
+    }
+
+  private:
+    const Ntk&                                          ntk;
+    std::vector<uint32_t>                               stamps;
+    std::vector<uint32_t>                               indices;
+    uint32_t                                            stamp{0};
+    std::vector<std::pair<mockturtle::node<Ntk>, bool>> stack{};
+    std::vector<mockturtle::node<Ntk>>                  fanins{};
+};
+
+/**
+ * @brief Appends the truth table of a raw AIG index list with a single output to @p words.
+ *
+ * The truth table is stored in 64-bit blocks as in `kitty::dynamic_truth_table`, so functions of up to six inputs
+ * take a single word whose bits beyond `2^k` are 0.
+ *
+ * @param values Raw values of the index list.
+ * @param words Words to append to.
+ */
+inline void simulate_index_list(const uint32_t* values, std::vector<uint64_t>& words)
+{
+    const auto  num_pis   = values[0];
+    const auto  num_gates = values[2];
+    const auto* gates     = values + 3;
+    const auto  output    = gates[2 * num_gates];
+
+    if (num_pis <= 6)
+    {
+        std::vector<uint64_t> sim(1 + num_pis + num_gates);
+        sim[0] = 0;
+        std::copy_n(projection_words.cbegin(), num_pis, sim.begin() + 1);
+        const auto literal = [&sim](const uint32_t lit) { return (lit & 1U) != 0 ? ~sim[lit >> 1] : sim[lit >> 1]; };
+        for (uint32_t g = 0; g < num_gates; ++g)
+        {
+            sim[1 + num_pis + g] = literal(gates[2 * g]) & literal(gates[(2 * g) + 1]);
+        }
+        const auto mask = num_pis < 6 ? (uint64_t{1} << (uint64_t{1} << num_pis)) - 1 : ~uint64_t{0};
+        words.push_back(literal(output) & mask);
+        return;
+    }
+
+    std::vector<kitty::dynamic_truth_table> sim(1 + num_pis + num_gates, kitty::dynamic_truth_table{num_pis});
+    for (uint32_t i = 0; i < num_pis; ++i)
+    {
+        kitty::create_nth_var(sim[1 + i], static_cast<uint8_t>(i));
+    }
+    const auto literal = [&sim](const uint32_t lit) { return (lit & 1U) != 0 ? ~sim[lit >> 1] : sim[lit >> 1]; };
+    for (uint32_t g = 0; g < num_gates; ++g)
+    {
+        sim[1 + num_pis + g] = literal(gates[2 * g]) & literal(gates[(2 * g) + 1]);
+    }
+    const auto tt = literal(output);
+    words.insert(words.end(), tt.cbegin(), tt.cend());
+}
+
+/**
+ * @brief Computes NPN-canonical representatives of functions of at most six inputs given as single words.
+ *
+ * The cuts of a network implement few distinct functions, so the representatives are remembered to avoid repeating
+ * the exact canonization for most of them.
+ */
+class npn_canonizer
+{
+  public:
+    /**
+     * @brief Returns the truth table word of the NPN-canonical representative of a function.
+     *
+     * @param word Truth table word of the function.
+     * @param num_vars Number of inputs of the function.
+     * @return Truth table word of the canonical representative.
+     */
+    uint64_t operator()(const uint64_t word, const uint32_t num_vars)
+    {
+        auto& cache = caches[num_vars];
+        if (const auto it = cache.find(word); it != cache.end())
+        {
+            return it->second;
+        }
+
+        kitty::dynamic_truth_table tt{num_vars};
+        *tt.begin()          = word;
+        const auto canonical = *std::get<0>(kitty::exact_npn_canonization(tt)).cbegin();
+        cache.emplace(word, canonical);
+
+        return canonical;
+    }
+
+  private:
+    std::array<std::unordered_map<uint64_t, uint64_t>, 7> caches{};
+};
+
+/// The output of encoding a contiguous range of cuts.
+struct encoded_chunk
+{
+    std::vector<uint32_t> index_lists{};
+    std::vector<uint64_t> functions{};
+};
+
+using node_array = nanobind::ndarray<const int64_t, nanobind::ndim<1>, nanobind::c_contig, nanobind::device::cpu>;
+
+template <typename Ntk>
+void cut_extraction(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    m.def(
+        "extract_cuts",
+        [](const Ntk& ntk, const node_array& roots, const node_array& leaves, const node_array& leaf_offsets,
+           const bool compute_truth, const bool compute_npn, const std::optional<uint32_t> workers) -> nb::dict
+        {
+            const auto num_cuts = roots.shape(0);
+            if (leaf_offsets.shape(0) != num_cuts + 1)
+            {
+                throw std::invalid_argument(
+                    fmt::format("leaf_offsets must have one more entry than roots, got {} for {}",
+                                leaf_offsets.shape(0), num_cuts));
+            }
+            if (workers.has_value() && *workers == 0)
+            {
+                throw std::invalid_argument("workers must be at least 1, got 0");
+            }
+
+            const auto* root_data   = roots.data();
+            const auto* leaf_data   = leaves.data();
+            const auto* offset_data = leaf_offsets.data();
+            const auto  num_nodes   = static_cast<int64_t>(ntk.size());
+
+            if (offset_data[0] != 0 || offset_data[num_cuts] != static_cast<int64_t>(leaves.shape(0)))
+            {
+                throw std::invalid_argument("leaf_offsets must start at 0 and end at the number of leaves");
+            }
+            const uint32_t max_leaves = compute_npn ? 6 : 16;
+            for (std::size_t c = 0; c < num_cuts; ++c)
+            {
+                if (root_data[c] < 0 || root_data[c] >= num_nodes)
+                {
+                    throw nb::index_error(fmt::format("root {} of cut {} is out of range", root_data[c], c).c_str());
+                }
+                if (offset_data[c + 1] < offset_data[c])
+                {
+                    throw std::invalid_argument("leaf_offsets must be non-decreasing");
+                }
+                if ((compute_truth || compute_npn) && offset_data[c + 1] - offset_data[c] > max_leaves)
+                {
+                    throw std::invalid_argument(
+                        fmt::format("cut {} has {} leaves, but computing {} supports at most {}", c,
+                                    offset_data[c + 1] - offset_data[c],
+                                    compute_npn ? "NPN-canonical forms" : "truth tables", max_leaves));
+                }
+            }
+            for (std::size_t l = 0; l < leaves.shape(0); ++l)
+            {
+                if (leaf_data[l] < 0 || leaf_data[l] >= num_nodes)
+                {
+                    throw nb::index_error(fmt::format("leaf {} is out of range", leaf_data[l]).c_str());
+                }
+            }
+
+            const bool                            with_functions = compute_truth || compute_npn;
+            owned_buffer<int64_t>                 index_list_offsets{num_cuts + 1};
+            std::optional<owned_buffer<int64_t>>  function_offsets{};
+            std::optional<owned_buffer<uint64_t>> npn_classes{};
+            if (compute_truth)
+            {
+                function_offsets.emplace(num_cuts + 1);
+            }
+            if (compute_npn)
+            {
+                npn_classes.emplace(num_cuts);
+            }
+
+            constexpr std::size_t      chunk_size = 256;
+            const auto                 num_chunks = (num_cuts + chunk_size - 1) / chunk_size;
+            std::vector<encoded_chunk> chunks(num_chunks);
+
+            {
+                const nb::gil_scoped_release release{};
+
+                for_each_chunk_with_state(
+                    num_chunks, workers,
+                    [&]
+                    {
+                        return [&, encoder = cut_encoder<Ntk>{ntk}, words = std::vector<uint64_t>{},
+                                canonize = npn_canonizer{}](const std::size_t index) mutable
+                        {
+                            auto& chunk = chunks[index];
+                            for (auto c = index * chunk_size; c < std::min(num_cuts, (index + 1) * chunk_size); ++c)
+                            {
+                                const auto header = chunk.index_lists.size();
+                                encoder.encode(static_cast<uint64_t>(root_data[c]), leaf_data + offset_data[c],
+                                               leaf_data + offset_data[c + 1], chunk.index_lists);
+                                index_list_offsets[c + 1] = static_cast<int64_t>(chunk.index_lists.size() - header);
+
+                                if (!with_functions)
+                                {
+                                    continue;
+                                }
+                                words.clear();
+                                simulate_index_list(chunk.index_lists.data() + header, words);
+                                if (compute_truth)
+                                {
+                                    (*function_offsets)[c + 1] = static_cast<int64_t>(words.size());
+                                    chunk.functions.insert(chunk.functions.end(), words.cbegin(), words.cend());
+                                }
+                                if (compute_npn)
+                                {
+                                    (*npn_classes)[c] = canonize(words.front(), chunk.index_lists[header]);
+                                }
+                            }
+                        };
+                    });
+
+                // turn the per-cut sizes into offsets and concatenate the chunks, which are in cut order
+                index_list_offsets[0] = 0;
+                for (std::size_t c = 0; c < num_cuts; ++c)
+                {
+                    index_list_offsets[c + 1] += index_list_offsets[c];
+                }
+                if (function_offsets)
+                {
+                    (*function_offsets)[0] = 0;
+                    for (std::size_t c = 0; c < num_cuts; ++c)
+                    {
+                        (*function_offsets)[c + 1] += (*function_offsets)[c];
+                    }
+                }
+            }
+
+            const auto                            num_values = static_cast<std::size_t>(index_list_offsets[num_cuts]);
+            owned_buffer<uint32_t>                index_lists{num_values};
+            std::optional<owned_buffer<uint64_t>> functions{};
+            std::size_t                           num_words = 0;
+            if (function_offsets)
+            {
+                num_words = static_cast<std::size_t>((*function_offsets)[num_cuts]);
+                functions.emplace(num_words);
+            }
+            {
+                const nb::gil_scoped_release release{};
+
+                std::size_t value_offset = 0;
+                std::size_t word_offset  = 0;
+                for (auto& chunk : chunks)
+                {
+                    std::copy(chunk.index_lists.cbegin(), chunk.index_lists.cend(), index_lists.data() + value_offset);
+                    value_offset += chunk.index_lists.size();
+                    if (functions)
+                    {
+                        std::copy(chunk.functions.cbegin(), chunk.functions.cend(), functions->data() + word_offset);
+                        word_offset += chunk.functions.size();
+                    }
+                    chunk = encoded_chunk{};
+                }
+            }
+
+            auto result                  = nb::dict();
+            result["index_lists"]        = index_lists.release_into_ndarray({num_values});
+            result["index_list_offsets"] = index_list_offsets.release_into_ndarray({num_cuts + 1});
+            if (functions)
+            {
+                result["functions"]        = functions->release_into_ndarray({num_words});
+                result["function_offsets"] = function_offsets->release_into_ndarray({num_cuts + 1});
+            }
+            if (npn_classes)
+            {
+                result["npn_classes"] = npn_classes->release_into_ndarray({num_cuts});
+            }
+
+            return result;
+        },
+        nb::arg("ntk"), nb::arg("roots"), nb::arg("leaves"), nb::arg("leaf_offsets"), nb::kw_only(),
+        nb::arg("compute_truth") = false, nb::arg("compute_npn") = false, nb::arg("workers") = nb::none(),
+        R"pb(Encodes many cuts of a network as index lists in a single call.
+
+This is the batch version of constructing an :class:`~aigverse.networks.AigCut` for
+every cut and calling its ``to_index_list`` method, but it neither creates Python
+objects per cut nor touches the network's visited flags. The cuts are encoded on a
+native thread pool without holding the GIL.
+
+Cut ``c`` is rooted at node ``roots[c]`` and has the leaves
+``leaves[leaf_offsets[c]:leaf_offsets[c + 1]]``, which is the layout
+:func:`enumerate_cuts` returns its cuts in::
+
+    cuts = enumerate_cuts(aig)
+    roots = np.repeat(np.arange(len(cuts["node_offsets"]) - 1), np.diff(cuts["node_offsets"]))
+    encoded = extract_cuts(aig, roots, cuts["leaves"], cuts["cut_offsets"])
+
+The results are packed the same way: the raw values of the index list of cut ``c``,
+as returned by ``AigCut.to_index_list().raw()``, are
+``index_lists[index_list_offsets[c]:index_list_offsets[c + 1]]``.
+
+Args:
+    ntk: The network the cuts belong to. It is not modified.
+    roots: Root node of each cut.
+    leaves: Leaf nodes of all cuts, concatenated.
+    leaf_offsets: Offsets of the leaves of each cut into ``leaves``, one more than there
+        are cuts.
+    compute_truth: Also computes the function of each cut in terms of its leaves, for
+        cuts of up to 16 leaves.
+    compute_npn: Also computes the NPN-canonical representative of the function of each
+        cut, for cuts of up to 6 leaves.
+    workers: Number of threads to encode the cuts on. Defaults to the number of hardware
+        threads.
+
+Returns:
+    A dictionary with ``index_lists`` (dtype ``uint32``) and ``index_list_offsets``
+    (shape ``(C + 1,)``, dtype ``int64``). If ``compute_truth`` is set, it also contains
+    ``functions`` (dtype ``uint64``) and ``function_offsets`` (shape ``(C + 1,)``, dtype
+    ``int64``), the truth table of cut ``c`` being the 64-bit blocks
+    ``functions[function_offsets[c]:function_offsets[c + 1]]`` in which leaf ``i`` is
+    variable ``i``. If ``compute_npn`` is set, it also contains ``npn_classes`` (shape
+    ``(C,)``, dtype ``uint64``), the truth table of the canonical representative of each
+    cut's function.
+
+Raises:
+    IndexError: If a root or leaf is not a node of the network.
+    ValueError: If ``leaf_offsets`` does not match ``roots`` and ``leaves``, if a cut has
+        too many leaves for the requested functions, or if a root depends on a primary
+        input that is not one of its leaves.)pb");
+}
+
+// Explicit instantiation for AIG
+template void cut_extraction<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_cut_extraction(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::cut_extraction<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
@@ -2,17 +2,35 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/algorithms/counterexample_cache.hpp"
+#include "aigverse/algorithms/interrupt.hpp"
+#include "aigverse/thread_pool.hpp"
 #include "aigverse/types.hpp"
 
+#include <fmt/format.h>
+#include <mockturtle/algorithms/cleanup.hpp>
+#include <mockturtle/algorithms/cnf.hpp>
 #include <mockturtle/algorithms/equivalence_checking.hpp>
+#include <mockturtle/algorithms/functional_reduction.hpp>
 #include <mockturtle/algorithms/miter.hpp>
 #include <mockturtle/networks/aig.hpp>
+#include <mockturtle/utils/stopwatch.hpp>
 #include <nanobind/nanobind.h>
+#include <nanobind/stl/map.h>       // NOLINT(misc-include-cleaner)
 #include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
 
+#include <algorithm>
+#include <chrono>
+#include <cstddef>
 #include <cstdint>
+#include <map>
+#include <mutex>
 #include <optional>
 #include <stdexcept>
+#include <utility>
+#include <vector>
 
 namespace aigverse
 {
@@ -20,16 +38,259 @@ namespace aigverse
 namespace detail
 {
 
+/**
+ * @brief The outcome of checking two networks output by output.
+ */
+struct output_equivalence_result
+{
+    std::vector<std::optional<bool>>      verdicts;
+    std::map<uint32_t, std::vector<bool>> counterexamples;
+    double                                runtime;
+};
+
+/**
+ * @brief Builds a miter with one output per output pair of two networks.
+ *
+ * Unlike `mockturtle::miter`, the XORs of the output pairs are not combined, so output `i` of the result is 1 for
+ * exactly the input assignments under which output `i` of the two networks differs.
+ *
+ * @param spec The specification network.
+ * @param impl The implementation network.
+ * @return The miter, or `std::nullopt` if the networks differ in their numbers of PIs or POs.
+ */
+template <typename Spec, typename Impl>
+std::optional<mockturtle::aig_network> output_miter(const Spec& spec, const Impl& impl)
+{
+    if (spec.num_pis() != impl.num_pis() || spec.num_pos() != impl.num_pos())
+    {
+        return std::nullopt;
+    }
+
+    mockturtle::aig_network                               miter{};
+    std::vector<typename mockturtle::aig_network::signal> pis{};
+    for (auto i = 0U; i < spec.num_pis(); ++i)
+    {
+        pis.push_back(miter.create_pi());
+    }
+
+    const auto spec_pos = mockturtle::cleanup_dangling(spec, miter, pis.begin(), pis.end());
+    const auto impl_pos = mockturtle::cleanup_dangling(impl, miter, pis.begin(), pis.end());
+
+    for (std::size_t i = 0; i < spec_pos.size(); ++i)
+    {
+        miter.create_po(miter.create_xor(spec_pos[i], impl_pos[i]));
+    }
+
+    return miter;
+}
+
+/**
+ * @brief Copies the transitive fanin of one output of a network into a single-output network.
+ *
+ * All PIs are copied, including those outside the cone, so that a counterexample of the cone assigns the PIs of the
+ * original network by position. The network's nodes must be stored in topological order, which holds for every
+ * network built without substitutions, such as the result of `output_miter`.
+ *
+ * @param ntk The network to copy from.
+ * @param index The position of the output.
+ * @return The cone of the output.
+ */
+inline mockturtle::aig_network output_cone(const mockturtle::aig_network& ntk, const uint32_t index)
+{
+    using node   = typename mockturtle::aig_network::node;
+    using signal = typename mockturtle::aig_network::signal;
+
+    const auto root = ntk.po_at(index);
+
+    std::vector<bool> in_cone(ntk.size(), false);
+    std::vector<node> stack{ntk.get_node(root)};
+    std::vector<node> gates{};
+    while (!stack.empty())
+    {
+        const auto n = stack.back();
+        stack.pop_back();
+        if (in_cone[n] || !ntk.is_and(n))
+        {
+            continue;
+        }
+        in_cone[n] = true;
+        gates.push_back(n);
+        ntk.foreach_fanin(n, [&stack](const signal& f) { stack.push_back(f.index); });
+    }
+    std::sort(gates.begin(), gates.end());
+
+    mockturtle::aig_network cone{};
+    std::vector<signal>     copies(ntk.size(), cone.get_constant(false));
+    ntk.foreach_pi([&copies, &cone](const node& n) { copies[n] = cone.create_pi(); });
+    for (const auto n : gates)
+    {
+        std::vector<signal> fanins{};
+        ntk.foreach_fanin(n, [&](const signal& f) { fanins.push_back(copies[f.index] ^ ntk.is_complemented(f)); });
+        copies[n] = cone.create_and(fanins[0], fanins[1]);
+    }
+    cone.create_po(copies[root.index] ^ ntk.is_complemented(root));
+
+    return cone;
+}
+
+/**
+ * @brief Decides whether the single output of a miter can be 1, stopping once an interrupt check fires.
+ *
+ * Follows `mockturtle::equivalence_checking`, but hands the SAT solver its conflict budget in chunks and consults the
+ * interrupt check between two of them, since a single call to the solver cannot be interrupted.
+ *
+ * @param miter The single-output miter.
+ * @param ps The conflict limit, whether to apply functional reduction first, and whether to report statistics.
+ * @param check The interrupt check.
+ * @param st Receives the runtime and, if the output can be 1, an assignment of all primary inputs that sets it.
+ * @return `true` if the output is constant 0, `false` if it is not, or `std::nullopt` if the conflict limit was
+ * reached or the check fired.
+ */
+inline std::optional<bool> check_miter(const mockturtle::aig_network&                 miter,
+                                       const mockturtle::equivalence_checking_params& ps, interrupt_check& check,
+                                       mockturtle::equivalence_checking_stats& st)
+{
+    static constexpr int conflicts_per_chunk = 1000;
+
+    const auto verdict = [&]() -> std::optional<bool>
+    {
+        const mockturtle::stopwatch<> t{st.time_total};
+
+        auto target = miter;
+        if (ps.functional_reduction)
+        {
+            target = miter.clone();
+            interruptible_view<mockturtle::aig_network> view{target, check};
+            mockturtle::functional_reduction(view);
+            if (check.fired())
+            {
+                return std::nullopt;
+            }
+            target = mockturtle::cleanup_dangling(target);
+        }
+
+        if (target.num_gates() == 0)
+        {
+            const auto po = target.po_at(0);
+            if (po == target.get_constant(false))
+            {
+                return true;
+            }
+            // the output is constant 1, in which case any assignment tells the networks apart, or a literal of a
+            // primary input, which must then be set to make the literal 1; cleaning up keeps the inputs in order
+            st.counter_example.assign(miter.num_pis(), false);
+            if (const auto n = target.get_node(po); target.is_pi(n))
+            {
+                st.counter_example[target.pi_index(n)] = !target.is_complemented(po);
+            }
+            return false;
+        }
+        if (check())
+        {
+            return std::nullopt;
+        }
+
+        percy::bsat_wrapper solver{};
+        auto                output = static_cast<int>(
+            mockturtle::generate_cnf(target, [&solver](const auto& clause) { solver.add_clause(clause); })[0]);
+
+        while (true)
+        {
+            const auto remaining =
+                ps.conflict_limit == 0 ?
+                    conflicts_per_chunk :
+                    std::min(conflicts_per_chunk, static_cast<int>(ps.conflict_limit) - solver.nr_conflicts());
+
+            switch (solver.solve(&output, &output + 1, std::max(remaining, 1)))
+            {
+                case percy::synth_result::success:
+                {
+                    st.counter_example.clear();
+                    for (auto i = 1U; i <= miter.num_pis(); ++i)
+                    {
+                        st.counter_example.push_back(solver.var_value(static_cast<int>(i)) != 0);
+                    }
+                    return false;
+                }
+                case percy::synth_result::failure: return true;
+                default: break;
+            }
+
+            if ((ps.conflict_limit != 0 && solver.nr_conflicts() >= static_cast<int>(ps.conflict_limit)) || check())
+            {
+                return std::nullopt;
+            }
+        }
+    }();
+
+    if (ps.verbose)
+    {
+        st.report();
+    }
+
+    return verdict;
+}
+
 template <typename Spec, typename Impl>
 void equivalence_checking(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
 {
     namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
 
+    nb::class_<counterexample_cache>(m, "CounterexampleCache",
+                                     R"pb(Stores input assignments that told networks apart, for reuse across checks.
+
+Pass the same cache to successive calls of :func:`equivalence_checking` or
+:func:`per_output_equivalence_checking` against one specification. Every counterexample
+a check finds is added, and every check simulates the stored patterns before any random
+one, so an implementation that fails like an earlier one is rejected without SAT solving.
+
+All patterns assign the same number of primary inputs, which the first pattern fixes.
+Once ``capacity`` patterns are stored, adding another evicts the oldest.)pb")
+        .def(nb::init<std::size_t>(), nb::arg("capacity") = 1024,
+             R"pb(Creates an empty cache.
+
+Args:
+    capacity: Maximum number of patterns kept.
+
+Raises:
+    ValueError: If ``capacity`` is 0.)pb")
+        .def("add", &counterexample_cache::add, nb::arg("pattern"),
+             R"pb(Stores a pattern, or marks it as the most recent one if it is already stored.
+
+Args:
+    pattern: One value per primary input, in input order.
+
+Raises:
+    ValueError: If ``pattern`` assigns a different number of inputs than the stored ones.)pb")
+        .def("clear", &counterexample_cache::clear,
+             R"pb(Removes all patterns and forgets their number of primary inputs.)pb")
+        .def_prop_ro(
+            "patterns", [](const counterexample_cache& self) { return self.patterns(); },
+            R"pb(The stored patterns, oldest first.)pb")
+        .def_prop_ro("last", &counterexample_cache::last,
+                     R"pb(The pattern stored most recently, or ``None`` if the cache is empty.)pb")
+        .def_prop_ro("capacity", &counterexample_cache::capacity, R"pb(Maximum number of patterns kept.)pb")
+        .def_prop_ro("num_pis", &counterexample_cache::num_pis,
+                     R"pb(Number of primary inputs every pattern assigns, or ``None`` if the cache is empty.)pb")
+        .def("__len__", &counterexample_cache::size)
+        .def("__repr__",
+             [](const counterexample_cache& self)
+             {
+                 const auto num_pis = self.num_pis();
+                 return fmt::format("CounterexampleCache(size={}, capacity={}, num_pis={})", self.size(),
+                                    self.capacity(), num_pis.has_value() ? fmt::format("{}", *num_pis) : "None");
+             });
+
     m.def(
         "equivalence_checking",
         [](const Spec& spec, const Impl& impl, const uint32_t conflict_limit = 0,
-           const bool functional_reduction = true, const bool verbose = false) -> std::optional<bool>
+           const bool functional_reduction = true, const bool verbose = false,
+           const uint32_t num_random_patterns = 1024, const uint32_t seed = 1, counterexample_cache* cache = nullptr,
+           const std::optional<double> time_limit = std::nullopt,
+           const cancellation_token*   token      = nullptr) -> std::optional<bool>
         {
+            interrupt_check check{token, time_limit};
+
             const auto miter = mockturtle::miter<mockturtle::aig_network, Spec, Impl>(spec, impl);
 
             if (!miter.has_value())
@@ -37,30 +298,269 @@ void equivalence_checking(nanobind::module_& m)  // NOLINT(misc-use-internal-lin
                 throw std::runtime_error("miter construction failed due to differing numbers of PIs or POs");
             }
 
+            const auto known = cache != nullptr ? cache->patterns(miter->num_pis()) : std::vector<std::vector<bool>>{};
+            if (auto simulated = find_counterexamples(*miter, known, num_random_patterns, seed).front();
+                simulated.has_value())
+            {
+                if (cache != nullptr)
+                {
+                    cache->add(std::move(*simulated));
+                }
+                return false;
+            }
+
             mockturtle::equivalence_checking_params params{};
             params.conflict_limit       = conflict_limit;
             params.functional_reduction = functional_reduction;
             params.verbose              = verbose;
 
-            return mockturtle::equivalence_checking(miter.value(), params);
+            mockturtle::equivalence_checking_stats st{};
+            const auto                             equivalent = check_miter(*miter, params, check, st);
+            check.rethrow_signal();
+
+            if (cache != nullptr && equivalent.has_value() && !*equivalent)
+            {
+                cache->add(std::move(st.counter_example));
+            }
+
+            return equivalent;
         },
         nb::arg("spec"), nb::arg("impl"), nb::kw_only(), nb::arg("conflict_limit") = 0,
-        nb::arg("functional_reduction") = true, nb::arg("verbose") = false,
+        nb::arg("functional_reduction") = true, nb::arg("verbose") = false, nb::arg("num_random_patterns") = 1024,
+        nb::arg("seed") = 1, nb::arg("counterexample_cache") = nb::none(), nb::arg("time_limit") = std::nullopt,
+        nb::arg("cancellation_token") = nb::none(),
         R"pb(Checks functional equivalence between a specification and implementation network using SAT solving.
 
+Before building a SAT instance, the miter is simulated bit-parallel on the patterns in
+``counterexample_cache``, if given, and on ``num_random_patterns`` random patterns. If any
+pattern tells the networks apart, they are reported as not equivalent right away. SAT
+solving only runs when simulation cannot separate them.
+
+Functional reduction and SAT solving can be stopped early by ``time_limit``,
+``cancellation_token``, or Ctrl-C. The SAT solver is checked every 1000 conflicts.
+
 Args:
     spec: The specification network.
     impl: The implementation network.
     conflict_limit: SAT conflict limit. A value of ``0`` means no limit.
     functional_reduction: Whether to perform functional reduction of the miter before checking.
     verbose: Whether to print verbose progress output.
+    num_random_patterns: Number of random input patterns to simulate before SAT solving.
+        ``0`` skips random simulation.
+    seed: Seed of the random patterns.
+    counterexample_cache: A cache whose patterns are simulated first and to which a
+        counterexample found by this check is added, or ``None``. After a ``False``
+        result, its ``last`` pattern tells the networks apart.
+    time_limit: Wall-clock seconds after which the check stops, or ``None`` for no limit.
+    cancellation_token: A token that stops the check once cancelled, or ``None``.
 
 Returns:
     ``True`` if equivalent, ``False`` if not equivalent, or ``None`` if the
-    procedure did not finish before the configured limit.
+    procedure did not finish before the configured limit or was stopped.
+
+Raises:
+    ValueError: If the patterns in ``counterexample_cache`` assign a different number of
+        inputs than the networks have, or ``time_limit`` is not positive.
+    RuntimeError: If miter construction fails due to incompatible interfaces (PI/PO count mismatch).
+    KeyboardInterrupt: If interrupted by Ctrl-C.)pb",
+        nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
+
+    using result_t = output_equivalence_result;
+
+    nb::class_<result_t>(m, "OutputEquivalenceResult",
+                         R"pb(Represents the outcome of :func:`per_output_equivalence_checking`.
+
+``verdicts[i]`` is ``True`` if output ``i`` of the two networks is equivalent, ``False`` if
+it is not, and ``None`` if its SAT call hit the conflict limit, was stopped early, or never
+started. Every output whose verdict is ``False`` has an entry in
+``counterexamples``.)pb")
+        .def_ro("verdicts", &result_t::verdicts, R"pb(One verdict per primary output, in output order.)pb")
+        .def_ro("counterexamples", &result_t::counterexamples,
+                R"pb(Input assignments under which the networks differ, keyed by output.
+
+Each assignment holds one value per primary input, in input order.)pb")
+        .def_prop_ro(
+            "equivalent",
+            [](const result_t& self) -> std::optional<bool>
+            {
+                if (std::any_of(self.verdicts.cbegin(), self.verdicts.cend(),
+                                [](const auto& verdict) { return verdict.has_value() && !*verdict; }))
+                {
+                    return false;
+                }
+                if (std::any_of(self.verdicts.cbegin(), self.verdicts.cend(),
+                                [](const auto& verdict) { return !verdict.has_value(); }))
+                {
+                    return std::nullopt;
+                }
+                return true;
+            },
+            R"pb(The overall verdict.
+
+``False`` if any output differs, ``None`` if none differs but some are undecided, and
+``True`` otherwise.)pb")
+        .def_prop_ro(
+            "failing_outputs",
+            [](const result_t& self)
+            {
+                std::vector<uint32_t> outputs{};
+                for (const auto& [output, counterexample] : self.counterexamples)
+                {
+                    outputs.push_back(output);
+                }
+                return outputs;
+            },
+            R"pb(Positions of the outputs that differ, in ascending order.)pb")
+        .def_ro("runtime", &result_t::runtime, R"pb(Wall-clock seconds the check took.)pb")
+        .def("__len__", [](const result_t& self) { return self.verdicts.size(); })
+        .def("__repr__",
+             [](const result_t& self)
+             {
+                 const auto num_undecided = std::count_if(self.verdicts.cbegin(), self.verdicts.cend(),
+                                                          [](const auto& verdict) { return !verdict.has_value(); });
+                 return fmt::format("OutputEquivalenceResult(num_pos={}, num_failing={}, num_undecided={}, "
+                                    "runtime={:.6f})",
+                                    self.verdicts.size(), self.counterexamples.size(), num_undecided, self.runtime);
+             });
+
+    m.def(
+        "per_output_equivalence_checking",
+        [](const Spec& spec, const Impl& impl, const uint32_t conflict_limit = 0,
+           const std::optional<double> time_budget = std::nullopt, const std::optional<uint32_t> workers = std::nullopt,
+           const bool functional_reduction = true, const uint32_t num_random_patterns = 1024, const uint32_t seed = 1,
+           counterexample_cache* cache = nullptr, const cancellation_token* token = nullptr) -> result_t
+        {
+            if (time_budget.has_value() && !(*time_budget > 0.0))
+            {
+                throw std::invalid_argument(fmt::format("time_budget must be positive, got {}", *time_budget));
+            }
+            if (workers.has_value() && *workers == 0)
+            {
+                throw std::invalid_argument("workers must be at least 1, got 0");
+            }
+
+            const auto      start = std::chrono::steady_clock::now();
+            interrupt_check check{token, time_budget};
+
+            const auto miter = output_miter(spec, impl);
+
+            if (!miter.has_value())
+            {
+                throw std::runtime_error("miter construction failed due to differing numbers of PIs or POs");
+            }
+
+            mockturtle::equivalence_checking_params params{};
+            params.conflict_limit       = conflict_limit;
+            params.functional_reduction = functional_reduction;
+
+            const auto num_pos = miter->num_pos();
+
+            result_t result{std::vector<std::optional<bool>>(num_pos), {}, 0.0};
+
+            // one simulation run covers all outputs; those it separates need no SAT call
+            const auto known = cache != nullptr ? cache->patterns(miter->num_pis()) : std::vector<std::vector<bool>>{};
+            auto       simulated = find_counterexamples(*miter, known, num_random_patterns, seed);
+
+            std::mutex mutex{};
+
+            const auto check_output = [&](const std::size_t chunk)
+            {
+                const auto index = static_cast<uint32_t>(chunk);
+                const auto root  = miter->po_at(index);
+
+                std::optional<bool> verdict{};
+                std::vector<bool>   counterexample{};
+
+                if (simulated[index].has_value())
+                {
+                    verdict        = false;
+                    counterexample = std::move(*simulated[index]);
+                }
+                // structural hashing already decides outputs whose two sides are identical or complementary
+                else if (miter->is_constant(miter->get_node(root)))
+                {
+                    verdict = root == miter->get_constant(false);
+                    if (!*verdict)
+                    {
+                        counterexample.assign(miter->num_pis(), false);
+                    }
+                }
+                else if (check())
+                {
+                    return;
+                }
+                else
+                {
+                    mockturtle::equivalence_checking_stats st{};
+                    verdict        = check_miter(output_cone(*miter, index), params, check, st);
+                    counterexample = std::move(st.counter_example);
+                }
+
+                const std::scoped_lock lock{mutex};
+                result.verdicts[index] = verdict;
+                if (verdict.has_value() && !*verdict)
+                {
+                    if (cache != nullptr)
+                    {
+                        cache->add(counterexample);
+                    }
+                    result.counterexamples.emplace(index, std::move(counterexample));
+                }
+            };
+            for_each_chunk(num_pos, workers, check_output);
+
+            check.rethrow_signal();
+
+            const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - start;
+            result.runtime                              = runtime.count();
+
+            return result;
+        },
+        nb::arg("spec"), nb::arg("impl"), nb::kw_only(), nb::arg("conflict_limit") = 0,
+        nb::arg("time_budget") = std::nullopt, nb::arg("workers") = std::nullopt,
+        nb::arg("functional_reduction") = true, nb::arg("num_random_patterns") = 1024, nb::arg("seed") = 1,
+        nb::arg("counterexample_cache") = nb::none(), nb::arg("cancellation_token") = nb::none(),
+        R"pb(Checks functional equivalence between a specification and implementation network output by output.
+
+Where :func:`equivalence_checking` solves a single miter over all outputs,
+this function checks every output pair on its own cone of logic. The checks run on a
+native thread pool without holding the GIL, so a hard output no longer holds up the
+others, and the result tells which outputs differ and under which input assignment.
+
+Before any SAT solving, all outputs are simulated at once, bit-parallel, on the
+patterns in ``counterexample_cache``, if given, and on ``num_random_patterns`` random
+patterns. Outputs that simulation separates, as well as outputs whose two sides are
+structurally identical or complementary, are decided without SAT solving.
+
+``conflict_limit`` applies to every output on its own. Once ``time_budget`` has passed
+or ``cancellation_token`` is cancelled, running SAT calls stop within 1000 conflicts and
+no further ones start, leaving their outputs undecided. Ctrl-C stops the check the same
+way and then raises ``KeyboardInterrupt``.
+
+Args:
+    spec: The specification network.
+    impl: The implementation network.
+    conflict_limit: SAT conflict limit per output. A value of ``0`` means no limit.
+    time_budget: Wall-clock seconds after which SAT solving stops, or ``None`` for no
+        limit.
+    workers: Maximum number of threads, or ``None`` for the number of CPUs.
+    functional_reduction: Whether to perform functional reduction of each output's
+        miter before checking.
+    num_random_patterns: Number of random input patterns to simulate before SAT solving.
+        ``0`` skips random simulation.
+    seed: Seed of the random patterns.
+    counterexample_cache: A cache whose patterns are simulated first and to which every
+        counterexample found by this check is added, or ``None``.
+    cancellation_token: A token that stops SAT solving once cancelled, or ``None``.
+
+Returns:
+    A verdict per output and a counterexample for every output that differs.
 
 Raises:
-    RuntimeError: If miter construction fails due to incompatible interfaces (PI/PO count mismatch).)pb",
+    ValueError: If ``time_budget`` is not positive, ``workers`` is 0, or the patterns in
+        ``counterexample_cache`` assign a different number of inputs than the networks have.
+    RuntimeError: If miter construction fails due to incompatible interfaces (PI/PO count mismatch).
+    KeyboardInterrupt: If interrupted by Ctrl-C.)pb",
         nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
 }
 
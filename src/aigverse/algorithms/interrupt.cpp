@@ -0,0 +1,37 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/interrupt.hpp"
+
+#include <fmt/format.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
+
+namespace aigverse
+{
+
+void bind_interrupt(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using detail::cancellation_token;
+
+    nb::class_<cancellation_token>(m, "CancellationToken",
+                                   R"pb(Lets any Python thread ask long-running algorithms to stop early.
+
+Pass the token to one or more calls, e.g., running on worker threads, and call
+:meth:`cancel` to stop them all. Each algorithm checks the token periodically and then
+returns as documented for its ``cancellation_token`` argument. A cancelled token stays
+cancelled until :meth:`reset` is called.)pb")
+        .def(nb::init<>(), R"pb(Creates a token that is not cancelled.)pb")
+        .def("cancel", &cancellation_token::cancel,
+             R"pb(Asks every algorithm observing this token to stop. Safe to call from any thread.)pb")
+        .def("reset", &cancellation_token::reset, R"pb(Clears the cancellation so that the token can be reused.)pb")
+        .def_prop_ro("cancelled", &cancellation_token::is_cancelled,
+                     R"pb(Whether :meth:`cancel` has been called since the token was created or last reset.)pb")
+        .def("__repr__", [](const cancellation_token& self)
+             { return fmt::format("CancellationToken(cancelled={})", self.is_cancelled() ? "True" : "False"); });
+}
+
+}  // namespace aigverse
@@ -0,0 +1,286 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include <fmt/format.h>
+#include <nanobind/nanobind.h>
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <exception>
+#include <memory>
+#include <optional>
+#include <stdexcept>
+#include <thread>
+#include <type_traits>
+#include <utility>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief A flag that any thread can raise to ask running algorithms to stop.
+ *
+ * Algorithms only read the flag, so one token can be shared by any number of concurrent calls, which all stop once
+ * it is raised.
+ */
+class cancellation_token
+{
+  public:
+    void cancel() noexcept
+    {
+        flag.store(true, std::memory_order_relaxed);
+    }
+
+    void reset() noexcept
+    {
+        flag.store(false, std::memory_order_relaxed);
+    }
+
+    [[nodiscard]] bool is_cancelled() const noexcept
+    {
+        return flag.load(std::memory_order_relaxed);
+    }
+
+  private:
+    std::atomic<bool> flag{false};
+};
+
+/**
+ * @brief Thrown from within a functional pass to abandon it once it has been interrupted.
+ */
+struct operation_interrupted : std::exception
+{
+    [[nodiscard]] const char* what() const noexcept override
+    {
+        return "operation interrupted";
+    }
+};
+
+/**
+ * @brief Decides when a running algorithm should stop.
+ *
+ * An algorithm stops once its cancellation token is raised, its time limit has passed, or a signal handler raised an
+ * exception, e.g., `KeyboardInterrupt` on Ctrl-C. Python only runs signal handlers on the main thread while it holds
+ * the GIL, so the thread that created the check briefly reacquires the GIL every few milliseconds to let them run.
+ * Other threads only consult the token and the time limit. Once a check has fired, it keeps firing.
+ */
+class interrupt_check
+{
+  public:
+    /**
+     * @brief Creates a check for the calling thread.
+     *
+     * @param cancellation The token to observe, or `nullptr`.
+     * @param time_limit Wall-clock seconds after which the algorithm should stop, if any.
+     */
+    interrupt_check(const cancellation_token* cancellation, const std::optional<double> time_limit) :
+            token{cancellation},
+            caller{std::this_thread::get_id()}
+    {
+        if (time_limit.has_value())
+        {
+            if (!(*time_limit > 0.0))
+            {
+                throw std::invalid_argument(fmt::format("time_limit must be positive, got {}", *time_limit));
+            }
+            deadline =
+                std::chrono::steady_clock::now() + std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+                                                       std::chrono::duration<double>{*time_limit});
+        }
+    }
+
+    /**
+     * @brief Checks whether the algorithm should stop. Safe to call from any thread.
+     *
+     * @return `true` if the algorithm should stop.
+     */
+    [[nodiscard]] bool operator()()
+    {
+        if (stopped.load(std::memory_order_relaxed))
+        {
+            return true;
+        }
+        if (token != nullptr && token->is_cancelled())
+        {
+            return stop();
+        }
+
+        const auto now = std::chrono::steady_clock::now();
+        if (deadline.has_value() && now >= *deadline)
+        {
+            return stop();
+        }
+        if (std::this_thread::get_id() == caller && now >= next_poll)
+        {
+            next_poll = now + poll_interval;
+            poll_signals();
+        }
+
+        return stopped.load(std::memory_order_relaxed);
+    }
+
+    /**
+     * @brief Whether the check has fired, without checking again.
+     */
+    [[nodiscard]] bool fired() const noexcept
+    {
+        return stopped.load(std::memory_order_relaxed);
+    }
+
+    /**
+     * @brief Rethrows the exception a signal handler raised, if any, e.g., `KeyboardInterrupt`.
+     *
+     * Must be called from the thread that created the check.
+     */
+    void rethrow_signal() const
+    {
+        if (signal_error)
+        {
+            std::rethrow_exception(signal_error);
+        }
+    }
+
+  private:
+    static constexpr std::chrono::milliseconds poll_interval{50};
+
+    const cancellation_token*                            token;
+    std::optional<std::chrono::steady_clock::time_point> deadline{};
+    std::thread::id                                      caller;
+    std::chrono::steady_clock::time_point                next_poll{};
+    std::atomic<bool>                                    stopped{false};
+    std::exception_ptr                                   signal_error{};
+
+    bool stop() noexcept
+    {
+        stopped.store(true, std::memory_order_relaxed);
+        return true;
+    }
+
+    void poll_signals()
+    {
+        const nanobind::gil_scoped_acquire acquire{};
+        if (PyErr_CheckSignals() != 0)
+        {
+            signal_error = std::make_exception_ptr(nanobind::python_error{});
+            stop();
+        }
+    }
+};
+
+/**
+ * @brief A network view whose outermost gate traversal ends early once an interrupt check fires.
+ *
+ * In-place passes such as resubstitution and refactoring visit the gates in one outermost `foreach_gate` loop and
+ * leave the network consistent between two gates, so ending that loop early yields a valid, partially optimized
+ * network. Nested traversals, e.g., by views the pass builds internally, are never cut short; neither are those that
+ * run before the main loop unless the check fires during them, in which case the main loop ends right away.
+ *
+ * @tparam Ntk The type of the logic network.
+ */
+template <typename Ntk>
+class interruptible_view : public Ntk
+{
+  public:
+    interruptible_view(const Ntk& ntk, interrupt_check& check) :
+            Ntk{ntk},
+            state{std::make_shared<traversal_state>(traversal_state{&check, 0})}
+    {}
+
+    template <typename Fn>
+    void foreach_gate(Fn&& fn) const
+    {
+        // views the pass builds on top of this one copy it, so the nesting depth lives in shared state
+        const depth_guard guard{*state};
+        const auto        outermost = state->depth == 1;
+
+        Ntk::foreach_gate(
+            [&](const auto& n, const auto i)
+            {
+                if (outermost && (*state->check)())
+                {
+                    return false;
+                }
+                if constexpr (std::is_invocable_v<Fn, decltype(n), decltype(i)>)
+                {
+                    if constexpr (std::is_same_v<std::invoke_result_t<Fn, decltype(n), decltype(i)>, bool>)
+                    {
+                        return fn(n, i);
+                    }
+                    else
+                    {
+                        fn(n, i);
+                        return true;
+                    }
+                }
+                else
+                {
+                    if constexpr (std::is_same_v<std::invoke_result_t<Fn, decltype(n)>, bool>)
+                    {
+                        return fn(n);
+                    }
+                    else
+                    {
+                        fn(n);
+                        return true;
+                    }
+                }
+            });
+    }
+
+  private:
+    struct traversal_state
+    {
+        interrupt_check* check;
+        uint32_t         depth;
+    };
+
+    struct depth_guard
+    {
+        explicit depth_guard(traversal_state& traversal) : state{traversal}
+        {
+            ++state.depth;
+        }
+        ~depth_guard()
+        {
+            --state.depth;
+        }
+        depth_guard(const depth_guard&)            = delete;
+        depth_guard& operator=(const depth_guard&) = delete;
+
+        traversal_state& state;
+    };
+
+    std::shared_ptr<traversal_state> state;
+};
+
+/**
+ * @brief Wraps a resynthesis function so that a functional pass is abandoned once an interrupt check fires.
+ *
+ * Functional passes such as balancing and cut rewriting call their resynthesis function for every cut they consider,
+ * and build their result only at the end, so a pass is abandoned by throwing `operation_interrupted`.
+ *
+ * @tparam Fn The type of the wrapped resynthesis function.
+ */
+template <typename Fn>
+struct interruptible_resynthesis
+{
+    const Fn&        fn;
+    interrupt_check& check;
+
+    // the return type keeps the call SFINAE-friendly, so that passes detect the overloads `Fn` actually provides
+    template <typename... Args>
+    auto operator()(Args&&... args) const -> decltype(fn(std::forward<Args>(args)...))
+    {
+        if (check())
+        {
+            throw operation_interrupted{};
+        }
+        return fn(std::forward<Args>(args)...);
+    }
+};
+
+}  // namespace aigverse::detail
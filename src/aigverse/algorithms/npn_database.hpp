@@ -0,0 +1,139 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include "aigverse/types.hpp"
+
+#include <kitty/static_truth_table.hpp>
+#include <mockturtle/algorithms/node_resynthesis/xag_npn.hpp>
+#include <mockturtle/networks/aig.hpp>
+
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <tuple>
+#include <vector>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief A snapshot of the shared NPN resynthesis database's state.
+ */
+struct npn_database_info
+{
+    bool        built{false};
+    double      build_time{0.0};
+    uint32_t    num_classes{0};
+    uint32_t    num_nodes{0};
+    std::size_t memory{0};
+};
+
+/**
+ * @brief Process-wide, lazily built NPN resynthesis engine for cut rewriting.
+ *
+ * Constructing `mockturtle::xag_npn_resynthesis` canonizes all 2^16 four-input functions and decodes the complete AIG
+ * database, which dominates the runtime of cut rewriting on small networks. The engine is immutable once built and its
+ * call operator only reads from it, so a single instance is built on first use and shared by all calls and threads.
+ *
+ * @tparam Ntk The type of the logic network the engine resynthesizes into.
+ */
+template <typename Ntk>
+class npn_database
+{
+  public:
+    using engine_type = mockturtle::xag_npn_resynthesis<Ntk, aigverse::aig, mockturtle::xag_npn_db_kind::aig_complete>;
+
+    /**
+     * @brief Returns the shared engine, building it on first use.
+     *
+     * Thread-safe. Concurrent first calls block until a single build has finished.
+     *
+     * @return The shared resynthesis engine.
+     */
+    [[nodiscard]] static const engine_type& engine()
+    {
+        auto& self = instance();
+        std::call_once(self.once, [&self] { self.build(); });
+        return *self.resynthesis;
+    }
+
+    /**
+     * @brief Describes the database without building it.
+     *
+     * @return Whether the database is built, and if so, its build time, size, and approximate memory footprint.
+     */
+    [[nodiscard]] static npn_database_info info()
+    {
+        auto& self = instance();
+        if (!self.built.load(std::memory_order_acquire))
+        {
+            return {};
+        }
+        return self.details;
+    }
+
+  private:
+    std::once_flag    once{};
+    std::atomic<bool> built{false};
+    // declared before the engine, which writes to it when it is destroyed
+    mockturtle::xag_npn_resynthesis_stats st{};
+    std::unique_ptr<engine_type>          resynthesis{};
+    npn_database_info                     details{};
+
+    [[nodiscard]] static npn_database& instance()
+    {
+        static npn_database database{};
+        return database;
+    }
+
+    void build()
+    {
+        const auto start = std::chrono::steady_clock::now();
+        resynthesis      = std::make_unique<engine_type>(mockturtle::xag_npn_resynthesis_params{}, &st);
+        const std::chrono::duration<double> build_time = std::chrono::steady_clock::now() - start;
+
+        {
+            // the engine publishes its statistics only from its destructor, so a throwaway copy reports them
+            const engine_type copy{*resynthesis};
+        }
+
+        details = {true, build_time.count(), st.covered_classes, st.db_size, approximate_memory(st)};
+        built.store(true, std::memory_order_release);
+    }
+
+    /**
+     * @brief Estimates the heap and object memory held by the engine from the sizes of its members.
+     *
+     * The engine's members are private, so this adds up their element counts times their element sizes. It ignores
+     * allocator overhead and container slack and is meant as an order of magnitude.
+     *
+     * @param st The statistics collected while building the engine.
+     * @return The approximate footprint in bytes.
+     */
+    [[nodiscard]] static std::size_t approximate_memory(const mockturtle::xag_npn_resynthesis_stats& st) noexcept
+    {
+        using tt_type     = kitty::static_truth_table<4u>;
+        using repr_type   = std::tuple<tt_type, uint32_t, std::vector<uint8_t>>;
+        using node_type   = typename mockturtle::aig_storage::node_type;
+        using signal_type = typename aigverse::aig::signal;
+
+        // one canonization per four-input function, each with a four-entry permutation
+        const std::size_t representatives = (std::size_t{1} << 16u) * (sizeof(repr_type) + 4u * sizeof(uint8_t));
+        // the database's nodes and the structural hash table over them
+        const std::size_t nodes = std::size_t{st.db_size} * (2u * sizeof(node_type) + sizeof(uint64_t));
+        // one entry per covered class, listing database signals; every node appears at most once per polarity
+        const std::size_t classes = std::size_t{st.covered_classes} *
+                                        (sizeof(tt_type) + sizeof(std::vector<signal_type>) + 2u * sizeof(void*)) +
+                                    2u * std::size_t{st.db_size} * sizeof(signal_type);
+
+        return sizeof(engine_type) + representatives + nodes + classes;
+    }
+};
+
+}  // namespace aigverse::detail
@@ -0,0 +1,352 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/recipe.hpp"
+#include "aigverse/thread_pool.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/algorithms/cleanup.hpp>
+#include <mockturtle/traits.hpp>
+#include <mockturtle/views/topo_view.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <iterator>
+#include <limits>
+#include <optional>
+#include <stdexcept>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief A set of gates that is optimized on its own, together with the signals crossing its boundary.
+ *
+ * Gates are listed in topological order. Inputs are the primary inputs and the gates of earlier partitions that the
+ * gates read, and outputs are the gates read by later partitions or primary outputs.
+ */
+template <typename Ntk>
+struct network_partition
+{
+    std::vector<mockturtle::node<Ntk>> gates{};
+    std::vector<mockturtle::node<Ntk>> inputs{};
+    std::vector<mockturtle::node<Ntk>> outputs{};
+};
+
+/**
+ * @brief Splits the live gates of a network into partitions of bounded size and boundary.
+ *
+ * Gates are visited in topological order and added to the current partition until it holds `max_size` gates or the
+ * next gate would raise its number of inputs past `max_inputs`. Since every partition only reads from earlier ones,
+ * the partitions can be stitched back together in order.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @param ntk The network to partition.
+ * @param max_size Maximum number of gates per partition.
+ * @param max_inputs Maximum number of inputs per partition. Must be at least 2.
+ * @return The partitions, in topological order.
+ */
+template <typename Ntk>
+std::vector<network_partition<Ntk>> partition_network(const Ntk& ntk, const uint32_t max_size,
+                                                      const uint32_t max_inputs)
+{
+    using node = mockturtle::node<Ntk>;
+
+    constexpr auto none = std::numeric_limits<uint32_t>::max();
+
+    std::vector<network_partition<Ntk>> partitions{};
+
+    // the partition a gate belongs to, and the last partition a node was recorded as an input of
+    std::vector<uint32_t> owner(ntk.size(), none);
+    std::vector<uint32_t> input_of(ntk.size(), none);
+
+    const auto is_new_input = [&](const node n, const uint32_t current)
+    { return !ntk.is_constant(n) && owner[n] != current && input_of[n] != current; };
+
+    const mockturtle::topo_view<Ntk> topo{ntk};
+    topo.foreach_gate(
+        [&](const node& n)
+        {
+            auto current = partitions.empty() ? none : static_cast<uint32_t>(partitions.size() - 1);
+
+            std::vector<node> fanins{};
+            ntk.foreach_fanin(n, [&](const auto& f) { fanins.push_back(ntk.get_node(f)); });
+            std::sort(fanins.begin(), fanins.end());
+            fanins.erase(std::unique(fanins.begin(), fanins.end()), fanins.end());
+
+            const auto num_new_inputs = static_cast<std::size_t>(std::count_if(
+                fanins.cbegin(), fanins.cend(), [&](const node fanin) { return is_new_input(fanin, current); }));
+
+            if (current == none || partitions[current].gates.size() >= max_size ||
+                partitions[current].inputs.size() + num_new_inputs > max_inputs)
+            {
+                partitions.emplace_back();
+                current = static_cast<uint32_t>(partitions.size() - 1);
+            }
+
+            auto& partition = partitions[current];
+            for (const auto fanin : fanins)
+            {
+                if (is_new_input(fanin, current))
+                {
+                    partition.inputs.push_back(fanin);
+                    input_of[fanin] = current;
+                }
+            }
+            partition.gates.push_back(n);
+            owner[n] = current;
+        });
+
+    std::vector<bool> is_output(ntk.size(), false);
+    for (uint32_t index = 0; index < partitions.size(); ++index)
+    {
+        for (const auto n : partitions[index].inputs)
+        {
+            if (owner[n] != none)
+            {
+                is_output[n] = true;
+            }
+        }
+    }
+    ntk.foreach_po(
+        [&](const auto& f)
+        {
+            if (const auto n = ntk.get_node(f); owner[n] != none)
+            {
+                is_output[n] = true;
+            }
+        });
+
+    for (auto& partition : partitions)
+    {
+        std::copy_if(partition.gates.cbegin(), partition.gates.cend(), std::back_inserter(partition.outputs),
+                     [&](const node n) { return is_output[n]; });
+    }
+
+    return partitions;
+}
+
+/**
+ * @brief Extracts a partition into a network of its own.
+ *
+ * Only reads from `ntk`, so several partitions of the same network can be extracted concurrently.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @param ntk The partitioned network.
+ * @param partition The partition to extract.
+ * @return A network with one primary input per partition input and one primary output per partition output, in order.
+ */
+template <typename Ntk>
+Ntk extract_partition(const Ntk& ntk, const network_partition<Ntk>& partition)
+{
+    Ntk sub{};
+
+    std::unordered_map<mockturtle::node<Ntk>, mockturtle::signal<Ntk>> signals{};
+    signals.reserve(partition.inputs.size() + partition.gates.size());
+
+    for (const auto n : partition.inputs)
+    {
+        signals.emplace(n, sub.create_pi());
+    }
+    for (const auto n : partition.gates)
+    {
+        std::vector<mockturtle::signal<Ntk>> children{};
+        ntk.foreach_fanin(n,
+                          [&](const auto& f)
+                          {
+                              const auto fanin  = ntk.get_node(f);
+                              const auto signal = ntk.is_constant(fanin) ? sub.get_constant(false) : signals.at(fanin);
+                              children.push_back(ntk.is_complemented(f) ? sub.create_not(signal) : signal);
+                          });
+        signals.emplace(n, sub.clone_node(ntk, n, children));
+    }
+    for (const auto n : partition.outputs)
+    {
+        sub.create_po(signals.at(n));
+    }
+
+    return sub;
+}
+
+/**
+ * @brief The outcome of optimizing a network partition by partition.
+ */
+template <typename Ntk>
+struct partitioned_result
+{
+    Ntk         network;
+    std::size_t num_partitions;
+    double      runtime;
+};
+
+template <typename Ntk>
+void partitioning(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using result_t = partitioned_result<Ntk>;
+
+    nb::class_<result_t>(m, "PartitionedResult",
+                         R"pb(Represents the outcome of optimizing a network with :func:`run_partitioned`.)pb")
+        .def_ro("network", &result_t::network, R"pb(The optimized network.)pb")
+        .def_ro("num_partitions", &result_t::num_partitions, R"pb(Number of partitions the network was split into.)pb")
+        .def_ro("runtime", &result_t::runtime,
+                R"pb(Wall-clock seconds the whole call took, including partitioning and stitching.)pb")
+        .def("__repr__",
+             [](const result_t& self)
+             {
+                 return fmt::format("PartitionedResult(num_partitions={}, num_gates={}, runtime={:.6f})",
+                                    self.num_partitions, self.network.num_gates(), self.runtime);
+             });
+
+    m.def(
+        "run_partitioned",
+        [](const Ntk& ntk, const std::vector<nb::object>& recipe, const uint32_t max_partition_size = 10000,
+           const uint32_t max_partition_inputs = 1000, const std::optional<uint32_t> workers = std::nullopt) -> result_t
+        {
+            if (max_partition_size == 0)
+            {
+                throw std::invalid_argument("max_partition_size must be at least 1, got 0");
+            }
+            if (max_partition_inputs < 2)
+            {
+                throw std::invalid_argument(
+                    fmt::format("max_partition_inputs must be at least 2, got {}", max_partition_inputs));
+            }
+            if (workers.has_value() && *workers == 0)
+            {
+                throw std::invalid_argument("workers must be at least 1, got 0");
+            }
+
+            const auto configs = parse_recipe(recipe);
+            for (std::size_t index = 0; index < configs.size(); ++index)
+            {
+                if (configs[index].remove_dangling_pis || configs[index].remove_redundant_pos)
+                {
+                    throw std::invalid_argument(
+                        fmt::format("recipe entry {} ('{}') must not remove primary inputs or outputs, which connect "
+                                    "a partition to the rest of the network",
+                                    index, configs[index].name));
+                }
+            }
+
+            nb::gil_scoped_release release{};
+
+            const auto start = std::chrono::steady_clock::now();
+
+            const auto partitions = partition_network(ntk, max_partition_size, max_partition_inputs);
+
+            std::vector<std::optional<Ntk>> optimized(partitions.size());
+
+            for_each_chunk(partitions.size(), workers,
+                           [&](const std::size_t index)
+                           {
+                               optimized[index] = run_recipe(extract_partition(ntk, partitions[index]), false, configs,
+                                                             [](const pass_step&) { return true; });
+                           });
+
+            // stitch the partitions back together in topological order; creating their gates in one network
+            // structurally hashes them, which merges logic that several partitions ended up sharing
+            Ntk stitched{};
+
+            std::vector<mockturtle::signal<Ntk>> signals(ntk.size());
+            signals[ntk.get_node(ntk.get_constant(false))] = stitched.get_constant(false);
+            ntk.foreach_pi([&](const auto& n) { signals[n] = stitched.create_pi(); });
+
+            for (std::size_t index = 0; index < partitions.size(); ++index)
+            {
+                const auto& partition = partitions[index];
+
+                std::vector<mockturtle::signal<Ntk>> leaves{};
+                leaves.reserve(partition.inputs.size());
+                for (const auto n : partition.inputs)
+                {
+                    leaves.push_back(signals[n]);
+                }
+
+                const auto outputs =
+                    mockturtle::cleanup_dangling(*optimized[index], stitched, leaves.cbegin(), leaves.cend());
+                for (std::size_t i = 0; i < outputs.size(); ++i)
+                {
+                    signals[partition.outputs[i]] = outputs[i];
+                }
+                optimized[index].reset();
+            }
+
+            ntk.foreach_po(
+                [&](const auto& f)
+                {
+                    const auto signal = signals[ntk.get_node(f)];
+                    stitched.create_po(ntk.is_complemented(f) ? stitched.create_not(signal) : signal);
+                });
+
+            // outputs whose only readers were optimized away are left dangling
+            auto network = mockturtle::cleanup_dangling(stitched);
+
+            const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - start;
+
+            return result_t{std::move(network), partitions.size(), runtime.count()};
+        },
+        nb::arg("ntk"), nb::arg("recipe"), nb::kw_only(), nb::arg("max_partition_size") = 10000,
+        nb::arg("max_partition_inputs") = 1000, nb::arg("workers") = std::nullopt,
+        R"pb(Optimizes a network partition by partition on a native thread pool.
+
+The optimization passes are single-threaded, so on very large networks this function
+splits the live logic into partitions, runs ``recipe`` on every partition concurrently
+without holding the GIL, and stitches the optimized partitions back together with
+structural hashing. ``recipe`` takes the format :func:`run_pipeline` accepts, so a single
+pass is a one-entry recipe such as ``["aig_resubstitution"]``.
+
+Partitions are formed from consecutive gates in topological order and hold at most
+``max_partition_size`` gates and ``max_partition_inputs`` signals entering from
+outside. Passes cannot optimize across partition boundaries, so smaller partitions
+parallelize better but leave more optimization potential on the table. A network
+within both limits forms a single partition.
+
+Every pass that runs on a partition is recorded by an active
+:class:`StatisticsCollector` as a run of its own.
+
+Args:
+    ntk: The input logic network. It is left unchanged.
+    recipe: The passes to run on every partition, in order.
+    max_partition_size: Maximum number of AND gates per partition.
+    max_partition_inputs: Maximum number of signals entering a partition.
+    workers: Maximum number of threads, or ``None`` for the number of CPUs.
+
+Returns:
+    The optimized network and the number of partitions.
+
+Raises:
+    TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+    ValueError: If a recipe entry names an unknown pass or parameter, a
+        ``cleanup_dangling`` entry removes primary inputs or outputs,
+        ``max_partition_size`` is 0, ``max_partition_inputs`` is less than 2, or
+        ``workers`` is 0.
+    RuntimeError: If a pass fails in the underlying synthesis engine.)pb");
+}
+
+// Explicit instantiation for AIG
+template void partitioning<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_partitioning(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::partitioning<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
@@ -0,0 +1,130 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/recipe.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
+
+#include <chrono>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief The outcome of running a recipe: the optimized network and a record of every pass.
+ */
+template <typename Ntk>
+struct pipeline_result
+{
+    Ntk                    network;
+    std::vector<pass_step> steps;
+    double                 runtime;
+};
+
+template <typename Ntk>
+void pipeline(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using result_t = pipeline_result<Ntk>;
+
+    nb::class_<pass_step>(m, "PipelineStep",
+                          R"pb(Records the network after one pass of a :func:`run_pipeline` recipe.)pb")
+        .def_ro("name", &pass_step::name, R"pb(Name of the pass.)pb")
+        .def_ro("num_gates", &pass_step::num_gates, R"pb(Number of AND gates after the pass.)pb")
+        .def_ro("depth", &pass_step::depth, R"pb(Number of levels after the pass.)pb")
+        .def_ro("runtime", &pass_step::runtime, R"pb(Wall-clock seconds the pass took.)pb")
+        .def("__repr__",
+             [](const pass_step& self)
+             {
+                 return fmt::format("PipelineStep(name='{}', num_gates={}, depth={}, runtime={:.6f})", self.name,
+                                    self.num_gates, self.depth, self.runtime);
+             });
+
+    nb::class_<result_t>(m, "PipelineResult",
+                         R"pb(Represents the outcome of running a recipe with :func:`run_pipeline`.
+
+``steps`` holds one entry per recipe entry, in order, so ``steps[-1]`` describes the
+network after the last pass. Size and depth are measured on the live logic only, which
+is what the final ``network`` ends up with once its dangling nodes are removed.)pb")
+        .def_ro("network", &result_t::network, R"pb(The optimized network.)pb")
+        .def_ro("steps", &result_t::steps, R"pb(One record per pass, in recipe order.)pb")
+        .def_ro("runtime", &result_t::runtime,
+                R"pb(Wall-clock seconds the whole recipe took, including the final cleanup.)pb")
+        .def("__len__", [](const result_t& self) { return self.steps.size(); })
+        .def("__repr__",
+             [](const result_t& self)
+             {
+                 return fmt::format("PipelineResult(num_steps={}, num_gates={}, runtime={:.6f})", self.steps.size(),
+                                    self.network.num_gates(), self.runtime);
+             });
+
+    m.def(
+        "run_pipeline",
+        [](const Ntk& ntk, const std::vector<nb::object>& recipe) -> result_t
+        {
+            const auto configs = parse_recipe(recipe);
+
+            nb::gil_scoped_release release{};
+
+            std::vector<pass_step> steps{};
+            steps.reserve(configs.size());
+
+            const auto                          start     = std::chrono::steady_clock::now();
+            auto                                optimized = run_recipe(ntk, configs, &steps);
+            const std::chrono::duration<double> runtime   = std::chrono::steady_clock::now() - start;
+
+            return result_t{std::move(optimized), std::move(steps), runtime.count()};
+        },
+        nb::arg("ntk"), nb::arg("recipe"),
+        R"pb(Runs a sequence of optimization passes on a network in a single native call.
+
+Chaining :func:`aig_cut_rewriting`, :func:`aig_resubstitution`, :func:`sop_refactoring`,
+:func:`balancing`, and :func:`cleanup_dangling` from Python copies and cleans up the
+network after every step and returns to the interpreter in between. This function
+instead runs all passes back to back on one working network without holding the GIL,
+copies the input at most once, and removes dangling nodes once at the end. The only
+other cleanups happen ahead of :func:`aig_cut_rewriting` and :func:`balancing`, which
+need a clean network, and only if an in-place pass ran since the last one.
+
+Each recipe entry is either the name of one of these functions or a ``(name, params)``
+tuple, where ``params`` is a mapping of that function's keyword arguments. ``inplace``
+and ``cleanup`` are not accepted, and parameters that are not given take the
+function's defaults.
+
+Args:
+    ntk: The input logic network. It is left unchanged.
+    recipe: The passes to run, in order.
+
+Returns:
+    The optimized network together with the size, depth, and runtime after every pass.
+
+Raises:
+    TypeError: If an entry is not a name or a ``(name, params)`` tuple, or a parameter
+        has the wrong type.
+    ValueError: If an entry names an unknown pass or parameter, or an unknown
+        ``rebalance_function``.
+    RuntimeError: If a pass fails in the underlying synthesis engine.)pb");
+}
+
+// Explicit instantiation for AIG
+template void pipeline<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_pipeline(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::pipeline<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
@@ -0,0 +1,339 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/recipe.hpp"
+#include "aigverse/thread_pool.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/views/depth_view.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief How the candidates of a portfolio are ranked.
+ */
+enum class portfolio_cost : uint8_t
+{
+    size,
+    depth,
+    size_then_depth,
+    depth_then_size
+};
+
+/**
+ * @brief Parses the name of a portfolio cost.
+ *
+ * @param name The cost as given in Python.
+ * @return The corresponding cost.
+ */
+inline portfolio_cost parse_portfolio_cost(const std::string& name)
+{
+    if (name == "size")
+    {
+        return portfolio_cost::size;
+    }
+    if (name == "depth")
+    {
+        return portfolio_cost::depth;
+    }
+    if (name == "size_then_depth")
+    {
+        return portfolio_cost::size_then_depth;
+    }
+    if (name == "depth_then_size")
+    {
+        return portfolio_cost::depth_then_size;
+    }
+
+    throw std::invalid_argument(fmt::format("Unknown cost: '{}'. Possible values are 'size', 'depth', "
+                                            "'size_then_depth', and 'depth_then_size'.",
+                                            name));
+}
+
+/**
+ * @brief Ranks a network by the chosen cost. Pairs compare lexicographically; lower is better.
+ *
+ * @param cost The cost to rank by.
+ * @param num_gates The network's number of AND gates.
+ * @param depth The network's number of levels.
+ * @return The primary and the secondary criterion.
+ */
+inline std::pair<uint32_t, uint32_t> rank(const portfolio_cost cost, const uint32_t num_gates, const uint32_t depth)
+{
+    switch (cost)
+    {
+        case portfolio_cost::size: return {num_gates, 0U};
+        case portfolio_cost::depth: return {depth, 0U};
+        case portfolio_cost::size_then_depth: return {num_gates, depth};
+        case portfolio_cost::depth_then_size: return {depth, num_gates};
+    }
+    return {num_gates, depth};
+}
+
+/**
+ * @brief How one candidate recipe of a portfolio went.
+ */
+struct portfolio_candidate
+{
+    std::size_t            index{0};
+    std::vector<pass_step> steps{};
+    uint32_t               num_gates{0};
+    uint32_t               depth{0};
+    double                 runtime{0.0};
+    bool                   cancelled{false};
+};
+
+/**
+ * @brief The outcome of a portfolio: the winning network and a record of every candidate.
+ */
+template <typename Ntk>
+struct portfolio_result
+{
+    Ntk                              network;
+    std::size_t                      best;
+    std::vector<portfolio_candidate> candidates;
+    double                           runtime;
+};
+
+template <typename Ntk>
+void portfolio(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using result_t = portfolio_result<Ntk>;
+
+    nb::class_<portfolio_candidate>(m, "PortfolioCandidate",
+                                    R"pb(Records how one recipe of a :func:`run_portfolio` call went.)pb")
+        .def_ro("index", &portfolio_candidate::index, R"pb(Position of the recipe in the portfolio.)pb")
+        .def_ro("steps", &portfolio_candidate::steps,
+                R"pb(One record per pass that ran, in recipe order.
+
+Shorter than the recipe if the candidate was cancelled.)pb")
+        .def_ro("num_gates", &portfolio_candidate::num_gates,
+                R"pb(Number of AND gates the candidate ended with, or had when it was cancelled.)pb")
+        .def_ro("depth", &portfolio_candidate::depth,
+                R"pb(Number of levels the candidate ended with, or had when it was cancelled.)pb")
+        .def_ro("runtime", &portfolio_candidate::runtime, R"pb(Wall-clock seconds the candidate took.)pb")
+        .def_ro("cancelled", &portfolio_candidate::cancelled,
+                R"pb(Whether the candidate was cancelled before finishing its recipe.)pb")
+        .def("__repr__",
+             [](const portfolio_candidate& self)
+             {
+                 return fmt::format("PortfolioCandidate(index={}, num_gates={}, depth={}, runtime={:.6f}, "
+                                    "cancelled={})",
+                                    self.index, self.num_gates, self.depth, self.runtime,
+                                    self.cancelled ? "True" : "False");
+             });
+
+    nb::class_<result_t>(m, "PortfolioResult",
+                         R"pb(Represents the outcome of running several recipes with :func:`run_portfolio`.
+
+``candidates`` holds one entry per recipe, in portfolio order, and ``candidates[best]``
+describes the recipe that produced ``network``.)pb")
+        .def_ro("network", &result_t::network, R"pb(The network produced by the best recipe.)pb")
+        .def_ro("best", &result_t::best, R"pb(Position of the best recipe in the portfolio.)pb")
+        .def_ro("candidates", &result_t::candidates, R"pb(One record per recipe, in portfolio order.)pb")
+        .def_ro("runtime", &result_t::runtime, R"pb(Wall-clock seconds the whole portfolio took.)pb")
+        .def("__len__", [](const result_t& self) { return self.candidates.size(); })
+        .def("__repr__",
+             [](const result_t& self)
+             {
+                 return fmt::format("PortfolioResult(num_candidates={}, best={}, num_gates={}, runtime={:.6f})",
+                                    self.candidates.size(), self.best, self.network.num_gates(), self.runtime);
+             });
+
+    m.def(
+        "run_portfolio",
+        [](const Ntk& ntk, const std::vector<std::vector<nb::object>>& recipes,
+           const std::string& cost = "size_then_depth", const std::optional<double> margin = std::nullopt,
+           const std::optional<uint32_t> workers = std::nullopt) -> result_t
+        {
+            if (recipes.empty())
+            {
+                throw std::invalid_argument("recipes must contain at least one recipe");
+            }
+            if (margin.has_value() && !(*margin >= 0.0))
+            {
+                throw std::invalid_argument(fmt::format("margin must be non-negative, got {}", *margin));
+            }
+            if (workers.has_value() && *workers == 0)
+            {
+                throw std::invalid_argument("workers must be at least 1, got 0");
+            }
+
+            const auto ranking = parse_portfolio_cost(cost);
+
+            std::vector<std::vector<pass_config>> configs{};
+            configs.reserve(recipes.size());
+            for (std::size_t index = 0; index < recipes.size(); ++index)
+            {
+                try
+                {
+                    configs.push_back(parse_recipe(recipes[index]));
+                }
+                catch (const nb::builtin_exception& e)
+                {
+                    const auto message = fmt::format("recipe {}: {}", index, e.what());
+                    throw nb::builtin_exception(e.type(), message.c_str());
+                }
+                catch (const std::invalid_argument& e)
+                {
+                    throw std::invalid_argument(fmt::format("recipe {}: {}", index, e.what()));
+                }
+            }
+
+            nb::gil_scoped_release release{};
+
+            const auto start = std::chrono::steady_clock::now();
+
+            std::vector<portfolio_candidate> candidates(configs.size());
+
+            std::atomic<bool>             failed{false};
+            std::mutex                    mutex{};
+            std::optional<std::size_t>    best_index{};
+            std::pair<uint32_t, uint32_t> best_rank{};
+            std::optional<Ntk>            best_network{};
+
+            const auto run_candidate = [&](const std::size_t index)
+            {
+                auto& candidate            = candidates[index];
+                candidate.index            = index;
+                const auto candidate_start = std::chrono::steady_clock::now();
+
+                try
+                {
+                    // every candidate works on a clone of its own: even functional passes keep scratch data in the
+                    // network's storage, which concurrent passes must not share
+                    auto optimized = run_recipe(ntk.clone(), false, configs[index],
+                                                [&](pass_step step)
+                                                {
+                                                    const auto primary =
+                                                        rank(ranking, step.num_gates, step.depth).first;
+                                                    candidate.steps.push_back(std::move(step));
+
+                                                    if (failed)
+                                                    {
+                                                        return false;
+                                                    }
+                                                    if (!margin.has_value())
+                                                    {
+                                                        return true;
+                                                    }
+
+                                                    const std::scoped_lock lock{mutex};
+                                                    return !best_index.has_value() ||
+                                                           static_cast<double>(primary) <=
+                                                               static_cast<double>(best_rank.first) * (1.0 + *margin);
+                                                });
+
+                    if (optimized.has_value())
+                    {
+                        candidate.num_gates = optimized->num_gates();
+                        candidate.depth     = mockturtle::depth_view<Ntk>{*optimized}.depth();
+
+                        const auto candidate_rank = rank(ranking, candidate.num_gates, candidate.depth);
+
+                        const std::scoped_lock lock{mutex};
+                        // ties go to the recipe listed first, so the outcome does not depend on scheduling
+                        if (!best_index.has_value() || candidate_rank < best_rank ||
+                            (candidate_rank == best_rank && index < *best_index))
+                        {
+                            best_index   = index;
+                            best_rank    = candidate_rank;
+                            best_network = std::move(*optimized);
+                        }
+                    }
+                    else
+                    {
+                        candidate.cancelled = true;
+                        candidate.num_gates = candidate.steps.back().num_gates;
+                        candidate.depth     = candidate.steps.back().depth;
+                    }
+                }
+                catch (...)
+                {
+                    // lets the candidates that are still running stop early
+                    failed = true;
+                    throw;
+                }
+
+                const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - candidate_start;
+                candidate.runtime                           = runtime.count();
+            };
+            for_each_chunk(configs.size(), workers, run_candidate);
+
+            const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - start;
+
+            return result_t{std::move(*best_network), *best_index, std::move(candidates), runtime.count()};
+        },
+        nb::arg("ntk"), nb::arg("recipes"), nb::kw_only(), nb::arg("cost") = "size_then_depth",
+        nb::arg("margin") = std::nullopt, nb::arg("workers") = std::nullopt,
+        R"pb(Runs several recipes on a network concurrently and keeps the best result.
+
+Each recipe is a list of passes in the format :func:`run_pipeline` accepts. Every
+candidate works on its own copy of ``ntk`` and runs on a native thread pool without
+holding the GIL, so trying several parameter sets costs no Python-side orchestration.
+
+Candidates are ranked by ``cost``. ``"size"`` and ``"depth"`` compare the number of AND
+gates or levels alone, while ``"size_then_depth"`` and ``"depth_then_size"`` break ties
+on the other criterion. Remaining ties go to the recipe listed first, so the winner
+does not depend on which thread finished first.
+
+With ``margin`` set, a running candidate is cancelled between two of its passes once
+its primary criterion exceeds that of the best finished candidate by more than
+``margin`` (relative), since it is then unlikely to win. This is a heuristic: a later
+pass may recover such a gap, so pruning trades the guarantee of finding the best
+recipe for time. Without ``margin``, every candidate runs to completion.
+
+Args:
+    ntk: The input logic network. It is left unchanged.
+    recipes: The candidate recipes.
+    cost: How candidates are ranked. Supported values are ``"size"``, ``"depth"``,
+        ``"size_then_depth"``, and ``"depth_then_size"``.
+    margin: Relative gap to the best finished candidate past which a running
+        candidate is cancelled, e.g., ``0.1`` for 10%. ``None`` disables cancellation.
+    workers: Maximum number of threads, or ``None`` for the number of CPUs.
+
+Returns:
+    The best network, the position of its recipe, and a record of every candidate.
+
+Raises:
+    TypeError: If a recipe entry is malformed or a parameter has the wrong type.
+    ValueError: If ``recipes`` is empty, a recipe names an unknown pass or parameter,
+        ``cost`` is unknown, ``margin`` is negative, or ``workers`` is 0.
+    RuntimeError: If a pass fails in the underlying synthesis engine.)pb");
+}
+
+// Explicit instantiation for AIG
+template void portfolio<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_portfolio(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::portfolio<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
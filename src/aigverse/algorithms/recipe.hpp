@@ -0,0 +1,540 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include "aigverse/algorithms/npn_database.hpp"
+#include "aigverse/algorithms/statistics.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <fmt/ranges.h>
+#include <mockturtle/algorithms/balancing.hpp>
+#include <mockturtle/algorithms/balancing/esop_balancing.hpp>
+#include <mockturtle/algorithms/balancing/sop_balancing.hpp>
+#include <mockturtle/algorithms/cleanup.hpp>
+#include <mockturtle/algorithms/cut_rewriting.hpp>
+#include <mockturtle/algorithms/node_resynthesis/sop_factoring.hpp>
+#include <mockturtle/algorithms/refactoring.hpp>
+#include <mockturtle/algorithms/resubstitution.hpp>
+#include <mockturtle/views/depth_view.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+
+#include <array>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <exception>
+#include <new>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief The optimization passes a recipe can name.
+ */
+enum class pass_kind : uint8_t
+{
+    cut_rewriting,
+    resubstitution,
+    refactoring,
+    balancing,
+    cleanup_dangling
+};
+
+/**
+ * @brief One parsed recipe entry: the pass to run and the parameters to run it with.
+ *
+ * Only the parameters belonging to `kind` are meaningful. All of them default to the keyword defaults of the
+ * corresponding Python function, which differ from mockturtle's own defaults in places.
+ */
+struct pass_config
+{
+    pass_kind   kind{pass_kind::cleanup_dangling};
+    std::string name{"cleanup_dangling"};
+
+    mockturtle::cut_rewriting_params  rewriting_ps{};
+    mockturtle::resubstitution_params resubstitution_ps{};
+    mockturtle::refactoring_params    refactoring_ps{};
+    mockturtle::sop_factoring_params  sop_factoring_ps{};
+    mockturtle::balancing_params      balancing_ps{};
+    std::string                       rebalance_function{"sop"};
+    bool                              sop_both_phases{true};
+    bool                              remove_dangling_pis{false};
+    bool                              remove_redundant_pos{false};
+
+    pass_config()
+    {
+        rewriting_ps.cut_enumeration_ps.cut_size             = 4;
+        rewriting_ps.cut_enumeration_ps.cut_limit            = 8;
+        rewriting_ps.cut_enumeration_ps.minimize_truth_table = true;
+        rewriting_ps.min_cand_cut_size                       = 3;
+
+        resubstitution_ps.max_pis                        = 8;
+        resubstitution_ps.max_divisors                   = 150;
+        resubstitution_ps.max_inserts                    = 2;
+        resubstitution_ps.skip_fanout_limit_for_roots    = 1000;
+        resubstitution_ps.skip_fanout_limit_for_divisors = 100;
+        resubstitution_ps.window_size                    = 12;
+
+        refactoring_ps.max_pis                  = 6;
+        sop_factoring_ps.use_quick_factoring    = true;
+        sop_factoring_ps.try_both_polarities    = true;
+        sop_factoring_ps.consider_inverter_cost = false;
+
+        balancing_ps.cut_enumeration_ps.cut_size             = 4;
+        balancing_ps.cut_enumeration_ps.cut_limit            = 8;
+        balancing_ps.cut_enumeration_ps.minimize_truth_table = true;
+    }
+};
+
+/**
+ * @brief A keyword a recipe entry may set, and how to store its value in a `pass_config`.
+ */
+struct pass_option
+{
+    std::string_view key;
+    void (*assign)(pass_config&, nanobind::handle);
+};
+
+// Keywords mirror the Python functions of the same name, minus `inplace` and `cleanup`, which recipes control.
+
+inline constexpr std::array<pass_option, 10> cut_rewriting_options{{
+    {"cut_size", [](pass_config& c, nanobind::handle v)
+     { c.rewriting_ps.cut_enumeration_ps.cut_size = nanobind::cast<uint32_t>(v); }},
+    {"cut_limit", [](pass_config& c, nanobind::handle v)
+     { c.rewriting_ps.cut_enumeration_ps.cut_limit = nanobind::cast<uint32_t>(v); }},
+    {"minimize_truth_table", [](pass_config& c, nanobind::handle v)
+     { c.rewriting_ps.cut_enumeration_ps.minimize_truth_table = nanobind::cast<bool>(v); }},
+    {"allow_zero_gain",
+     [](pass_config& c, nanobind::handle v) { c.rewriting_ps.allow_zero_gain = nanobind::cast<bool>(v); }},
+    {"use_dont_cares",
+     [](pass_config& c, nanobind::handle v) { c.rewriting_ps.use_dont_cares = nanobind::cast<bool>(v); }},
+    {"min_cand_cut_size",
+     [](pass_config& c, nanobind::handle v) { c.rewriting_ps.min_cand_cut_size = nanobind::cast<uint32_t>(v); }},
+    {"min_cand_cut_size_override", [](pass_config& c, nanobind::handle v)
+     { c.rewriting_ps.min_cand_cut_size_override = nanobind::cast<std::optional<uint32_t>>(v); }},
+    {"preserve_depth",
+     [](pass_config& c, nanobind::handle v) { c.rewriting_ps.preserve_depth = nanobind::cast<bool>(v); }},
+    {"verbose", [](pass_config& c, nanobind::handle v) { c.rewriting_ps.verbose = nanobind::cast<bool>(v); }},
+    {"very_verbose", [](pass_config& c, nanobind::handle v) { c.rewriting_ps.very_verbose = nanobind::cast<bool>(v); }},
+}};
+
+inline constexpr std::array<pass_option, 9> resubstitution_options{{
+    {"max_pis", [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.max_pis = nanobind::cast<uint32_t>(v); }},
+    {"max_divisors",
+     [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.max_divisors = nanobind::cast<uint32_t>(v); }},
+    {"max_inserts",
+     [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.max_inserts = nanobind::cast<uint32_t>(v); }},
+    {"skip_fanout_limit_for_roots", [](pass_config& c, nanobind::handle v)
+     { c.resubstitution_ps.skip_fanout_limit_for_roots = nanobind::cast<uint32_t>(v); }},
+    {"skip_fanout_limit_for_divisors", [](pass_config& c, nanobind::handle v)
+     { c.resubstitution_ps.skip_fanout_limit_for_divisors = nanobind::cast<uint32_t>(v); }},
+    {"verbose", [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.verbose = nanobind::cast<bool>(v); }},
+    {"use_dont_cares",
+     [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.use_dont_cares = nanobind::cast<bool>(v); }},
+    {"window_size",
+     [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.window_size = nanobind::cast<uint32_t>(v); }},
+    {"preserve_depth",
+     [](pass_config& c, nanobind::handle v) { c.resubstitution_ps.preserve_depth = nanobind::cast<bool>(v); }},
+}};
+
+inline constexpr std::array<pass_option, 8> refactoring_options{{
+    {"max_pis", [](pass_config& c, nanobind::handle v) { c.refactoring_ps.max_pis = nanobind::cast<uint32_t>(v); }},
+    {"allow_zero_gain",
+     [](pass_config& c, nanobind::handle v) { c.refactoring_ps.allow_zero_gain = nanobind::cast<bool>(v); }},
+    {"use_reconvergence_cut",
+     [](pass_config& c, nanobind::handle v) { c.refactoring_ps.use_reconvergence_cut = nanobind::cast<bool>(v); }},
+    {"use_dont_cares",
+     [](pass_config& c, nanobind::handle v) { c.refactoring_ps.use_dont_cares = nanobind::cast<bool>(v); }},
+    {"use_quick_factoring",
+     [](pass_config& c, nanobind::handle v) { c.sop_factoring_ps.use_quick_factoring = nanobind::cast<bool>(v); }},
+    {"try_both_polarities",
+     [](pass_config& c, nanobind::handle v) { c.sop_factoring_ps.try_both_polarities = nanobind::cast<bool>(v); }},
+    {"consider_inverter_cost",
+     [](pass_config& c, nanobind::handle v) { c.sop_factoring_ps.consider_inverter_cost = nanobind::cast<bool>(v); }},
+    {"verbose", [](pass_config& c, nanobind::handle v) { c.refactoring_ps.verbose = nanobind::cast<bool>(v); }},
+}};
+
+inline constexpr std::array<pass_option, 7> balancing_options{{
+    {"cut_size", [](pass_config& c, nanobind::handle v)
+     { c.balancing_ps.cut_enumeration_ps.cut_size = nanobind::cast<uint32_t>(v); }},
+    {"cut_limit", [](pass_config& c, nanobind::handle v)
+     { c.balancing_ps.cut_enumeration_ps.cut_limit = nanobind::cast<uint32_t>(v); }},
+    {"minimize_truth_table", [](pass_config& c, nanobind::handle v)
+     { c.balancing_ps.cut_enumeration_ps.minimize_truth_table = nanobind::cast<bool>(v); }},
+    {"only_on_critical_path",
+     [](pass_config& c, nanobind::handle v) { c.balancing_ps.only_on_critical_path = nanobind::cast<bool>(v); }},
+    {"rebalance_function",
+     [](pass_config& c, nanobind::handle v) { c.rebalance_function = nanobind::cast<std::string>(v); }},
+    {"sop_both_phases", [](pass_config& c, nanobind::handle v) { c.sop_both_phases = nanobind::cast<bool>(v); }},
+    {"verbose", [](pass_config& c, nanobind::handle v) { c.balancing_ps.verbose = nanobind::cast<bool>(v); }},
+}};
+
+inline constexpr std::array<pass_option, 2> cleanup_dangling_options{{
+    {"remove_dangling_pis",
+     [](pass_config& c, nanobind::handle v) { c.remove_dangling_pis = nanobind::cast<bool>(v); }},
+    {"remove_redundant_pos",
+     [](pass_config& c, nanobind::handle v) { c.remove_redundant_pos = nanobind::cast<bool>(v); }},
+}};
+
+/**
+ * @brief Applies the keyword arguments of one recipe entry to its configuration.
+ *
+ * @tparam N The number of keywords the pass accepts.
+ * @param config The configuration to update.
+ * @param index Position of the entry in the recipe, for error messages.
+ * @param params The keyword arguments of the entry.
+ * @param options The keywords the pass accepts.
+ */
+template <std::size_t N>
+void apply_pass_options(pass_config& config, const std::size_t index, const nanobind::dict& params,
+                        const std::array<pass_option, N>& options)
+{
+    for (const auto& [key, value] : params)
+    {
+        const auto name = nanobind::cast<std::string>(key);
+
+        const pass_option* option = nullptr;
+        for (const auto& candidate : options)
+        {
+            if (candidate.key == name)
+            {
+                option = &candidate;
+                break;
+            }
+        }
+
+        if (option == nullptr)
+        {
+            std::vector<std::string_view> keys{};
+            keys.reserve(N);
+            for (const auto& candidate : options)
+            {
+                keys.push_back(candidate.key);
+            }
+            throw std::invalid_argument(fmt::format("recipe entry {} ('{}') got an unexpected parameter '{}'. "
+                                                    "Possible parameters are: {}.",
+                                                    index, config.name, name, fmt::join(keys, ", ")));
+        }
+
+        try
+        {
+            option->assign(config, value);
+        }
+        catch (const nanobind::cast_error&)
+        {
+            const auto message = fmt::format("recipe entry {} ('{}') got a value of type '{}' for parameter '{}'",
+                                             index, config.name, nanobind::inst_name(value).c_str(), name);
+            throw nanobind::type_error(message.c_str());
+        }
+    }
+
+    if (config.kind == pass_kind::balancing && config.rebalance_function != "sop" &&
+        config.rebalance_function != "esop")
+    {
+        throw std::invalid_argument(fmt::format("recipe entry {} ('{}'): unknown rebalance function '{}'. Possible "
+                                                "values are 'sop' and 'esop'.",
+                                                index, config.name, config.rebalance_function));
+    }
+}
+
+/**
+ * @brief Checks whether a Python object is a `collections.abc.Mapping`.
+ *
+ * Unlike `PyMapping_Check`, which nanobind's `isinstance<mapping>` uses, this rejects sequences such as lists.
+ *
+ * @param obj The object to check.
+ * @return `true` if @p obj is a mapping.
+ */
+inline bool is_mapping(const nanobind::handle obj)
+{
+    const auto mapping = nanobind::module_::import_("collections.abc").attr("Mapping");
+    const auto result  = PyObject_IsInstance(obj.ptr(), mapping.ptr());
+    if (result < 0)
+    {
+        throw nanobind::python_error();
+    }
+    return result == 1;
+}
+
+/**
+ * @brief Parses a Python recipe into pass configurations.
+ *
+ * Every entry is either the name of a pass or a `(name, params)` tuple, where `params` is a mapping of keyword
+ * arguments for that pass. Pass names and keywords are those of the Python functions in `aigverse.algorithms`.
+ *
+ * Must be called with the GIL held.
+ *
+ * @param recipe The recipe entries.
+ * @return The parsed configurations, in recipe order.
+ */
+inline std::vector<pass_config> parse_recipe(const std::vector<nanobind::object>& recipe)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    std::vector<pass_config> configs{};
+    configs.reserve(recipe.size());
+
+    for (std::size_t index = 0; index < recipe.size(); ++index)
+    {
+        const auto& entry = recipe[index];
+
+        nb::dict params{};
+        if (nb::isinstance<nb::str>(entry))
+        {
+            configs.emplace_back().name = nb::cast<std::string>(entry);
+        }
+        else if (nb::isinstance<nb::tuple>(entry) && nb::len(entry) == 2 && nb::isinstance<nb::str>(entry[0]) &&
+                 is_mapping(entry[1]))
+        {
+            configs.emplace_back().name = nb::cast<std::string>(entry[0]);
+            for (const auto item : nb::borrow<nb::mapping>(entry[1]).items())
+            {
+                params[item[0]] = item[1];
+            }
+        }
+        else
+        {
+            const auto message = fmt::format(
+                "recipe entry {} must be a pass name or a (name, params) tuple with a mapping of parameters, got '{}'",
+                index, nb::inst_name(entry).c_str());
+            throw nb::type_error(message.c_str());
+        }
+
+        auto& config = configs.back();
+        if (config.name == "aig_cut_rewriting")
+        {
+            config.kind = pass_kind::cut_rewriting;
+            apply_pass_options(config, index, params, cut_rewriting_options);
+        }
+        else if (config.name == "aig_resubstitution")
+        {
+            config.kind = pass_kind::resubstitution;
+            apply_pass_options(config, index, params, resubstitution_options);
+        }
+        else if (config.name == "sop_refactoring")
+        {
+            config.kind = pass_kind::refactoring;
+            apply_pass_options(config, index, params, refactoring_options);
+        }
+        else if (config.name == "balancing")
+        {
+            config.kind = pass_kind::balancing;
+            apply_pass_options(config, index, params, balancing_options);
+        }
+        else if (config.name == "cleanup_dangling")
+        {
+            config.kind = pass_kind::cleanup_dangling;
+            apply_pass_options(config, index, params, cleanup_dangling_options);
+        }
+        else
+        {
+            throw std::invalid_argument(
+                fmt::format("recipe entry {} names an unknown pass '{}'. Possible passes are 'aig_cut_rewriting', "
+                            "'aig_resubstitution', 'sop_refactoring', 'balancing', and 'cleanup_dangling'.",
+                            index, config.name));
+        }
+    }
+
+    return configs;
+}
+
+/**
+ * @brief What a network looked like after one recipe pass, and how long the pass took.
+ */
+struct pass_step
+{
+    std::string name;
+    uint32_t    num_gates;
+    uint32_t    depth;
+    double      runtime;
+};
+
+/**
+ * @brief Runs a single pass on `ntk` and records its statistics to the process-wide log, if any.
+ *
+ * Functional passes (cut rewriting, balancing, and cleanup) replace `ntk` by a fresh, clean network. The others
+ * rewrite `ntk` in place and may leave dangling nodes behind.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @param ntk The network to optimize. Must not share its storage with a network the caller wants to keep.
+ * @param config The pass to run.
+ * @return Whether `ntk` may contain dangling nodes afterward.
+ */
+template <typename Ntk>
+bool run_pass(Ntk& ntk, const pass_config& config)
+{
+    const uint64_t before         = ntk.num_gates();
+    uint64_t       num_candidates = 0;
+
+    const auto rebalance = [&](const auto& rebalance_fn)
+    {
+        using rebalance_fn_t = std::decay_t<decltype(rebalance_fn)>;
+
+        mockturtle::balancing_stats st{};
+        ntk = mockturtle::balancing(ntk, {counting_resynthesis<rebalance_fn_t>{rebalance_fn, num_candidates}},
+                                    config.balancing_ps, &st);
+        publish_statistics(make_statistics(st, num_candidates, before, ntk.num_gates()), nullptr);
+    };
+
+    switch (config.kind)
+    {
+        case pass_kind::cut_rewriting:
+        {
+            using engine_t = typename npn_database<Ntk>::engine_type;
+
+            mockturtle::cut_rewriting_stats st{};
+            ntk = mockturtle::cut_rewriting(ntk,
+                                            counting_resynthesis<engine_t>{npn_database<Ntk>::engine(), num_candidates},
+                                            config.rewriting_ps, &st);
+            publish_statistics(make_statistics(st, num_candidates, before, ntk.num_gates()), nullptr);
+            return false;
+        }
+        case pass_kind::resubstitution:
+        {
+            publish_statistics(aig_resubstitution_with_statistics(ntk, config.resubstitution_ps), nullptr);
+            return true;
+        }
+        case pass_kind::refactoring:
+        {
+            mockturtle::sop_factoring<Ntk>                             sop_resyn_engine{config.sop_factoring_ps};
+            mockturtle::refactoring_stats                              st{};
+            const counting_resynthesis<mockturtle::sop_factoring<Ntk>> counted{sop_resyn_engine, num_candidates};
+            mockturtle::refactoring(ntk, counted, config.refactoring_ps, &st);
+            publish_statistics(make_statistics(st, num_candidates, before, ntk.num_gates()), nullptr);
+            return true;
+        }
+        case pass_kind::balancing:
+        {
+            if (config.rebalance_function == "esop")
+            {
+                mockturtle::esop_rebalancing<Ntk> rebalance_fn{};
+                rebalance_fn.both_phases = config.sop_both_phases;
+                rebalance(rebalance_fn);
+            }
+            else
+            {
+                mockturtle::sop_rebalancing<Ntk> rebalance_fn{};
+                rebalance_fn.both_phases_ = config.sop_both_phases;
+                rebalance(rebalance_fn);
+            }
+            return false;
+        }
+        case pass_kind::cleanup_dangling:
+        {
+            ntk = mockturtle::cleanup_dangling(ntk, config.remove_dangling_pis, config.remove_redundant_pos);
+            return false;
+        }
+    }
+    return false;
+}
+
+/**
+ * @brief Runs a parsed recipe on a network, reporting after every pass and stopping when told to.
+ *
+ * The passes run back to back on one working network. If `shared` is set, the network is cloned only once an in-place
+ * pass would otherwise modify it. Dangling nodes left behind by in-place passes are removed once at the end rather
+ * than after every pass, and before cut rewriting or balancing only if an in-place pass ran since the last cleanup.
+ * Does not need the GIL.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @tparam OnStep Callable taking a `pass_step` and returning whether to continue with the next pass.
+ * @param current The network to optimize.
+ * @param shared Whether `current` shares its storage with a network that must not be modified.
+ * @param recipe The passes to run, in order.
+ * @param on_step Called after every pass with the network's size and depth after it and the pass's runtime.
+ * @return The optimized network, or `std::nullopt` if `on_step` stopped the recipe early.
+ */
+template <typename Ntk, typename OnStep>
+std::optional<Ntk> run_recipe(Ntk current, bool shared, const std::vector<pass_config>& recipe, OnStep&& on_step)
+{
+    bool dirty = false;
+    // the storage that must not be modified, which passes can hand back unchanged
+    const auto original = shared ? current._storage : nullptr;
+
+    for (std::size_t index = 0; index < recipe.size(); ++index)
+    {
+        const auto& config = recipe[index];
+
+        const auto start = std::chrono::steady_clock::now();
+        try
+        {
+            const auto in_place = config.kind == pass_kind::resubstitution || config.kind == pass_kind::refactoring;
+            if (shared && in_place)
+            {
+                current = current.clone();
+            }
+            else if (dirty && !in_place && config.kind != pass_kind::cleanup_dangling)
+            {
+                // cut rewriting and balancing rebuild the network from its nodes and do not skip dead ones
+                current = mockturtle::cleanup_dangling(current);
+            }
+            dirty = run_pass(current, config);
+            // functional passes usually build a new network, but cut rewriting returns its input itself if rewriting
+            // made it worse, which then still shares its storage
+            shared = shared && current._storage == original;
+        }
+        catch (const std::bad_alloc&)
+        {
+            throw;
+        }
+        catch (const std::exception& e)
+        {
+            throw std::runtime_error(fmt::format("Error in recipe entry {} ('{}'): {}", index, config.name, e.what()));
+        }
+        const std::chrono::duration<double> runtime = std::chrono::steady_clock::now() - start;
+
+        if (!on_step(pass_step{config.name, current.num_gates(), mockturtle::depth_view<Ntk>{current}.depth(),
+                               runtime.count()}))
+        {
+            return std::nullopt;
+        }
+    }
+
+    if (dirty)
+    {
+        return mockturtle::cleanup_dangling(current);
+    }
+    if (shared)
+    {
+        return current.clone();
+    }
+    return current;
+}
+
+/**
+ * @brief Runs a parsed recipe on a network without touching it.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @param ntk The network to optimize.
+ * @param recipe The passes to run, in order.
+ * @param steps If not null, receives one entry per pass with the network's size and depth after it and its runtime.
+ * @return The optimized network, which never shares its storage with `ntk`.
+ */
+template <typename Ntk>
+Ntk run_recipe(const Ntk& ntk, const std::vector<pass_config>& recipe, std::vector<pass_step>* steps = nullptr)
+{
+    // copies of a network share its storage, so this is free until the first in-place pass has to clone
+    return *run_recipe(Ntk{ntk}, true, recipe,
+                       [steps](pass_step step)
+                       {
+                           if (steps != nullptr)
+                           {
+                               steps->push_back(std::move(step));
+                           }
+                           return true;
+                       });
+}
+
+}  // namespace aigverse::detail
@@ -2,6 +2,8 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/algorithms/interrupt.hpp"
+#include "aigverse/algorithms/statistics.hpp"
 #include "aigverse/algorithms/transform_helpers.hpp"
 #include "aigverse/types.hpp"
 
@@ -32,9 +34,14 @@ void refactoring(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
         [](Ntk& ntk, const uint32_t max_pis = 6, const bool allow_zero_gain = false,
            const bool use_reconvergence_cut = false, const bool use_dont_cares = false,
            const bool use_quick_factoring = true, const bool try_both_polarities = true,
-           const bool consider_inverter_cost = false, const bool verbose = false,
-           const bool inplace = false) -> std::optional<Ntk>
+           const bool consider_inverter_cost = false, const bool verbose = false, const bool inplace = false,
+           const bool cleanup = true, const std::optional<double> time_limit = std::nullopt,
+           const cancellation_token* token = nullptr, pass_statistics* statistics = nullptr) -> std::optional<Ntk>
         {
+            interrupt_check check{token, time_limit};
+
+            std::optional<Ntk> result{};
+            pass_statistics    st{};
             try
             {
                 mockturtle::refactoring_params params{};
@@ -50,8 +57,21 @@ void refactoring(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
                 sop_params.consider_inverter_cost = consider_inverter_cost;
                 mockturtle::sop_factoring<Ntk> sop_resyn_engine{sop_params};
 
-                return run_transform(ntk, inplace, [&params, &sop_resyn_engine](Ntk& target)
-                                     { mockturtle::refactoring(target, sop_resyn_engine, params); });
+                result =
+                    run_transform(ntk, inplace, cleanup,
+                                  [&params, &sop_resyn_engine, &check, &st](Ntk& target)
+                                  {
+                                      interruptible_view<Ntk>       view{target, check};
+                                      mockturtle::refactoring_stats refactoring_st{};
+                                      uint64_t                      num_candidates = 0;
+
+                                      const auto before = view.num_gates();
+                                      // refactoring only accepts its function as an lvalue
+                                      const counting_resynthesis<mockturtle::sop_factoring<Ntk>> counted{
+                                          sop_resyn_engine, num_candidates};
+                                      mockturtle::refactoring(view, counted, params, &refactoring_st);
+                                      st = make_statistics(refactoring_st, num_candidates, before, view.num_gates());
+                                  });
             }
             catch (const std::exception& e)
             {
@@ -61,13 +81,23 @@ void refactoring(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
             {
                 throw std::runtime_error("Unknown error in mockturtle::sop_refactoring");
             }
+            check.rethrow_signal();
+            publish_statistics(st, statistics);
+
+            return result;
         },
         nb::arg("ntk"), nb::kw_only(), nb::arg("max_pis") = 6, nb::arg("allow_zero_gain") = false,
         nb::arg("use_reconvergence_cut") = false, nb::arg("use_dont_cares") = false,
         nb::arg("use_quick_factoring") = true, nb::arg("try_both_polarities") = true,
         nb::arg("consider_inverter_cost") = false, nb::arg("verbose") = false, nb::arg("inplace") = false,
+        nb::arg("cleanup") = true, nb::arg("time_limit") = std::nullopt, nb::arg("cancellation_token") = nb::none(),
+        nb::arg("statistics") = nb::none(),
         R"pb(Performs SOP-based network refactoring.
 
+The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+all of which are checked before each node is visited. Every replacement keeps the
+network's function, so a pass stopped early still yields a valid network.
+
 Args:
     ntk: The input logic network.
     max_pis: Maximum number of leaves used in local windows.
@@ -79,12 +109,25 @@ Args:
     consider_inverter_cost: Whether inverter cost is included in optimization.
     verbose: Whether to print verbose progress output.
     inplace: Whether to mutate ``ntk`` in place.
+    cleanup: Whether to remove the dangling nodes the pass leaves behind from the
+        returned network. Skipping this saves building a second copy of the network.
+        Has no effect with ``inplace``, which never removes them.
+    time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+        limit.
+    cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+    statistics: If given, filled with the statistics of this run. Its ``times`` hold
+        ``"mffc"``, ``"simulation"``, and ``"resynthesis"``. Its ``counts`` hold
+        ``"candidates"``, the number of windows resynthesized.
 
 Returns:
-    The refactored network if ``inplace`` is ``False``. Otherwise ``None``.
+    The refactored network if ``inplace`` is ``False``. Otherwise ``None``. If the pass
+    stopped early, the network holds the replacements made until then.
 
 Raises:
-    RuntimeError: If refactoring fails in the underlying synthesis engine.)pb",
+    ValueError: If ``time_limit`` is not positive.
+    RuntimeError: If refactoring fails in the underlying synthesis engine.
+    KeyboardInterrupt: If interrupted by Ctrl-C. With ``inplace``, ``ntk`` keeps the
+        replacements made until then.)pb",
         nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
 }
 
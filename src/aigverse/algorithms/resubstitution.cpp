@@ -2,10 +2,11 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/algorithms/interrupt.hpp"
+#include "aigverse/algorithms/statistics.hpp"
 #include "aigverse/algorithms/transform_helpers.hpp"
 #include "aigverse/types.hpp"
 
-#include <mockturtle/algorithms/aig_resub.hpp>
 #include <mockturtle/algorithms/resubstitution.hpp>
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
@@ -29,8 +30,12 @@ void resubstitution(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
         [](Ntk& ntk, const uint32_t max_pis = 8, const uint32_t max_divisors = 150, const uint32_t max_inserts = 2,
            const uint32_t skip_fanout_limit_for_roots = 1000, const uint32_t skip_fanout_limit_for_divisors = 100,
            const bool verbose = false, const bool use_dont_cares = false, const uint32_t window_size = 12,
-           const bool preserve_depth = false, const bool inplace = false) -> std::optional<Ntk>
+           const bool preserve_depth = false, const bool inplace = false, const bool cleanup = true,
+           const std::optional<double> time_limit = std::nullopt, const cancellation_token* token = nullptr,
+           pass_statistics* statistics = nullptr) -> std::optional<Ntk>
         {
+            interrupt_check check{token, time_limit};
+
             mockturtle::resubstitution_params params{};
             params.max_pis                        = max_pis;
             params.max_divisors                   = max_divisors;
@@ -42,15 +47,31 @@ void resubstitution(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
             params.window_size                    = window_size;
             params.preserve_depth                 = preserve_depth;
 
-            return run_transform(ntk, inplace,
-                                 [params](Ntk& target) { mockturtle::aig_resubstitution(target, params); });
+            pass_statistics st{};
+
+            auto result = run_transform(ntk, inplace, cleanup,
+                                        [&params, &check, &st](Ntk& target)
+                                        {
+                                            interruptible_view<Ntk> view{target, check};
+                                            st = aig_resubstitution_with_statistics(view, params);
+                                        });
+            check.rethrow_signal();
+            publish_statistics(st, statistics);
+
+            return result;
         },
         nb::arg("ntk"), nb::kw_only(), nb::arg("max_pis") = 8, nb::arg("max_divisors") = 150,
         nb::arg("max_inserts") = 2, nb::arg("skip_fanout_limit_for_roots") = 1000,
         nb::arg("skip_fanout_limit_for_divisors") = 100, nb::arg("verbose") = false, nb::arg("use_dont_cares") = false,
         nb::arg("window_size") = 12, nb::arg("preserve_depth") = false, nb::arg("inplace") = false,
+        nb::arg("cleanup") = true, nb::arg("time_limit") = std::nullopt, nb::arg("cancellation_token") = nb::none(),
+        nb::arg("statistics") = nb::none(),
         R"pb(Performs AIG resubstitution-based optimization.
 
+The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+all of which are checked before each node is visited. Every replacement keeps the
+network's function, so a pass stopped early still yields a valid network.
+
 Args:
     ntk: The input logic network.
     max_pis: Maximum number of leaves in a local window.
@@ -63,9 +84,26 @@ Args:
     window_size: Window size used for don't-care computation.
     preserve_depth: Whether replacements must preserve depth.
     inplace: Whether to mutate ``ntk`` in place.
+    cleanup: Whether to remove the dangling nodes the pass leaves behind from the
+        returned network. Skipping this saves building a second copy of the network.
+        Has no effect with ``inplace``, which never removes them.
+    time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+        limit.
+    cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+    statistics: If given, filled with the statistics of this run. Its ``times`` hold
+        ``"cuts"``, ``"mffc"``, ``"divisor_collection"``, ``"simulation"``,
+        ``"dont_cares"``, ``"resynthesis"``, and ``"substitution"``. Its ``counts`` hold
+        ``"leaves"``, ``"divisors"``, ``"estimated_gain"``, and ``"accepted"``, also
+        broken down by kind, e.g., ``"accepted_1_resub"``.
 
 Returns:
-    The optimized network if ``inplace`` is ``False``. Otherwise ``None``.)pb",
+    The optimized network if ``inplace`` is ``False``. Otherwise ``None``. If the pass
+    stopped early, the network holds the replacements made until then.
+
+Raises:
+    ValueError: If ``time_limit`` is not positive.
+    KeyboardInterrupt: If interrupted by Ctrl-C. With ``inplace``, ``ntk`` keeps the
+        replacements made until then.)pb",
         nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
 }
 
@@ -2,12 +2,18 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/algorithms/interrupt.hpp"
+#include "aigverse/algorithms/npn_database.hpp"
+#include "aigverse/algorithms/statistics.hpp"
+#include "aigverse/algorithms/transform_helpers.hpp"
 #include "aigverse/types.hpp"
 
+#include <fmt/format.h>
 #include <mockturtle/algorithms/cut_rewriting.hpp>
-#include <mockturtle/algorithms/node_resynthesis/xag_npn.hpp>
+#include <mockturtle/utils/stopwatch.hpp>
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
 
 #include <cstdint>
 #include <optional>
@@ -23,13 +29,65 @@ void rewriting(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
 {
     namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
 
+    nb::class_<npn_database_info>(m, "NpnDatabaseInfo",
+                                  R"pb(Describes the NPN resynthesis database shared by all cut rewriting calls.)pb")
+        .def_ro("built", &npn_database_info::built, R"pb(Whether the database has been built.)pb")
+        .def_ro("build_time", &npn_database_info::build_time,
+                R"pb(Wall-clock seconds building the database took, or ``0.0`` if it is not built.)pb")
+        .def_ro("num_classes", &npn_database_info::num_classes,
+                R"pb(Number of NPN classes of four-input functions the database holds implementations for.)pb")
+        .def_ro("num_nodes", &npn_database_info::num_nodes, R"pb(Number of nodes in the database network.)pb")
+        .def_ro("memory", &npn_database_info::memory,
+                R"pb(Approximate memory footprint in bytes, ignoring allocator overhead.)pb")
+        .def("__repr__",
+             [](const npn_database_info& self)
+             {
+                 return fmt::format("NpnDatabaseInfo(built={}, build_time={:.6f}, num_classes={}, num_nodes={}, "
+                                    "memory={})",
+                                    self.built ? "True" : "False", self.build_time, self.num_classes, self.num_nodes,
+                                    self.memory);
+             });
+
+    m.def(
+        "prewarm_npn_database",
+        []() -> npn_database_info
+        {
+            static_cast<void>(npn_database<Ntk>::engine());
+            return npn_database<Ntk>::info();
+        },
+        R"pb(Builds the NPN resynthesis database used by cut rewriting ahead of time.
+
+:func:`aig_cut_rewriting` resynthesizes cuts from a database of optimal
+implementations of all four-input functions. The database is built on first use,
+which takes noticeably longer than rewriting a small network, and is then shared
+by every later call in the process, from any thread. Calling this function during
+setup moves that one-time cost out of the first rewriting call.
+
+Calling it again once the database is built returns immediately.
+
+Returns:
+    The state of the database after building it.)pb",
+        nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
+
+    m.def(
+        "npn_database_info", []() -> npn_database_info { return npn_database<Ntk>::info(); },
+        R"pb(Describes the NPN resynthesis database used by cut rewriting without building it.
+
+Returns:
+    Whether the database is built, and if so, how long building it took, its size, and
+    its approximate memory footprint.)pb");
+
     m.def(
         "aig_cut_rewriting",
         [](Ntk& ntk, const uint32_t cut_size = 4, const uint32_t cut_limit = 8, const bool minimize_truth_table = true,
            const bool allow_zero_gain = false, const bool use_dont_cares = false, const uint32_t min_cand_cut_size = 3,
            const std::optional<uint32_t> min_cand_cut_size_override = std::nullopt, const bool preserve_depth = false,
-           const bool verbose = false, const bool very_verbose = false) -> Ntk
+           const bool verbose = false, const bool very_verbose = false, const bool inplace = false,
+           const std::optional<double> time_limit = std::nullopt, const cancellation_token* token = nullptr,
+           pass_statistics* statistics = nullptr) -> std::optional<Ntk>
         {
+            interrupt_check check{token, time_limit};
+
             mockturtle::cut_rewriting_params params{};
             params.cut_enumeration_ps.cut_size             = cut_size;
             params.cut_enumeration_ps.cut_limit            = cut_limit;
@@ -42,17 +100,66 @@ void rewriting(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
             params.verbose                                 = verbose;
             params.very_verbose                            = very_verbose;
 
-            const mockturtle::xag_npn_resynthesis<Ntk, aigverse::aig, mockturtle::xag_npn_db_kind::aig_complete>
-                aig_npn_resyn_engine{};
+            using engine_t = typename npn_database<Ntk>::engine_type;
+
+            mockturtle::cut_rewriting_stats   rewriting_st{};
+            mockturtle::stopwatch<>::duration elapsed{};
+            uint64_t                          num_candidates = 0;
+
+            const counting_resynthesis<engine_t> counted{npn_database<Ntk>::engine(), num_candidates};
 
-            return mockturtle::cut_rewriting(ntk, aig_npn_resyn_engine, params);
+            return run_functional_transform(
+                ntk, inplace,
+                [&](const Ntk& source) -> std::optional<Ntk>
+                {
+                    auto rewritten = [&]() -> std::optional<Ntk>
+                    {
+                        try
+                        {
+                            const mockturtle::stopwatch<> t{elapsed};
+                            return mockturtle::cut_rewriting(
+                                source, interruptible_resynthesis<counting_resynthesis<engine_t>>{counted, check},
+                                params, &rewriting_st);
+                        }
+                        catch (const operation_interrupted&)
+                        {
+                            // the rewritten network is only assembled at the end, so nothing better than the input
+                            // exists yet
+                            rewriting_st.time_total = elapsed;
+                            return std::nullopt;
+                        }
+                    }();
+                    check.rethrow_signal();
+                    publish_statistics(
+                        make_statistics(rewriting_st, num_candidates, source.num_gates(),
+                                        rewritten.has_value() ? rewritten->num_gates() : source.num_gates()),
+                        statistics);
+
+                    return rewritten;
+                });
         },
         nb::arg("ntk"), nb::kw_only(), nb::arg("cut_size") = 4, nb::arg("cut_limit") = 8,
         nb::arg("minimize_truth_table") = true, nb::arg("allow_zero_gain") = false, nb::arg("use_dont_cares") = false,
         nb::arg("min_cand_cut_size") = 3, nb::arg("min_cand_cut_size_override") = std::nullopt,
         nb::arg("preserve_depth") = false, nb::arg("verbose") = false, nb::arg("very_verbose") = false,
+        nb::arg("inplace") = false, nb::arg("time_limit") = std::nullopt, nb::arg("cancellation_token") = nb::none(),
+        nb::arg("statistics") = nb::none(),
         R"pb(Rewrites an AIG network using cut-based NPN resynthesis.
 
+Cuts are replaced by optimal implementations from a database covering all
+four-input functions. The database is built on the first call and shared by all
+later ones; see :func:`prewarm_npn_database`.
+
+The pass can be stopped early by ``time_limit``, ``cancellation_token``, or Ctrl-C,
+all of which are checked before each cut is resynthesized. Since the rewritten network
+is only assembled once all nodes are processed, a pass stopped early returns a copy of
+``ntk``.
+
+Cut rewriting always builds a new network. With ``inplace``, ``ntk`` takes it over
+instead of a new object being returned, which frees the memory of the original
+network during the call unless another network still shares it. A pass stopped early
+then leaves ``ntk`` unchanged without copying it.
+
 Args:
     ntk: The input logic network.
     cut_size: Maximum cut size used during cut enumeration.
@@ -65,9 +172,21 @@ Args:
     preserve_depth: Whether replacements must preserve network depth.
     verbose: Whether to print verbose progress output.
     very_verbose: Whether to print highly detailed progress output.
+    inplace: Whether to replace ``ntk`` by the rewritten network.
+    time_limit: Wall-clock seconds after which the pass stops early, or ``None`` for no
+        limit.
+    cancellation_token: A token that stops the pass early once cancelled, or ``None``.
+    statistics: If given, filled with the statistics of this run. Its ``times`` hold
+        ``"cut_enumeration"`` and ``"resynthesis"``, which stay 0 if the pass stopped
+        early. Its ``counts`` hold ``"candidates"``, the number of cuts resynthesized.
 
 Returns:
-    A rewritten network.)pb",
+    The rewritten network, or a copy of ``ntk`` if the pass stopped early, if
+    ``inplace`` is ``False``. Otherwise ``None``.
+
+Raises:
+    ValueError: If ``time_limit`` is not positive.
+    KeyboardInterrupt: If interrupted by Ctrl-C.)pb",
         nb::call_guard<nb::gil_scoped_release>());  // NOLINT(misc-include-cleaner)
 }
 
@@ -0,0 +1,126 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/algorithms/statistics.hpp"
+
+#include <fmt/format.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/map.h>     // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
+
+#include <memory>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief The Python-facing handle of a statistics log.
+ *
+ * The process-wide log is shared with this handle rather than referring to it, so that it never holds a Python object.
+ */
+struct statistics_collector
+{
+    std::shared_ptr<statistics_log> log{std::make_shared<statistics_log>()};
+    // the logs that were active when the enclosing `with` blocks were entered, innermost last
+    std::vector<std::shared_ptr<statistics_log>> previous{};
+};
+
+}  // namespace detail
+
+void bind_statistics(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using detail::active_statistics_log;
+    using detail::pass_statistics;
+    using detail::statistics_collector;
+
+    nb::class_<pass_statistics>(m, "PassStatistics",
+                                R"pb(Describes what an optimization pass did and where it spent its time.
+
+Pass an instance as the ``statistics`` argument of :func:`aig_resubstitution`,
+:func:`sop_refactoring`, :func:`aig_cut_rewriting`, or :func:`balancing` to have it
+filled after the pass. The keys of :attr:`times` and :attr:`counts` depend on the pass
+and are listed in its documentation.)pb")
+        .def(nb::init<>(), R"pb(Creates empty statistics, to be filled by a pass.)pb")
+        .def_ro("name", &pass_statistics::name, R"pb(Name of the pass, e.g., ``"aig_resubstitution"``.)pb")
+        .def_ro("num_runs", &pass_statistics::num_runs,
+                R"pb(Number of runs these statistics cover.
+
+1 after a single pass, 0 if no pass has filled them yet, and more for the aggregates
+of :meth:`StatisticsCollector.summary`.)pb")
+        .def_ro("runtime", &pass_statistics::runtime, R"pb(Seconds the pass took in total.)pb")
+        .def_ro("num_gates_before", &pass_statistics::num_gates_before, R"pb(Number of AND gates before the pass.)pb")
+        .def_ro("num_gates_after", &pass_statistics::num_gates_after, R"pb(Number of AND gates after the pass.)pb")
+        .def_ro("times", &pass_statistics::times, R"pb(Seconds spent in each phase of the pass, by phase.)pb")
+        .def_ro("counts", &pass_statistics::counts,
+                R"pb(Event counters of the pass, e.g., the number of candidates tried.)pb")
+        .def("__repr__",
+             [](const pass_statistics& self)
+             {
+                 return fmt::format("PassStatistics(name='{}', num_runs={}, runtime={:.6f}, num_gates_before={}, "
+                                    "num_gates_after={})",
+                                    self.name, self.num_runs, self.runtime, self.num_gates_before,
+                                    self.num_gates_after);
+             });
+
+    nb::class_<statistics_collector>(m, "StatisticsCollector",
+                                     R"pb(Records the statistics of every optimization pass run while it is active.
+
+Activate a collector process-wide with :func:`set_statistics_collector` or for the
+duration of a ``with`` block. While active, it records every run of
+:func:`aig_resubstitution`, :func:`sop_refactoring`, :func:`aig_cut_rewriting`, and
+:func:`balancing`, including those run by :func:`run_pipeline`, :func:`run_portfolio`,
+and :func:`run_until_convergence`, from any thread. Recording is thread-safe.)pb")
+        .def(nb::init<>(), R"pb(Creates an empty collector that is not active.)pb")
+        .def_prop_ro(
+            "records", [](const statistics_collector& self) { return self.log->records(); },
+            R"pb(Statistics of every recorded pass, oldest first.)pb")
+        .def(
+            "summary", [](const statistics_collector& self) { return self.log->summary(); },
+            R"pb(Sums up the recorded statistics per pass.
+
+Returns:
+    One aggregate per pass name, whose ``num_runs`` tells how many runs it covers.)pb")
+        .def(
+            "clear", [](statistics_collector& self) { self.log->clear(); }, R"pb(Removes all recorded statistics.)pb")
+        .def("__len__", [](const statistics_collector& self) { return self.log->size(); })
+        .def(
+            "__enter__",
+            [](statistics_collector& self) -> statistics_collector&
+            {
+                self.previous.push_back(active_statistics_log::exchange(self.log));
+                return self;
+            },
+            nb::rv_policy::reference)
+        .def("__exit__",
+             [](statistics_collector& self, const nb::args&)
+             {
+                 if (!self.previous.empty())
+                 {
+                     active_statistics_log::exchange(std::move(self.previous.back()));
+                     self.previous.pop_back();
+                 }
+             })
+        .def("__repr__", [](const statistics_collector& self)
+             { return fmt::format("StatisticsCollector(num_records={})", self.log->size()); });
+
+    m.def(
+        "set_statistics_collector", [](const statistics_collector* collector)
+        { active_statistics_log::exchange(collector != nullptr ? collector->log : nullptr); },
+        nb::arg("collector").none(),
+        R"pb(Activates a statistics collector process-wide.
+
+Args:
+    collector: The collector to record every subsequent pass to, or ``None`` to stop
+        recording.)pb");
+}
+
+}  // namespace aigverse
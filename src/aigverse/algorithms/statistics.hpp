@@ -0,0 +1,353 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include <kitty/dynamic_truth_table.hpp>
+#include <kitty/static_truth_table.hpp>
+#include <mockturtle/algorithms/aig_resub.hpp>
+#include <mockturtle/algorithms/balancing.hpp>
+#include <mockturtle/algorithms/cut_rewriting.hpp>
+#include <mockturtle/algorithms/refactoring.hpp>
+#include <mockturtle/algorithms/resubstitution.hpp>
+#include <mockturtle/utils/stopwatch.hpp>
+#include <mockturtle/views/depth_view.hpp>
+#include <mockturtle/views/fanout_view.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief What one run of an optimization pass did and where it spent its time.
+ *
+ * The keys of `times` and `counts` depend on the pass. Aggregates over several runs of the same pass sum up every
+ * field and record the number of runs in `num_runs`.
+ */
+struct pass_statistics
+{
+    std::string                     name{};
+    uint32_t                        num_runs{0};
+    double                          runtime{0.0};
+    uint64_t                        num_gates_before{0};
+    uint64_t                        num_gates_after{0};
+    std::map<std::string, double>   times{};
+    std::map<std::string, uint64_t> counts{};
+
+    /**
+     * @brief Adds the statistics of another run to these.
+     *
+     * @param other The statistics to add.
+     */
+    void merge(const pass_statistics& other)
+    {
+        num_runs += other.num_runs;
+        runtime += other.runtime;
+        num_gates_before += other.num_gates_before;
+        num_gates_after += other.num_gates_after;
+        for (const auto& [key, value] : other.times)
+        {
+            times[key] += value;
+        }
+        for (const auto& [key, value] : other.counts)
+        {
+            counts[key] += value;
+        }
+    }
+};
+
+/**
+ * @brief A thread-safe, append-only list of pass statistics.
+ */
+class statistics_log
+{
+  public:
+    void add(pass_statistics statistics)
+    {
+        const std::scoped_lock lock{mutex};
+        entries.push_back(std::move(statistics));
+    }
+
+    /**
+     * @brief Returns all statistics recorded so far, oldest first.
+     */
+    [[nodiscard]] std::vector<pass_statistics> records() const
+    {
+        const std::scoped_lock lock{mutex};
+        return entries;
+    }
+
+    /**
+     * @brief Sums up the recorded statistics per pass.
+     *
+     * @return One aggregate per pass name.
+     */
+    [[nodiscard]] std::map<std::string, pass_statistics> summary() const
+    {
+        const std::scoped_lock lock{mutex};
+
+        std::map<std::string, pass_statistics> aggregates{};
+        for (const auto& entry : entries)
+        {
+            auto& aggregate = aggregates[entry.name];
+            aggregate.name  = entry.name;
+            aggregate.merge(entry);
+        }
+        return aggregates;
+    }
+
+    void clear()
+    {
+        const std::scoped_lock lock{mutex};
+        entries.clear();
+    }
+
+    [[nodiscard]] std::size_t size() const
+    {
+        const std::scoped_lock lock{mutex};
+        return entries.size();
+    }
+
+  private:
+    mutable std::mutex           mutex{};
+    std::vector<pass_statistics> entries{};
+};
+
+/**
+ * @brief The process-wide log every pass records its statistics to, if any.
+ *
+ * Holds no Python objects, so it can be read and replaced from any thread without the GIL and safely outlives the
+ * interpreter.
+ */
+class active_statistics_log
+{
+  public:
+    [[nodiscard]] static std::shared_ptr<statistics_log> get()
+    {
+        auto&                  self = instance();
+        const std::scoped_lock lock{self.mutex};
+        return self.log;
+    }
+
+    /**
+     * @brief Replaces the process-wide log.
+     *
+     * @param log The new log, or `nullptr` to stop recording.
+     * @return The log that was active before.
+     */
+    static std::shared_ptr<statistics_log> exchange(std::shared_ptr<statistics_log> log)
+    {
+        auto&                  self = instance();
+        const std::scoped_lock lock{self.mutex};
+        return std::exchange(self.log, std::move(log));
+    }
+
+  private:
+    std::mutex                      mutex{};
+    std::shared_ptr<statistics_log> log{};
+
+    [[nodiscard]] static active_statistics_log& instance()
+    {
+        static active_statistics_log active{};
+        return active;
+    }
+};
+
+/**
+ * @brief Hands the statistics of a finished pass to the caller and to the process-wide log.
+ *
+ * @param statistics The statistics of the pass.
+ * @param out If not null, receives a copy of `statistics`.
+ */
+inline void publish_statistics(const pass_statistics& statistics, pass_statistics* out)
+{
+    if (out != nullptr)
+    {
+        *out = statistics;
+    }
+    if (const auto log = active_statistics_log::get(); log != nullptr)
+    {
+        log->add(statistics);
+    }
+}
+
+/**
+ * @brief Wraps a resynthesis function to count how often a pass calls it, i.e., how many candidates it tries.
+ *
+ * @tparam Fn The type of the wrapped resynthesis function.
+ */
+template <typename Fn>
+struct counting_resynthesis
+{
+    const Fn& fn;
+    uint64_t& calls;
+
+    // the return type keeps the call SFINAE-friendly, so that passes detect the overloads `Fn` actually provides
+    template <typename... Args>
+    auto operator()(Args&&... args) const -> decltype(fn(std::forward<Args>(args)...))
+    {
+        ++calls;
+        return fn(std::forward<Args>(args)...);
+    }
+};
+
+/**
+ * @brief Converts the statistics of a cut rewriting run.
+ *
+ * @param st The statistics reported by mockturtle.
+ * @param num_candidates The number of cuts resynthesized.
+ * @param before The number of gates before the pass.
+ * @param after The number of gates after the pass.
+ * @return The statistics under the name `aig_cut_rewriting`.
+ */
+inline pass_statistics make_statistics(const mockturtle::cut_rewriting_stats& st, const uint64_t num_candidates,
+                                       const uint64_t before, const uint64_t after)
+{
+    return {"aig_cut_rewriting",
+            1,
+            mockturtle::to_seconds(st.time_total),
+            before,
+            after,
+            {{"cut_enumeration", mockturtle::to_seconds(st.time_cuts)},
+             {"resynthesis", mockturtle::to_seconds(st.time_rewriting)}},
+            {{"candidates", num_candidates}}};
+}
+
+/**
+ * @brief Converts the statistics of a refactoring run.
+ *
+ * @param st The statistics reported by mockturtle.
+ * @param num_candidates The number of windows resynthesized.
+ * @param before The number of gates before the pass.
+ * @param after The number of gates after the pass.
+ * @return The statistics under the name `sop_refactoring`.
+ */
+inline pass_statistics make_statistics(const mockturtle::refactoring_stats& st, const uint64_t num_candidates,
+                                       const uint64_t before, const uint64_t after)
+{
+    return {"sop_refactoring",
+            1,
+            mockturtle::to_seconds(st.time_total),
+            before,
+            after,
+            {{"mffc", mockturtle::to_seconds(st.time_mffc)},
+             {"simulation", mockturtle::to_seconds(st.time_simulation)},
+             {"resynthesis", mockturtle::to_seconds(st.time_refactoring)}},
+            {{"candidates", num_candidates}}};
+}
+
+/**
+ * @brief Converts the statistics of a balancing run.
+ *
+ * @param st The statistics reported by mockturtle.
+ * @param num_candidates The number of cuts rebalanced.
+ * @param before The number of gates before the pass.
+ * @param after The number of gates after the pass.
+ * @return The statistics under the name `balancing`.
+ */
+inline pass_statistics make_statistics(const mockturtle::balancing_stats& st, const uint64_t num_candidates,
+                                       const uint64_t before, const uint64_t after)
+{
+    return {"balancing",
+            1,
+            mockturtle::to_seconds(st.time_total),
+            before,
+            after,
+            {{"cut_enumeration", mockturtle::to_seconds(st.cut_enumeration_st.time_total)},
+             {"truth_tables", mockturtle::to_seconds(st.cut_enumeration_st.time_truth_table)}},
+            {{"candidates", num_candidates}}};
+}
+
+/**
+ * @brief Runs one instantiation of AIG resubstitution and converts its statistics.
+ *
+ * @tparam View The resubstitution view of the network.
+ * @tparam TT The truth table type of the window simulation.
+ */
+template <typename View, typename TT>
+pass_statistics run_aig_resubstitution(View& view, const mockturtle::resubstitution_params& ps)
+{
+    using dc_type      = kitty::dynamic_truth_table;
+    using functor_type = mockturtle::aig_resub_functor<View, mockturtle::detail::window_simulator<View, TT>, dc_type>;
+    using engine_type  = mockturtle::detail::window_based_resub_engine<View, TT, dc_type, functor_type>;
+    using impl_type    = mockturtle::detail::resubstitution_impl<View, engine_type>;
+
+    mockturtle::resubstitution_stats   st{};
+    typename impl_type::engine_st_t    engine_st{};
+    typename impl_type::collector_st_t collector_st{};
+
+    const auto before = view.num_gates();
+
+    impl_type impl{view, ps, st, engine_st, collector_st};
+    impl.run();
+
+    if (ps.verbose)
+    {
+        st.report();
+        collector_st.report();
+        engine_st.report();
+    }
+
+    const auto& kernel_st = engine_st.functor_st;
+
+    return {"aig_resubstitution",
+            1,
+            mockturtle::to_seconds(st.time_total),
+            before,
+            view.num_gates(),
+            {{"cuts", mockturtle::to_seconds(collector_st.time_cuts)},
+             {"mffc", mockturtle::to_seconds(collector_st.time_mffc)},
+             {"divisor_collection", mockturtle::to_seconds(st.time_divs)},
+             {"simulation", mockturtle::to_seconds(engine_st.time_sim)},
+             {"dont_cares", mockturtle::to_seconds(engine_st.time_dont_care)},
+             {"resynthesis", mockturtle::to_seconds(engine_st.time_compute_function)},
+             {"substitution", mockturtle::to_seconds(st.time_callback)}},
+            {{"leaves", collector_st.num_total_leaves},
+             {"divisors", st.num_total_divisors},
+             {"accepted", engine_st.num_resub},
+             {"accepted_constant", kernel_st.num_const_accepts},
+             {"accepted_0_resub", kernel_st.num_div0_accepts},
+             {"accepted_1_resub", kernel_st.num_div1_accepts},
+             {"accepted_12_resub", kernel_st.num_div12_accepts},
+             {"accepted_2_resub", kernel_st.num_div2_accepts},
+             {"accepted_3_resub", kernel_st.num_div3_accepts},
+             {"estimated_gain", st.estimated_gain}}};
+}
+
+/**
+ * @brief Runs AIG resubstitution like `mockturtle::aig_resubstitution` and returns its statistics.
+ *
+ * mockturtle's function only hands out the top-level statistics and drops those of the divisor collector and the
+ * resubstitution engine, which hold the don't-care runtime and the accepted substitutions, so this instantiates the
+ * same implementation itself.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @param ntk The network to optimize in place.
+ * @param ps The resubstitution parameters.
+ * @return The statistics under the name `aig_resubstitution`.
+ */
+template <typename Ntk>
+pass_statistics aig_resubstitution_with_statistics(Ntk& ntk, const mockturtle::resubstitution_params& ps)
+{
+    using view_type = mockturtle::fanout_view<mockturtle::depth_view<Ntk>>;
+
+    mockturtle::depth_view<Ntk> depth_ntk{ntk};
+    view_type                   resub_ntk{depth_ntk};
+
+    if (ps.max_pis == 8)
+    {
+        return run_aig_resubstitution<view_type, kitty::static_truth_table<8u>>(resub_ntk, ps);
+    }
+    return run_aig_resubstitution<view_type, kitty::dynamic_truth_table>(resub_ntk, ps);
+}
+
+}  // namespace aigverse::detail
@@ -19,11 +19,13 @@ namespace aigverse::detail
  * @tparam Fn The type of the transformation function, which should accept a non-const reference to an Ntk.
  * @param ntk The input logic network to transform.
  * @param inplace Whether to perform the transformation in-place on the input network (if true) or on a copy (if false).
+ * @param cleanup Whether to remove dangling nodes from the copy. Skipping it saves building a second copy of the
+ * network. Has no effect if `inplace` is true, which never removes dangling nodes.
  * @param fn The transformation function to apply.
  * @return The transformed network if not in-place, otherwise std::nullopt.
  */
 template <typename Ntk, typename Fn>
-std::optional<Ntk> run_transform(Ntk& ntk, const bool inplace, Fn&& fn)
+std::optional<Ntk> run_transform(Ntk& ntk, const bool inplace, const bool cleanup, Fn&& fn)
 {
     if (inplace)
     {
@@ -33,7 +35,53 @@ std::optional<Ntk> run_transform(Ntk& ntk, const bool inplace, Fn&& fn)
 
     auto ntk_clone = ntk.clone();
     std::forward<Fn>(fn)(ntk_clone);
+    if (!cleanup)
+    {
+        return ntk_clone;
+    }
     return mockturtle::cleanup_dangling(ntk_clone);
 }
 
+/**
+ * @brief Helper function to run a transformation that builds a new network, storing the result either in the input
+ * network or in a new one.
+ *
+ * In-place, the input network takes over the storage of the result, so that its own storage is released right away
+ * unless other networks share it, and nothing is copied if the transformation is abandoned.
+ *
+ * @tparam Ntk The type of the logic network.
+ * @tparam Fn The type of the transformation function, which should accept a const reference to an Ntk and return the
+ * transformed network, or std::nullopt if it was abandoned.
+ * @param ntk The input logic network to transform.
+ * @param inplace Whether to store the result in the input network (if true) or return it (if false).
+ * @param fn The transformation function to apply.
+ * @return The transformed network, or a copy of the input if the transformation was abandoned, if not in-place,
+ * otherwise std::nullopt.
+ */
+template <typename Ntk, typename Fn>
+std::optional<Ntk> run_functional_transform(Ntk& ntk, const bool inplace, Fn&& fn)
+{
+    auto result = std::forward<Fn>(fn)(std::as_const(ntk));
+
+    if (inplace)
+    {
+        if (result.has_value())
+        {
+            ntk = std::move(*result);
+        }
+        return std::nullopt;
+    }
+
+    if (!result.has_value())
+    {
+        return mockturtle::cleanup_dangling(ntk);
+    }
+    // mockturtle returns the input itself if rewriting made it worse, which must not share storage with the result
+    if (result->_storage == ntk._storage)
+    {
+        return ntk.clone();
+    }
+    return result;
+}
+
 }  // namespace aigverse::detail
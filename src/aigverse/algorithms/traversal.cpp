@@ -0,0 +1,453 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/traits.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief Validates node indices passed from Python and converts them to nodes.
+ *
+ * @tparam Ntk Network type.
+ * @tparam Array NumPy array type.
+ * @param ntk Network the indices refer to.
+ * @param indices Node indices.
+ * @return The nodes.
+ */
+template <typename Ntk, typename Array>
+std::vector<mockturtle::node<Ntk>> to_live_nodes(const Ntk& ntk, const Array& indices)
+{
+    std::vector<mockturtle::node<Ntk>> nodes{};
+    nodes.reserve(indices.shape(0));
+    for (std::size_t i = 0; i < indices.shape(0); ++i)
+    {
+        const auto index = indices(i);
+        if (index < 0 || index >= static_cast<int64_t>(ntk.size()))
+        {
+            throw nanobind::index_error(fmt::format("node {} is out of range", index).c_str());
+        }
+        const auto n = ntk.index_to_node(static_cast<uint32_t>(index));
+        if (ntk.is_dead(n))
+        {
+            throw std::invalid_argument(fmt::format("node {} is dead", index));
+        }
+        nodes.push_back(n);
+    }
+    return nodes;
+}
+
+/**
+ * @brief Moves the indices of all marked nodes, in ascending order, into a NumPy array.
+ *
+ * @param marks One mark per node index.
+ * @return NumPy array of the marked node indices.
+ */
+inline nanobind::ndarray<nanobind::numpy, int64_t> marked_indices(const std::vector<uint8_t>& marks)
+{
+    const auto count = static_cast<std::size_t>(std::count(marks.cbegin(), marks.cend(), uint8_t{1}));
+
+    owned_buffer<int64_t> indices{count};
+    std::size_t           next = 0;
+    for (std::size_t i = 0; i < marks.size(); ++i)
+    {
+        if (marks[i] != 0)
+        {
+            indices[next++] = static_cast<int64_t>(i);
+        }
+    }
+    return indices.release_into_ndarray({count});
+}
+
+/**
+ * @brief Orders the live nodes of a network topologically.
+ *
+ * Node indices are not necessarily topological: substituting nodes in place, e.g., in resubstitution without cleanup,
+ * makes gates depend on nodes of higher index. The nodes are therefore ordered by a depth-first search started at
+ * every node in ascending index order, which keeps networks whose indices are topological in index order.
+ *
+ * @tparam Ntk Network type.
+ * @param ntk Network to order.
+ * @return The live nodes, each after all of its fanins.
+ */
+template <typename Ntk>
+std::vector<mockturtle::node<Ntk>> topological_order(const Ntk& ntk)
+{
+    using node = mockturtle::node<Ntk>;
+
+    std::vector<node>                  order{};
+    std::vector<uint8_t>               visited(ntk.size(), 0);
+    std::vector<std::pair<node, bool>> stack{};
+    order.reserve(ntk.size());
+
+    ntk.foreach_node(
+        [&ntk, &order, &visited, &stack](const auto& root)
+        {
+            stack.emplace_back(root, false);
+            while (!stack.empty())
+            {
+                const auto [n, expanded] = stack.back();
+                if (expanded)
+                {
+                    stack.pop_back();
+                    order.push_back(n);
+                    continue;
+                }
+                if (visited[ntk.node_to_index(n)] != 0)
+                {
+                    stack.pop_back();
+                    continue;
+                }
+                visited[ntk.node_to_index(n)] = 1;
+                stack.back().second           = true;
+                ntk.foreach_fanin(n,
+                                  [&ntk, &visited, &stack](const auto& f)
+                                  {
+                                      if (visited[ntk.node_to_index(ntk.get_node(f))] == 0)
+                                      {
+                                          stack.emplace_back(ntk.get_node(f), false);
+                                      }
+                                  });
+            }
+        });
+
+    return order;
+}
+
+/**
+ * @brief Computes the level of every node, i.e., the length of a longest path to it from a primary input or the
+ * constant.
+ *
+ * Unlike `mockturtle::depth_view`, which only levels the transitive fanin of the outputs, this also levels dangling
+ * gates.
+ *
+ * @tparam Ntk Network type.
+ * @param ntk Network to level.
+ * @return The level of each node by node index, which is 0 for the constant, the primary inputs, and dead nodes.
+ */
+template <typename Ntk>
+std::vector<uint32_t> compute_levels(const Ntk& ntk)
+{
+    std::vector<uint32_t> levels(ntk.size(), 0);
+    for (const auto& n : topological_order(ntk))
+    {
+        if (ntk.is_constant(n) || ntk.is_ci(n))
+        {
+            continue;
+        }
+        uint32_t level = 0;
+        ntk.foreach_fanin(n, [&ntk, &levels, &level](const auto& f)
+                          { level = std::max(level, levels[ntk.node_to_index(ntk.get_node(f))]); });
+        levels[ntk.node_to_index(n)] = level + 1;
+    }
+    return levels;
+}
+
+template <typename Ntk>
+void traversal(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using node_array = nb::ndarray<const int64_t, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+    m.def(
+        "topological_order",
+        [](const Ntk& ntk)
+        {
+            owned_buffer<int64_t> indices{0};
+            std::size_t           count = 0;
+            {
+                const nb::gil_scoped_release release{};
+
+                const auto order = topological_order(ntk);
+                count            = order.size();
+                indices          = owned_buffer<int64_t>{count};
+                for (std::size_t i = 0; i < count; ++i)
+                {
+                    indices[i] = static_cast<int64_t>(ntk.node_to_index(order[i]));
+                }
+            }
+            return indices.release_into_ndarray({count});
+        },
+        nb::arg("ntk"),
+        R"pb(Orders the live nodes of a network topologically.
+
+Node indices are topological for networks built gate by gate, but not after nodes were
+substituted in place, e.g., by :func:`aig_resubstitution` or :func:`sop_refactoring`
+with ``cleanup=False``, which can make gates depend on nodes of higher index. The order
+is computed by a depth-first search without holding the GIL and coincides with index
+order whenever that is topological.
+
+Args:
+    ntk: The network to order.
+
+Returns:
+    The indices of all live nodes, including the constant and the primary inputs, with
+    every node after its fanins, as an ``int64`` array.)pb");
+
+    m.def(
+        "node_levels",
+        [](const Ntk& ntk)
+        {
+            owned_buffer<int64_t> levels{ntk.size()};
+            {
+                const nb::gil_scoped_release release{};
+
+                const auto computed = compute_levels(ntk);
+                std::copy(computed.cbegin(), computed.cend(), levels.data());
+            }
+            return levels.release_into_ndarray({ntk.size()});
+        },
+        nb::arg("ntk"),
+        R"pb(Computes the level of every node.
+
+The level of a node is the length of a longest path to it from a primary input or the
+constant, i.e., the number of gates on that path including the node itself. Unlike
+:class:`~aigverse.networks.DepthAig`, which only levels the nodes in the transitive fanin
+of the outputs, this also levels dangling gates. The levels are computed in a single
+pass over the nodes in topological order without holding the GIL.
+
+Args:
+    ntk: The network to level.
+
+Returns:
+    The level of each node by node index (shape ``(N,)``, dtype ``int64``), which is 0
+    for the constant, the primary inputs, and dead nodes.)pb");
+
+    m.def(
+        "transitive_fanin",
+        [](const Ntk& ntk, const node_array& roots)
+        {
+            const auto nodes = to_live_nodes(ntk, roots);
+
+            std::vector<uint8_t> marks(ntk.size(), 0);
+            {
+                const nb::gil_scoped_release release{};
+
+                std::vector<mockturtle::node<Ntk>> stack{};
+                for (const auto& n : nodes)
+                {
+                    if (marks[ntk.node_to_index(n)] == 0)
+                    {
+                        marks[ntk.node_to_index(n)] = 1;
+                        stack.push_back(n);
+                    }
+                }
+                while (!stack.empty())
+                {
+                    const auto n = stack.back();
+                    stack.pop_back();
+                    ntk.foreach_fanin(n,
+                                      [&ntk, &marks, &stack](const auto& f)
+                                      {
+                                          auto& mark = marks[ntk.node_to_index(ntk.get_node(f))];
+                                          if (mark == 0)
+                                          {
+                                              mark = 1;
+                                              stack.push_back(ntk.get_node(f));
+                                          }
+                                      });
+                }
+            }
+
+            return marked_indices(marks);
+        },
+        nb::arg("ntk"), nb::arg("roots"),
+        R"pb(Computes the transitive fanin of a set of nodes.
+
+The transitive fanin consists of the roots and all nodes they depend on, down to the
+constant and primary inputs. It is collected without holding the GIL.
+
+Args:
+    ntk: The network to traverse.
+    roots: Indices of the nodes to start from.
+
+Returns:
+    The indices of the nodes in the transitive fanin, including the roots, in ascending
+    order as an ``int64`` array. Index order is only topological if no nodes were
+    substituted in place; see :func:`topological_order`.
+
+Raises:
+    IndexError: If a root is not a node of the network.
+    ValueError: If a root is dead.)pb");
+
+    m.def(
+        "transitive_fanout",
+        [](const Ntk& ntk, const node_array& roots) -> nb::dict
+        {
+            const auto nodes = to_live_nodes(ntk, roots);
+
+            std::vector<uint8_t> marks(ntk.size(), 0);
+            std::vector<int64_t> outputs{};
+            {
+                const nb::gil_scoped_release release{};
+
+                for (const auto& n : nodes)
+                {
+                    marks[ntk.node_to_index(n)] = 1;
+                }
+                // every fanin precedes its fanouts in topological order, so a single pass reaches all fanouts
+                for (const auto& n : topological_order(ntk))
+                {
+                    auto& mark = marks[ntk.node_to_index(n)];
+                    ntk.foreach_fanin(n,
+                                      [&ntk, &marks, &mark](const auto& f)
+                                      {
+                                          if (marks[ntk.node_to_index(ntk.get_node(f))] != 0)
+                                          {
+                                              mark = 1;
+                                          }
+                                      });
+                }
+                ntk.foreach_po(
+                    [&ntk, &marks, &outputs](const auto& f, const auto i)
+                    {
+                        if (marks[ntk.node_to_index(ntk.get_node(f))] != 0)
+                        {
+                            outputs.push_back(static_cast<int64_t>(i));
+                        }
+                    });
+            }
+
+            owned_buffer<int64_t> output_buffer{outputs.size()};
+            std::copy(outputs.cbegin(), outputs.cend(), output_buffer.data());
+
+            auto result       = nb::dict();
+            result["nodes"]   = marked_indices(marks);
+            result["outputs"] = output_buffer.release_into_ndarray({outputs.size()});
+
+            return result;
+        },
+        nb::arg("ntk"), nb::arg("roots"),
+        R"pb(Computes the transitive fanout of a set of nodes.
+
+The transitive fanout consists of the roots and all gates that depend on them, together
+with the primary outputs those nodes drive. It is collected in a single pass over the
+nodes in topological order without holding the GIL and without a fanout view.
+
+Args:
+    ntk: The network to traverse.
+    roots: Indices of the nodes to start from.
+
+Returns:
+    A dictionary with ``nodes``, the indices of the nodes in the transitive fanout,
+    including the roots, in ascending order, and ``outputs``, the indices of the primary
+    outputs driven by any of them in ascending order, both of dtype ``int64``.
+
+Raises:
+    IndexError: If a root is not a node of the network.
+    ValueError: If a root is dead.)pb");
+
+    m.def(
+        "critical_path",
+        [](const Ntk& ntk) -> nb::dict
+        {
+            std::vector<int64_t> path{};
+            int64_t              output = -1;
+            {
+                const nb::gil_scoped_release release{};
+
+                const auto levels = compute_levels(ntk);
+
+                // the path ends at the driver of the first deepest output, or at the first deepest node without outputs
+                auto end = ntk.get_node(ntk.get_constant(false));
+                if (ntk.num_pos() > 0)
+                {
+                    ntk.foreach_po(
+                        [&](const auto& f, const auto i)
+                        {
+                            if (output == -1 ||
+                                levels[ntk.node_to_index(ntk.get_node(f))] > levels[ntk.node_to_index(end)])
+                            {
+                                end    = ntk.get_node(f);
+                                output = static_cast<int64_t>(i);
+                            }
+                        });
+                }
+                else
+                {
+                    ntk.foreach_node(
+                        [&ntk, &levels, &end](const auto& n)
+                        {
+                            if (levels[ntk.node_to_index(n)] > levels[ntk.node_to_index(end)])
+                            {
+                                end = n;
+                            }
+                        });
+                }
+
+                path.push_back(static_cast<int64_t>(ntk.node_to_index(end)));
+                for (auto n = end; levels[ntk.node_to_index(n)] > 0;)
+                {
+                    const auto level = levels[ntk.node_to_index(n)];
+                    ntk.foreach_fanin(n,
+                                      [&ntk, &levels, &n, level](const auto& f)
+                                      {
+                                          if (levels[ntk.node_to_index(ntk.get_node(f))] + 1 == level)
+                                          {
+                                              n = ntk.get_node(f);
+                                              return false;
+                                          }
+                                          return true;
+                                      });
+                    path.push_back(static_cast<int64_t>(ntk.node_to_index(n)));
+                }
+                std::reverse(path.begin(), path.end());
+            }
+
+            owned_buffer<int64_t> nodes{path.size()};
+            std::copy(path.cbegin(), path.cend(), nodes.data());
+
+            auto result      = nb::dict();
+            result["nodes"]  = nodes.release_into_ndarray({path.size()});
+            result["output"] = output;
+
+            return result;
+        },
+        nb::arg("ntk"),
+        R"pb(Computes a longest path from a primary input or the constant to a primary output.
+
+The levels of all nodes are computed in a single pass over the nodes in topological
+order without holding the GIL, and the path is traced back from the driver of the
+first output of maximum level through the first fanin one level below, so that every
+step goes through a gate.
+
+Args:
+    ntk: The network to traverse.
+
+Returns:
+    A dictionary with ``nodes``, the indices of the nodes on the path from its source to
+    the output driver (dtype ``int64``), whose length is the depth of the network plus
+    one, and ``output``, the index of the primary output the path ends at. If the network
+    has no primary outputs, the path ends at the first node of maximum level instead and
+    ``output`` is -1.)pb");
+}
+
+// Explicit instantiation for AIG
+template void traversal<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_traversal(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::traversal<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
@@ -0,0 +1,311 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/algorithms/resubstitution.hpp>
+#include <mockturtle/views/depth_view.hpp>
+#include <mockturtle/views/fanout_view.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief Computes the size of the maximum fanout-free cone of every node.
+ *
+ * The cones are dereferenced and referenced again on a private copy of the reference counts, so the network is not
+ * modified, and with explicit stacks, so that deep cones cannot overflow the call stack.
+ *
+ * @tparam Ntk Network type.
+ * @param ntk Network to compute the MFFC sizes of.
+ * @param sizes Buffer of `ntk.size()` entries to store the size of each node's MFFC in.
+ */
+template <typename Ntk>
+void compute_mffc_sizes(const Ntk& ntk, owned_buffer<int64_t>& sizes)
+{
+    using node = mockturtle::node<Ntk>;
+
+    std::vector<uint32_t> refs(ntk.size(), 0);
+    ntk.foreach_node([&ntk, &refs](const auto& n) { refs[ntk.node_to_index(n)] = ntk.fanout_size(n); });
+
+    std::fill_n(sizes.data(), ntk.size(), 0);
+
+    std::vector<node> stack{};
+    // dereferences the cone of n if `deref`, and references it back otherwise; returns the number of gates visited
+    const auto traverse = [&ntk, &refs, &stack](const node& n, const bool deref)
+    {
+        int64_t count = 0;
+        stack.assign(1, n);
+        while (!stack.empty())
+        {
+            const auto m = stack.back();
+            stack.pop_back();
+            ++count;
+            ntk.foreach_fanin(m,
+                              [&](const auto& f)
+                              {
+                                  const auto child = ntk.get_node(f);
+                                  if (ntk.is_constant(child) || ntk.is_ci(child))
+                                  {
+                                      return;
+                                  }
+                                  auto& ref = refs[ntk.node_to_index(child)];
+                                  if (deref ? --ref == 0 : ref++ == 0)
+                                  {
+                                      stack.push_back(child);
+                                  }
+                              });
+        }
+        return count;
+    };
+
+    ntk.foreach_gate(
+        [&](const auto& n)
+        {
+            sizes[ntk.node_to_index(n)] = traverse(n, true);
+            traverse(n, false);
+        });
+}
+
+/// The windows of many roots, packed into flat arrays.
+struct packed_windows
+{
+    std::vector<int64_t> roots{};
+    std::vector<int64_t> leaves{};
+    std::vector<int64_t> leaf_offsets{0};
+    std::vector<int64_t> divisors{};
+    std::vector<int64_t> divisor_offsets{0};
+    std::vector<int64_t> mffcs{};
+    std::vector<int64_t> mffc_offsets{0};
+};
+
+/**
+ * @brief Moves a vector into a NumPy array.
+ *
+ * @tparam T Element type.
+ * @param values Values to move.
+ * @return NumPy array that owns a copy of the values.
+ */
+template <typename T>
+nanobind::ndarray<nanobind::numpy, T> to_ndarray(std::vector<T>&& values)
+{
+    owned_buffer<T> buffer{values.size()};
+    std::copy(values.cbegin(), values.cend(), buffer.data());
+    const auto size = values.size();
+    values          = std::vector<T>{};
+    return buffer.release_into_ndarray({size});
+}
+
+template <typename Ntk>
+void windowing(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using node_array = nb::ndarray<const int64_t, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+    m.def(
+        "mffc_sizes",
+        [](const Ntk& ntk)
+        {
+            owned_buffer<int64_t> sizes{ntk.size()};
+            {
+                const nb::gil_scoped_release release{};
+                compute_mffc_sizes(ntk, sizes);
+            }
+            return sizes.release_into_ndarray({ntk.size()});
+        },
+        nb::arg("ntk"),
+        R"pb(Computes the size of the maximum fanout-free cone (MFFC) of every node.
+
+The MFFC of a node consists of the node and all gates in its transitive fanin whose
+every path to a primary output passes through the node, i.e., the gates that become
+dangling once the node is removed. Its size is thus the number of AND gates an
+optimization saves by replacing the node with an existing signal.
+
+The sizes of all nodes are computed in a single call without holding the GIL, which
+takes time proportional to the sum of the sizes rather than one traversal per node
+from Python.
+
+Args:
+    ntk: The network to compute the MFFC sizes of. It is not modified.
+
+Returns:
+    The MFFC size of each node by node index (shape ``(N,)``, dtype ``int64``), which is
+    0 for the constant, the primary inputs, and dead nodes.)pb");
+
+    m.def(
+        "compute_windows",
+        [](const Ntk& ntk, const std::optional<node_array>& roots, const uint32_t max_pis, const uint32_t max_divisors,
+           const uint32_t skip_fanout_limit_for_roots, const uint32_t skip_fanout_limit_for_divisors,
+           const bool preserve_depth) -> nb::dict
+        {
+            if (max_pis == 0)
+            {
+                throw std::invalid_argument("max_pis must be at least 1, got 0");
+            }
+            if (max_divisors < max_pis)
+            {
+                throw std::invalid_argument(
+                    fmt::format("max_divisors must be at least max_pis ({}), got {}", max_pis, max_divisors));
+            }
+
+            std::vector<mockturtle::node<Ntk>> candidates{};
+            if (roots.has_value())
+            {
+                candidates.reserve(roots->shape(0));
+                for (std::size_t i = 0; i < roots->shape(0); ++i)
+                {
+                    const auto root = (*roots)(i);
+                    if (root < 0 || root >= static_cast<int64_t>(ntk.size()))
+                    {
+                        throw nb::index_error(fmt::format("root {} is out of range", root).c_str());
+                    }
+                    const auto n = ntk.index_to_node(static_cast<uint32_t>(root));
+                    if (!ntk.is_and(n) || ntk.is_dead(n))
+                    {
+                        throw std::invalid_argument(fmt::format("root {} is not a gate", root));
+                    }
+                    candidates.push_back(n);
+                }
+            }
+
+            packed_windows windows{};
+            {
+                const nb::gil_scoped_release release{};
+
+                if (!roots.has_value())
+                {
+                    candidates.reserve(ntk.num_gates());
+                    ntk.foreach_gate([&candidates](const auto& n) { candidates.push_back(n); });
+                }
+
+                mockturtle::resubstitution_params ps{};
+                ps.max_pis                        = max_pis;
+                ps.max_divisors                   = max_divisors;
+                ps.skip_fanout_limit_for_roots    = skip_fanout_limit_for_roots;
+                ps.skip_fanout_limit_for_divisors = skip_fanout_limit_for_divisors;
+                ps.preserve_depth                 = preserve_depth;
+
+                // the same views and divisor collector aig_resubstitution uses, which mark nodes by their values and
+                // traversal ids and dereference MFFCs in place; the binding's docstring states that this is not
+                // thread-safe
+                ntk.clear_values();
+                using view_t = mockturtle::fanout_view<mockturtle::depth_view<Ntk>>;
+                const mockturtle::depth_view<Ntk> depth{ntk};
+                const view_t                      view{depth};
+
+                typename mockturtle::detail::default_divisor_collector<view_t>::stats st{};
+                mockturtle::detail::default_divisor_collector<view_t>                 collector{view, ps, st};
+
+                const auto append =
+                    [&view](const auto& nodes, std::vector<int64_t>& values, std::vector<int64_t>& offsets)
+                {
+                    std::transform(nodes.cbegin(), nodes.cend(), std::back_inserter(values),
+                                   [&view](const auto& n) { return static_cast<int64_t>(view.node_to_index(n)); });
+                    offsets.push_back(static_cast<int64_t>(values.size()));
+                };
+
+                for (const auto& n : candidates)
+                {
+                    uint32_t potential_gain = 0;
+                    if (!collector.run(n, potential_gain))
+                    {
+                        continue;
+                    }
+                    windows.roots.push_back(static_cast<int64_t>(view.node_to_index(n)));
+                    append(collector.leaves, windows.leaves, windows.leaf_offsets);
+                    append(collector.divs, windows.divisors, windows.divisor_offsets);
+                    append(collector.mffc, windows.mffcs, windows.mffc_offsets);
+                }
+            }
+
+            auto result               = nb::dict();
+            result["roots"]           = to_ndarray(std::move(windows.roots));
+            result["leaves"]          = to_ndarray(std::move(windows.leaves));
+            result["leaf_offsets"]    = to_ndarray(std::move(windows.leaf_offsets));
+            result["divisors"]        = to_ndarray(std::move(windows.divisors));
+            result["divisor_offsets"] = to_ndarray(std::move(windows.divisor_offsets));
+            result["mffcs"]           = to_ndarray(std::move(windows.mffcs));
+            result["mffc_offsets"]    = to_ndarray(std::move(windows.mffc_offsets));
+
+            return result;
+        },
+        nb::arg("ntk"), nb::arg("roots") = nb::none(), nb::kw_only(), nb::arg("max_pis") = 8,
+        nb::arg("max_divisors") = 150, nb::arg("skip_fanout_limit_for_roots") = 1000,
+        nb::arg("skip_fanout_limit_for_divisors") = 100, nb::arg("preserve_depth") = false,
+        R"pb(Computes the reconvergence-driven windows :func:`aig_resubstitution` optimizes.
+
+The window of a root gate consists of
+
+- its leaves, a reconvergence-driven cut of at most ``max_pis`` nodes,
+- its divisors, the leaves followed by the nodes between the leaves and the root that
+  are not in the root's MFFC, extended by nodes in the fanout of the divisors whose
+  fanins are all divisors, and
+- its MFFC, the gates of the root's maximum fanout-free cone within the leaves, which
+  ends with the root.
+
+A resubstitution re-expresses the root in terms of divisors, which frees its MFFC.
+
+All windows are computed in a single call without holding the GIL and returned packed
+into flat NumPy arrays: window ``w`` belongs to ``roots[w]``, its leaves are
+``leaves[leaf_offsets[w]:leaf_offsets[w + 1]]``, and its divisors and MFFC are laid
+out in the same way.
+
+The windows are computed by the divisor collector of :func:`aig_resubstitution`, which
+keeps its marks in the network itself: the call overwrites the values and traversal
+marks of the nodes, and it temporarily decrements the fanout reference counts of the
+MFFC gates while collecting them. The fanout counts are restored before the call
+returns, and the network's structure, i.e., its nodes, fanins, and outputs, is not
+modified. As all of this happens without holding the GIL, the call is not
+thread-safe: no other call, e.g., :class:`~aigverse.networks.AigCut` or
+:func:`mffc_sizes`, may use the same network concurrently.
+
+Args:
+    ntk: The network to compute windows in. Its structure is not modified.
+    roots: Gates to compute windows for. Defaults to all gates in topological order.
+    max_pis: Maximum number of leaves of a window.
+    max_divisors: Maximum number of divisors and MFFC gates of a window. Roots whose
+        window exceeds this before its fanout extension get no window.
+    skip_fanout_limit_for_roots: Roots with more fanouts get no window.
+    skip_fanout_limit_for_divisors: Divisors with more fanouts are not extended.
+    preserve_depth: Extends the divisors only by nodes whose level does not exceed the
+        root's.
+
+Returns:
+    A dictionary with ``roots``, ``leaves``, ``leaf_offsets``, ``divisors``,
+    ``divisor_offsets``, ``mffcs``, and ``mffc_offsets``, all of dtype ``int64``. Roots
+    that get no window are left out of ``roots``.
+
+Raises:
+    IndexError: If a root is not a node of the network.
+    ValueError: If a root is not a gate, ``max_pis`` is 0, or ``max_divisors`` is less
+        than ``max_pis``.)pb");
+}
+
+// Explicit instantiation for AIG
+template void windowing<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_windowing(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::windowing<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
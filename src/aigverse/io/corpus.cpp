@@ -0,0 +1,855 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/networks/index_list.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <kitty/dynamic_truth_table.hpp>
+#include <mockturtle/algorithms/simulation.hpp>
+#include <mockturtle/utils/index_list/index_list.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/filesystem.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/optional.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>      // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/tuple.h>       // NOLINT(misc-include-cleaner)
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#include <array>
+#include <cerrno>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <mutex>
+#include <optional>
+#include <shared_mutex>
+#include <stdexcept>
+#include <string>
+#include <system_error>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * @brief The header at the start of both files of a corpus.
+ */
+struct corpus_header
+{
+    std::array<char, 8> magic{};
+    uint32_t            version{};
+    uint32_t            reserved{};
+};
+
+static_assert(sizeof(corpus_header) == 16);
+
+/**
+ * @brief The index entry of one network of a corpus.
+ *
+ * The record of a network in the data file consists of its raw index-list values,
+ * followed by the UTF-8 bytes of its name, and starts at a multiple of four bytes.
+ */
+struct corpus_entry
+{
+    uint64_t offset{};       // byte offset of the record in the data file
+    uint32_t num_values{};   // number of index-list values
+    uint32_t name_length{};  // number of name bytes
+    uint32_t num_pis{};
+    uint32_t num_pos{};
+    uint32_t num_gates{};
+    uint32_t flags{};
+    uint64_t truth_table_hash{};
+};
+
+static_assert(sizeof(corpus_entry) == 40);
+
+constexpr std::array<char, 8> corpus_data_magic{'A', 'I', 'G', 'C', 'O', 'R', 'P', 'D'};
+constexpr std::array<char, 8> corpus_index_magic{'A', 'I', 'G', 'C', 'O', 'R', 'P', 'I'};
+constexpr uint32_t            corpus_version = 1;
+// set in corpus_entry::flags if the entry has a truth-table hash
+constexpr uint32_t corpus_has_truth_table_hash = 1;
+// truth tables are hashed for networks with at most this many primary inputs
+constexpr uint32_t corpus_max_hashed_pis = 16;
+// buffered records are written once they exceed this many bytes
+constexpr std::size_t corpus_buffer_size = std::size_t{1} << 20;
+
+inline std::filesystem::path corpus_index_path(const std::filesystem::path& filename)
+{
+    auto path = filename;
+    path += ".idx";
+    return path;
+}
+
+[[noreturn]] inline void throw_corpus_io_error(const std::string& action, const std::filesystem::path& path,
+                                               const int error_code)
+{
+    throw std::runtime_error(
+        fmt::format("cannot {} '{}': {}", action, path.string(), std::system_category().message(error_code)));
+}
+
+/**
+ * @brief A read-only memory mapping of a whole file.
+ *
+ * The file may be appended to while it is mapped; the mapping keeps the size the file
+ * had when it was mapped.
+ */
+class mapped_file
+{
+  public:
+    mapped_file() = default;
+
+    explicit mapped_file(const std::filesystem::path& path)
+    {
+#ifdef _WIN32
+        // share writing and deletion, so that a writer can keep appending to the file
+        file = CreateFileW(path.c_str(), GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE, nullptr,
+                           OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+        if (file == INVALID_HANDLE_VALUE)
+        {
+            throw_corpus_io_error("open", path, static_cast<int>(GetLastError()));
+        }
+        LARGE_INTEGER file_size{};
+        if (GetFileSizeEx(file, &file_size) == 0)
+        {
+            const auto error = static_cast<int>(GetLastError());
+            unmap();
+            throw_corpus_io_error("open", path, error);
+        }
+        length = static_cast<std::size_t>(file_size.QuadPart);
+        if (length > 0)
+        {
+            mapping = CreateFileMappingW(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+            view    = mapping != nullptr ? MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0) : nullptr;
+            if (view == nullptr)
+            {
+                const auto error = static_cast<int>(GetLastError());
+                unmap();
+                throw_corpus_io_error("map", path, error);
+            }
+        }
+#else
+        const int fd = ::open(path.c_str(), O_RDONLY | O_CLOEXEC);  // NOLINT(cppcoreguidelines-pro-type-vararg)
+        if (fd < 0)
+        {
+            throw_corpus_io_error("open", path, errno);
+        }
+        struct stat status{};
+        if (::fstat(fd, &status) != 0)
+        {
+            const auto error = errno;
+            ::close(fd);
+            throw_corpus_io_error("open", path, error);
+        }
+        length = static_cast<std::size_t>(status.st_size);
+        if (length > 0)
+        {
+            view             = ::mmap(nullptr, length, PROT_READ, MAP_SHARED, fd, 0);
+            const auto error = errno;
+            ::close(fd);
+            if (view == MAP_FAILED)  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
+            {
+                view = nullptr;
+                throw_corpus_io_error("map", path, error);
+            }
+        }
+        else
+        {
+            ::close(fd);
+        }
+#endif
+    }
+
+    mapped_file(const mapped_file&)            = delete;
+    mapped_file& operator=(const mapped_file&) = delete;
+
+    mapped_file(mapped_file&& other) noexcept
+    {
+        swap(other);
+    }
+
+    mapped_file& operator=(mapped_file&& other) noexcept
+    {
+        mapped_file released{std::move(other)};
+        swap(released);
+        return *this;
+    }
+
+    ~mapped_file()
+    {
+        unmap();
+    }
+
+    [[nodiscard]] const std::byte* data() const noexcept
+    {
+        return static_cast<const std::byte*>(view);
+    }
+
+    [[nodiscard]] std::size_t size() const noexcept
+    {
+        return length;
+    }
+
+  private:
+    void swap(mapped_file& other) noexcept
+    {
+        std::swap(view, other.view);
+        std::swap(length, other.length);
+#ifdef _WIN32
+        std::swap(file, other.file);
+        std::swap(mapping, other.mapping);
+#endif
+    }
+
+    void unmap() noexcept
+    {
+#ifdef _WIN32
+        if (view != nullptr)
+        {
+            UnmapViewOfFile(view);
+        }
+        if (mapping != nullptr)
+        {
+            CloseHandle(mapping);
+        }
+        if (file != INVALID_HANDLE_VALUE)
+        {
+            CloseHandle(file);
+        }
+        file    = INVALID_HANDLE_VALUE;
+        mapping = nullptr;
+#else
+        if (view != nullptr)
+        {
+            ::munmap(view, length);
+        }
+#endif
+        view   = nullptr;
+        length = 0;
+    }
+
+    void*       view{nullptr};
+    std::size_t length{0};
+#ifdef _WIN32
+    HANDLE file{INVALID_HANDLE_VALUE};
+    HANDLE mapping{nullptr};
+#endif
+};
+
+/**
+ * @brief Checks that a file starts with a corpus header with the given magic bytes.
+ */
+inline void check_corpus_header(const std::byte* data, const std::size_t size, const std::array<char, 8>& magic,
+                                const std::filesystem::path& path)
+{
+    corpus_header header{};
+    if (size >= sizeof(header))
+    {
+        std::memcpy(&header, data, sizeof(header));
+    }
+    if (size < sizeof(header) || header.magic != magic)
+    {
+        throw std::invalid_argument(fmt::format("'{}' is not an aigverse corpus file", path.string()));
+    }
+    if (header.version != corpus_version)
+    {
+        throw std::invalid_argument(fmt::format("'{}' has format version {}, but only version {} is supported",
+                                                path.string(), header.version, corpus_version));
+    }
+}
+
+/**
+ * @brief Hashes the output truth tables of a network with 64-bit FNV-1a.
+ *
+ * The hash covers the bits of the outputs in order, so it does not depend on the
+ * platform or on the structure that implements the functions.
+ */
+inline uint64_t corpus_truth_table_hash(const aigverse::aig& ntk)
+{
+    const auto tts = mockturtle::simulate<kitty::dynamic_truth_table>(
+        ntk, mockturtle::default_simulator<kitty::dynamic_truth_table>{ntk.num_pis()});
+
+    uint64_t hash = 0xcbf29ce484222325ULL;
+    for (const auto& tt : tts)
+    {
+        const auto mask = tt.num_bits() < 64 ? (uint64_t{1} << tt.num_bits()) - 1 : ~uint64_t{0};
+        for (const auto word : tt)
+        {
+            for (auto byte = 0U; byte < 8; ++byte)
+            {
+                hash ^= ((word & mask) >> (8 * byte)) & 0xffU;
+                hash *= 0x100000001b3ULL;
+            }
+        }
+    }
+    return hash;
+}
+
+/**
+ * @brief Appends networks to a corpus.
+ *
+ * Records and their index entries are buffered and written in this order, so that a
+ * concurrent reader never sees an index entry whose record is incomplete. All members
+ * lock the writer, so that threads can share it.
+ */
+class corpus_writer
+{
+  public:
+    corpus_writer(std::filesystem::path path, const bool truth_table_hashes) :
+            filename{std::move(path)},
+            hash_truth_tables{truth_table_hashes}
+    {
+        const auto index_filename = corpus_index_path(filename);
+        const auto data_exists    = std::filesystem::exists(filename);
+        const auto index_exists   = std::filesystem::exists(index_filename);
+        if (data_exists != index_exists)
+        {
+            throw std::invalid_argument(fmt::format("'{}' exists, but '{}' does not",
+                                                    (data_exists ? filename : index_filename).string(),
+                                                    (data_exists ? index_filename : filename).string()));
+        }
+
+        if (data_exists)
+        {
+            {
+                const mapped_file data{filename};
+                check_corpus_header(data.data(), data.size(), corpus_data_magic, filename);
+                data_size = data.size();
+            }
+            const mapped_file index{index_filename};
+            check_corpus_header(index.data(), index.size(), corpus_index_magic, index_filename);
+            num_written = (index.size() - sizeof(corpus_header)) / sizeof(corpus_entry);
+        }
+
+        if (const auto index_size = sizeof(corpus_header) + (num_written * sizeof(corpus_entry));
+            data_exists && std::filesystem::file_size(index_filename) != index_size)
+        {
+            // drop an entry that a previous writer did not finish
+            std::filesystem::resize_file(index_filename, index_size);
+        }
+
+        data_stream.open(filename, std::ios::binary | std::ios::app);
+        index_stream.open(index_filename, std::ios::binary | std::ios::app);
+        if (!data_stream || !index_stream)
+        {
+            throw_corpus_io_error("open", data_stream ? index_filename : filename, errno);
+        }
+
+        if (!data_exists)
+        {
+            write_header(data_buffer, corpus_data_magic);
+            write_header(index_buffer, corpus_index_magic);
+            data_size = sizeof(corpus_header);
+            write_buffers();
+        }
+    }
+
+    corpus_writer(const corpus_writer&)            = delete;
+    corpus_writer& operator=(const corpus_writer&) = delete;
+    corpus_writer(corpus_writer&&)                 = delete;
+    corpus_writer& operator=(corpus_writer&&)      = delete;
+
+    ~corpus_writer()
+    {
+        try
+        {
+            close();
+        }
+        catch (...)  // NOLINT(bugprone-empty-catch)
+        {
+            // destructors must not throw; close() reports errors when called explicitly
+        }
+    }
+
+    std::size_t append(const aigverse::aig& ntk, const std::string& name)
+    {
+        const std::scoped_lock lock{mutex};
+        check_open();
+        if (!has_normalized_index_order(ntk))
+        {
+            throw std::invalid_argument("the network is not in normalized index order, i.e., it has dead nodes or "
+                                        "primary inputs created after gates");
+        }
+        if (name.size() > UINT32_MAX)
+        {
+            throw std::invalid_argument("the name is too long");
+        }
+
+        aigverse::aig_index_list il{};
+        mockturtle::encode(il, ntk);
+        const auto raw = il.raw();
+
+        // records start at multiples of four bytes, so that readers can address their values in place
+        const auto padding = (4 - (data_size % 4)) % 4;
+        data_buffer.insert(data_buffer.end(), padding, std::byte{0});
+
+        corpus_entry entry{};
+        entry.offset      = data_size + padding;
+        entry.num_values  = static_cast<uint32_t>(raw.size());
+        entry.name_length = static_cast<uint32_t>(name.size());
+        entry.num_pis     = static_cast<uint32_t>(il.num_pis());
+        entry.num_pos     = static_cast<uint32_t>(il.num_pos());
+        entry.num_gates   = static_cast<uint32_t>(il.num_gates());
+        if (hash_truth_tables && ntk.num_pis() <= corpus_max_hashed_pis)
+        {
+            entry.flags |= corpus_has_truth_table_hash;
+            entry.truth_table_hash = corpus_truth_table_hash(ntk);
+        }
+
+        append_bytes(data_buffer, raw.data(), raw.size() * sizeof(uint32_t));
+        append_bytes(data_buffer, name.data(), name.size());
+        append_bytes(index_buffer, &entry, sizeof(entry));
+        data_size += padding + (raw.size() * sizeof(uint32_t)) + name.size();
+
+        if (data_buffer.size() >= corpus_buffer_size)
+        {
+            write_buffers();
+        }
+        return num_written++;
+    }
+
+    void flush()
+    {
+        const std::scoped_lock lock{mutex};
+        check_open();
+        write_buffers();
+    }
+
+    void close()
+    {
+        const std::scoped_lock lock{mutex};
+        if (closed)
+        {
+            return;
+        }
+        write_buffers();
+        data_stream.close();
+        index_stream.close();
+        closed = true;
+    }
+
+    [[nodiscard]] std::size_t size() const
+    {
+        const std::scoped_lock lock{mutex};
+        return num_written;
+    }
+
+    [[nodiscard]] bool is_closed() const
+    {
+        const std::scoped_lock lock{mutex};
+        return closed;
+    }
+
+    [[nodiscard]] const std::filesystem::path& path() const noexcept
+    {
+        return filename;
+    }
+
+  private:
+    static void append_bytes(std::vector<std::byte>& buffer, const void* bytes, const std::size_t size)
+    {
+        const auto* begin = static_cast<const std::byte*>(bytes);
+        buffer.insert(buffer.end(), begin, begin + size);
+    }
+
+    static void write_header(std::vector<std::byte>& buffer, const std::array<char, 8>& magic)
+    {
+        corpus_header header{};
+        header.magic   = magic;
+        header.version = corpus_version;
+        append_bytes(buffer, &header, sizeof(header));
+    }
+
+    static void write_buffer(std::ofstream& stream, std::vector<std::byte>& buffer, const std::filesystem::path& path)
+    {
+        if (buffer.empty())
+        {
+            return;
+        }
+        stream.write(
+            reinterpret_cast<const char*>(buffer.data()),  // NOLINT(cppcoreguidelines-pro-type-reinterpret-cast)
+            static_cast<std::streamsize>(buffer.size()));
+        stream.flush();
+        if (!stream)
+        {
+            throw_corpus_io_error("write to", path, errno);
+        }
+        buffer.clear();
+    }
+
+    void write_buffers()
+    {
+        // the records go first, so that every index entry a reader sees refers to a complete record
+        write_buffer(data_stream, data_buffer, filename);
+        write_buffer(index_stream, index_buffer, corpus_index_path(filename));
+    }
+
+    void check_open() const
+    {
+        if (closed)
+        {
+            throw std::invalid_argument("the corpus writer is closed");
+        }
+    }
+
+    std::filesystem::path  filename;
+    bool                   hash_truth_tables;
+    std::ofstream          data_stream{};
+    std::ofstream          index_stream{};
+    std::vector<std::byte> data_buffer{};
+    std::vector<std::byte> index_buffer{};
+    std::size_t            data_size{0};
+    std::size_t            num_written{0};
+    bool                   closed{false};
+    mutable std::mutex     mutex{};
+};
+
+/**
+ * @brief Reads networks from a memory-mapped corpus.
+ *
+ * Accessors share a lock that refreshing and closing take exclusively, so that a
+ * mapping is never replaced while it is read.
+ */
+class corpus_reader
+{
+  public:
+    explicit corpus_reader(std::filesystem::path path) : filename{std::move(path)}
+    {
+        refresh();
+    }
+
+    std::size_t refresh()
+    {
+        // the index is mapped first: every entry in it refers to a record that was written before the entry, and
+        // thus lies within the data mapped afterwards
+        const auto  index_filename = corpus_index_path(filename);
+        mapped_file new_index{index_filename};
+        check_corpus_header(new_index.data(), new_index.size(), corpus_index_magic, index_filename);
+        mapped_file new_data{filename};
+        check_corpus_header(new_data.data(), new_data.size(), corpus_data_magic, filename);
+
+        const std::unique_lock lock{mutex};
+        index       = std::move(new_index);
+        data        = std::move(new_data);
+        num_entries = (index.size() - sizeof(corpus_header)) / sizeof(corpus_entry);
+        closed      = false;
+        return num_entries;
+    }
+
+    void close()
+    {
+        const std::unique_lock lock{mutex};
+        index       = mapped_file{};
+        data        = mapped_file{};
+        num_entries = 0;
+        closed      = true;
+    }
+
+    [[nodiscard]] std::size_t size() const
+    {
+        const std::shared_lock lock{mutex};
+        return num_entries;
+    }
+
+    [[nodiscard]] const std::filesystem::path& path() const noexcept
+    {
+        return filename;
+    }
+
+    /**
+     * @brief Calls a function with the entry, the values, and the name of a network.
+     *
+     * @param position Index of the network, negative ones counting from the end.
+     */
+    template <typename Fn>
+    auto with_record(const int64_t position, Fn&& fn) const
+    {
+        const std::shared_lock lock{mutex};
+        if (closed)
+        {
+            throw std::invalid_argument("the corpus reader is closed");
+        }
+
+        const auto size = static_cast<int64_t>(num_entries);
+        if (position < -size || position >= size)
+        {
+            throw nanobind::index_error(
+                fmt::format("network index {} is out of range for a corpus of {} networks", position, size).c_str());
+        }
+        const auto i = static_cast<std::size_t>(position < 0 ? position + size : position);
+
+        corpus_entry entry{};
+        std::memcpy(&entry, index.data() + sizeof(corpus_header) + (i * sizeof(corpus_entry)), sizeof(entry));
+
+        const auto values_size = uint64_t{entry.num_values} * sizeof(uint32_t);
+        if (entry.offset % 4 != 0 || entry.offset < sizeof(corpus_header) || entry.offset > data.size() ||
+            data.size() - entry.offset < values_size + entry.name_length)
+        {
+            throw std::invalid_argument(
+                fmt::format("the record of network {} lies outside of '{}'", i, filename.string()));
+        }
+
+        const auto* record = data.data() + entry.offset;
+        const auto* values =
+            reinterpret_cast<const uint32_t*>(record);  // NOLINT(cppcoreguidelines-pro-type-reinterpret-cast)
+        if (const auto problem = index_list_problem(values, entry.num_values); !problem.empty())
+        {
+            throw std::invalid_argument(fmt::format("the index list of network {} {}", i, problem));
+        }
+
+        const std::string name{
+            reinterpret_cast<const char*>(record + values_size),  // NOLINT(cppcoreguidelines-pro-type-reinterpret-cast)
+            entry.name_length};
+        return fn(entry, values, name);
+    }
+
+  private:
+    std::filesystem::path     filename;
+    mapped_file               index{};
+    mapped_file               data{};
+    std::size_t               num_entries{0};
+    bool                      closed{false};
+    mutable std::shared_mutex mutex{};
+};
+
+}  // namespace detail
+
+void bind_corpus(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;  // NOLINT(misc-unused-alias-decls)
+
+    using detail::corpus_reader;
+    using detail::corpus_writer;
+
+    nb::class_<corpus_writer>(m, "CorpusWriter",
+                              R"pb(Appends networks to a memory-mappable corpus.
+
+A corpus packs many networks as index lists into one data file, ``filename``, and keeps
+an offset table with their metadata in a second file, ``filename + ".idx"``, from which
+:class:`CorpusReader` accesses any network in constant time. Opening an existing corpus
+appends to it; records are only ever appended, so any number of processes can read a
+corpus while one writer extends it. Written networks become visible to readers after
+:meth:`flush` or :meth:`close` and a :meth:`CorpusReader.refresh`.
+
+Only one writer may append to a corpus at a time.)pb")
+        .def(nb::init<std::filesystem::path, bool>(), nb::arg("filename"), nb::kw_only(),
+             nb::arg("truth_table_hashes") = false,
+             R"pb(Creates a corpus or opens an existing one for appending.
+
+Args:
+    filename: Path to the data file of the corpus.
+    truth_table_hashes: Whether to store a hash of the output truth tables of each
+        network with at most 16 primary inputs. Networks are simulated to compute it.
+
+Raises:
+    ValueError: If only one of the two corpus files exists or they are not corpus files.
+    RuntimeError: If the files cannot be opened.)pb")
+        .def(
+            "append",
+            [](corpus_writer& self, const aigverse::aig& ntk, const std::optional<std::string>& name)
+            {
+                const auto handle = nb::find(&ntk);
+                if (nb::isinstance<aigverse::sequential_aig>(handle))
+                {
+                    throw nb::type_error("a SequentialAig cannot be stored in a corpus, since its index list would "
+                                         "drop register state");
+                }
+                if (name.has_value())
+                {
+                    return self.append(ntk, *name);
+                }
+                if (nb::isinstance<aigverse::named_aig>(handle))
+                {
+                    return self.append(ntk, nb::cast<const aigverse::named_aig&>(handle).get_network_name());
+                }
+                return self.append(ntk, {});
+            },
+            nb::arg("ntk"), nb::arg("name") = nb::none(),
+            R"pb(Appends a network to the corpus.
+
+Only the combinational structure is stored, as by :meth:`~aigverse.networks.Aig.to_index_list`.
+
+Args:
+    ntk: The network to append.
+    name: Name to store with the network. Defaults to the network name of a
+        :class:`~aigverse.networks.NamedAig` and to no name otherwise.
+
+Returns:
+    The index of the network in the corpus.
+
+Raises:
+    TypeError: If ``ntk`` is a :class:`~aigverse.networks.SequentialAig`.
+    ValueError: If the writer is closed or ``ntk`` has dead nodes or primary inputs
+        created after gates, which index lists cannot represent.
+    RuntimeError: If writing to the corpus fails.)pb")
+        .def("flush", &corpus_writer::flush,
+             R"pb(Writes all buffered networks to the corpus files.
+
+Raises:
+    ValueError: If the writer is closed.
+    RuntimeError: If writing to the corpus fails.)pb")
+        .def("close", &corpus_writer::close,
+             R"pb(Writes all buffered networks and closes the corpus files.
+
+Closing a closed writer has no effect.
+
+Raises:
+    RuntimeError: If writing to the corpus fails.)pb")
+        .def_prop_ro("closed", &corpus_writer::is_closed, R"pb(Whether the writer is closed.)pb")
+        .def_prop_ro(
+            "filename", [](const corpus_writer& self) { return self.path(); },
+            R"pb(Path to the data file of the corpus.)pb")
+        .def("__len__", &corpus_writer::size, R"pb(Returns the number of networks in the corpus.)pb")
+        .def(
+            "__enter__", [](corpus_writer& self) -> corpus_writer& { return self; }, nb::rv_policy::reference)
+        .def("__exit__", [](corpus_writer& self, const nb::args&) { self.close(); })
+        .def("__repr__", [](const corpus_writer& self)
+             { return fmt::format("CorpusWriter('{}', num_networks={})", self.path().string(), self.size()); });
+
+    nb::class_<corpus_reader>(m, "CorpusReader",
+                              R"pb(Reads networks from a memory-mapped corpus written by :class:`CorpusWriter`.
+
+Both corpus files are memory-mapped, so opening a corpus is cheap regardless of its
+size, any network is decoded in constant time, and processes that read the same corpus
+share its pages in the operating system's cache. Readers can be pickled, e.g., to pass
+them to the worker processes of a data loader, which then map the corpus themselves.
+
+A reader sees the networks that were written when it was opened or last refreshed.)pb")
+        .def(nb::init<std::filesystem::path>(), nb::arg("filename"),
+             R"pb(Opens a corpus for reading.
+
+Args:
+    filename: Path to the data file of the corpus.
+
+Raises:
+    ValueError: If the files are not corpus files.
+    RuntimeError: If the files cannot be opened or mapped.)pb")
+        .def("refresh", &corpus_reader::refresh,
+             R"pb(Maps the corpus files anew to see the networks appended since they were mapped.
+
+This also reopens a closed reader.
+
+Returns:
+    The number of networks in the corpus.
+
+Raises:
+    ValueError: If the files are not corpus files.
+    RuntimeError: If the files cannot be opened or mapped.)pb")
+        .def("close", &corpus_reader::close, R"pb(Unmaps the corpus files.)pb")
+        .def(
+            "__getitem__",
+            [](const corpus_reader& self, const int64_t index)
+            {
+                return self.with_record(
+                    index,
+                    [](const detail::corpus_entry& entry, const uint32_t* values, const std::string&)
+                    {
+                        aigverse::aig ntk{};
+                        mockturtle::decode(
+                            ntk, aigverse::aig_index_list{std::vector<uint32_t>(values, values + entry.num_values)});
+                        return ntk;
+                    });
+            },
+            nb::arg("index"),
+            R"pb(Decodes one network of the corpus.
+
+Args:
+    index: Index of the network. Negative indices are supported.
+
+Returns:
+    The decoded network.
+
+Raises:
+    IndexError: If ``index`` is out of range.
+    ValueError: If the reader is closed or the record of the network is corrupted.)pb")
+        .def(
+            "index_list",
+            [](const corpus_reader& self, const int64_t index)
+            {
+                return self.with_record(
+                    index, [](const detail::corpus_entry& entry, const uint32_t* values, const std::string&)
+                    { return aigverse::aig_index_list{std::vector<uint32_t>(values, values + entry.num_values)}; });
+            },
+            nb::arg("index"),
+            R"pb(Returns the index list of one network of the corpus without decoding it.
+
+Args:
+    index: Index of the network. Negative indices are supported.
+
+Returns:
+    The index list of the network.
+
+Raises:
+    IndexError: If ``index`` is out of range.
+    ValueError: If the reader is closed or the record of the network is corrupted.)pb")
+        .def(
+            "metadata",
+            [](const corpus_reader& self, const int64_t index)
+            {
+                return self.with_record(index,
+                                        [](const detail::corpus_entry& entry, const uint32_t*, const std::string& name)
+                                        {
+                                            auto result         = nb::dict();
+                                            result["name"]      = name.empty() ? nb::none() : nb::cast(name);
+                                            result["num_pis"]   = entry.num_pis;
+                                            result["num_pos"]   = entry.num_pos;
+                                            result["num_gates"] = entry.num_gates;
+                                            result["truth_table_hash"] =
+                                                (entry.flags & detail::corpus_has_truth_table_hash) != 0 ?
+                                                    nb::cast(entry.truth_table_hash) :
+                                                    nb::none();
+                                            return result;
+                                        });
+            },
+            nb::arg("index"),
+            R"pb(Returns the metadata of one network of the corpus without decoding it.
+
+Args:
+    index: Index of the network. Negative indices are supported.
+
+Returns:
+    A dictionary with the ``name`` of the network, or ``None`` if it has none, its
+    ``num_pis``, ``num_pos``, and ``num_gates``, and its ``truth_table_hash``, a 64-bit
+    FNV-1a hash of the bits of its output truth tables, or ``None`` if the writer did not
+    compute one.
+
+Raises:
+    IndexError: If ``index`` is out of range.
+    ValueError: If the reader is closed or the record of the network is corrupted.)pb")
+        .def_prop_ro(
+            "filename", [](const corpus_reader& self) { return self.path(); },
+            R"pb(Path to the data file of the corpus.)pb")
+        .def("__len__", &corpus_reader::size, R"pb(Returns the number of networks in the corpus.)pb")
+        .def(
+            "__enter__", [](corpus_reader& self) -> corpus_reader& { return self; }, nb::rv_policy::reference)
+        .def("__exit__", [](corpus_reader& self, const nb::args&) { self.close(); })
+        .def(
+            "__getstate__", [](const corpus_reader& self) { return nb::make_tuple(self.path()); },
+            R"pb(Returns pickle state as a tuple holding the path of the corpus.)pb")
+        .def(
+            "__setstate__", [](corpus_reader& self, const std::tuple<std::filesystem::path>& state)
+            { new (&self) corpus_reader{std::get<0>(state)}; }, nb::arg("state"),
+            R"pb(Opens the corpus at the pickled path.)pb")
+        .def("__repr__", [](const corpus_reader& self)
+             { return fmt::format("CorpusReader('{}', num_networks={})", self.path().string(), self.size()); });
+}
+
+}  // namespace aigverse
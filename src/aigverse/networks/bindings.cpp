@@ -5,6 +5,7 @@ namespace aigverse
 void bind_logic_networks(nanobind::module_& m);
 void bind_ntk_edge_list(nanobind::module_& m);
 void bind_ntk_index_list(nanobind::module_& m);
+void bind_graph_import(nanobind::module_& m);
 }  // namespace aigverse
 
 NB_MODULE(networks, m)
@@ -16,4 +17,5 @@ objects for structural manipulation.)pb";
     aigverse::bind_logic_networks(m);
     aigverse::bind_ntk_edge_list(m);
     aigverse::bind_ntk_index_list(m);
+    aigverse::bind_graph_import(m);
 }
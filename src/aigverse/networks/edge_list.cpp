@@ -4,6 +4,7 @@
 
 #include "aigverse/networks/edge_list.hpp"
 
+#include "aigverse/owned_buffer.hpp"
 #include "aigverse/types.hpp"
 
 #include <fmt/format.h>
@@ -11,11 +12,15 @@
 #include <mockturtle/traits.hpp>
 #include <nanobind/make_iterator.h>  // NOLINT(misc-include-cleaner)
 #include <nanobind/nanobind.h>
-#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
-#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
 
 #include <cstddef>
 #include <cstdint>
+#include <optional>
+#include <stdexcept>
 #include <string>
 #include <vector>
 
@@ -25,6 +30,30 @@ namespace aigverse
 namespace detail
 {
 
+/**
+ * @brief Gathers one field of every edge into a NumPy array.
+ *
+ * The edges are stored as an array of structs that is reallocated when the list grows,
+ * so the field is copied into a contiguous buffer in one pass rather than exposed as a
+ * strided view that could dangle.
+ *
+ * @tparam Ntk Network type.
+ * @tparam Field Pointer to the gathered member of the edge.
+ * @param el Edge list.
+ * @return NumPy array holding the field of every edge.
+ */
+template <typename Ntk, auto Field>
+nanobind::ndarray<nanobind::numpy, int64_t> edge_field(const edge_list<Ntk>& el)
+{
+    const auto            count = el.edges.size();
+    owned_buffer<int64_t> values{count};
+    for (std::size_t i = 0; i < count; ++i)
+    {
+        values[i] = static_cast<int64_t>(el.edges[i].*Field);
+    }
+    return values.release_into_ndarray({count});
+}
+
 template <typename Ntk>
 void ntk_edge_list(nanobind::module_& m, const std::string& network_name)  // NOLINT(misc-use-internal-linkage)
 {
@@ -101,7 +130,8 @@ Returns:
     /**
      * Edge list.
      */
-    using EdgeList = edge_list<Ntk>;  // NOLINT(readability-identifier-naming)
+    using EdgeList   = edge_list<Ntk>;  // NOLINT(readability-identifier-naming)
+    using edge_array = nb::ndarray<const int64_t, nb::ndim<1>, nb::device::cpu>;
     nb::class_<EdgeList>(m, fmt::format("{}EdgeList", network_name).c_str(),
                          R"pb(Represents a list of edges associated with a network.)pb")
         .def(nb::init<>(), R"pb(Creates an empty edge list.)pb")
@@ -121,8 +151,55 @@ Args:
 Args:
     ntk: Network associated with the edge list.
     edges: Initial edge collection.)pb")
+        .def(
+            "__init__",
+            [](EdgeList* el, const edge_array& sources, const edge_array& targets,
+               const std::optional<edge_array>& weights)
+            {
+                const auto count = sources.shape(0);
+                if (targets.shape(0) != count || (weights.has_value() && weights->shape(0) != count))
+                {
+                    throw std::invalid_argument(
+                        fmt::format("sources, targets, and weights must have the same length, got {}, {}, and {}",
+                                    count, targets.shape(0), weights.has_value() ? weights->shape(0) : count));
+                }
+
+                std::vector<Edge> edges{};
+                edges.reserve(count);
+                for (std::size_t i = 0; i < count; ++i)
+                {
+                    if (sources(i) < 0 || targets(i) < 0)
+                    {
+                        throw std::invalid_argument(
+                            fmt::format("edge {} has a negative endpoint ({}, {})", i, sources(i), targets(i)));
+                    }
+                    edges.emplace_back(static_cast<mockturtle::node<Ntk>>(sources(i)),
+                                       static_cast<mockturtle::node<Ntk>>(targets(i)),
+                                       weights.has_value() ? (*weights)(i) : 0);
+                }
+                new (el) EdgeList{edges};
+            },
+            nb::arg("sources"), nb::arg("targets"), nb::arg("weights") = nb::none(),
+            R"pb(Creates an edge list from columns of edge data.
+
+Args:
+    sources: Source node identifier of each edge.
+    targets: Target node identifier of each edge.
+    weights: Weight of each edge. Defaults to ``0`` for all edges.
+
+Raises:
+    ValueError: If the arrays differ in length or an endpoint is negative.)pb")
         .def_rw("ntk", &EdgeList::ntk, R"pb(Underlying network associated with this list.)pb")
         .def_rw("edges", &EdgeList::edges, R"pb(Stored edges in insertion order.)pb")
+        .def_prop_ro("sources", &edge_field<Ntk, &Edge::source>, nb::rv_policy::move,
+                     R"pb(Source node identifier of each edge as a new ``int64`` array.
+
+Unlike :attr:`edges`, which creates one Python object per edge, this gathers the field
+of all edges natively. The array is a copy, so it stays valid when the list changes.)pb")
+        .def_prop_ro("targets", &edge_field<Ntk, &Edge::target>, nb::rv_policy::move,
+                     R"pb(Target node identifier of each edge as a new ``int64`` array.)pb")
+        .def_prop_ro("weights", &edge_field<Ntk, &Edge::weight>, nb::rv_policy::move,
+                     R"pb(Weight of each edge as a new ``int64`` array.)pb")
         .def(
             "append", [](EdgeList& el, const Edge& e) { el.edges.push_back(e); }, nb::arg("edge"),
             R"pb(Appends an edge to the list.
@@ -0,0 +1,437 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/networks/graph_tensors.hpp"
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <mockturtle/traits.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/pair.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <queue>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/// Node-type label of a row that could not be decoded.
+constexpr int8_t invalid_node_type = -1;
+
+/**
+ * @brief A network built from graph tensors, or the structural problems that prevented building it.
+ *
+ * @tparam Ntk Network type.
+ */
+template <typename Ntk>
+struct imported_graph
+{
+    /// The built network, which is only meaningful if there are no problems.
+    Ntk ntk{};
+    /// Literal of the signal each node row became, or -1 for synthetic PO rows.
+    std::vector<int64_t> literals{};
+    /// Kind and node or edge index of each structural problem.
+    std::vector<std::pair<std::string, int64_t>> problems{};
+};
+
+/**
+ * @brief Validates a graph in the `to_graph_tensors` layout and builds it into a network.
+ *
+ * Rows of type constant map to the constant-0 node, PI rows become primary inputs in row order, gate rows become
+ * structurally hashed AND gates in topological order, and PO rows become primary outputs in row order. Every
+ * structural problem is recorded; the network is only built if there are none.
+ *
+ * @tparam Ntk Network type.
+ * @param types Node-type label of each row, or `invalid_node_type`.
+ * @param sources Source row of each edge.
+ * @param targets Target row of each edge.
+ * @param inverted Whether each edge is complemented.
+ * @return The built network or the structural problems.
+ */
+template <typename Ntk>
+imported_graph<Ntk> import_graph(const std::vector<int8_t>& types, const int64_t* sources, const int64_t* targets,
+                                 const std::vector<bool>& inverted)
+{
+    constexpr int8_t type_pi   = 1;
+    constexpr int8_t type_gate = 2;
+    constexpr int8_t type_po   = 3;
+
+    imported_graph<Ntk> result{};
+    auto&               problems = result.problems;
+
+    const auto num_rows  = types.size();
+    const auto num_edges = inverted.size();
+
+    // edges whose endpoints are rows, bucketed by target and by source in edge order
+    std::vector<std::size_t> fanin_offsets(num_rows + 1, 0);
+    std::vector<std::size_t> fanout_offsets(num_rows + 1, 0);
+    std::vector<bool>        valid_edge(num_edges, false);
+    // NOLINTBEGIN(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+    for (std::size_t e = 0; e < num_edges; ++e)
+    {
+        const auto source = sources[e];
+        const auto target = targets[e];
+        if (source < 0 || target < 0 || static_cast<uint64_t>(source) >= num_rows ||
+            static_cast<uint64_t>(target) >= num_rows)
+        {
+            problems.emplace_back("edge_out_of_range", static_cast<int64_t>(e));
+            continue;
+        }
+        valid_edge[e] = true;
+        ++fanin_offsets[static_cast<std::size_t>(target) + 1];
+        ++fanout_offsets[static_cast<std::size_t>(source) + 1];
+    }
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        fanin_offsets[row + 1] += fanin_offsets[row];
+        fanout_offsets[row + 1] += fanout_offsets[row];
+    }
+    std::vector<std::size_t> fanin_edges(fanin_offsets.back());
+    std::vector<std::size_t> fanout_rows(fanout_offsets.back());
+    {
+        auto fanin_cursor  = fanin_offsets;
+        auto fanout_cursor = fanout_offsets;
+        for (std::size_t e = 0; e < num_edges; ++e)
+        {
+            if (valid_edge[e])
+            {
+                const auto source                    = static_cast<std::size_t>(sources[e]);
+                const auto target                    = static_cast<std::size_t>(targets[e]);
+                fanin_edges[fanin_cursor[target]++]  = e;
+                fanout_rows[fanout_cursor[source]++] = target;
+            }
+        }
+    }
+    // NOLINTEND(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        const auto type = types[row];
+        if (type == invalid_node_type)
+        {
+            problems.emplace_back("node_type", static_cast<int64_t>(row));
+            continue;
+        }
+        const auto num_fanins = fanin_offsets[row + 1] - fanin_offsets[row];
+        const auto expected   = type == type_gate ? 2U : type == type_po ? 1U : 0U;
+        if (num_fanins != expected)
+        {
+            problems.emplace_back("fanin_count", static_cast<int64_t>(row));
+        }
+        if (type == type_po && fanout_offsets[row + 1] != fanout_offsets[row])
+        {
+            problems.emplace_back("po_fanout", static_cast<int64_t>(row));
+        }
+    }
+
+    // Kahn's algorithm orders all rows that are not on or behind a cycle; always taking the smallest ready row keeps
+    // rows that are already in topological order in place
+    std::vector<std::size_t> in_degree(num_rows);
+    std::vector<std::size_t> order{};
+    order.reserve(num_rows);
+    std::priority_queue<std::size_t, std::vector<std::size_t>, std::greater<>> ready{};
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        in_degree[row] = fanin_offsets[row + 1] - fanin_offsets[row];
+        if (in_degree[row] == 0)
+        {
+            ready.push(row);
+        }
+    }
+    while (!ready.empty())
+    {
+        const auto row = ready.top();
+        ready.pop();
+        order.push_back(row);
+        for (auto f = fanout_offsets[row]; f < fanout_offsets[row + 1]; ++f)
+        {
+            if (--in_degree[fanout_rows[f]] == 0)
+            {
+                ready.push(fanout_rows[f]);
+            }
+        }
+    }
+    if (order.size() != num_rows)
+    {
+        // of the remaining rows, repeatedly drop those that only feed rows behind a cycle, which leaves the rows on
+        // a cycle or between two cycles
+        std::vector<bool> remaining(num_rows, true);
+        for (const auto row : order)
+        {
+            remaining[row] = false;
+        }
+        std::vector<std::size_t> out_degree(num_rows, 0);
+        std::vector<std::size_t> behind{};
+        for (std::size_t row = 0; row < num_rows; ++row)
+        {
+            if (!remaining[row])
+            {
+                continue;
+            }
+            for (auto f = fanout_offsets[row]; f < fanout_offsets[row + 1]; ++f)
+            {
+                if (remaining[fanout_rows[f]])
+                {
+                    ++out_degree[row];
+                }
+            }
+            if (out_degree[row] == 0)
+            {
+                behind.push_back(row);
+            }
+        }
+        while (!behind.empty())
+        {
+            const auto row = behind.back();
+            behind.pop_back();
+            remaining[row] = false;
+            for (auto f = fanin_offsets[row]; f < fanin_offsets[row + 1]; ++f)
+            {
+                // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+                const auto source = static_cast<std::size_t>(sources[fanin_edges[f]]);
+                if (remaining[source] && --out_degree[source] == 0)
+                {
+                    behind.push_back(source);
+                }
+            }
+        }
+        for (std::size_t row = 0; row < num_rows; ++row)
+        {
+            if (remaining[row])
+            {
+                problems.emplace_back("cycle", static_cast<int64_t>(row));
+            }
+        }
+    }
+
+    if (!problems.empty())
+    {
+        return result;
+    }
+
+    auto&                                ntk = result.ntk;
+    std::vector<mockturtle::signal<Ntk>> signals(num_rows, ntk.get_constant(false));
+    const auto                           fanin = [&](const std::size_t f)
+    {
+        const auto e = fanin_edges[f];
+        // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+        return signals[static_cast<std::size_t>(sources[e])] ^ inverted[e];
+    };
+
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        if (types[row] == type_pi)
+        {
+            signals[row] = ntk.create_pi();
+        }
+    }
+    for (const auto row : order)
+    {
+        if (types[row] == type_gate)
+        {
+            const auto f = fanin_offsets[row];
+            signals[row] = ntk.create_and(fanin(f), fanin(f + 1));
+        }
+    }
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        if (types[row] == type_po)
+        {
+            ntk.create_po(fanin(fanin_offsets[row]));
+        }
+    }
+
+    result.literals.resize(num_rows);
+    for (std::size_t row = 0; row < num_rows; ++row)
+    {
+        result.literals[row] = types[row] == type_po ?
+                                   -1 :
+                                   static_cast<int64_t>((ntk.node_to_index(ntk.get_node(signals[row])) * 2) +
+                                                        (ntk.is_complemented(signals[row]) ? 1 : 0));
+    }
+
+    return result;
+}
+
+template <typename Ntk>
+void graph_import(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;
+
+    using index_array   = nb::ndarray<const int64_t, nb::ndim<2>, nb::c_contig, nb::device::cpu>;
+    using feature_array = nb::ndarray<const float, nb::ndim<2>, nb::c_contig, nb::device::cpu>;
+
+    m.def(
+        "from_graph_tensors",
+        [](const index_array& edge_index, const feature_array& edge_attr, const feature_array& node_attr,
+           const node_tensor_encoding node_encoding, const edge_tensor_encoding edge_encoding) -> nb::dict
+        {
+            const auto num_edges = edge_index.shape(1);
+            const auto num_rows  = node_attr.shape(0);
+            if (edge_index.shape(0) != 2)
+            {
+                throw std::invalid_argument(
+                    fmt::format("edge_index must have shape (2, E), got ({}, {})", edge_index.shape(0), num_edges));
+            }
+            if (edge_attr.shape(0) != num_edges)
+            {
+                throw std::invalid_argument(
+                    fmt::format("edge_attr must have one row per edge ({}), got {}", num_edges, edge_attr.shape(0)));
+            }
+            const std::size_t edge_dim = edge_encoding == edge_tensor_encoding::ONE_HOT ? 2 : 1;
+            if (edge_attr.shape(1) < edge_dim)
+            {
+                throw std::invalid_argument(
+                    fmt::format("edge_attr must have at least {} columns, got {}", edge_dim, edge_attr.shape(1)));
+            }
+            const std::size_t node_dim = node_encoding == node_tensor_encoding::ONE_HOT ? 4 : 1;
+            if (node_attr.shape(1) < node_dim)
+            {
+                throw std::invalid_argument(
+                    fmt::format("node_attr must have at least {} columns, got {}", node_dim, node_attr.shape(1)));
+            }
+
+            imported_graph<Ntk> imported{};
+            {
+                const nb::gil_scoped_release release{};
+
+                std::vector<int8_t> types(num_rows, invalid_node_type);
+                for (std::size_t row = 0; row < num_rows; ++row)
+                {
+                    if (node_encoding == node_tensor_encoding::INTEGER)
+                    {
+                        const auto label = std::nearbyint(node_attr(row, 0));
+                        if (label >= 0.0f && label <= 3.0f)
+                        {
+                            types[row] = static_cast<int8_t>(label);
+                        }
+                        continue;
+                    }
+                    // the most likely category, as long as any is likely at all
+                    float best = 0.0f;
+                    for (std::size_t c = 0; c < 4; ++c)
+                    {
+                        if (node_attr(row, c) > best)
+                        {
+                            best       = node_attr(row, c);
+                            types[row] = static_cast<int8_t>(c);
+                        }
+                    }
+                }
+
+                std::vector<bool> inverted(num_edges);
+                for (std::size_t e = 0; e < num_edges; ++e)
+                {
+                    switch (edge_encoding)
+                    {
+                        case edge_tensor_encoding::BINARY:
+                        {
+                            inverted[e] = edge_attr(e, 0) > 0.5f;
+                            break;
+                        }
+                        case edge_tensor_encoding::SIGNED:
+                        {
+                            inverted[e] = edge_attr(e, 0) < 0.0f;
+                            break;
+                        }
+                        case edge_tensor_encoding::ONE_HOT:
+                        {
+                            inverted[e] = edge_attr(e, 1) > edge_attr(e, 0);
+                            break;
+                        }
+                    }
+                }
+
+                // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+                imported = import_graph<Ntk>(types, edge_index.data(), edge_index.data() + num_edges, inverted);
+            }
+
+            auto result = nb::dict();
+            if (imported.problems.empty())
+            {
+                owned_buffer<int64_t> literals{num_rows};
+                std::copy(imported.literals.cbegin(), imported.literals.cend(), literals.data());
+                result["ntk"]      = nb::cast(std::move(imported.ntk));
+                result["literals"] = literals.release_into_ndarray({num_rows});
+            }
+            else
+            {
+                result["ntk"]      = nb::none();
+                result["literals"] = nb::none();
+            }
+            result["problems"] = nb::cast(imported.problems);
+
+            return result;
+        },
+        nb::arg("edge_index"), nb::arg("edge_attr"), nb::arg("node_attr"),
+        nb::arg("node_encoding") = node_tensor_encoding::INTEGER,
+        nb::arg("edge_encoding") = edge_tensor_encoding::BINARY,
+        R"pb(Builds an AIG from graph tensors in the layout of :meth:`Aig.to_graph_tensors`.
+
+Every row of ``node_attr`` is a node whose type is read from its leading columns:
+the rounded label with ``INTEGER`` encoding, or the largest positive entry among the
+first four columns with ``ONE_HOT`` encoding. Every column of ``edge_index`` is an edge
+from a source row to a target row whose polarity is read from ``edge_attr``: above
+0.5 with ``BINARY``, negative with ``SIGNED``, and a larger inverted than regular
+entry with ``ONE_HOT`` encoding. Any further feature columns are ignored, so the
+output of a model that predicts scores rather than exact labels can be passed as is.
+
+The rows may come in any order. Constant rows map to the constant-0 node, primary
+input and output rows become primary inputs and outputs in row order, and gate rows
+become AND gates, which are created in topological order with structural hashing.
+
+The graph is validated in a single pass without holding the GIL. Structural
+problems do not raise; instead, each is reported with the index of the offending node
+row or edge column, and no network is built:
+
+- ``"edge_out_of_range"``: an edge (edge index) has an endpoint that is not a row.
+- ``"node_type"``: a row's type cannot be decoded.
+- ``"fanin_count"``: a row does not have exactly two fanins as a gate, one as a
+  primary output, or none as a constant or primary input.
+- ``"po_fanout"``: a primary output row drives another row.
+- ``"cycle"``: a row lies on a cycle or on a path between two cycles.
+
+Args:
+    edge_index: Source and target rows of the edges (shape ``(2, E)``).
+    edge_attr: Edge features (shape ``(E, D_edge)``).
+    node_attr: Node features (shape ``(N, D_node)``).
+    node_encoding: Node encoding of ``node_attr`` as :class:`~aigverse.networks.NodeTensorEncoding`.
+    edge_encoding: Edge encoding of ``edge_attr`` as :class:`~aigverse.networks.EdgeTensorEncoding`.
+
+Returns:
+    A dictionary with ``ntk``, the built :class:`~aigverse.networks.Aig`, ``literals``,
+    the literal ``2 * node + complemented`` of the signal each row became (shape
+    ``(N,)``, dtype ``int64``, -1 for primary output rows), and ``problems``, a list of
+    ``(kind, index)`` pairs. ``ntk`` and ``literals`` are ``None`` if there are problems.
+
+Raises:
+    ValueError: If the arrays' shapes do not match each other or the encodings.)pb");
+}
+
+// Explicit instantiation for AIG
+template void graph_import<aigverse::aig>(nanobind::module_& m);
+
+}  // namespace detail
+
+void bind_graph_import(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    detail::graph_import<aigverse::aig>(m);
+}
+
+}  // namespace aigverse
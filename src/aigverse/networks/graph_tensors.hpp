@@ -1,5 +1,6 @@
 #pragma once
 
+#include "aigverse/owned_buffer.hpp"
 #include "aigverse/types.hpp"
 
 #include <mockturtle/algorithms/simulation.hpp>  // NOLINT(misc-include-cleaner)
@@ -8,26 +9,12 @@
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
-#include <initializer_list>
-#include <memory>
 #include <optional>
 #include <stdexcept>
-
-// This translation unit is compiled as part of a nanobind binding module built
-// with LTO, which nanobind deliberately builds with a size-optimized codegen
-// level to keep binding-heavy translation units small. That is the right
-// trade-off for binding glue code, but it makes the compiler's inliner more
-// conservative than a plain -O3 build for the small accessor methods below,
-// which are called once per edge/node in the exporter's hot loops. Force
-// inlining them keeps codegen equivalent to the raw-pointer arithmetic they
-// replace, regardless of the enclosing translation unit's optimization level.
-#if defined(__GNUC__) || defined(__clang__)
-#define AIGVERSE_ALWAYS_INLINE [[gnu::always_inline]] inline
-#else
-#define AIGVERSE_ALWAYS_INLINE inline
-#endif
+#include <vector>
 
 namespace aigverse
 {
@@ -74,110 +61,25 @@ enum class edge_tensor_encoding : uint8_t
     ONE_HOT,
 };
 
-namespace detail
-{
-
 /**
- * @brief A minimal RAII owner for a heap array that hands off ownership to nanobind.
+ * @brief Compressed sparse layout of exported adjacency matrices.
  *
- * ``owned_buffer`` exists to give exporters a non-zero-filled heap array through a
- * single, encapsulated ``new[]`` call instead of three duplicated raw-pointer call
- * sites. C++17 offers no standard factory that produces an unzeroed heap array
- * through a smart pointer (``std::make_unique<T[]>`` and ``std::vector<T>(n)`` both
- * value-initialize; ``std::make_unique_for_overwrite`` is C++20-only), so the bare
- * ``new[]`` is intentional and lives only here.
- *
- * Access is unchecked (mirrors ``std::vector::operator[]`` in release builds) so
- * hot export loops keep raw-pointer-equivalent codegen without repeating the
- * pointer-arithmetic NOLINT suppressions at every call site.
- *
- * @tparam T Element type.
+ * Both layouts describe the same matrix, whose entry ``(u, v)`` is the edge from
+ * node ``u`` to node ``v``:
+ * - `CSR`: Rows are compressed, so each row lists the fanouts of a node.
+ * - `CSC`: Columns are compressed, so each column lists the fanins of a node.
  */
-template <typename T>
-class owned_buffer
+enum class sparse_layout : uint8_t
 {
-  public:
-    /**
-     * @brief Allocates an array of @p n default-initialized elements.
-     *
-     * For trivial ``T`` this leaves the contents indeterminate (no zero-fill),
-     * matching the performance property the exporter relies on.
-     *
-     * @param n Number of elements to allocate.
-     */
-    explicit owned_buffer(const std::size_t n) :
-            // Bare new[] is the only way to get non-value-initialized storage in
-            // C++17; encapsulated once here instead of duplicated across call sites.
-            // NOLINTNEXTLINE(*-avoid-c-arrays)
-            ptr{new T[n]}
-    {}
-
-    owned_buffer(const owned_buffer&)                = delete;
-    owned_buffer& operator=(const owned_buffer&)     = delete;
-    owned_buffer(owned_buffer&&) noexcept            = default;
-    owned_buffer& operator=(owned_buffer&&) noexcept = default;
-    ~owned_buffer()                                  = default;
-
-    /// @return Raw pointer to the start of the buffer.
-    [[nodiscard]] AIGVERSE_ALWAYS_INLINE T* data() noexcept
-    {
-        return ptr.get();
-    }
-    /// @return Raw pointer to the start of the buffer.
-    [[nodiscard]] AIGVERSE_ALWAYS_INLINE const T* data() const noexcept
-    {
-        return ptr.get();
-    }
-
-    /// @return Unchecked reference to the element at @p index (no bounds check).
-    // This is the buffer's documented contract (see class docs): unchecked,
-    // std::vector-like access, so the underlying unique_ptr<T[]>::operator[] use
-    // below is intentional rather than a missed .at().
-    [[nodiscard]] AIGVERSE_ALWAYS_INLINE T& operator[](const std::size_t index) noexcept
-    {
-        // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
-        return ptr[index];
-    }
-    /// @return Unchecked reference to the element at @p index (no bounds check).
-    [[nodiscard]] AIGVERSE_ALWAYS_INLINE const T& operator[](const std::size_t index) const noexcept
-    {
-        // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
-        return ptr[index];
-    }
-
-    /**
-     * @brief Transfers ownership of the buffer into a NumPy-backed nanobind ndarray.
-     *
-     * Builds a capsule with a matching ``delete[]`` deleter first, then releases the
-     * internal ``unique_ptr`` so the capsule becomes the sole owner. Constructing the
-     * capsule before releasing keeps this exception-safe: if capsule construction
-     * throws, the buffer is still freed by ``ptr``'s destructor.
-     *
-     * @param shape Target tensor shape.
-     * @return NumPy-backed ndarray that owns the buffer.
-     */
-    nanobind::ndarray<nanobind::numpy, T> release_into_ndarray(const std::initializer_list<std::size_t>& shape)
-    {
-        namespace nb = nanobind;
-
-        auto* raw = ptr.get();
-        // nanobind::capsule stores a raw pointer plus a C-style destructor callback.
-        // The callback is the final owner and performs the matching delete[].
-        nb::capsule owner(raw,
-                          [](void* p) noexcept
-                          {
-                              delete[] static_cast<T*>(p);  // NOLINT(cppcoreguidelines-owning-memory)
-                          });
-        ptr.release();
-
-        return nb::ndarray<nb::numpy, T>(raw, shape, owner);
-    }
-
-  private:
-    // NOLINTNEXTLINE(*-avoid-c-arrays)
-    std::unique_ptr<T[]> ptr;
+    /// Compressed sparse rows, i.e., fanout lists.
+    CSR,
+    /// Compressed sparse columns, i.e., fanin lists.
+    CSC,
 };
 
+namespace detail
+{
+
 /**
  * @brief Expands one dynamic truth table into a contiguous float feature slice.
  *
@@ -498,8 +400,128 @@ nanobind::dict to_graph_tensors(const Ntk& ntk, const node_tensor_encoding node_
     return result;
 }
 
+/**
+ * @brief Exports the adjacency matrix of an AIG-style network in a compressed sparse layout.
+ *
+ * The result dictionary contains ``indptr``, ``indices``, and ``data`` in the
+ * conventions of ``scipy.sparse`` together with the matrix ``shape``. Rows and
+ * columns ``[0, ntk.size())`` are node indices, so dead nodes keep their empty
+ * row and column, and ``[ntk.size(), ntk.size() + ntk.num_pos())`` are the
+ * synthetic PO nodes in ``foreach_po`` order, as in ``to_graph_tensors``.
+ *
+ * Neither layout goes through COO: the CSC arrays are filled in a single pass
+ * over the fanins in node order, and the CSR arrays are filled in a counting
+ * pass over the fanouts followed by a scatter pass. Both passes visit targets in
+ * ascending order, so the indices of every row and column end up sorted.
+ *
+ * @tparam Ntk Network type.
+ * @param ntk Input network.
+ * @param layout Compressed layout to export.
+ * @param edge_encoding Encoding of the edge polarity in ``data``, which must not be one-hot.
+ * @return Dictionary of exported arrays.
+ */
+template <typename Ntk>
+nanobind::dict to_sparse_adjacency(const Ntk& ntk, const sparse_layout layout, const edge_tensor_encoding edge_encoding)
+{
+    namespace nb = nanobind;
+
+    if (edge_encoding == edge_tensor_encoding::ONE_HOT)
+    {
+        throw std::invalid_argument("sparse adjacency values are scalars, so edge_encoding must be BINARY or SIGNED");
+    }
+
+    const auto        size = static_cast<std::size_t>(ntk.size());
+    const std::size_t dim  = size + static_cast<std::size_t>(ntk.num_pos());
+    // the same fixed-fanin edge count the graph tensor exporter relies on
+    const std::size_t nnz =
+        (static_cast<std::size_t>(Ntk::max_fanin_size) * static_cast<std::size_t>(ntk.num_gates())) +
+        static_cast<std::size_t>(ntk.num_pos());
+
+    owned_buffer<int64_t> indptr{dim + 1};
+    owned_buffer<int64_t> indices{nnz};
+    owned_buffer<float>   data{nnz};
+
+    {
+        const nb::gil_scoped_release release{};
+
+        const float regular_value  = edge_encoding == edge_tensor_encoding::SIGNED ? 1.0f : 0.0f;
+        const float inverted_value = edge_encoding == edge_tensor_encoding::SIGNED ? -1.0f : 1.0f;
+
+        // NOLINTBEGIN(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
+        if (layout == sparse_layout::CSC)
+        {
+            std::size_t cursor = 0;
+
+            indptr[0] = 0;
+            for (std::size_t index = 0; index < size; ++index)
+            {
+                const auto n     = ntk.index_to_node(static_cast<uint32_t>(index));
+                const auto begin = cursor;
+                if (!ntk.is_dead(n))
+                {
+                    ntk.foreach_fanin(n,
+                                      [&](const auto& f)
+                                      {
+                                          auto       position = cursor++;
+                                          const auto source = static_cast<int64_t>(ntk.node_to_index(ntk.get_node(f)));
+                                          const auto value  = ntk.is_complemented(f) ? inverted_value : regular_value;
+                                          // fanins are few, so an insertion step keeps the column sorted
+                                          for (; position > begin && indices[position - 1] > source; --position)
+                                          {
+                                              indices[position] = indices[position - 1];
+                                              data[position]    = data[position - 1];
+                                          }
+                                          indices[position] = source;
+                                          data[position]    = value;
+                                      });
+                }
+                indptr[index + 1] = static_cast<int64_t>(cursor);
+            }
+            ntk.foreach_po(
+                [&](const auto& f, const auto i)
+                {
+                    indices[cursor] = static_cast<int64_t>(ntk.node_to_index(ntk.get_node(f)));
+                    data[cursor]    = ntk.is_complemented(f) ? inverted_value : regular_value;
+                    ++cursor;
+                    indptr[size + i + 1] = static_cast<int64_t>(cursor);
+                });
+        }
+        else
+        {
+            // count the fanouts of every node into indptr[source + 1] and turn the counts into row offsets
+            std::fill_n(indptr.data(), dim + 1, 0);
+            ntk.foreach_gate(
+                [&](const auto& n)
+                { ntk.foreach_fanin(n, [&](const auto& f) { ++indptr[ntk.node_to_index(ntk.get_node(f)) + 1]; }); });
+            ntk.foreach_po([&](const auto& f) { ++indptr[ntk.node_to_index(ntk.get_node(f)) + 1]; });
+            for (std::size_t row = 0; row < dim; ++row)
+            {
+                indptr[row + 1] += indptr[row];
+            }
+
+            std::vector<int64_t> next(indptr.data(), indptr.data() + dim);
+            const auto           scatter = [&](const auto& f, const std::size_t target)
+            {
+                const auto position = static_cast<std::size_t>(next[ntk.node_to_index(ntk.get_node(f))]++);
+                indices[position]   = static_cast<int64_t>(target);
+                data[position]      = ntk.is_complemented(f) ? inverted_value : regular_value;
+            };
+            ntk.foreach_gate([&](const auto& n)
+                             { ntk.foreach_fanin(n, [&](const auto& f) { scatter(f, ntk.node_to_index(n)); }); });
+            ntk.foreach_po([&](const auto& f, const auto i) { scatter(f, size + i); });
+        }
+        // NOLINTEND(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
+    }
+
+    auto result       = nb::dict();
+    result["indptr"]  = indptr.release_into_ndarray({dim + 1});
+    result["indices"] = indices.release_into_ndarray({nnz});
+    result["data"]    = data.release_into_ndarray({nnz});
+    result["shape"]   = nb::make_tuple(dim, dim);
+
+    return result;
+}
+
 }  // namespace detail
 
 }  // namespace aigverse
-
-#undef AIGVERSE_ALWAYS_INLINE
@@ -4,18 +4,25 @@
 
 #include "aigverse/networks/index_list.hpp"
 
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/thread_pool.hpp"
 #include "aigverse/types.hpp"
 
 #include <fmt/format.h>
 #include <fmt/ranges.h>  // NOLINT(misc-include-cleaner)
 #include <mockturtle/utils/index_list/index_list.hpp>
 #include <nanobind/nanobind.h>
-#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
-#include <nanobind/stl/tuple.h>   // NOLINT(misc-include-cleaner)
-#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/tuple.h>     // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
+#include <optional>
+#include <stdexcept>
 #include <string>
 #include <tuple>
 #include <type_traits>
@@ -27,6 +34,9 @@ namespace aigverse
 namespace detail
 {
 
+/// Number of networks a worker encodes or decodes at a time.
+constexpr std::size_t index_list_chunk_size = 64;
+
 template <typename Ntk>
 void ntk_index_list(nanobind::module_& m, const std::string& network_name)  // NOLINT(misc-use-internal-linkage)
 {
@@ -37,14 +47,35 @@ void ntk_index_list(nanobind::module_& m, const std::string& network_name)  // N
         /**
          * Index list.
          */
-        using IndexList = aigverse::aig_index_list;  // NOLINT(readability-identifier-naming)
+        using IndexList   = aigverse::aig_index_list;  // NOLINT(readability-identifier-naming)
+        using value_array = nb::ndarray<const uint32_t, nb::ndim<1>, nb::device::cpu>;
+
         nb::class_<IndexList>(m, fmt::format("{}IndexList", network_name).c_str(),
-                              R"pb(Represents an index-list encoding of an AIG network.)pb")
+                              R"pb(Represents an index-list encoding of an AIG network.
+
+Index lists implement NumPy's array protocol, so ``numpy.asarray(index_list)``
+returns their raw values as a ``uint32`` array.)pb")
             .def(nb::init<const uint32_t>(), nb::arg("num_pis") = 0,
                  R"pb(Creates an empty index list with a given number of primary inputs.
 
 Args:
     num_pis: Number of primary inputs to initialize.)pb")
+            .def(
+                "__init__",
+                [](IndexList* il, const value_array& values)
+                {
+                    std::vector<uint32_t> raw(values.shape(0));
+                    for (std::size_t i = 0; i < raw.size(); ++i)
+                    {
+                        raw[i] = values(i);
+                    }
+                    new (il) IndexList{raw};
+                },
+                nb::arg("values"),
+                R"pb(Creates an index list from an array of raw values.
+
+Args:
+    values: Raw index-list encoding values as a ``uint32`` array.)pb")
             .def(nb::init<const std::vector<uint32_t>&>(), nb::arg("values"),
                  R"pb(Creates an index list from raw integer values.
 
@@ -189,6 +220,35 @@ Raises:
 
     Raises:
         IndexError: If ``index`` is out of range.)pb")
+            .def(
+                "__array__",
+                [](const IndexList& il, const nb::object& dtype, const std::optional<bool> copy) -> nb::object
+                {
+                    if (copy.has_value() && !*copy)
+                    {
+                        throw std::invalid_argument(
+                            "the values of an AigIndexList are private to it, so a copy cannot be avoided");
+                    }
+
+                    const auto             raw = il.raw();
+                    owned_buffer<uint32_t> values{raw.size()};
+                    std::copy(raw.cbegin(), raw.cend(), values.data());
+
+                    auto array = nb::cast(values.release_into_ndarray({raw.size()}));
+                    return dtype.is_none() ? array : array.attr("astype")(dtype);
+                },
+                nb::arg("dtype") = nb::none(), nb::arg("copy") = nb::none(),
+                R"pb(Returns the raw encoding values as a new NumPy array.
+
+Args:
+    dtype: Data type of the array. Defaults to ``uint32``.
+    copy: Must not be ``False``, since the values are always copied.
+
+Returns:
+    The raw values of the index list.
+
+Raises:
+    ValueError: If ``copy`` is ``False``.)pb")
             .def(
                 "__len__", [](const IndexList& il) { return il.size(); },
                 R"pb(Returns the number of raw encoding entries.)pb")
@@ -202,6 +262,198 @@ Raises:
             ;
 
         nb::implicitly_convertible<nb::list, IndexList>();
+
+        m.def(
+            "encode_index_lists",
+            [](const std::vector<const Ntk*>& ntks, const std::optional<uint32_t> workers) -> nb::dict
+            {
+                if (workers.has_value() && *workers == 0)
+                {
+                    throw std::invalid_argument("workers must be at least 1, got 0");
+                }
+
+                const auto num_ntks = ntks.size();
+                for (std::size_t i = 0; i < num_ntks; ++i)
+                {
+                    if (nb::isinstance<aigverse::sequential_aig>(nb::find(ntks[i])))
+                    {
+                        throw nb::type_error(fmt::format("network {} is a SequentialAig, whose index list would drop "
+                                                         "register state",
+                                                         i)
+                                                 .c_str());
+                    }
+                }
+
+                owned_buffer<int64_t> offsets{num_ntks + 1};
+                const auto            num_chunks = (num_ntks + index_list_chunk_size - 1) / index_list_chunk_size;
+                std::vector<std::vector<uint32_t>> chunks(num_chunks);
+                {
+                    const nb::gil_scoped_release release{};
+
+                    for_each_chunk(num_chunks, workers,
+                                   [&](const std::size_t chunk)
+                                   {
+                                       for (auto i = chunk * index_list_chunk_size;
+                                            i < std::min(num_ntks, (chunk + 1) * index_list_chunk_size); ++i)
+                                       {
+                                           const auto& ntk = *ntks[i];
+                                           if (!has_normalized_index_order(ntk))
+                                           {
+                                               throw std::invalid_argument(fmt::format(
+                                                   "network {} is not in normalized index order, i.e., it has dead "
+                                                   "nodes or primary inputs created after gates",
+                                                   i));
+                                           }
+
+                                           IndexList il{};
+                                           mockturtle::encode(il, ntk);
+                                           const auto raw = il.raw();
+                                           chunks[chunk].insert(chunks[chunk].end(), raw.cbegin(), raw.cend());
+                                           offsets[i + 1] = static_cast<int64_t>(raw.size());
+                                       }
+                                   });
+
+                    offsets[0] = 0;
+                    for (std::size_t i = 0; i < num_ntks; ++i)
+                    {
+                        offsets[i + 1] += offsets[i];
+                    }
+                }
+
+                const auto             num_values = static_cast<std::size_t>(offsets[num_ntks]);
+                owned_buffer<uint32_t> values{num_values};
+                {
+                    const nb::gil_scoped_release release{};
+
+                    std::size_t value_offset = 0;
+                    for (auto& chunk : chunks)
+                    {
+                        std::copy(chunk.cbegin(), chunk.cend(), values.data() + value_offset);
+                        value_offset += chunk.size();
+                        chunk = std::vector<uint32_t>{};
+                    }
+                }
+
+                auto result                  = nb::dict();
+                result["index_lists"]        = values.release_into_ndarray({num_values});
+                result["index_list_offsets"] = offsets.release_into_ndarray({num_ntks + 1});
+
+                return result;
+            },
+            nb::arg("ntks"), nb::kw_only(), nb::arg("workers") = nb::none(),
+            R"pb(Encodes many networks as index lists in a single call.
+
+This is the batch version of :meth:`~aigverse.networks.Aig.to_index_list`. The networks
+are encoded on a pool of threads without holding the GIL, and the raw values of all
+index lists are concatenated into one buffer, in the layout that
+:func:`~aigverse.algorithms.extract_cuts` uses as well.
+
+Args:
+    ntks: The networks to encode.
+    workers: Maximum number of threads. Defaults to the number of hardware threads.
+
+Returns:
+    A dictionary with ``index_lists``, the raw values of all index lists (dtype
+    ``uint32``), and ``index_list_offsets`` (shape ``(len(ntks) + 1,)``, dtype
+    ``int64``), such that the index list of network ``i`` is
+    ``index_lists[index_list_offsets[i]:index_list_offsets[i + 1]]``.
+
+Raises:
+    TypeError: If a network is a :class:`~aigverse.networks.SequentialAig`.
+    ValueError: If ``workers`` is 0 or a network has dead nodes or primary inputs
+        created after gates, which index lists cannot represent.)pb");
+
+        m.def(
+            "decode_index_lists",
+            [](const value_array& index_lists, const nb::ndarray<const int64_t, nb::ndim<1>, nb::device::cpu>& offsets,
+               const std::optional<uint32_t> workers) -> nb::list
+            {
+                if (workers.has_value() && *workers == 0)
+                {
+                    throw std::invalid_argument("workers must be at least 1, got 0");
+                }
+                if (offsets.shape(0) == 0)
+                {
+                    throw std::invalid_argument("index_list_offsets must have at least one entry");
+                }
+
+                const auto num_ntks   = offsets.shape(0) - 1;
+                const auto num_values = static_cast<int64_t>(index_lists.shape(0));
+                if (offsets(0) != 0 || offsets(num_ntks) != num_values)
+                {
+                    throw std::invalid_argument(
+                        "index_list_offsets must start at 0 and end at the number of index-list values");
+                }
+                for (std::size_t i = 0; i < num_ntks; ++i)
+                {
+                    if (offsets(i + 1) < offsets(i))
+                    {
+                        throw std::invalid_argument("index_list_offsets must be non-decreasing");
+                    }
+                }
+
+                // strided inputs are gathered once, so that workers can read plain pointers
+                std::vector<uint32_t> gathered{};
+                const uint32_t*       data = index_lists.data();
+                if (num_values > 1 && index_lists.stride(0) != 1)
+                {
+                    gathered.resize(static_cast<std::size_t>(num_values));
+                    for (std::size_t i = 0; i < gathered.size(); ++i)
+                    {
+                        gathered[i] = index_lists(i);
+                    }
+                    data = gathered.data();
+                }
+
+                std::vector<Ntk> ntks(num_ntks);
+                {
+                    const nb::gil_scoped_release release{};
+
+                    const auto num_chunks = (num_ntks + index_list_chunk_size - 1) / index_list_chunk_size;
+                    for_each_chunk(num_chunks, workers,
+                                   [&](const std::size_t chunk)
+                                   {
+                                       for (auto i = chunk * index_list_chunk_size;
+                                            i < std::min(num_ntks, (chunk + 1) * index_list_chunk_size); ++i)
+                                       {
+                                           const auto* begin = data + offsets(i);
+                                           const auto  size  = static_cast<std::size_t>(offsets(i + 1) - offsets(i));
+                                           if (const auto problem = index_list_problem(begin, size); !problem.empty())
+                                           {
+                                               throw std::invalid_argument(fmt::format("index list {} {}", i, problem));
+                                           }
+                                           mockturtle::decode(ntks[i],
+                                                              IndexList{std::vector<uint32_t>(begin, begin + size)});
+                                       }
+                                   });
+                }
+
+                nb::list result{};
+                for (auto& ntk : ntks)
+                {
+                    result.append(nb::cast(std::move(ntk), nb::rv_policy::move));
+                }
+                return result;
+            },
+            nb::arg("index_lists"), nb::arg("index_list_offsets"), nb::kw_only(), nb::arg("workers") = nb::none(),
+            R"pb(Decodes many index lists stored in one buffer into networks in a single call.
+
+This is the batch version of :meth:`~aigverse.networks.AigIndexList.to_aig` and the
+inverse of :func:`encode_index_lists`. The index lists are validated and decoded on a
+pool of threads without holding the GIL.
+
+Args:
+    index_lists: The raw values of all index lists (dtype ``uint32``).
+    index_list_offsets: Offsets of the index lists in ``index_lists`` (dtype ``int64``),
+        one more than there are index lists.
+    workers: Maximum number of threads. Defaults to the number of hardware threads.
+
+Returns:
+    One decoded network per index list.
+
+Raises:
+    ValueError: If ``workers`` is 0, the offsets are inconsistent, or an index list is
+        malformed, e.g., refers to a literal that is not defined before it.)pb");
     }
 }
 }  // namespace detail
@@ -10,7 +10,10 @@
 #include <fmt/ranges.h>  // NOLINT(misc-include-cleaner)
 #include <mockturtle/utils/index_list/index_list.hpp>
 
+#include <algorithm>
+#include <cstddef>
 #include <cstdint>
+#include <string>
 #include <tuple>
 #include <vector>
 
@@ -19,6 +22,64 @@ namespace aigverse
 
 using aig_index_list = mockturtle::xag_index_list<true>;
 
+namespace detail
+{
+
+/**
+ * @brief Checks that raw index-list values describe a valid network.
+ *
+ * Decoding trusts the values, so every literal must refer to the constant, a primary
+ * input, or an earlier gate.
+ *
+ * @param values Raw values with the separate three-value header.
+ * @param size Number of values.
+ * @return A description of the first problem, or an empty string if there is none.
+ */
+inline std::string index_list_problem(const uint32_t* values, const std::size_t size)
+{
+    if (size < 3)
+    {
+        return fmt::format("has {} values, but its header alone has 3", size);
+    }
+    const uint64_t num_pis   = values[0];
+    const uint64_t num_pos   = values[1];
+    const uint64_t num_gates = values[2];
+    if (size != 3 + (2 * num_gates) + num_pos)
+    {
+        return fmt::format("has {} values, but its header announces {} gates and {} outputs", size, num_gates, num_pos);
+    }
+    for (uint64_t i = 3; i < size; ++i)
+    {
+        const auto num_signals = 1 + num_pis + std::min((i - 3) / 2, num_gates);
+        if (values[i] >= 2 * num_signals)
+        {
+            return fmt::format("refers to the undefined literal {} at position {}", values[i], i);
+        }
+    }
+    return {};
+}
+
+/**
+ * @brief Checks whether a network can be encoded as an index list.
+ *
+ * mockturtle::encode aborts the process on networks with dead nodes or primary inputs
+ * created after gates, so this has to hold before encoding.
+ *
+ * @tparam Ntk Network type.
+ * @param ntk The network to check.
+ * @return Whether the nodes are the constant, the primary inputs, and the gates, in this order.
+ */
+template <typename Ntk>
+bool has_normalized_index_order(const Ntk& ntk)
+{
+    bool normalized = ntk.size() == 1 + ntk.num_pis() + ntk.num_gates();
+    ntk.foreach_pi([&ntk, &normalized](const auto& n, const auto index)
+                   { normalized &= ntk.node_to_index(n) == index + 1; });
+    return normalized;
+}
+
+}  // namespace detail
+
 }  // namespace aigverse
 
 namespace fmt
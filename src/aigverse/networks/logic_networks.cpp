@@ -169,6 +169,15 @@ void bind_tensor_encodings(nanobind::module_& m)  // NOLINT(misc-use-internal-li
                R"pb(Labels are encoded as +1.0 (regular) and -1.0 (inverted).)pb")
         .value("ONE_HOT", aigverse::edge_tensor_encoding::ONE_HOT,
                R"pb(One-hot edge labels in [regular, inverted] order.)pb");
+
+    nb::enum_<aigverse::sparse_layout>(m, "SparseLayout",
+                                       R"pb(Compressed layout of exported sparse adjacency matrices.
+
+    Both layouts describe the matrix whose entry `(u, v)` is the edge from node `u` to node `v`.
+    - `CSR`: Rows are compressed, so row `u` lists the fanouts of node `u`.
+    - `CSC`: Columns are compressed, so column `v` lists the fanins of node `v`.)pb")
+        .value("CSR", aigverse::sparse_layout::CSR, R"pb(Compressed sparse rows, i.e., fanout lists.)pb")
+        .value("CSC", aigverse::sparse_layout::CSC, R"pb(Compressed sparse columns, i.e., fanin lists.)pb");
 }
 
 template <typename Ntk>
@@ -552,6 +561,35 @@ Returns:
     ``edge_attr`` (shape ``(E, D_edge)``, dtype ``float32``), and ``node_attr``
     (shape ``(N, D_node)``, dtype ``float32``).
 )pb")
+        .def(
+            "to_sparse_adjacency",
+            [](const Ntk& ntk, const aigverse::sparse_layout layout, const aigverse::edge_tensor_encoding edge_encoding)
+            { return aigverse::detail::to_sparse_adjacency(ntk, layout, edge_encoding); },
+            nb::arg("layout")        = aigverse::sparse_layout::CSR,
+            nb::arg("edge_encoding") = aigverse::edge_tensor_encoding::SIGNED,
+            R"pb(Exports the adjacency matrix in a compressed sparse layout.
+
+Entry ``(u, v)`` of the ``(N, N)`` matrix is the edge from node ``u`` to node ``v``,
+where ``N`` is ``size`` plus the number of primary outputs: rows and columns below
+``size`` are node indices, in which dead nodes have no entries, and ``size + k`` is the
+synthetic node of output ``k``, as in :meth:`to_graph_tensors`. The arrays follow the
+conventions of ``scipy.sparse`` and are filled directly from the network rather than
+converted from COO: ``CSC`` columns are the fanin lists, and ``CSR`` rows are the
+fanout lists, counted first and then scattered. The indices of every row or column are
+sorted.
+
+Args:
+    layout: Compressed layout as :class:`~aigverse.networks.SparseLayout`.
+    edge_encoding: Encoding of the edge polarity in ``data``, ``SIGNED`` or ``BINARY``.
+        ``BINARY`` stores regular edges as explicit zeros.
+
+Returns:
+    A dictionary with ``indptr`` (shape ``(N + 1,)``, dtype ``int64``), ``indices``
+    (shape ``(E,)``, dtype ``int64``), ``data`` (shape ``(E,)``, dtype ``float32``), and
+    ``shape``, the tuple ``(N, N)``.
+
+Raises:
+    ValueError: If ``edge_encoding`` is ``ONE_HOT``.)pb")
         .def("__len__", &Ntk::size, R"pb(Returns the number of nodes.)pb")
         .def(
             "__repr__",
@@ -662,6 +700,49 @@ Preserves only combinational structure and does not capture augmented view metad
              R"pb(Sets the name of output ``index``.)pb")
         .def("get_output_name", &NamedNtk::get_output_name, nb::arg("index"),
              R"pb(Returns the name of output ``index``.)pb")
+        .def(
+            "get_signal_names",
+            [](const NamedNtk& ntk)
+            {
+                auto names = nb::dict();
+                for (uint32_t i = 0; i < ntk.size(); ++i)
+                {
+                    const auto s = ntk.make_signal(ntk.index_to_node(i));
+                    for (const auto& f : {s, !s})
+                    {
+                        if (ntk.has_name(f))
+                        {
+                            names[nb::cast(f)] = ntk.get_name(f);
+                        }
+                    }
+                }
+                return names;
+            },
+            R"pb(Returns the names of all named signals.
+
+Looks up every node in both polarities in a single call, which is considerably faster
+than calling :meth:`has_name` and :meth:`get_name` for each signal from Python.
+
+Returns:
+    A dictionary mapping each named signal to its name.)pb")
+        .def(
+            "get_output_names",
+            [](const NamedNtk& ntk)
+            {
+                auto names = nb::dict();
+                for (uint32_t i = 0; i < ntk.num_pos(); ++i)
+                {
+                    if (ntk.has_output_name(i))
+                    {
+                        names[nb::int_(i)] = ntk.get_output_name(i);
+                    }
+                }
+                return names;
+            },
+            R"pb(Returns the names of all named primary outputs.
+
+Returns:
+    A dictionary mapping the index of each named primary output to its name.)pb")
         .def(
             "__repr__",
             [network_name](const NamedNtk& ntk)
@@ -993,6 +1074,22 @@ Returns:
             nb::sig("def to_graph_tensors(self, node_encoding: NodeTensorEncoding = ..., edge_encoding: "
                     "EdgeTensorEncoding = ..., *, levels: bool = True, fanouts: bool = False, node_tts: bool = "
                     "False) -> NoReturn"))
+        .def(
+            "to_sparse_adjacency",
+            [network_name](const SequentialNtk&, const aigverse::sparse_layout,
+                           const aigverse::edge_tensor_encoding) -> nb::dict
+            {
+                const auto message = fmt::format("Sequential{} does not support to_sparse_adjacency() because the "
+                                                 "adjacency export is combinational-only and would drop register "
+                                                 "state.",
+                                                 network_name);
+                throw nb::type_error(message.c_str());
+            },
+            nb::arg("layout")        = aigverse::sparse_layout::CSR,
+            nb::arg("edge_encoding") = aigverse::edge_tensor_encoding::SIGNED,
+            R"pb(Sequential networks cannot be exported as combinational adjacency matrices.)pb",
+            nb::sig("def to_sparse_adjacency(self, layout: SparseLayout = ..., edge_encoding: EdgeTensorEncoding = "
+                    "...) -> NoReturn"))
         .def(
             "__getstate__",
             [network_name](const SequentialNtk&) -> nb::tuple
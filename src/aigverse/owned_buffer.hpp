@@ -0,0 +1,134 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include <cstddef>
+#include <initializer_list>
+#include <memory>
+
+// This translation unit is compiled as part of a nanobind binding module built
+// with LTO, which nanobind deliberately builds with a size-optimized codegen
+// level to keep binding-heavy translation units small. That is the right
+// trade-off for binding glue code, but it makes the compiler's inliner more
+// conservative than a plain -O3 build for the small accessor methods below,
+// which are called once per edge/node in the exporter's hot loops. Force
+// inlining them keeps codegen equivalent to the raw-pointer arithmetic they
+// replace, regardless of the enclosing translation unit's optimization level.
+#if defined(__GNUC__) || defined(__clang__)
+#define AIGVERSE_ALWAYS_INLINE [[gnu::always_inline]] inline
+#else
+#define AIGVERSE_ALWAYS_INLINE inline
+#endif
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief A minimal RAII owner for a heap array that hands off ownership to nanobind.
+ *
+ * ``owned_buffer`` exists to give exporters a non-zero-filled heap array through a
+ * single, encapsulated ``new[]`` call instead of three duplicated raw-pointer call
+ * sites. C++17 offers no standard factory that produces an unzeroed heap array
+ * through a smart pointer (``std::make_unique<T[]>`` and ``std::vector<T>(n)`` both
+ * value-initialize; ``std::make_unique_for_overwrite`` is C++20-only), so the bare
+ * ``new[]`` is intentional and lives only here.
+ *
+ * Access is unchecked (mirrors ``std::vector::operator[]`` in release builds) so
+ * hot export loops keep raw-pointer-equivalent codegen without repeating the
+ * pointer-arithmetic NOLINT suppressions at every call site.
+ *
+ * @tparam T Element type.
+ */
+template <typename T>
+class owned_buffer
+{
+  public:
+    /**
+     * @brief Allocates an array of @p n default-initialized elements.
+     *
+     * For trivial ``T`` this leaves the contents indeterminate (no zero-fill),
+     * matching the performance property the exporter relies on.
+     *
+     * @param n Number of elements to allocate.
+     */
+    explicit owned_buffer(const std::size_t n) :
+            // Bare new[] is the only way to get non-value-initialized storage in
+            // C++17; encapsulated once here instead of duplicated across call sites.
+            // NOLINTNEXTLINE(*-avoid-c-arrays)
+            ptr{new T[n]}
+    {}
+
+    owned_buffer(const owned_buffer&)                = delete;
+    owned_buffer& operator=(const owned_buffer&)     = delete;
+    owned_buffer(owned_buffer&&) noexcept            = default;
+    owned_buffer& operator=(owned_buffer&&) noexcept = default;
+    ~owned_buffer()                                  = default;
+
+    /// @return Raw pointer to the start of the buffer.
+    [[nodiscard]] AIGVERSE_ALWAYS_INLINE T* data() noexcept
+    {
+        return ptr.get();
+    }
+    /// @return Raw pointer to the start of the buffer.
+    [[nodiscard]] AIGVERSE_ALWAYS_INLINE const T* data() const noexcept
+    {
+        return ptr.get();
+    }
+
+    /// @return Unchecked reference to the element at @p index (no bounds check).
+    // This is the buffer's documented contract (see class docs): unchecked,
+    // std::vector-like access, so the underlying unique_ptr<T[]>::operator[] use
+    // below is intentional rather than a missed .at().
+    [[nodiscard]] AIGVERSE_ALWAYS_INLINE T& operator[](const std::size_t index) noexcept
+    {
+        // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
+        return ptr[index];
+    }
+    /// @return Unchecked reference to the element at @p index (no bounds check).
+    [[nodiscard]] AIGVERSE_ALWAYS_INLINE const T& operator[](const std::size_t index) const noexcept
+    {
+        // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-avoid-unchecked-container-access)
+        return ptr[index];
+    }
+
+    /**
+     * @brief Transfers ownership of the buffer into a NumPy-backed nanobind ndarray.
+     *
+     * Builds a capsule with a matching ``delete[]`` deleter first, then releases the
+     * internal ``unique_ptr`` so the capsule becomes the sole owner. Constructing the
+     * capsule before releasing keeps this exception-safe: if capsule construction
+     * throws, the buffer is still freed by ``ptr``'s destructor.
+     *
+     * @param shape Target tensor shape.
+     * @return NumPy-backed ndarray that owns the buffer.
+     */
+    nanobind::ndarray<nanobind::numpy, T> release_into_ndarray(const std::initializer_list<std::size_t>& shape)
+    {
+        namespace nb = nanobind;
+
+        auto* raw = ptr.get();
+        // nanobind::capsule stores a raw pointer plus a C-style destructor callback.
+        // The callback is the final owner and performs the matching delete[].
+        nb::capsule owner(raw,
+                          [](void* p) noexcept
+                          {
+                              delete[] static_cast<T*>(p);  // NOLINT(cppcoreguidelines-owning-memory)
+                          });
+        ptr.release();
+
+        return nb::ndarray<nb::numpy, T>(raw, shape, owner);
+    }
+
+  private:
+    // NOLINTNEXTLINE(*-avoid-c-arrays)
+    std::unique_ptr<T[]> ptr;
+};
+
+}  // namespace aigverse::detail
+
+#undef AIGVERSE_ALWAYS_INLINE
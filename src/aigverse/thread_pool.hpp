@@ -0,0 +1,116 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <optional>
+#include <system_error>
+#include <thread>
+#include <vector>
+
+namespace aigverse::detail
+{
+
+/**
+ * @brief Processes chunks of work on a pool of threads, including the calling one, with per-worker state.
+ *
+ * Every worker calls @p make_fn once, before its first chunk, and processes its chunks with the returned function,
+ * which can own scratch state that is reused across the worker's chunks. Must be called without holding the GIL. If
+ * creating a worker's function or processing a chunk throws, the remaining chunks are skipped and the exception of
+ * the lowest failing chunk is rethrown.
+ *
+ * @tparam MakeFn Callable returning a callable that takes a chunk index.
+ * @param num_chunks Number of chunks.
+ * @param workers Maximum number of threads, or all hardware threads if not given.
+ * @param make_fn Function creating a worker's chunk function.
+ */
+template <typename MakeFn>
+void for_each_chunk_with_state(const std::size_t num_chunks, const std::optional<uint32_t> workers, MakeFn&& make_fn)
+{
+    std::atomic<std::size_t> next{0};
+    std::atomic<bool>        failed{false};
+    std::mutex               mutex{};
+    std::exception_ptr       error{};
+    std::size_t              error_index{0};
+
+    const auto worker = [&]
+    {
+        std::optional<decltype(make_fn())> fn{};
+        for (auto index = next++; index < num_chunks && !failed; index = next++)
+        {
+            try
+            {
+                if (!fn)
+                {
+                    fn.emplace(make_fn());
+                }
+                (*fn)(index);
+            }
+            catch (...)
+            {
+                const std::scoped_lock lock{mutex};
+                if (!error || index < error_index)
+                {
+                    error       = std::current_exception();
+                    error_index = index;
+                }
+                failed = true;
+            }
+        }
+    };
+
+    const auto num_workers = std::max<std::size_t>(
+        std::min<std::size_t>(workers.value_or(std::max(std::thread::hardware_concurrency(), 1U)), num_chunks), 1);
+
+    std::vector<std::thread> threads{};
+    threads.reserve(num_workers - 1);
+    for (std::size_t i = 1; i < num_workers; ++i)
+    {
+        try
+        {
+            threads.emplace_back(worker);
+        }
+        catch (const std::system_error&)
+        {
+            // fewer threads than asked for only make the work slower
+            break;
+        }
+    }
+    worker();
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+
+    if (error)
+    {
+        std::rethrow_exception(error);
+    }
+}
+
+/**
+ * @brief Processes chunks of work on a pool of threads, including the calling one.
+ *
+ * Must be called without holding the GIL. If processing chunks throws, the remaining chunks are skipped and the
+ * exception of the lowest failing chunk is rethrown.
+ *
+ * @tparam Fn Callable taking a chunk index.
+ * @param num_chunks Number of chunks.
+ * @param workers Maximum number of threads, or all hardware threads if not given.
+ * @param fn Function processing one chunk, called concurrently by all workers.
+ */
+template <typename Fn>
+void for_each_chunk(const std::size_t num_chunks, const std::optional<uint32_t> workers, Fn&& fn)
+{
+    for_each_chunk_with_state(num_chunks, workers, [&fn] { return std::ref(fn); });
+}
+
+}  // namespace aigverse::detail
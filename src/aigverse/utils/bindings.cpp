@@ -4,6 +4,7 @@ namespace aigverse
 {
 void bind_truth_table(nanobind::module_& m);
 void bind_truth_table_operations(nanobind::module_& m);
+void bind_truth_table_array(nanobind::module_& m);
 }  // namespace aigverse
 
 NB_MODULE(utils, m)
@@ -11,4 +12,5 @@ NB_MODULE(utils, m)
     m.doc() = R"pb(Provides utility data structures and functions.)pb";
     aigverse::bind_truth_table(m);
     aigverse::bind_truth_table_operations(m);
+    aigverse::bind_truth_table_array(m);
 }
@@ -2,6 +2,7 @@
 // Created by marcel on 03.09.25.
 //
 
+#include "aigverse/owned_buffer.hpp"
 #include "aigverse/types.hpp"
 
 #include <fmt/format.h>
@@ -13,11 +14,16 @@
 #include <kitty/print.hpp>
 #include <nanobind/make_iterator.h>  // NOLINT(misc-include-cleaner)
 #include <nanobind/nanobind.h>
-#include <nanobind/operators.h>   // NOLINT(misc-include-cleaner)
-#include <nanobind/stl/string.h>  // NOLINT(misc-include-cleaner)
-#include <nanobind/stl/vector.h>  // NOLINT(misc-include-cleaner)
-
+#include <nanobind/ndarray.h>
+#include <nanobind/operators.h>     // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <cstddef>
 #include <cstdint>
+#include <optional>
 #include <sstream>
 #include <stdexcept>
 #include <string>
@@ -93,6 +99,48 @@ class truth_table_bit_iterator
     uint64_t index;
 };
 
+/**
+ * Unpacks the bits of a truth table into one Boolean per bit.
+ *
+ * @param tt The truth table to unpack.
+ * @return A NumPy array of shape ``(num_bits,)``.
+ */
+inline nanobind::ndarray<nanobind::numpy, bool> unpack_bits(const aigverse::truth_table& tt)
+{
+    const std::size_t  num_bits = tt.num_bits();
+    owned_buffer<bool> bits{num_bits};
+    {
+        const nanobind::gil_scoped_release release{};
+
+        for (std::size_t i = 0; i < num_bits; ++i)
+        {
+            bits[i] = ((tt._bits[i >> 6U] >> (i & 63U)) & 1U) != 0;
+        }
+    }
+    return bits.release_into_ndarray({num_bits});
+}
+
+/**
+ * Computes the number of variables of a truth table from a power-of-two size.
+ *
+ * @param size Number of bits or blocks.
+ * @param what Description of the size for error messages.
+ * @return The base-2 logarithm of ``size``.
+ */
+inline uint32_t log2_of_size(const std::size_t size, const char* what)
+{
+    if (size == 0 || (size & (size - 1)) != 0)
+    {
+        throw std::invalid_argument(fmt::format("the number of {} must be a power of two, got {}", what, size));
+    }
+    uint32_t log = 0;
+    while ((std::size_t{1} << log) < size)
+    {
+        ++log;
+    }
+    return log;
+}
+
 }  // namespace detail
 
 void bind_truth_table(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
@@ -100,12 +148,84 @@ void bind_truth_table(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage
 
     namespace nb = nanobind;
 
-    nb::class_<aigverse::truth_table>(m, "TruthTable", R"pb(Represents a dynamic Boolean truth table.)pb")
+    using bit_array   = nb::ndarray<const bool, nb::ndim<1>, nb::device::cpu>;
+    using block_array = nb::ndarray<const uint64_t, nb::ndim<1>, nb::device::cpu>;
+
+    nb::class_<aigverse::truth_table>(m, "TruthTable", R"pb(Represents a dynamic Boolean truth table.
+
+Truth tables implement NumPy's array protocol, so ``numpy.asarray(tt)`` returns one
+Boolean per bit, and :attr:`blocks` views their 64-bit storage blocks without copying.)pb")
         .def(nb::init<uint32_t>(), nb::arg("num_vars"),
              R"pb(Creates a truth table with all bits initialized to ``0``.
 
 Args:
     num_vars: Number of Boolean variables.)pb")
+        .def_static(
+            "from_bits",
+            [](const bit_array& bits)
+            {
+                aigverse::truth_table tt{detail::log2_of_size(bits.shape(0), "bits")};
+                {
+                    const nb::gil_scoped_release release{};
+
+                    for (std::size_t i = 0; i < bits.shape(0); ++i)
+                    {
+                        tt._bits[i >> 6U] |= static_cast<uint64_t>(bits(i)) << (i & 63U);
+                    }
+                }
+                return tt;
+            },
+            nb::arg("bits"),
+            R"pb(Creates a truth table from one value per bit.
+
+Args:
+    bits: The bits in ascending order of their index, i.e., bit ``j`` is the value
+        under input assignment ``j``, as a Boolean array (shape ``(2**num_vars,)``).
+
+Returns:
+    A truth table with ``log2(len(bits))`` variables.
+
+Raises:
+    ValueError: If the number of bits is not a power of two.)pb")
+        .def_static(
+            "from_blocks",
+            [](const block_array& blocks, const std::optional<uint32_t> num_vars)
+            {
+                const auto num_blocks = blocks.shape(0);
+                const auto vars = num_vars.has_value() ? *num_vars : detail::log2_of_size(num_blocks, "blocks") + 6;
+                // checked before constructing the table, which allocates its blocks
+                if (const auto log_blocks = vars > 6 ? vars - 6 : 0U;
+                    log_blocks >= 64 || (uint64_t{1} << log_blocks) != num_blocks)
+                {
+                    throw std::invalid_argument(fmt::format("a truth table with {} variables has 2**{} blocks, got {}",
+                                                            vars, log_blocks, num_blocks));
+                }
+                aigverse::truth_table tt{vars};
+                for (std::size_t i = 0; i < num_blocks; ++i)
+                {
+                    tt._bits[i] = blocks(i);
+                }
+                tt.mask_bits();
+                return tt;
+            },
+            nb::arg("blocks"), nb::arg("num_vars") = nb::none(),
+            R"pb(Creates a truth table from its 64-bit storage blocks.
+
+This is the inverse of :attr:`blocks`. Bit ``j`` of the truth table is bit ``j % 64``
+of block ``j // 64``.
+
+Args:
+    blocks: The blocks as a ``uint64`` array.
+    num_vars: Number of variables. Defaults to the number that fills all blocks, which
+        is at least 6; tables with fewer variables use only the lowest bits of their
+        single block, and the other bits are ignored.
+
+Returns:
+    The truth table.
+
+Raises:
+    ValueError: If the number of blocks does not match ``num_vars`` or, if it is not
+        given, is not a power of two.)pb")
         // Operators
         // Equality/Inequality need to accept arbitrary Python objects for a compatible __eq__/__ne__ signature.
         .def(
@@ -219,7 +339,19 @@ Raises:
             "__deepcopy__", [](const aigverse::truth_table& self, nb::dict&) { return self; },
             R"pb(Returns a deep copy of the truth table.)pb")
         .def(
-            "__assign__", [](aigverse::truth_table& self, const aigverse::truth_table& other) { return self = other; },
+            "__assign__",
+            [](aigverse::truth_table& self, const aigverse::truth_table& other)
+            {
+                // the blocks are copied in place, so that views of them stay valid
+                if (self.num_vars() != other.num_vars())
+                {
+                    throw std::invalid_argument(
+                        fmt::format("cannot assign a truth table with {} variables to one with {} variables",
+                                    other.num_vars(), self.num_vars()));
+                }
+                std::copy(other.cbegin(), other.cend(), self.begin());
+                return self;
+            },
             nb::arg("other"),
             R"pb(Assigns from another truth table with a compatible shape.
 
@@ -227,7 +359,10 @@ Args:
     other: Source truth table.
 
 Returns:
-    The updated truth table.)pb")
+    The updated truth table.
+
+Raises:
+    ValueError: If ``other`` has a different number of variables.)pb")
 
         // Hashing
         .def(
@@ -474,6 +609,66 @@ Raises:
                 return stream.str();
             },
             R"pb(Returns the truth table as a binary string.)pb")
+        .def_prop_ro(
+            "blocks",
+            [](const aigverse::truth_table& self)
+            {
+                return nb::ndarray<nb::numpy, const uint64_t, nb::ndim<1>>(self._bits.data(), {self.num_blocks()},
+                                                                           nb::find(&self));
+            },
+            nb::rv_policy::reference_internal,
+            R"pb(Read-only view of the 64-bit storage blocks, without copying them.
+
+Bit ``j`` of the truth table is bit ``j % 64`` of block ``j // 64``. Tables with fewer
+than 6 variables use only the lowest ``num_bits`` bits of their single block. The view
+reflects later changes to the truth table and keeps it alive.)pb")
+        .def(
+            "to_numpy",
+            [](const aigverse::truth_table& self, const bool bits) -> nb::object
+            {
+                if (bits)
+                {
+                    return nb::cast(detail::unpack_bits(self));
+                }
+                detail::owned_buffer<uint64_t> blocks{self.num_blocks()};
+                std::copy(self.cbegin(), self.cend(), blocks.data());
+                return nb::cast(blocks.release_into_ndarray({self.num_blocks()}));
+            },
+            nb::arg("bits") = true,
+            R"pb(Returns the truth table as a new NumPy array.
+
+Args:
+    bits: Whether to unpack the bits into one Boolean per bit (shape ``(num_bits,)``),
+        in ascending order of their index. Otherwise, returns a copy of :attr:`blocks`
+        (shape ``(num_blocks,)``, dtype ``uint64``). Defaults to ``True``.
+
+Returns:
+    The bits or the blocks of the truth table.)pb")
+        .def(
+            "__array__",
+            [](const aigverse::truth_table& self, const nb::object& dtype, const std::optional<bool> copy) -> nb::object
+            {
+                if (copy.has_value() && !*copy)
+                {
+                    throw std::invalid_argument(
+                        "the bits of a TruthTable are packed into blocks, so a copy cannot be avoided");
+                }
+
+                auto array = nb::cast(detail::unpack_bits(self));
+                return dtype.is_none() ? array : array.attr("astype")(dtype);
+            },
+            nb::arg("dtype") = nb::none(), nb::arg("copy") = nb::none(),
+            R"pb(Returns the bits as a new NumPy array, one Boolean per bit.
+
+Args:
+    dtype: Data type of the array. Defaults to ``bool``.
+    copy: Must not be ``False``, since the bits are always unpacked.
+
+Returns:
+    The bits of the truth table in ascending order of their index.
+
+Raises:
+    ValueError: If ``copy`` is ``False``.)pb")
         .def(
             "to_hex",
             [](const aigverse::truth_table& self)
@@ -0,0 +1,731 @@
+//
+// Created by marcel on 19.10.26.
+//
+
+#include "aigverse/owned_buffer.hpp"
+#include "aigverse/types.hpp"
+
+#include <fmt/format.h>
+#include <kitty/detail/constants.hpp>
+#include <kitty/detail/mscfix.hpp>
+#include <kitty/dynamic_truth_table.hpp>
+#include <kitty/hash.hpp>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>  // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/string.h>    // NOLINT(misc-include-cleaner)
+#include <nanobind/stl/vector.h>    // NOLINT(misc-include-cleaner)
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+#include <type_traits>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace aigverse
+{
+
+namespace detail
+{
+
+/**
+ * A batch of truth tables of equal arity, stored as one row-major matrix of 64-bit blocks.
+ *
+ * Its size is fixed at construction, so that views of the blocks stay valid.
+ */
+class truth_table_array
+{
+  public:
+    truth_table_array(const uint32_t vars, const std::size_t size) :
+            num_vars{vars},
+            num_tables{size},
+            blocks_per_table{vars <= 6 ? std::size_t{1} : std::size_t{1} << (vars - 6)},
+            blocks(num_tables * blocks_per_table, 0)
+    {}
+
+    explicit truth_table_array(const aigverse::truth_table& tt) : truth_table_array{tt.num_vars(), 1}
+    {
+        std::copy(tt.cbegin(), tt.cend(), blocks.begin());
+    }
+
+    [[nodiscard]] uint32_t vars() const noexcept
+    {
+        return num_vars;
+    }
+
+    [[nodiscard]] std::size_t size() const noexcept
+    {
+        return num_tables;
+    }
+
+    [[nodiscard]] std::size_t num_blocks() const noexcept
+    {
+        return blocks_per_table;
+    }
+
+    [[nodiscard]] uint64_t* row(const std::size_t i) noexcept
+    {
+        return blocks.data() + (i * blocks_per_table);
+    }
+
+    [[nodiscard]] const uint64_t* row(const std::size_t i) const noexcept
+    {
+        return blocks.data() + (i * blocks_per_table);
+    }
+
+    [[nodiscard]] const std::vector<uint64_t>& data() const noexcept
+    {
+        return blocks;
+    }
+
+    /**
+     * Clears the bits beyond ``num_bits`` that tables with fewer than 6 variables do not use.
+     */
+    void mask_bits() noexcept
+    {
+        if (num_vars < 6)
+        {
+            for (auto& block : blocks)
+            {
+                block &= kitty::detail::masks[num_vars];
+            }
+        }
+    }
+
+  private:
+    uint32_t              num_vars;
+    std::size_t           num_tables;
+    std::size_t           blocks_per_table;
+    std::vector<uint64_t> blocks;
+};
+
+/**
+ * Checks that truth table arrays can be combined elementwise and returns the size of the result.
+ *
+ * Arrays broadcast like NumPy arrays of shape ``(N,)``: their sizes must be equal or 1.
+ */
+inline std::size_t broadcast_size(const std::vector<const truth_table_array*>& operands)
+{
+    std::size_t size = 1;
+    for (const auto* operand : operands)
+    {
+        if (operand->vars() != operands.front()->vars())
+        {
+            throw std::invalid_argument(fmt::format("cannot combine truth tables with {} and {} variables",
+                                                    operands.front()->vars(), operand->vars()));
+        }
+        if (operand->size() != 1)
+        {
+            if (size != 1 && size != operand->size())
+            {
+                throw std::invalid_argument(
+                    fmt::format("cannot broadcast truth table arrays of sizes {} and {}", size, operand->size()));
+            }
+            size = operand->size();
+        }
+    }
+    return size;
+}
+
+/**
+ * Applies a blockwise function to broadcast operands without holding the GIL.
+ *
+ * @param operands The operands of equal arity.
+ * @param fn Function from one block of each operand to a block of the result.
+ * @return The result array.
+ */
+template <typename Fn>
+truth_table_array blockwise(const std::vector<const truth_table_array*>& operands, Fn&& fn)
+{
+    const auto size = broadcast_size(operands);
+
+    truth_table_array result{operands.front()->vars(), size};
+    {
+        const nanobind::gil_scoped_release release{};
+
+        const auto num_blocks = result.num_blocks();
+        for (std::size_t i = 0; i < size; ++i)
+        {
+            auto* out = result.row(i);
+            for (std::size_t b = 0; b < num_blocks; ++b)
+            {
+                const auto block = [&operands, i, b, num_blocks](const std::size_t k)
+                {
+                    const auto* operand = operands[k];
+                    return operand->data()[((operand->size() == 1 ? 0 : i) * num_blocks) + b];
+                };
+                if constexpr (std::is_invocable_v<Fn, uint64_t>)
+                {
+                    out[b] = fn(block(0));
+                }
+                else if constexpr (std::is_invocable_v<Fn, uint64_t, uint64_t>)
+                {
+                    out[b] = fn(block(0), block(1));
+                }
+                else
+                {
+                    out[b] = fn(block(0), block(1), block(2));
+                }
+            }
+        }
+        result.mask_bits();
+    }
+    return result;
+}
+
+/**
+ * Computes a cofactor of every truth table in an array without holding the GIL.
+ *
+ * @param tts The truth tables.
+ * @param var_index The variable to fix.
+ * @param value The value to fix the variable to.
+ * @return The cofactors, which do not depend on ``var_index``.
+ */
+inline truth_table_array cofactors(const truth_table_array& tts, const uint8_t var_index, const bool value)
+{
+    if (var_index >= tts.vars())
+    {
+        throw std::invalid_argument("var_index out of range");
+    }
+
+    truth_table_array result = tts;
+    {
+        const nanobind::gil_scoped_release release{};
+
+        const auto num_blocks = result.num_blocks();
+        for (std::size_t i = 0; i < result.size(); ++i)
+        {
+            auto* row = result.row(i);
+            if (var_index < 6)
+            {
+                const auto shift = uint64_t{1} << var_index;
+                for (std::size_t b = 0; b < num_blocks; ++b)
+                {
+                    const auto kept = value ? row[b] & kitty::detail::projections[var_index] :
+                                              row[b] & kitty::detail::projections_neg[var_index];
+                    row[b]          = value ? kept | (kept >> shift) : kept | (kept << shift);
+                }
+            }
+            else
+            {
+                // copy the half of every pair of block ranges in which the variable has the given value
+                const auto step = std::size_t{1} << (var_index - 6);
+                for (std::size_t b = 0; b < num_blocks; b += 2 * step)
+                {
+                    if (value)
+                    {
+                        std::copy(row + b + step, row + b + (2 * step), row + b);
+                    }
+                    else
+                    {
+                        std::copy(row + b, row + b + step, row + b + step);
+                    }
+                }
+            }
+        }
+        result.mask_bits();
+    }
+    return result;
+}
+
+/**
+ * Counts the set or unset bits of every truth table without holding the GIL.
+ */
+inline nanobind::ndarray<nanobind::numpy, int64_t> popcounts(const truth_table_array& tts, const bool ones)
+{
+    owned_buffer<int64_t> counts{tts.size()};
+    {
+        const nanobind::gil_scoped_release release{};
+
+        const auto num_bits = int64_t{1} << tts.vars();
+        for (std::size_t i = 0; i < tts.size(); ++i)
+        {
+            const auto* row   = tts.row(i);
+            int64_t     count = 0;
+            for (std::size_t b = 0; b < tts.num_blocks(); ++b)
+            {
+                count += __builtin_popcount(static_cast<uint32_t>(row[b])) +
+                         __builtin_popcount(static_cast<uint32_t>(row[b] >> 32U));
+            }
+            counts[i] = ones ? count : num_bits - count;
+        }
+    }
+    return counts.release_into_ndarray({tts.size()});
+}
+
+/**
+ * Computes the hash of every truth table, as kitty computes the hash of a single one.
+ */
+inline std::vector<uint64_t> row_hashes(const truth_table_array& tts)
+{
+    std::vector<uint64_t> hashes(tts.size());
+    for (std::size_t i = 0; i < tts.size(); ++i)
+    {
+        const auto* row  = tts.row(i);
+        auto        seed = kitty::hash_block(row[0]);
+        for (std::size_t b = 1; b < tts.num_blocks(); ++b)
+        {
+            kitty::hash_combine(seed, kitty::hash_block(row[b]));
+        }
+        hashes[i] = seed;
+    }
+    return hashes;
+}
+
+inline std::size_t normalize_index(const truth_table_array& tts, const int64_t index)
+{
+    const auto size = static_cast<int64_t>(tts.size());
+    if (index < -size || index >= size)
+    {
+        throw nanobind::index_error("index out of range");  // NOLINT(misc-include-cleaner)
+    }
+    return static_cast<std::size_t>(index < 0 ? index + size : index);
+}
+
+}  // namespace detail
+
+void bind_truth_table_array(nanobind::module_& m)  // NOLINT(misc-use-internal-linkage)
+{
+    namespace nb = nanobind;
+
+    using detail::blockwise;
+    using detail::truth_table_array;
+
+    using block_matrix = nb::ndarray<const uint64_t, nb::ndim<2>, nb::device::cpu>;
+
+    nb::class_<truth_table_array>(m, "TruthTableArray",
+                                  R"pb(Represents a batch of truth tables with the same number of variables.
+
+The truth tables are stored in one contiguous ``(len(self), num_blocks)`` matrix of
+64-bit blocks, and all operations process the whole batch in native code without
+holding the GIL. The bitwise operators ``&``, ``|``, ``^``, and ``~`` work elementwise
+and broadcast like one-dimensional NumPy arrays: both operands have the same length,
+or one of them has length 1 or is a single :class:`TruthTable`.
+
+Like truth tables, arrays implement NumPy's array protocol, so ``numpy.asarray(tts)``
+returns one row of Booleans per truth table.)pb")
+        .def(nb::init<uint32_t, std::size_t>(), nb::arg("num_vars"), nb::arg("size") = 0,
+             R"pb(Creates an array of truth tables with all bits initialized to ``0``.
+
+Args:
+    num_vars: Number of Boolean variables of each truth table.
+    size: Number of truth tables.)pb")
+        .def(nb::init_implicit<const aigverse::truth_table&>(), nb::arg("tt"),
+             R"pb(Creates an array that holds a single truth table.
+
+Functions and operators that take arrays also accept single truth tables this way, which
+broadcast against arrays of any length.
+
+Args:
+    tt: The truth table.)pb")
+        .def(
+            "__init__",
+            [](truth_table_array* self, const std::vector<const aigverse::truth_table*>& tts)
+            {
+                if (tts.empty())
+                {
+                    throw std::invalid_argument("cannot infer the number of variables from an empty sequence of "
+                                                "truth tables, pass it as num_vars instead");
+                }
+                truth_table_array array{tts.front()->num_vars(), tts.size()};
+                for (std::size_t i = 0; i < tts.size(); ++i)
+                {
+                    if (tts[i]->num_vars() != array.vars())
+                    {
+                        throw std::invalid_argument(
+                            fmt::format("truth table {} has {} variables, but truth table 0 has {}", i,
+                                        tts[i]->num_vars(), array.vars()));
+                    }
+                    std::copy(tts[i]->cbegin(), tts[i]->cend(), array.row(i));
+                }
+                new (self) truth_table_array{std::move(array)};
+            },
+            nb::arg("tts"),
+            R"pb(Creates an array from a sequence of truth tables.
+
+Args:
+    tts: Truth tables with the same number of variables, e.g., the values of
+        :func:`~aigverse.algorithms.simulate_nodes`.
+
+Raises:
+    ValueError: If ``tts`` is empty or the truth tables differ in their number of variables.)pb")
+        .def_static(
+            "from_blocks",
+            [](const block_matrix& blocks, const std::optional<uint32_t> num_vars)
+            {
+                const auto num_blocks = blocks.shape(1);
+                if (num_blocks == 0 || (num_blocks & (num_blocks - 1)) != 0)
+                {
+                    throw std::invalid_argument(
+                        fmt::format("the number of blocks must be a power of two, got {}", num_blocks));
+                }
+                auto filled_vars = uint32_t{6};
+                while ((std::size_t{1} << (filled_vars - 6)) < num_blocks)
+                {
+                    ++filled_vars;
+                }
+                const auto vars = num_vars.has_value() ? *num_vars : filled_vars;
+                if (vars != filled_vars && (vars > 6 || num_blocks != 1))
+                {
+                    throw std::invalid_argument(fmt::format("a truth table with {} variables has 2**{} blocks, got {}",
+                                                            vars, vars > 6 ? vars - 6 : 0, num_blocks));
+                }
+
+                truth_table_array result{vars, blocks.shape(0)};
+                for (std::size_t i = 0; i < result.size(); ++i)
+                {
+                    for (std::size_t b = 0; b < num_blocks; ++b)
+                    {
+                        result.row(i)[b] = blocks(i, b);
+                    }
+                }
+                result.mask_bits();
+                return result;
+            },
+            nb::arg("blocks"), nb::arg("num_vars") = nb::none(),
+            R"pb(Creates an array from a matrix of 64-bit blocks.
+
+This is the inverse of :attr:`blocks`.
+
+Args:
+    blocks: One row of blocks per truth table as a ``uint64`` array of shape
+        ``(N, num_blocks)``.
+    num_vars: Number of variables. Defaults to the number that fills all blocks, which
+        is at least 6; tables with fewer variables use only the lowest bits of their
+        single block, and the other bits are ignored.
+
+Returns:
+    The array of truth tables.
+
+Raises:
+    ValueError: If the number of blocks per row does not match ``num_vars`` or, if it
+        is not given, is not a power of two.)pb")
+        .def("num_vars", &truth_table_array::vars, R"pb(Returns the number of variables of each truth table.)pb")
+        .def("num_blocks", &truth_table_array::num_blocks,
+             R"pb(Returns the number of storage blocks of each truth table.)pb")
+        .def(
+            "num_bits", [](const truth_table_array& self) { return uint64_t{1} << self.vars(); },
+            R"pb(Returns the number of bits of each truth table.)pb")
+        .def("__len__", &truth_table_array::size, R"pb(Returns the number of truth tables.)pb")
+        .def(
+            "__getitem__",
+            [](const truth_table_array& self, const int64_t index)
+            {
+                const auto*           row = self.row(detail::normalize_index(self, index));
+                aigverse::truth_table tt{self.vars()};
+                std::copy(row, row + self.num_blocks(), tt.begin());
+                return tt;
+            },
+            nb::arg("index"),
+            R"pb(Returns a copy of one truth table.
+
+Args:
+    index: Index of the truth table. Negative indices are supported.
+
+Returns:
+    The truth table.
+
+Raises:
+    IndexError: If ``index`` is out of range.)pb")
+        .def(
+            "__setitem__",
+            [](truth_table_array& self, const int64_t index, const aigverse::truth_table& tt)
+            {
+                const auto i = detail::normalize_index(self, index);
+                if (tt.num_vars() != self.vars())
+                {
+                    throw std::invalid_argument(
+                        fmt::format("cannot store a truth table with {} variables in an array of truth tables with {}",
+                                    tt.num_vars(), self.vars()));
+                }
+                std::copy(tt.cbegin(), tt.cend(), self.row(i));
+            },
+            nb::arg("index"), nb::arg("tt"),
+            R"pb(Replaces one truth table.
+
+Args:
+    index: Index of the truth table. Negative indices are supported.
+    tt: Replacement truth table with the same number of variables.
+
+Raises:
+    IndexError: If ``index`` is out of range.
+    ValueError: If ``tt`` has a different number of variables.)pb")
+        .def_prop_ro(
+            "blocks",
+            [](const truth_table_array& self)
+            {
+                return nb::ndarray<nb::numpy, const uint64_t, nb::ndim<2>>(
+                    self.data().data(), {self.size(), self.num_blocks()}, nb::find(&self));
+            },
+            nb::rv_policy::reference_internal,
+            R"pb(Read-only view of the ``(len(self), num_blocks)`` block matrix, without copying it.
+
+Bit ``j`` of truth table ``i`` is bit ``j % 64`` of ``blocks[i, j // 64]``, as in
+:attr:`TruthTable.blocks`. The view reflects later changes to the array and keeps it
+alive.)pb")
+        .def(
+            "to_numpy",
+            [](const truth_table_array& self, const bool bits) -> nb::object
+            {
+                if (!bits)
+                {
+                    detail::owned_buffer<uint64_t> blocks{self.data().size()};
+                    std::copy(self.data().cbegin(), self.data().cend(), blocks.data());
+                    return nb::cast(blocks.release_into_ndarray({self.size(), self.num_blocks()}));
+                }
+
+                const std::size_t          num_bits = uint64_t{1} << self.vars();
+                detail::owned_buffer<bool> result{self.size() * num_bits};
+                {
+                    const nb::gil_scoped_release release{};
+
+                    for (std::size_t i = 0; i < self.size(); ++i)
+                    {
+                        const auto* row = self.row(i);
+                        for (std::size_t j = 0; j < num_bits; ++j)
+                        {
+                            result[(i * num_bits) + j] = ((row[j >> 6U] >> (j & 63U)) & 1U) != 0;
+                        }
+                    }
+                }
+                return nb::cast(result.release_into_ndarray({self.size(), num_bits}));
+            },
+            nb::arg("bits") = true,
+            R"pb(Returns the truth tables as a new NumPy array.
+
+Args:
+    bits: Whether to unpack the bits into one row of Booleans per truth table (shape
+        ``(len(self), num_bits)``), in ascending order of their index. Otherwise, returns
+        a copy of :attr:`blocks`. Defaults to ``True``.
+
+Returns:
+    The bits or the blocks of the truth tables.)pb")
+        .def(
+            "__array__",
+            [](const nb::object& self, const nb::object& dtype, const std::optional<bool> copy) -> nb::object
+            {
+                if (copy.has_value() && !*copy)
+                {
+                    throw std::invalid_argument(
+                        "the bits of a TruthTableArray are packed into blocks, so a copy cannot be avoided");
+                }
+
+                auto array = self.attr("to_numpy")();
+                return dtype.is_none() ? array : array.attr("astype")(dtype);
+            },
+            nb::arg("dtype") = nb::none(), nb::arg("copy") = nb::none(),
+            R"pb(Returns the bits as a new NumPy array, one row of Booleans per truth table.
+
+Args:
+    dtype: Data type of the array. Defaults to ``bool``.
+    copy: Must not be ``False``, since the bits are always unpacked.
+
+Returns:
+    The bits of the truth tables in ascending order of their index.
+
+Raises:
+    ValueError: If ``copy`` is ``False``.)pb")
+        // Bitwise operators, with single truth tables broadcast as arrays of length 1
+        .def(
+            "__and__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&self, &other}, [](const uint64_t a, const uint64_t b) { return a & b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise AND.)pb")
+        .def(
+            "__or__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&self, &other}, [](const uint64_t a, const uint64_t b) { return a | b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise OR.)pb")
+        .def(
+            "__xor__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&self, &other}, [](const uint64_t a, const uint64_t b) { return a ^ b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise XOR.)pb")
+        .def(
+            "__rand__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&other, &self}, [](const uint64_t a, const uint64_t b) { return a & b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise AND with a truth table on the left.)pb")
+        .def(
+            "__ror__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&other, &self}, [](const uint64_t a, const uint64_t b) { return a | b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise OR with a truth table on the left.)pb")
+        .def(
+            "__rxor__", [](const truth_table_array& self, const truth_table_array& other)
+            { return blockwise({&other, &self}, [](const uint64_t a, const uint64_t b) { return a ^ b; }); },
+            nb::arg("other"), R"pb(Computes the elementwise bitwise XOR with a truth table on the left.)pb")
+        .def(
+            "__invert__", [](const truth_table_array& self)
+            { return blockwise({&self}, [](const uint64_t a) { return ~a; }); }, R"pb(Computes the bitwise NOT.)pb")
+        .def(
+            "count_ones", [](const truth_table_array& self) { return detail::popcounts(self, true); },
+            R"pb(Returns the number of set bits of every truth table.
+
+Returns:
+    The counts (shape ``(len(self),)``, dtype ``int64``).)pb")
+        .def(
+            "count_zeroes", [](const truth_table_array& self) { return detail::popcounts(self, false); },
+            R"pb(Returns the number of unset bits of every truth table.
+
+Returns:
+    The counts (shape ``(len(self),)``, dtype ``int64``).)pb")
+        .def(
+            "hashes",
+            [](const truth_table_array& self)
+            {
+                detail::owned_buffer<uint64_t> hashes{self.size()};
+                {
+                    const nb::gil_scoped_release release{};
+
+                    const auto computed = detail::row_hashes(self);
+                    std::copy(computed.cbegin(), computed.cend(), hashes.data());
+                }
+                return hashes.release_into_ndarray({self.size()});
+            },
+            R"pb(Returns a 64-bit hash of every truth table.
+
+Equal truth tables have equal hashes, also across arrays.
+
+Returns:
+    The hashes (shape ``(len(self),)``, dtype ``uint64``).)pb")
+        .def(
+            "unique",
+            [](const truth_table_array& self)
+            {
+                const auto                       size = self.size();
+                detail::owned_buffer<int64_t>    inverse{size};
+                std::vector<std::size_t>         first{};
+                std::optional<truth_table_array> unique{};
+                {
+                    const nb::gil_scoped_release release{};
+
+                    const auto hashes     = detail::row_hashes(self);
+                    const auto num_blocks = self.num_blocks();
+                    const auto row_hash   = [&hashes](const std::size_t i) { return hashes[i]; };
+                    const auto row_equal  = [&self, num_blocks](const std::size_t i, const std::size_t j)
+                    { return std::equal(self.row(i), self.row(i) + num_blocks, self.row(j)); };
+
+                    std::unordered_map<std::size_t, int64_t, decltype(row_hash), decltype(row_equal)> classes{
+                        size, row_hash, row_equal};
+                    for (std::size_t i = 0; i < size; ++i)
+                    {
+                        const auto [it, inserted] = classes.try_emplace(i, static_cast<int64_t>(first.size()));
+                        if (inserted)
+                        {
+                            first.push_back(i);
+                        }
+                        inverse[i] = it->second;
+                    }
+
+                    unique.emplace(self.vars(), first.size());
+                    for (std::size_t k = 0; k < first.size(); ++k)
+                    {
+                        std::copy(self.row(first[k]), self.row(first[k]) + num_blocks, unique->row(k));
+                    }
+                }
+
+                detail::owned_buffer<int64_t> indices{first.size()};
+                std::copy(first.cbegin(), first.cend(), indices.data());
+
+                auto result       = nb::dict();
+                result["tables"]  = nb::cast(std::move(*unique), nb::rv_policy::move);
+                result["indices"] = indices.release_into_ndarray({first.size()});
+                result["inverse"] = inverse.release_into_ndarray({size});
+                return result;
+            },
+            R"pb(Removes duplicate truth tables.
+
+Returns:
+    A dictionary with ``tables``, the distinct truth tables in the order of their first
+    occurrence, ``indices``, the index of the first occurrence of each (shape
+    ``(U,)``, dtype ``int64``), and ``inverse``, the index in ``tables`` of every
+    truth table (shape ``(len(self),)``, dtype ``int64``), such that ``tables[inverse[i]]``
+    equals ``self[i]``.)pb")
+        // Pickle support via __getstate__ / __setstate__
+        .def(
+            "__getstate__",
+            [](const truth_table_array& self) { return nb::make_tuple(self.vars(), self.size(), self.data()); },
+            R"pb(Returns pickle state as ``(num_vars, size, words)``.)pb")
+        .def(
+            "__setstate__",
+            [](truth_table_array& self, const nb::tuple& t)
+            {
+                if (t.size() != 3)
+                {
+                    throw std::runtime_error("Invalid state for TruthTableArray unpickling.");
+                }
+                truth_table_array array{nb::cast<uint32_t>(t[0]), nb::cast<std::size_t>(t[1])};
+                const auto        words = nb::cast<std::vector<uint64_t>>(t[2]);
+                if (words.size() != array.size() * array.num_blocks())
+                {
+                    throw std::runtime_error("Mismatched block count during unpickling.");
+                }
+                std::copy(words.cbegin(), words.cend(), array.row(0));
+                new (&self) truth_table_array{std::move(array)};
+            },
+            nb::arg("state"), R"pb(Restores an array of truth tables from pickle state.
+
+Args:
+    state: Tuple ``(num_vars, size, words)``.
+
+Raises:
+    RuntimeError: If the serialized state is malformed.
+    TypeError: If nanobind cannot convert the pickle payload to the expected C++ types.)pb")
+        .def("__repr__", [](const truth_table_array& self)
+             { return fmt::format("TruthTableArray <vars={}, size={}>", self.vars(), self.size()); });
+
+    m.def(
+        "ternary_majority",
+        [](const truth_table_array& a, const truth_table_array& b, const truth_table_array& c)
+        {
+            return blockwise({&a, &b, &c}, [](const uint64_t x, const uint64_t y, const uint64_t z)
+                             { return (x & y) | (x & z) | (y & z); });
+        },
+        nb::arg("a"), nb::arg("b"), nb::arg("c"),
+        R"pb(Computes the elementwise ternary majority of three truth table arrays.
+
+The arrays broadcast, and single truth tables count as arrays of length 1.
+
+Args:
+    a: First truth tables.
+    b: Second truth tables.
+    c: Third truth tables.
+
+Returns:
+    The bitwise majority truth tables.
+
+Raises:
+    ValueError: If the arrays differ in their number of variables or cannot be broadcast.)pb");
+
+    m.def(
+        "cofactor0", [](const truth_table_array& tts, const uint8_t var_index)
+        { return detail::cofactors(tts, var_index, false); }, nb::arg("tt"), nb::arg("var_index"),
+        R"pb(Computes the cofactors of an array of truth tables with respect to assigning one variable to ``0``.
+
+Args:
+    tt: Input truth tables.
+    var_index: Index of the variable to cofactor.
+
+Returns:
+    The cofactored truth tables with ``var_index`` fixed to ``0``.
+
+Raises:
+    ValueError: If ``var_index`` is out of range.)pb");
+
+    m.def(
+        "cofactor1", [](const truth_table_array& tts, const uint8_t var_index)
+        { return detail::cofactors(tts, var_index, true); }, nb::arg("tt"), nb::arg("var_index"),
+        R"pb(Computes the cofactors of an array of truth tables with respect to assigning one variable to ``1``.
+
+Args:
+    tt: Input truth tables.
+    var_index: Index of the variable to cofactor.
+
+Returns:
+    The cofactored truth tables with ``var_index`` fixed to ``1``.
+
+Raises:
+    ValueError: If ``var_index`` is out of range.)pb");
+}
+
+}  // namespace aigverse
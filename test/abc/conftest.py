@@ -37,11 +37,12 @@ def abc_available() -> None:
 
 @pytest.fixture(autouse=True)
 def _clear_abc_override() -> None:
-    """Clears any explicit binary or resource-file override left by a previous test."""
-    from aigverse.abc import set_abc_binary, set_abc_rc
+    """Clears any explicit binary, resource-file or scratch override left by a previous test."""
+    from aigverse.abc import set_abc_binary, set_abc_rc, set_abc_scratch
 
     set_abc_binary(None)
     set_abc_rc(None)
+    set_abc_scratch(None)
 
 
 @pytest.fixture
@@ -0,0 +1,166 @@
+"""Tests for the scratch directories the bridge exchanges files with ABC in."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.abc import (
+    ABC_SCRATCH_ENV_VAR,
+    AbcExecutionError,
+    abc_scratch,
+    run_script,
+    set_abc_scratch,
+)
+from aigverse.abc._scratch import _SHARED_MEMORY, scratch_directory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aigverse.networks import Aig
+
+requires_posix = pytest.mark.skipif(sys.platform == "win32", reason="the fake ABC shims rely on POSIX executable bits")
+
+# Copies the input to the output and reports the directory it ran in.
+_ECHO_CWD = """
+cwd = pathlib.Path.cwd()
+(cwd / "out.aig").write_bytes((cwd / "in.aig").read_bytes())
+(cwd / "abc.history").write_text("history")
+print(f"cwd={cwd}")
+"""
+
+
+def _cwd_of(output: str) -> Path:
+    """Extracts the working directory the `_ECHO_CWD` shim reported.
+
+    Args:
+        output: Everything the shim wrote.
+
+    Returns:
+        The directory the shim ran in.
+    """
+    line = next(line for line in output.splitlines() if line.startswith("cwd="))
+    return Path(line.removeprefix("cwd="))
+
+
+def test_override_is_used(tmp_path: Path) -> None:
+    """An explicit directory takes precedence over everything else."""
+    assert set_abc_scratch(tmp_path) == tmp_path.resolve()
+    assert abc_scratch() == tmp_path.resolve()
+
+
+def test_override_beats_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The explicit override wins over the environment variable."""
+    env_dir = tmp_path / "env"
+    env_dir.mkdir()
+    explicit = tmp_path / "explicit"
+    explicit.mkdir()
+
+    monkeypatch.setenv(ABC_SCRATCH_ENV_VAR, str(env_dir))
+    assert abc_scratch() == env_dir.resolve()
+
+    set_abc_scratch(explicit)
+    assert abc_scratch() == explicit.resolve()
+
+
+def test_missing_env_dir_falls_back(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A configured directory that does not exist must not fail the call."""
+    monkeypatch.setenv(ABC_SCRATCH_ENV_VAR, str(tmp_path / "gone"))
+    assert abc_scratch().is_dir()
+    assert abc_scratch() != tmp_path / "gone"
+
+
+def test_shared_memory_is_the_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without configuration the RAM-backed `/dev/shm` is preferred where it exists."""
+    monkeypatch.delenv(ABC_SCRATCH_ENV_VAR, raising=False)
+    if not _SHARED_MEMORY.is_dir():
+        pytest.skip("no /dev/shm on this platform")
+    assert abc_scratch() == _SHARED_MEMORY
+
+
+def test_non_directory_is_rejected(tmp_path: Path) -> None:
+    """A file or a missing path is refused when it is set, not when it is used."""
+    file = tmp_path / "file"
+    file.write_text("")
+
+    with pytest.raises(NotADirectoryError, match="not an existing, writable directory"):
+        set_abc_scratch(file)
+    with pytest.raises(NotADirectoryError):
+        set_abc_scratch(tmp_path / "missing")
+
+
+@requires_posix
+def test_directory_is_reused_and_emptied(
+    and_aig: Aig, fake_abc: Callable[[str], Path], tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Consecutive calls share one working directory, which is left empty."""
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    set_abc_scratch(scratch)
+    shim = fake_abc(_ECHO_CWD)
+
+    run_script(and_aig, "balance", verbose=True, binary=shim)
+    first = _cwd_of(capsys.readouterr().out)
+    run_script(and_aig, "balance", verbose=True, binary=shim)
+    second = _cwd_of(capsys.readouterr().out)
+
+    assert first == second
+    assert first.parent == scratch.resolve()
+    assert list(first.iterdir()) == []
+
+
+@requires_posix
+def test_directory_is_emptied_after_a_failure(and_aig: Aig, fake_abc: Callable[[str], Path], tmp_path: Path) -> None:
+    """A failing call must not leave files behind for the next one to pick up."""
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    set_abc_scratch(scratch)
+    shim = fake_abc('(pathlib.Path.cwd() / "out.aig").write_bytes(b"not an aiger file")')
+
+    with pytest.raises(AbcExecutionError):
+        run_script(and_aig, "balance", binary=shim)
+
+    (directory,) = scratch.iterdir()
+    assert list(directory.iterdir()) == []
+
+
+@requires_posix
+def test_concurrent_calls_get_their_own_directory(
+    and_aig: Aig, fake_abc: Callable[[str], Path], tmp_path: Path
+) -> None:
+    """Calls in flight at the same time must never share a working directory."""
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    set_abc_scratch(scratch)
+    # holds the call open long enough for the others to start
+    shim = fake_abc(_ECHO_CWD + "time.sleep(0.5)\n")
+
+    results: list[int] = []
+
+    def _run() -> None:
+        results.append(run_script(and_aig, "balance", binary=shim).num_gates)
+
+    threads = [threading.Thread(target=_run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [and_aig.num_gates] * 3
+    assert len(list(scratch.iterdir())) == 3
+
+
+def test_changing_the_base_removes_idle_directories(tmp_path: Path) -> None:
+    """Idle directories below the old base do not outlive the switch."""
+    old = tmp_path / "old"
+    old.mkdir()
+    set_abc_scratch(old)
+    with scratch_directory() as directory:
+        assert directory.parent == old.resolve()
+
+    set_abc_scratch(tmp_path)
+    assert list(old.iterdir()) == []
@@ -0,0 +1,122 @@
+"""Tests for the beam search over ABC commands, driven by stand-in ABC executables."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.abc import AbcExecutionError, SearchResult, search
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from aigverse.networks import Aig
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the fake ABC shims rely on POSIX executable bits")
+
+# Changes nothing, whatever it is asked to do.
+_IDENTITY = """
+cwd = pathlib.Path.cwd()
+(cwd / "out.aig").write_bytes((cwd / "in.aig").read_bytes())
+"""
+
+# Removes the only gate -- wiring the output to the first input -- when asked to
+# resubstitute, and changes nothing otherwise. Not equivalence-preserving, which
+# does not matter here: the search only looks at the cost.
+_RESUB_HELPS = """
+cwd = pathlib.Path.cwd()
+if "; resub;" in sys.argv[-1]:
+    (cwd / "out.aig").write_bytes(b"aig 2 2 0 1 0\\n2\\n")
+else:
+    (cwd / "out.aig").write_bytes((cwd / "in.aig").read_bytes())
+"""
+
+
+def test_nothing_to_gain_returns_the_input(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """A search that finds no improvement stops after one round and keeps the input."""
+    commands = ("balance", "rewrite", "&dc2")
+    result = search(and_aig, budget=30, commands=commands, binary=fake_abc(_IDENTITY))
+
+    assert isinstance(result, SearchResult)
+    assert result.trajectory == ()
+    assert result.network.num_gates == and_aig.num_gates
+    assert result.evaluations == len(commands)
+    assert result.budget_exhausted is False
+
+
+def test_the_improving_command_is_found(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """The trajectory names the command that produced the best network."""
+    result = search(
+        and_aig,
+        budget=30,
+        commands=("balance", "rewrite", "resub"),
+        binary=fake_abc(_RESUB_HELPS),
+    )
+
+    assert result.trajectory == ("resub",)
+    assert result.network.num_gates == 0
+    assert result.cost == (0, 0)
+    assert type(result.network) is type(and_aig)
+
+
+def test_greedy_search_extends_the_best_prefix(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """With a beam of one, the second round only extends the first round's winner."""
+    result = search(
+        and_aig,
+        budget=30,
+        commands=("balance", "resub"),
+        beam_width=1,
+        binary=fake_abc(_RESUB_HELPS),
+    )
+
+    # round one tries both commands; round two extends `resub` by `balance` only,
+    # since a command is never repeated back to back
+    assert result.trajectory == ("resub",)
+    assert result.evaluations == 3
+
+
+def test_a_custom_cost_is_honored(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """A cost that prefers more gates turns the search around."""
+    result = search(
+        and_aig,
+        budget=30,
+        commands=("resub",),
+        cost=lambda ntk: -ntk.num_gates,
+        binary=fake_abc(_RESUB_HELPS),
+    )
+
+    assert result.trajectory == ()
+    assert result.cost == -and_aig.num_gates
+
+
+def test_the_budget_is_enforced(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """An ABC that never finishes must not hold the search past its budget."""
+    start = time.monotonic()
+    result = search(and_aig, budget=1, commands=("balance",), binary=fake_abc("time.sleep(30)"))
+
+    assert time.monotonic() - start < 10
+    assert result.budget_exhausted is True
+    assert result.trajectory == ()
+    assert result.network.num_gates == and_aig.num_gates
+
+
+def test_abc_errors_propagate(and_aig: Aig, fake_abc: Callable[[str], Path]) -> None:
+    """A command ABC rejects is a mistake in the call, not a dead end to skip."""
+    shim = fake_abc("print(\"** cmd error: unknown command 'nope'\")")
+    with pytest.raises(AbcExecutionError, match="unknown command"):
+        search(and_aig, budget=30, commands=("nope",), binary=shim)
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("budget", 0), ("beam_width", 0), ("max_length", 0), ("workers", 0), ("commands", ())],
+)
+def test_invalid_options_are_rejected(and_aig: Aig, option: str, value: object) -> None:
+    """Out-of-range options are refused before ABC is looked up."""
+    kwargs: dict[str, object] = {"budget": 10, option: value}
+    with pytest.raises(ValueError, match=option):
+        search(and_aig, **kwargs)  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from itertools import starmap
+from typing import TYPE_CHECKING
+
+import pytest
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pytest.skip(
+        "PyArrow could not be imported. The `aigverse.adapters.arrow` module will not be available. "
+        "Skipping Arrow adapter tests. To enable this functionality, install pyarrow:\n\n"
+        "  uv pip install pyarrow\n",
+        allow_module_level=True,
+    )
+
+from aigverse.adapters import arrow
+from aigverse.algorithms import aig_resubstitution, cleanup_dangling, equivalence_checking, sop_refactoring
+from aigverse.networks import Aig, SequentialAig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aigverse.networks import AigSignal
+
+
+def _redundant_aig() -> Aig:
+    aig = Aig()
+    a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    redundant = aig.create_or(aig.create_and(a, b), aig.create_and(a, ~b))
+    aig.create_po(aig.create_and(redundant, c))
+    aig.create_po(~b)
+    return aig
+
+
+def _corpus() -> list[Aig]:
+    return [_redundant_aig(), aig_resubstitution(_redundant_aig(), cleanup=False), Aig()]
+
+
+def test_record_batch_layout(simple_aig: Aig) -> None:
+    batch = arrow.to_record_batch([simple_aig], [7], levels=True, fanouts=True, node_tts=True)
+
+    assert batch.schema == arrow.schema(levels=True, fanouts=True, node_tts=True)
+    row = batch.to_pylist()[0]
+    assert row["graph_id"] == 7
+    assert (row["num_pis"], row["num_pos"], row["num_gates"]) == (2, 3, 1)
+    assert row["node_type"] == [0, 1, 1, 2, 3, 3, 3]
+    assert row["edge_source"] == [1, 2, 1, 2, 3]
+    assert row["edge_target"] == [3, 3, 4, 5, 6]
+    assert row["edge_inverted"] == [0, 0, 0, 0, 0]
+    assert row["node_level"] == [0, 0, 0, 1, 1, 1, 2]
+    assert row["node_fanouts"] == [0, 2, 2, 1, 0, 0, 0]
+    # bit j of each table is the value under input assignment j
+    assert row["node_tt"] == [b"\x00", b"\x0a", b"\x0c", b"\x08", b"\x0a", b"\x0c", b"\x08"]
+
+
+def test_record_batch_drops_dead_nodes() -> None:
+    aig = aig_resubstitution(_redundant_aig(), cleanup=False)
+    assert len(aig.nodes()) < aig.size
+
+    row = arrow.to_record_batch([aig]).to_pylist()[0]
+
+    num_rows = len(aig.nodes()) + aig.num_pos
+    assert len(row["node_type"]) == num_rows
+    assert max(row["edge_source"] + row["edge_target"]) == num_rows - 1
+    assert row["node_type"][-aig.num_pos :] == [3] * aig.num_pos
+
+
+def test_record_batch_of_reordered_gates() -> None:
+    aig = Aig()
+    a, b, c, d = (aig.create_pi() for _ in range(4))
+    aig.create_po(a)
+    aig.create_po(aig.create_and(c, ~d))
+    aig.create_po(aig.create_and(~c, ~aig.create_and(~d, aig.create_and(b, c))))
+    # refactoring in place leaves dead nodes and makes a gate depend on a gate of higher index
+    aig = sop_refactoring(aig, cleanup=False)
+    assert any(aig.get_node(f) > n for n in aig.gates() for f in aig.fanins(n))
+
+    batch = arrow.to_record_batch([aig], node_tts=True)
+
+    assert batch.equals(arrow.to_record_batch([cleanup_dangling(aig)], node_tts=True))
+    # the last output is ~c, which is 1 exactly under the assignments without bit 2
+    assert batch.to_pylist()[0]["node_tt"][-1] == b"\x0f\x0f"
+
+
+def test_record_batch_round_trip() -> None:
+    corpus = _corpus()
+
+    batch = arrow.to_record_batch(corpus, node_tts=True)
+
+    assert batch.column("graph_id").to_pylist() == [0, 1, 2]
+    rebuilt = arrow.from_record_batch(batch)
+    assert all(starmap(equivalence_checking, zip(corpus, rebuilt, strict=True)))
+    # slices keep the values of the whole batch, which must be addressed through the offsets
+    assert [aig.num_gates for aig in arrow.from_record_batch(batch.slice(1))] == [1, 0]
+    assert len(arrow.from_record_batch(pa.Table.from_batches([batch, batch]))) == 6
+
+
+def test_record_batch_errors(sequential_single_register_aig: tuple[SequentialAig, AigSignal]) -> None:
+    with pytest.raises(ValueError, match="graph ids"):
+        arrow.to_record_batch([Aig()], [0, 1])
+    with pytest.raises(TypeError):
+        arrow.to_record_batch([sequential_single_register_aig[0]])
+
+    batch = arrow.to_record_batch([_redundant_aig()])
+    # turn the first gate into a primary input with two fanins
+    corrupted = batch.set_column(
+        batch.schema.get_field_index("node_type"),
+        batch.schema.field("node_type"),
+        pa.array([[0, 1, 1, 1, 1, 2, 2, 2, 3, 3]], type=pa.list_(pa.int8())),
+    )
+    with pytest.raises(ValueError, match=r"row 0 .* fanin_count"):
+        arrow.from_record_batch(corrupted)
+
+
+def test_record_batch_offset_overflow() -> None:
+    # broadcast views report more values than 32-bit offsets can address without allocating them
+    edges = np.broadcast_to(np.zeros(1, dtype=np.int32), (2**30,))
+    with pytest.raises(ValueError, match="edge_source column would hold 2147483648 values"):
+        arrow._list_array("edge_source", [edges, edges], pa.int32())  # ruff: ignore[private-member-access]
+
+    tts = np.broadcast_to(np.zeros((1, 1), dtype=np.uint8), (2**28, 8))
+    with pytest.raises(ValueError, match="node_tt column would hold 2147483648 bytes"):
+        arrow._list_array("node_tt", [tts], pa.binary())  # ruff: ignore[private-member-access]
+
+
+def test_parquet_streaming(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.parquet"
+
+    with arrow.ParquetCorpusWriter(path, levels=True, batch_size=2) as writer:
+        for aig in _corpus():
+            writer.write(aig)
+        assert writer.num_written == 2
+        writer.write(_redundant_aig(), graph_id=10)
+    assert writer.num_written == 4
+
+    assert pq.ParquetFile(path).num_row_groups == 2
+    ids, aigs = zip(*arrow.read_parquet(path, batch_size=3), strict=True)
+    assert ids == (0, 1, 2, 10)
+    assert [aig.num_gates for aig in aigs] == [4, 1, 0, 4]
+
+
+def test_write_parquet_consumes_generators(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.parquet"
+
+    assert arrow.write_parquet((_redundant_aig() for _ in range(5)), path, batch_size=2, compression="zstd") == 5
+
+    table = pq.read_table(path, memory_map=True)
+    assert table.num_rows == 5
+    assert table.column("graph_id").to_pylist() == [0, 1, 2, 3, 4]
+    sources = table.column("edge_source").chunk(0).values
+    assert np.array_equal(sources.to_numpy(zero_copy_only=True)[:4], [1, 2, 1, 2])
+
+    with pytest.raises(ValueError, match="batch_size"):
+        arrow.ParquetCorpusWriter(tmp_path / "empty.parquet", batch_size=0)
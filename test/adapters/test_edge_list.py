@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from aigverse.networks import Aig, AigEdge, AigEdgeList
@@ -241,3 +242,44 @@ def test_sequential_aig_feedback_loop(sequential_feedback_aig: tuple[SequentialA
 
     # Check total number of edges
     assert len(edge_list) == 3  # x1->AND, RO->AND, AND->RI(->RO)
+
+
+def test_edge_list_arrays(three_pi_three_and_po_aig: Aig) -> None:
+    edge_list = three_pi_three_and_po_aig.to_edge_list(regular_weight=2, inverted_weight=-2)
+
+    for column, field in (("sources", "source"), ("targets", "target"), ("weights", "weight")):
+        values = getattr(edge_list, column)
+        assert values.dtype == np.int64
+        assert values.tolist() == [getattr(edge, field) for edge in edge_list]
+
+    # the arrays are copies, so they stay valid when the list grows
+    sources = edge_list.sources
+    edge_list.append(AigEdge(9, 9, 9))
+    assert len(sources) == len(edge_list) - 1
+    assert edge_list.sources[-1] == 9
+
+    assert AigEdgeList().sources.shape == (0,)
+
+
+def test_edge_list_from_arrays() -> None:
+    edge_list = AigEdgeList(np.array([1, 2, 3]), np.array([3, 3, 4]), np.array([0, 1, 0]))
+
+    assert list(edge_list) == [AigEdge(1, 3, 0), AigEdge(2, 3, 1), AigEdge(3, 4, 0)]
+    # other integer types and strided arrays are converted
+    edge_list = AigEdgeList(np.array([1, 2], dtype=np.int32), np.array([4, 3])[::-1])
+    assert list(edge_list) == [AigEdge(1, 3, 0), AigEdge(2, 4, 0)]
+
+    with pytest.raises(ValueError, match="same length"):
+        AigEdgeList(np.array([1, 2]), np.array([3]))
+    with pytest.raises(ValueError, match="same length"):
+        AigEdgeList(np.array([1]), np.array([3]), np.array([0, 1]))
+    with pytest.raises(ValueError, match="negative"):
+        AigEdgeList(np.array([-1]), np.array([3]))
+
+
+def test_edge_list_array_round_trip(medium_structured_aig: Aig) -> None:
+    edge_list = medium_structured_aig.to_edge_list(regular_weight=10, inverted_weight=-10)
+
+    rebuilt = AigEdgeList(edge_list.sources, edge_list.targets, edge_list.weights)
+
+    assert list(rebuilt) == list(edge_list)
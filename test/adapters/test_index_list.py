@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from itertools import starmap
+
+import numpy as np
 import pytest
 
-from aigverse.algorithms import equivalence_checking, simulate
-from aigverse.networks import Aig, AigIndexList
+from aigverse.algorithms import aig_resubstitution, equivalence_checking, simulate
+from aigverse.networks import Aig, AigIndexList, SequentialAig, decode_index_lists, encode_index_lists
 from aigverse.utils import TruthTable
 
 
@@ -195,3 +198,77 @@ def test_index_list_to_python_list(sample_aig_index_list_raw: list[int]) -> None
 
     pylist = [int(i) for i in il]
     assert pylist == [4, 1, 3, 2, 4, 6, 8, 12, 10, 14]
+
+
+def test_index_list_array_protocol(sample_aig_index_list_raw: list[int]) -> None:
+    il = AigIndexList(sample_aig_index_list_raw)
+
+    values = np.asarray(il)
+    assert values.dtype == np.uint32
+    assert values.tolist() == sample_aig_index_list_raw
+
+    # the array is a copy, so writing to it leaves the index list untouched
+    values[0] = 99
+    assert il[0] == 4
+    assert np.asarray(il, dtype=np.int64).dtype == np.int64
+    with pytest.raises(ValueError, match="copy"):
+        il.__array__(copy=False)
+
+    rebuilt = AigIndexList(np.asarray(sample_aig_index_list_raw, dtype=np.uint32)[::-1][::-1])
+    assert rebuilt.raw() == sample_aig_index_list_raw
+
+
+def test_encode_decode_index_lists(xor_of_two_and_aig: Aig, inverted_signals_aig: Aig) -> None:
+    ntks = [xor_of_two_and_aig, Aig(), inverted_signals_aig]
+
+    encoded = encode_index_lists(ntks, workers=2)
+
+    offsets = encoded["index_list_offsets"]
+    assert encoded["index_lists"].dtype == np.uint32
+    assert offsets.dtype == np.int64
+    for i, ntk in enumerate(ntks):
+        assert encoded["index_lists"][offsets[i] : offsets[i + 1]].tolist() == ntk.to_index_list().raw()
+
+    decoded = decode_index_lists(encoded["index_lists"], offsets)
+    assert len(decoded) == len(ntks)
+    assert all(starmap(equivalence_checking, zip(ntks, decoded, strict=True)))
+    assert decode_index_lists(np.zeros(0, dtype=np.uint32), np.zeros(1, dtype=np.int64)) == []
+
+
+def test_encode_index_lists_errors() -> None:
+    with pytest.raises(TypeError, match="SequentialAig"):
+        encode_index_lists([Aig(), SequentialAig()])
+    with pytest.raises(ValueError, match="workers"):
+        encode_index_lists([Aig()], workers=0)
+
+    late_pi = Aig()
+    late_pi.create_and(late_pi.create_pi(), late_pi.create_pi())
+    late_pi.create_pi()
+    with pytest.raises(ValueError, match="network 0 is not in normalized index order"):
+        encode_index_lists([late_pi])
+
+    redundant = Aig()
+    a, b, c = redundant.create_pi(), redundant.create_pi(), redundant.create_pi()
+    gate = redundant.create_or(redundant.create_and(a, b), redundant.create_and(a, ~b))
+    redundant.create_po(redundant.create_and(gate, c))
+    with pytest.raises(ValueError, match="network 1 is not in normalized index order"):
+        encode_index_lists([Aig(), aig_resubstitution(redundant, cleanup=False)])
+
+
+def test_decode_index_lists_errors() -> None:
+    values = np.asarray([1, 1, 1, 2, 3, 4, 1, 1, 1, 2, 8, 6, 0, 0, 0], dtype=np.uint32)
+
+    with pytest.raises(ValueError, match="index list 1 refers to the undefined literal 8 at position 4"):
+        decode_index_lists(values, np.asarray([0, 6, 12, 15]))
+    with pytest.raises(ValueError, match="index list 1 has 2 values, but its header alone has 3"):
+        decode_index_lists(values, np.asarray([0, 6, 8, 15]))
+    with pytest.raises(ValueError, match="index list 0 has 7 values, but its header announces 1 gates"):
+        decode_index_lists(values, np.asarray([0, 7, 15]))
+    with pytest.raises(ValueError, match="start at 0"):
+        decode_index_lists(values, np.asarray([0, 6]))
+    with pytest.raises(ValueError, match="non-decreasing"):
+        decode_index_lists(values, np.asarray([0, 6, 3, 15]))
+    with pytest.raises(ValueError, match="at least one entry"):
+        decode_index_lists(values, np.zeros(0, dtype=np.int64))
+    with pytest.raises(ValueError, match="workers"):
+        decode_index_lists(values, np.asarray([0, 15]), workers=0)
@@ -6,7 +6,7 @@ from unittest import mock
 import pytest
 
 try:
-    import networkx as nx  # ruff:ignore[unused-import]
+    import networkx as nx
     import numpy as np
 except ImportError:
     pytest.skip(
@@ -17,7 +17,8 @@ except ImportError:
     )
 
 
-from aigverse.networks import Aig, DepthAig, FanoutAig, SequentialAig
+from aigverse.algorithms import aig_resubstitution
+from aigverse.networks import Aig, AigSignal, DepthAig, FanoutAig, SequentialAig
 
 
 @pytest.mark.parametrize("dependency", ["networkx", "numpy"])
@@ -289,3 +290,76 @@ class TestNetworkxAdapter:
         # Edges should not have name attributes
         for _src, _tgt, data in g.edges(data=True):
             assert "name" not in data
+
+    @staticmethod
+    def test_to_networkx_matches_edge_list_with_dead_nodes() -> None:
+        """Test that nodes and edges follow the network after optimization left dead nodes behind."""
+        aig = Aig()
+        a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+        redundant = aig.create_or(aig.create_and(a, b), aig.create_and(a, ~b))
+        aig.create_po(aig.create_and(redundant, c))
+        aig.create_po(b)
+        aig = aig_resubstitution(aig, cleanup=False)
+        assert len(aig.nodes()) < aig.size
+
+        g = aig.to_networkx(levels=True, fanouts=True)
+
+        depth_aig = DepthAig(aig)
+        assert list(g.nodes) == aig.nodes() + list(range(aig.size, aig.size + aig.num_pos))
+        for node in aig.nodes():
+            assert g.nodes[node]["level"] == depth_aig.level(node)
+            assert g.nodes[node]["fanouts"] == aig.fanout_size(node)
+        assert sorted((u, v, int(data["type"][1])) for u, v, data in g.edges(data=True)) == sorted(
+            (e.source, e.target, e.weight) for e in aig.to_edge_list()
+        )
+
+    @staticmethod
+    def test_to_networkx_sequential(sequential_single_register_aig: tuple[SequentialAig, AigSignal]) -> None:
+        """Test that sequential networks include their register feedback edges."""
+        aig, f1 = sequential_single_register_aig
+
+        g = aig.to_networkx(levels=True, fanouts=True)
+
+        ro = aig.ro_at(0)
+        assert g.has_edge(f1.index, ro)
+        assert tuple(g.nodes[ro]["type"].tolist()) == (0, 0, 1, 0)
+        assert g.number_of_edges() == len(aig.to_edge_list())
+
+    @staticmethod
+    def test_from_networkx_round_trip(simple_aig: Aig) -> None:
+        """Test that a graph produced by to_networkx is built back into the same network."""
+        from aigverse.adapters import from_networkx
+
+        g = simple_aig.to_networkx(levels=True, dtype=np.float32)
+
+        imported = from_networkx(g)
+
+        assert imported["problems"] == []
+        assert imported["ntk"].to_index_list().raw() == simple_aig.to_index_list().raw()
+
+    @staticmethod
+    def test_from_networkx_relabeled_nodes(simple_aig: Aig) -> None:
+        """Test that node keys other than indices are supported and problems refer to node positions."""
+        from aigverse.adapters import from_networkx
+
+        g = nx.relabel_nodes(simple_aig.to_networkx(), {node: f"n{node}" for node in range(simple_aig.size + 3)})
+        assert from_networkx(g)["problems"] == []
+
+        g.remove_edge("n1", "n3")
+        assert from_networkx(g)["problems"] == [("fanin_count", 3)]
+
+    @staticmethod
+    def test_from_networkx_missing_types() -> None:
+        """Test that nodes and edges without a type are rejected."""
+        from aigverse.adapters import from_networkx
+
+        g = nx.DiGraph()
+        g.add_node(0, type=np.array([1, 0, 0, 0]))
+        g.add_node(1)
+        with pytest.raises(ValueError, match="node 1"):
+            from_networkx(g)
+
+        g.nodes[1]["type"] = np.array([0, 0, 0, 1])
+        g.add_edge(0, 1)
+        with pytest.raises(ValueError, match=r"edge \(0, 1\)"):
+            from_networkx(g)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+try:
+    import networkx as nx
+except ImportError:
+    pytest.skip(
+        "NetworkX could not be imported. Skipping NetworkX backend tests. To enable this functionality, "
+        "install aigverse's 'adapters' extra:\n\n"
+        "  uv pip install aigverse[adapters]\n",
+        allow_module_level=True,
+    )
+
+from aigverse._networkx_backend_info import FUNCTIONS, get_info  # ruff:ignore[import-private-name]
+from aigverse.adapters import networkx_backend
+from aigverse.adapters.networkx import to_networkx
+from aigverse.adapters.networkx_backend import AigGraph
+from aigverse.algorithms import aig_resubstitution, sop_refactoring
+from aigverse.networks import Aig, SequentialAig
+
+
+def _redundant_aig() -> Aig:
+    aig = Aig()
+    a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    redundant = aig.create_or(aig.create_and(a, b), aig.create_and(a, ~b))
+    aig.create_po(aig.create_and(redundant, c))
+    aig.create_po(b)
+    aig.create_po(aig.get_constant(False))
+    return aig
+
+
+def _deep_aig() -> Aig:
+    aig = Aig()
+    pis = [aig.create_pi() for _ in range(5)]
+    node = pis[0]
+    for pi in pis[1:]:
+        node = aig.create_xor(node, pi)
+    aig.create_po(node)
+    aig.create_po(~aig.create_and(pis[1], pis[2]))
+    aig.create_po(pis[4])
+    return aig
+
+
+def _reordered_aig() -> Aig:
+    aig = Aig()
+    a, b, c, d = (aig.create_pi() for _ in range(4))
+    aig.create_po(aig.get_constant(False))
+    aig.create_po(a)
+    aig.create_po(aig.create_and(c, ~d))
+    aig.create_po(aig.create_and(~c, ~aig.create_and(~d, aig.create_and(b, c))))
+    # refactoring in place makes the last output's driver depend on a gate of higher index
+    return sop_refactoring(aig, cleanup=False)
+
+
+def _dangling_aig() -> Aig:
+    aig = Aig()
+    x, y, z = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    xy = aig.create_and(x, y)
+    aig.create_po(xy)
+    # a chain of dangling gates that is deeper than every path to an output
+    aig.create_and(aig.create_and(xy, z), ~x)
+    return aig
+
+
+@pytest.fixture(
+    params=[
+        _redundant_aig,
+        lambda: aig_resubstitution(_redundant_aig(), cleanup=False),
+        _deep_aig,
+        _reordered_aig,
+        _dangling_aig,
+    ],
+    ids=["redundant", "dead-nodes", "deep", "reordered", "dangling"],
+)
+def aig(request: pytest.FixtureRequest) -> Aig:
+    return request.param()
+
+
+def test_graph_matches_to_networkx(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+
+    assert list(aig_graph) == list(g)
+    assert len(aig_graph) == aig_graph.number_of_nodes() == g.number_of_nodes()
+    assert aig_graph.number_of_edges() == g.number_of_edges()
+    assert aig_graph.is_directed()
+    assert not aig_graph.is_multigraph()
+    assert dict(aig_graph.in_degree) == dict(g.in_degree)
+    assert dict(aig_graph.out_degree) == dict(g.out_degree)
+    assert aig.size + aig.num_pos not in aig_graph
+    assert True not in aig_graph
+
+
+def test_degree_views(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+    last = aig.size + aig.num_pos - 1
+
+    assert aig_graph.in_degree[last] == aig_graph.in_degree(last) == 1
+    assert aig_graph.out_degree(None) is not None
+    assert dict(aig_graph.out_degree([0, last, -5])) == dict(g.out_degree([0, last]))
+    assert len(aig_graph.in_degree([0, last])) == 2
+    with pytest.raises(nx.NetworkXError):
+        _ = aig_graph.in_degree[-5]
+
+
+def test_traversals_match_networkx(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+
+    for node in g:
+        assert networkx_backend.ancestors(aig_graph, node) == nx.ancestors(g, node)
+        assert networkx_backend.descendants(aig_graph, node) == nx.descendants(g, node)
+
+    with pytest.raises(nx.NetworkXError, match="not in the graph"):
+        networkx_backend.ancestors(aig_graph, aig.size + aig.num_pos)
+
+
+def test_orders_match_networkx(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+
+    generations = [sorted(generation) for generation in networkx_backend.topological_generations(aig_graph)]
+    assert generations == [sorted(generation) for generation in nx.topological_generations(g)]
+
+    order = list(networkx_backend.topological_sort(aig_graph))
+    assert sorted(order) == sorted(g)
+    positions = {node: position for position, node in enumerate(order)}
+    assert all(positions[u] < positions[v] for u, v in g.edges)
+    assert networkx_backend.is_directed_acyclic_graph(aig_graph)
+
+
+def test_longest_paths_match_networkx(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+
+    path = networkx_backend.dag_longest_path(aig_graph)
+    assert len(path) == len(nx.dag_longest_path(g))
+    assert all(itertools.starmap(g.has_edge, itertools.pairwise(path)))
+    assert g.out_degree(path[-1]) == 0
+    assert networkx_backend.dag_longest_path_length(aig_graph) == nx.dag_longest_path_length(g)
+    assert networkx_backend.dag_longest_path_length(aig_graph, default_weight=2.5) == nx.dag_longest_path_length(
+        g, default_weight=2.5
+    )
+
+
+def test_centralities_match_networkx(aig: Aig) -> None:
+    g = to_networkx(aig)
+    aig_graph = AigGraph(aig)
+
+    assert networkx_backend.in_degree_centrality(aig_graph) == pytest.approx(nx.in_degree_centrality(g))
+    assert networkx_backend.out_degree_centrality(aig_graph) == pytest.approx(nx.out_degree_centrality(g))
+
+
+def test_constant_only_graph() -> None:
+    aig_graph = AigGraph(Aig())
+
+    assert list(aig_graph) == [0]
+    assert networkx_backend.in_degree_centrality(aig_graph) == {0: 1}
+    assert networkx_backend.dag_longest_path(aig_graph) == [0]
+    assert list(networkx_backend.topological_generations(aig_graph)) == [[0]]
+
+
+def test_sequential_aigs_are_rejected(sequential_single_register_aig: tuple[SequentialAig, object]) -> None:
+    with pytest.raises(TypeError, match="sequential"):
+        AigGraph(sequential_single_register_aig[0])
+
+
+def test_can_run() -> None:
+    aig_graph = AigGraph(_deep_aig())
+
+    assert networkx_backend.can_run("ancestors", (aig_graph, 1), {}) is True
+    assert networkx_backend.can_run("dag_longest_path", (aig_graph,), {"default_weight": 3}) is True
+    assert isinstance(networkx_backend.can_run("dag_longest_path", (aig_graph, "weight", 0), {}), str)
+    assert isinstance(networkx_backend.can_run("dag_longest_path_length", (aig_graph,), {"default_weight": -1}), str)
+
+
+def test_conversions() -> None:
+    aig = _deep_aig()
+    g = to_networkx(aig)
+
+    aig_graph = networkx_backend.convert_from_nx(g, preserve_edge_attrs=True)
+    assert list(aig_graph) == list(g)
+    assert networkx_backend.ancestors(aig_graph, aig.size) == nx.ancestors(g, aig.size)
+
+    round_trip = networkx_backend.convert_to_nx(aig_graph)
+    assert isinstance(round_trip, nx.DiGraph)
+    assert list(round_trip.edges) == list(g.edges)
+    assert networkx_backend.convert_to_nx({1, 2}) == {1, 2}
+
+
+def test_conversion_of_renumbered_graphs_is_not_implemented() -> None:
+    g = nx.relabel_nodes(to_networkx(_deep_aig()), lambda node: node + 1)
+
+    with pytest.raises(NotImplementedError, match="does not keep its key"):
+        networkx_backend.convert_from_nx(g)
+    with pytest.raises(NotImplementedError):
+        networkx_backend.convert_from_nx(nx.DiGraph([(0, 1)]))
+
+
+def test_backend_info() -> None:
+    info = get_info()
+
+    assert info["backend_name"] == "aigverse"
+    assert set(info["functions"]) == set(FUNCTIONS)
+    assert all(callable(getattr(networkx_backend, name)) for name in FUNCTIONS)
+
+
+@pytest.mark.skipif(
+    "aigverse" not in nx.utils.backends.backends, reason="the aigverse NetworkX backend is not installed"
+)
+def test_dispatch() -> None:
+    aig = _deep_aig()
+    aig_graph = AigGraph(aig)
+
+    assert nx.ancestors(aig_graph, aig.size) == nx.ancestors(to_networkx(aig), aig.size)
+    assert nx.dag_longest_path_length(aig_graph) == nx.dag_longest_path_length(to_networkx(aig))
@@ -85,3 +85,67 @@ class TestNumpyConversion:
         assert arr.shape == (1,)
         assert arr.dtype == np.bool_
         np.testing.assert_array_equal(arr, [True])
+
+    @staticmethod
+    def test_blocks_view() -> None:
+        """Test that the blocks are a read-only view that follows the truth table."""
+        tt = TruthTable(7)
+        tt.create_nth_var(6)
+
+        blocks = tt.blocks
+        assert blocks.dtype == np.uint64
+        np.testing.assert_array_equal(blocks, [0, 2**64 - 1])
+        assert not blocks.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            blocks[0] = 1
+
+        tt.set_bit(0)
+        assert blocks[0] == 1
+        # assignment copies in place, so the view stays valid
+        tt.__assign__(TruthTable(7))
+        np.testing.assert_array_equal(blocks, [0, 0])
+        with pytest.raises(ValueError, match="variables"):
+            tt.__assign__(TruthTable(6))
+
+    @staticmethod
+    def test_to_numpy() -> None:
+        """Test unpacking bits and copying blocks in native code."""
+        tt = TruthTable(8)
+        tt.create_random()
+
+        bits = tt.to_numpy()
+        assert bits.dtype == np.bool_
+        assert bits.tolist() == list(tt)
+        np.testing.assert_array_equal(np.asarray(tt), bits)
+
+        blocks = tt.to_numpy(bits=False)
+        np.testing.assert_array_equal(blocks, tt.blocks)
+        assert not np.shares_memory(blocks, tt.blocks)
+        np.testing.assert_array_equal(np.packbits(bits, bitorder="little").view("<u8"), blocks)
+
+        with pytest.raises(ValueError, match="copy"):
+            tt.__array__(copy=False)
+
+    @staticmethod
+    def test_from_numpy() -> None:
+        """Test creating truth tables from bits and blocks."""
+        tt = TruthTable(8)
+        tt.create_random()
+
+        assert TruthTable.from_bits(tt.to_numpy()) == tt
+        assert TruthTable.from_bits(np.array([0, 1, 1, 0])).to_binary() == "0110"
+        assert TruthTable.from_blocks(tt.blocks) == tt
+        assert TruthTable.from_blocks(tt.blocks[::-1][::-1], num_vars=8) == tt
+
+        # tables with fewer than 6 variables ignore the unused bits of their block
+        small = TruthTable.from_blocks(np.array([0xFF], dtype=np.uint64), num_vars=2)
+        assert small.to_binary() == "1111"
+        assert small.blocks[0] == 0xF
+        assert TruthTable.from_blocks(np.zeros(1, dtype=np.uint64)).num_vars() == 6
+
+        with pytest.raises(ValueError, match="power of two"):
+            TruthTable.from_bits(np.zeros(3, dtype=bool))
+        with pytest.raises(ValueError, match="power of two"):
+            TruthTable.from_blocks(np.zeros(3, dtype=np.uint64))
+        with pytest.raises(ValueError, match=r"8 variables has 2\*\*2 blocks, got 3"):
+            TruthTable.from_blocks(np.zeros(3, dtype=np.uint64), num_vars=8)
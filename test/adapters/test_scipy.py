@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:
+    pytest.skip(
+        "SciPy could not be imported. The `Aig.to_scipy_sparse()` adapter will not be available. "
+        "Skipping SciPy adapter tests. To enable this functionality, install scipy:\n\n"
+        "  uv pip install scipy\n",
+        allow_module_level=True,
+    )
+
+from aigverse.networks import Aig, EdgeTensorEncoding, SparseLayout
+
+
+@pytest.mark.usefixtures("_import_adapters")
+class TestScipyAdapter:
+    """Test suite for the SciPy sparse adapter."""
+
+    @staticmethod
+    def test_to_scipy_sparse_layouts(simple_aig: Aig) -> None:
+        """Test that both layouts describe the same matrix with the right types."""
+        csr = simple_aig.to_scipy_sparse()
+        csc = simple_aig.to_scipy_sparse(SparseLayout.CSC)
+
+        assert isinstance(csr, sp.csr_array)
+        assert isinstance(csc, sp.csc_array)
+        dim = simple_aig.size + simple_aig.num_pos
+        assert csr.shape == csc.shape == (dim, dim)
+        assert csr.dtype == np.float32
+        assert csr.indices.dtype == np.int64
+        assert csr.has_sorted_indices
+        assert csc.has_sorted_indices
+        assert (csr != csc).nnz == 0
+
+    @staticmethod
+    def test_to_scipy_sparse_matches_to_networkx(inverted_signals_aig: Aig) -> None:
+        """Test that the matrix has the edges of the NetworkX graph with signed polarities."""
+        g = inverted_signals_aig.to_networkx()
+        matrix = inverted_signals_aig.to_scipy_sparse().toarray()
+
+        expected = np.zeros_like(matrix)
+        for u, v, edge_type in g.edges(data="type"):
+            expected[u, v] = -1.0 if edge_type[1] else 1.0
+        assert np.array_equal(matrix, expected)
+
+    @staticmethod
+    def test_to_scipy_sparse_binary_values(inverted_signals_aig: Aig) -> None:
+        """Test that binary encoding keeps regular edges as explicit zeros."""
+        matrix = inverted_signals_aig.to_scipy_sparse(edge_encoding=EdgeTensorEncoding.BINARY)
+
+        assert matrix.nnz == 2 * inverted_signals_aig.num_gates + inverted_signals_aig.num_pos
+        assert set(matrix.data.tolist()) == {0.0, 1.0}
+
+    @staticmethod
+    def test_to_scipy_sparse_does_not_copy(simple_aig: Aig) -> None:
+        """Test that the matrix wraps the exported arrays."""
+        adjacency = simple_aig.to_sparse_adjacency(SparseLayout.CSC)
+        matrix = sp.csc_array((adjacency["data"], adjacency["indices"], adjacency["indptr"]), shape=adjacency["shape"])
+
+        assert np.shares_memory(matrix.indices, adjacency["indices"])
+        assert np.shares_memory(matrix.indptr, adjacency["indptr"])
+        assert np.shares_memory(matrix.data, adjacency["data"])
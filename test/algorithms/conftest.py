@@ -238,3 +238,25 @@ def positive_divisor_substitution_aig() -> Aig:
     n0 = aig.create_and(x0, x1)
     aig.create_po(aig.create_and(x1, n0))
     return aig
+
+
+@pytest.fixture
+def cut_rewriting_resistant_aig() -> Aig:
+    """Create an AIG that cut rewriting cannot improve, but resubstitution reduces to no gates.
+
+    mockturtle's cut rewriting returns its input itself for this network, as rewriting
+    it would add gates.
+
+    Returns:
+        An AIG network whose outputs compute the constant 0 and ``x0``.
+    """
+    aig = Aig()
+    x0, x1, x2 = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    n0 = aig.create_and(~x0, ~x1)
+    n1 = aig.create_and(x0, ~n0)
+    n2 = aig.create_and(x0, ~n1)
+    n3 = aig.create_and(aig.create_and(~x0, x2), aig.create_and(x1, ~n0))
+    n4 = aig.create_and(~n1, ~n3)
+    aig.create_po(n2)
+    aig.create_po(aig.create_and(~n3, ~n4))
+    return aig
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from aigverse.algorithms import balancing
+from aigverse.algorithms import balancing, equivalence_checking
 from aigverse.networks import DepthAig
 
 if TYPE_CHECKING:
@@ -237,3 +237,14 @@ def test_return_new_does_not_mutate_input(make_and_chain_aig: Callable[[int], Ai
 
     assert result is not None
     assert _depth(aig) == _depth(aig_before)
+
+
+def test_inplace_replaces_the_input(complex_unbalanced_balancing_aig: Aig) -> None:
+    aig = complex_unbalanced_balancing_aig
+    aig_before = aig.clone()
+    expected = balancing(aig)
+
+    assert balancing(aig, inplace=True) is None
+    assert aig.to_index_list().raw() == expected.to_index_list().raw()
+    assert _depth(aig) == _depth(expected) < _depth(aig_before)
+    assert equivalence_checking(aig, aig_before)
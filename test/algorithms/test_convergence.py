@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import ConvergenceResult, equivalence_checking, run_until_convergence
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aigverse.networks import Aig
+
+
+def test_stops_once_nothing_is_gained(implicant_reduction_aig: Aig) -> None:
+    aig = implicant_reduction_aig
+
+    result = run_until_convergence(aig, ["aig_resubstitution"])
+
+    assert isinstance(result, ConvergenceResult)
+    assert result.stop_reason == "converged"
+    assert result.num_iterations == len(result) == 2
+    assert result.num_gates == [aig.num_gates, 0, 0]
+    assert result.gains == [1.0, 0.0]
+    assert result.network.num_gates == 0
+    assert equivalence_checking(result.network, aig)
+
+
+def test_iteration_limit(implicant_reduction_aig: Aig) -> None:
+    result = run_until_convergence(implicant_reduction_aig, ["sop_refactoring"], max_iterations=1)
+
+    assert result.stop_reason == "max_iterations"
+    assert result.num_iterations == 1
+    assert result.network.num_gates == 0
+
+
+def test_growth_is_discarded(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+
+    result = run_until_convergence(aig, ["balancing"])
+
+    assert result.stop_reason == "converged"
+    assert result.num_iterations == 1
+    assert result.gains[0] < 0.0
+    assert result.network.num_gates == aig.num_gates
+    assert equivalence_checking(result.network, aig)
+
+
+def test_time_budget(implicant_reduction_aig: Aig) -> None:
+    result = run_until_convergence(implicant_reduction_aig, ["aig_resubstitution"], time_budget=1e-9)
+
+    assert result.stop_reason == "time_budget"
+    assert result.num_iterations == 0
+    assert result.network.num_gates == implicant_reduction_aig.num_gates
+
+
+def test_input_is_left_unchanged(implicant_reduction_aig: Aig) -> None:
+    before = implicant_reduction_aig.clone()
+
+    result = run_until_convergence(implicant_reduction_aig, ["aig_resubstitution", "sop_refactoring"])
+    result.network.create_po(result.network.create_pi())
+
+    assert implicant_reduction_aig.size == before.size
+    assert implicant_reduction_aig.num_pos == before.num_pos
+
+
+def test_input_is_left_unchanged_when_cut_rewriting_returns_it(cut_rewriting_resistant_aig: Aig) -> None:
+    aig = cut_rewriting_resistant_aig
+    before = aig.clone()
+
+    result = run_until_convergence(aig, ["aig_cut_rewriting", "aig_resubstitution"])
+
+    assert result.network.num_gates == 0
+    assert aig.to_index_list().raw() == before.to_index_list().raw()
+
+    # an iteration that gains nothing returns a copy of the input rather than the input itself
+    result = run_until_convergence(aig, ["aig_cut_rewriting"])
+    assert result.stop_reason == "converged"
+    result.network.create_po(result.network.create_pi())
+    assert aig.num_pos == before.num_pos
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"recipe": []}, "at least one pass"),
+        ({"max_iterations": 0}, "max_iterations"),
+        ({"min_gain": -0.1}, "min_gain"),
+        ({"time_budget": 0.0}, "time_budget"),
+    ],
+)
+def test_invalid_arguments_are_rejected(implicant_reduction_aig: Aig, kwargs: dict[str, object], match: str) -> None:
+    arguments: dict[str, object] = {"recipe": ["aig_resubstitution"], **kwargs}
+    with pytest.raises(ValueError, match=match):
+        run_until_convergence(implicant_reduction_aig, **arguments)  # ty: ignore[invalid-argument-type]
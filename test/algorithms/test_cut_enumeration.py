@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from aigverse.algorithms import enumerate_cuts
+from aigverse.networks import Aig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _cuts_of(cuts: dict[str, np.ndarray], node: int) -> list[list[int]]:
+    node_offsets, cut_offsets, leaves = cuts["node_offsets"], cuts["cut_offsets"], cuts["leaves"]
+    return [
+        leaves[cut_offsets[c] : cut_offsets[c + 1]].tolist() for c in range(node_offsets[node], node_offsets[node + 1])
+    ]
+
+
+def _functions_of(cuts: dict[str, np.ndarray], node: int) -> list[int]:
+    node_offsets = cuts["node_offsets"]
+    return cuts["functions"][node_offsets[node] : node_offsets[node + 1]].tolist()
+
+
+@pytest.fixture
+def small_aig() -> Aig:
+    aig = Aig()
+    a, b, c = (aig.create_pi() for _ in range(3))
+    n0 = aig.create_and(a, b)
+    n1 = aig.create_and(~n0, c)
+    aig.create_po(n1)
+    return aig
+
+
+def test_arrays_are_packed(small_aig: Aig) -> None:
+    cuts = enumerate_cuts(small_aig)
+
+    assert set(cuts) == {"node_offsets", "cut_offsets", "leaves", "functions"}
+    assert cuts["node_offsets"].dtype == np.int64
+    assert cuts["cut_offsets"].dtype == np.int64
+    assert cuts["leaves"].dtype == np.int64
+    assert cuts["functions"].dtype == np.uint64
+    assert cuts["node_offsets"].shape == (small_aig.size + 1,)
+    num_cuts = int(cuts["node_offsets"][-1])
+    assert cuts["cut_offsets"].shape == (num_cuts + 1,)
+    assert cuts["functions"].shape == (num_cuts,)
+    assert int(cuts["cut_offsets"][-1]) == cuts["leaves"].shape[0]
+
+
+def test_cuts_and_functions(small_aig: Aig) -> None:
+    cuts = enumerate_cuts(small_aig)
+
+    assert _cuts_of(cuts, 0) == [[]]
+    assert _functions_of(cuts, 0) == [0x0]
+    for pi in (1, 2, 3):
+        assert _cuts_of(cuts, pi) == [[pi]]
+        assert _functions_of(cuts, pi) == [0x2]
+    assert _cuts_of(cuts, 4) == [[1, 2], [4]]
+    assert _functions_of(cuts, 4) == [0x8, 0x2]
+    assert sorted(zip(_cuts_of(cuts, 5), _functions_of(cuts, 5), strict=True)) == [
+        ([1, 2, 3], 0x70),
+        ([3, 4], 0x2),
+        ([5], 0x2),
+    ]
+
+
+def test_functions_can_be_skipped(small_aig: Aig) -> None:
+    with_functions = enumerate_cuts(small_aig)
+    without_functions = enumerate_cuts(small_aig, compute_truth=False)
+
+    assert "functions" not in without_functions
+    for key in ("node_offsets", "cut_offsets", "leaves"):
+        assert np.array_equal(with_functions[key], without_functions[key])
+
+
+@pytest.mark.parametrize(("cut_size", "cut_limit"), [(2, 2), (3, 4), (4, 8), (6, 25)])
+def test_limits_are_respected(make_xor_chain_aig: Callable[[int], Aig], cut_size: int, cut_limit: int) -> None:
+    aig = make_xor_chain_aig(8)
+
+    cuts = enumerate_cuts(aig, cut_size=cut_size, cut_limit=cut_limit)
+
+    assert np.all(np.diff(cuts["node_offsets"]) <= cut_limit)
+    assert np.all(np.diff(cuts["cut_offsets"]) <= cut_size)
+    if cut_size < 6:
+        assert np.all(cuts["functions"] < 1 << 2**cut_size)
+    for node in aig.gates():
+        node_cuts = _cuts_of(cuts, node)
+        assert [node] in node_cuts
+        assert all(leaves == sorted(leaves) for leaves in node_cuts)
+
+
+def test_large_cuts_without_functions(make_and_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_and_chain_aig(12)
+
+    cuts = enumerate_cuts(aig, cut_size=16, compute_truth=False)
+
+    assert max(np.diff(cuts["cut_offsets"])) > 6
+
+
+def test_minimized_cuts_drop_redundant_leaves() -> None:
+    aig = Aig()
+    a, b = aig.create_pi(), aig.create_pi()
+    n0 = aig.create_and(a, b)
+    n1 = aig.create_and(a, ~b)
+    n2 = aig.create_or(n0, n1)
+    aig.create_po(n2)
+
+    plain = enumerate_cuts(aig)
+    minimized = enumerate_cuts(aig, minimize_truth_table=True)
+
+    assert [1, 2] in _cuts_of(plain, n2.index)
+    assert [1] in _cuts_of(minimized, n2.index)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"cut_size": 0}, "cut_size"),
+        ({"cut_size": 17, "compute_truth": False}, "cut_size"),
+        ({"cut_size": 7}, "at most 6"),
+        ({"cut_limit": 0}, "cut_limit"),
+        ({"cut_limit": 26}, "cut_limit"),
+    ],
+)
+def test_invalid_arguments_are_rejected(small_aig: Aig, kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        enumerate_cuts(small_aig, **kwargs)  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from aigverse.algorithms import enumerate_cuts, extract_cuts
+from aigverse.networks import Aig, AigCut
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _enumerated(aig: Aig, cut_size: int = 4) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    cuts = enumerate_cuts(aig, cut_size=cut_size)
+    node_offsets = cuts["node_offsets"]
+    roots = np.repeat(np.arange(len(node_offsets) - 1), np.diff(node_offsets))
+    return roots, cuts["leaves"], cuts["cut_offsets"], cuts["functions"]
+
+
+def _pack(cuts: list[tuple[int, list[int]]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    roots = np.array([root for root, _ in cuts], dtype=np.int64)
+    leaves = np.array([leaf for _, leaves in cuts for leaf in leaves], dtype=np.int64)
+    leaf_offsets = np.cumsum([0] + [len(leaves) for _, leaves in cuts], dtype=np.int64)
+    return roots, leaves, leaf_offsets
+
+
+def test_index_lists_match_cut_views(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(5)
+    roots, leaves, leaf_offsets, _ = _enumerated(aig)
+
+    encoded = extract_cuts(aig, roots, leaves, leaf_offsets)
+
+    assert set(encoded) == {"index_lists", "index_list_offsets"}
+    assert encoded["index_lists"].dtype == np.uint32
+    assert encoded["index_list_offsets"].dtype == np.int64
+    assert encoded["index_list_offsets"].shape == (len(roots) + 1,)
+    index_lists, offsets = encoded["index_lists"], encoded["index_list_offsets"]
+    for c, root in enumerate(roots.tolist()):
+        cut = AigCut(aig, leaves[leaf_offsets[c] : leaf_offsets[c + 1]].tolist(), aig.make_signal(root))
+        assert index_lists[offsets[c] : offsets[c + 1]].tolist() == cut.to_index_list().raw()
+
+
+def test_functions_match_enumerated_functions(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+    roots, leaves, leaf_offsets, functions = _enumerated(aig, cut_size=6)
+
+    encoded = extract_cuts(aig, roots, leaves, leaf_offsets, compute_truth=True)
+
+    assert np.array_equal(encoded["function_offsets"], np.arange(len(roots) + 1))
+    assert np.array_equal(encoded["functions"], functions)
+
+
+def test_functions_of_large_cuts_span_several_words(make_and_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_and_chain_aig(8)
+    root = max(aig.gates())
+
+    encoded = extract_cuts(aig, *_pack([(root, aig.pis())]), compute_truth=True)
+
+    assert encoded["function_offsets"].tolist() == [0, 4]
+    assert encoded["functions"].tolist() == [0, 0, 0, 1 << 63]
+
+
+def test_npn_classes() -> None:
+    aig = Aig()
+    a, b = aig.create_pi(), aig.create_pi()
+    conjunction = aig.create_and(a, b)
+    disjunction = aig.create_or(a, b)
+    implication = aig.create_and(~a, b)
+    exclusive = aig.create_xor(a, b)
+
+    cuts = [(signal.index, [a.index, b.index]) for signal in (conjunction, disjunction, implication, exclusive)]
+    encoded = extract_cuts(aig, *_pack(cuts), compute_npn=True)
+
+    assert "functions" not in encoded
+    classes = encoded["npn_classes"].tolist()
+    assert classes[0] == classes[1] == classes[2]
+    assert classes[3] != classes[0]
+
+
+def test_workers_do_not_change_the_result(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(64)
+    roots, leaves, leaf_offsets, _ = _enumerated(aig)
+
+    sequential = extract_cuts(aig, roots, leaves, leaf_offsets, compute_truth=True, workers=1)
+    parallel = extract_cuts(aig, roots, leaves, leaf_offsets, compute_truth=True, workers=3)
+
+    for key, values in sequential.items():
+        assert np.array_equal(values, parallel[key])
+
+
+def test_empty_batch(implicant_reduction_aig: Aig) -> None:
+    encoded = extract_cuts(implicant_reduction_aig, *_pack([]), compute_truth=True)
+
+    assert encoded["index_lists"].shape == (0,)
+    assert encoded["index_list_offsets"].tolist() == [0]
+    assert encoded["function_offsets"].tolist() == [0]
+
+
+def test_unbounded_cut_is_rejected(make_and_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_and_chain_aig(4)
+
+    with pytest.raises(ValueError, match="not bounded by its leaves"):
+        extract_cuts(aig, *_pack([(max(aig.gates()), aig.pis()[:2])]))
+
+
+@pytest.mark.parametrize(
+    ("cuts", "kwargs", "match"),
+    [
+        ([(3, [1, 2, 4, 5, 6, 7, 8])], {"compute_npn": True}, "supports at most 6"),
+        ([(3, list(range(1, 18)))], {"compute_truth": True}, "supports at most 16"),
+        ([(3, [1, 2])], {"workers": 0}, "workers"),
+    ],
+)
+def test_invalid_arguments_are_rejected(
+    implicant_reduction_aig: Aig, cuts: list[tuple[int, list[int]]], kwargs: dict[str, object], match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        extract_cuts(implicant_reduction_aig, *_pack(cuts), **kwargs)  # ty: ignore[invalid-argument-type]
+
+
+def test_malformed_offsets_are_rejected(implicant_reduction_aig: Aig) -> None:
+    roots, leaves, _ = _pack([(3, [1, 2])])
+
+    with pytest.raises(ValueError, match="one more entry"):
+        extract_cuts(implicant_reduction_aig, roots, leaves, np.array([0], dtype=np.int64))
+    with pytest.raises(ValueError, match="end at the number of leaves"):
+        extract_cuts(implicant_reduction_aig, roots, leaves, np.array([0, 1], dtype=np.int64))
+
+
+def test_nodes_out_of_range_are_rejected(implicant_reduction_aig: Aig) -> None:
+    with pytest.raises(IndexError):
+        extract_cuts(implicant_reduction_aig, *_pack([(1000, [1, 2])]))
+    with pytest.raises(IndexError):
+        extract_cuts(implicant_reduction_aig, *_pack([(3, [1, 1000])]))
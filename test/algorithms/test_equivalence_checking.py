@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import pytest
 
-from aigverse.algorithms import equivalence_checking
+from aigverse.algorithms import (
+    CounterexampleCache,
+    OutputEquivalenceResult,
+    equivalence_checking,
+    per_output_equivalence_checking,
+)
 from aigverse.networks import Aig
 
 
@@ -30,3 +35,190 @@ def test_aig_and_its_negated_copy(aig_and_negated_copy_pair: tuple[Aig, Aig]) ->
     aig1, aig2 = aig_and_negated_copy_pair
 
     assert not equivalence_checking(aig1, aig2)
+
+
+@pytest.fixture
+def three_output_aigs() -> tuple[Aig, Aig]:
+    """Create two AIGs whose first and last outputs agree and whose middle output differs.
+
+    Returns:
+        A tuple containing the specification and the implementation.
+    """
+    spec = Aig()
+    a, b, c = spec.create_pi(), spec.create_pi(), spec.create_pi()
+    spec.create_po(spec.create_and(a, b))
+    spec.create_po(spec.create_or(a, b))
+    spec.create_po(spec.create_and(a, spec.create_or(b, c)))
+
+    impl = Aig()
+    a, b, c = impl.create_pi(), impl.create_pi(), impl.create_pi()
+    impl.create_po(impl.create_and(a, b))
+    impl.create_po(impl.create_and(a, b))
+    impl.create_po(impl.create_or(impl.create_and(a, b), impl.create_and(a, c)))
+
+    return spec, impl
+
+
+def test_per_output_verdicts(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+
+    result = per_output_equivalence_checking(spec, impl, workers=2)
+
+    assert isinstance(result, OutputEquivalenceResult)
+    assert len(result) == 3
+    assert result.verdicts == [True, False, True]
+    assert result.equivalent is False
+    assert result.failing_outputs == [1]
+
+    a, b, _ = result.counterexamples[1]
+    assert (a or b) != (a and b)
+
+
+def test_per_output_agrees_with_the_single_miter(equivalent_two_output_aigs: tuple[Aig, Aig]) -> None:
+    aig1, aig2 = equivalent_two_output_aigs
+
+    result = per_output_equivalence_checking(aig1, aig2, functional_reduction=False)
+
+    assert result.verdicts == [True, True]
+    assert result.equivalent is True
+    assert result.counterexamples == {}
+    assert equivalence_checking(aig1, aig2)
+
+
+def test_per_output_complemented_output(aig_and_negated_copy_pair: tuple[Aig, Aig]) -> None:
+    aig1, aig2 = aig_and_negated_copy_pair
+
+    result = per_output_equivalence_checking(aig1, aig2)
+
+    assert result.verdicts == [False]
+    assert len(result.counterexamples[0]) == aig1.num_pis
+
+
+def test_per_output_time_budget(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+
+    result = per_output_equivalence_checking(spec, impl, time_budget=1e-12)
+
+    # structural hashing and simulation decide the first two outputs without a SAT call
+    assert result.verdicts == [True, False, None]
+    assert result.equivalent is False
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"time_budget": 0.0}, "time_budget"),
+        ({"workers": 0}, "workers"),
+    ],
+)
+def test_per_output_invalid_arguments(
+    three_output_aigs: tuple[Aig, Aig], kwargs: dict[str, object], match: str
+) -> None:
+    spec, impl = three_output_aigs
+
+    with pytest.raises(ValueError, match=match):
+        per_output_equivalence_checking(spec, impl, **kwargs)  # ty: ignore[invalid-argument-type]
+
+
+def test_per_output_interface_mismatch(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+    impl.create_po(impl.create_pi())
+
+    with pytest.raises(RuntimeError, match="differing numbers"):
+        per_output_equivalence_checking(spec, impl)
+
+
+def test_simulation_and_sat_agree(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+
+    assert equivalence_checking(spec, impl) is False
+    assert equivalence_checking(spec, impl, num_random_patterns=0) is False
+    assert per_output_equivalence_checking(spec, impl, num_random_patterns=0).verdicts == [True, False, True]
+
+
+def test_counterexamples_are_cached(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+    cache = CounterexampleCache(capacity=4)
+
+    assert len(cache) == 0
+    assert cache.last is None
+    assert cache.num_pis is None
+
+    assert equivalence_checking(spec, impl, num_random_patterns=0, counterexample_cache=cache) is False
+
+    assert len(cache) == 1
+    assert cache.num_pis == spec.num_pis
+    a, b, _ = cache.last
+    assert (a or b) != (a and b)
+
+    # the cached pattern separates the networks again, so no new counterexample is found
+    result = per_output_equivalence_checking(spec, impl, num_random_patterns=0, counterexample_cache=cache)
+    assert result.counterexamples[1] == cache.last
+    assert cache.patterns == [result.counterexamples[1]]
+
+
+@pytest.mark.parametrize("functional_reduction", [False, True])
+@pytest.mark.parametrize("complemented", [False, True])
+def test_counterexample_of_an_input_literal_output(*, complemented: bool, functional_reduction: bool) -> None:
+    # the miter of these networks has no gates and outputs a literal of the second input
+    spec, impl = Aig(), Aig()
+    spec.create_pi()
+    x1 = spec.create_pi()
+    spec.create_po(~x1 if complemented else x1)
+    impl.create_pi()
+    impl.create_pi()
+    impl.create_po(impl.get_constant(False))
+    expected = [False, not complemented]
+
+    cache = CounterexampleCache()
+    assert (
+        equivalence_checking(
+            spec,
+            impl,
+            num_random_patterns=0,
+            functional_reduction=functional_reduction,
+            counterexample_cache=cache,
+        )
+        is False
+    )
+    assert cache.patterns == [expected]
+
+    result = per_output_equivalence_checking(
+        spec, impl, num_random_patterns=0, functional_reduction=functional_reduction
+    )
+    assert result.verdicts == [False]
+    assert result.counterexamples == {0: expected}
+
+
+def test_counterexample_cache_bookkeeping() -> None:
+    cache = CounterexampleCache(capacity=2)
+
+    cache.add([False, False])
+    cache.add([True, False])
+    cache.add([False, False])
+    assert cache.patterns == [[True, False], [False, False]]
+
+    cache.add([True, True])
+    assert cache.patterns == [[False, False], [True, True]]
+    assert cache.capacity == 2
+
+    with pytest.raises(ValueError, match="2 primary inputs"):
+        cache.add([True])
+
+    cache.clear()
+    cache.add([True])
+    assert cache.patterns == [[True]]
+
+    with pytest.raises(ValueError, match="capacity"):
+        CounterexampleCache(capacity=0)
+
+
+def test_cache_of_a_different_interface_is_rejected(three_output_aigs: tuple[Aig, Aig]) -> None:
+    spec, impl = three_output_aigs
+    cache = CounterexampleCache()
+    cache.add([True])
+
+    with pytest.raises(ValueError, match="primary inputs"):
+        equivalence_checking(spec, impl, counterexample_cache=cache)
+    with pytest.raises(ValueError, match="primary inputs"):
+        per_output_equivalence_checking(spec, impl, counterexample_cache=cache)
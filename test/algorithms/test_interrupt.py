@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import (
+    CancellationToken,
+    aig_cut_rewriting,
+    aig_resubstitution,
+    balancing,
+    equivalence_checking,
+    per_output_equivalence_checking,
+    sop_refactoring,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aigverse.networks import Aig
+
+
+@pytest.fixture
+def cancelled_token() -> CancellationToken:
+    token = CancellationToken()
+    token.cancel()
+    return token
+
+
+def test_token_bookkeeping() -> None:
+    token = CancellationToken()
+    assert not token.cancelled
+    assert repr(token) == "CancellationToken(cancelled=False)"
+
+    token.cancel()
+    token.cancel()
+    assert token.cancelled
+    assert repr(token) == "CancellationToken(cancelled=True)"
+
+    token.reset()
+    assert not token.cancelled
+
+
+@pytest.mark.parametrize("optimize", [aig_resubstitution, sop_refactoring])
+def test_in_place_passes_stop_before_the_first_node(
+    implicant_reduction_aig: Aig, cancelled_token: CancellationToken, optimize: Callable[..., Aig | None]
+) -> None:
+    aig = implicant_reduction_aig
+
+    stopped = optimize(aig, cancellation_token=cancelled_token)
+    assert stopped is not None
+    assert stopped.num_gates == aig.num_gates
+    assert equivalence_checking(stopped, aig)
+
+    expired = optimize(aig, time_limit=1e-9)
+    assert expired is not None
+    assert expired.num_gates == aig.num_gates
+
+    assert optimize(aig, inplace=True, cancellation_token=cancelled_token) is None
+    assert aig.num_gates == 2
+
+    cancelled_token.reset()
+    finished = optimize(aig, time_limit=60.0, cancellation_token=cancelled_token)
+    assert finished is not None
+    assert finished.num_gates == 0
+
+
+@pytest.mark.parametrize("optimize", [aig_cut_rewriting, balancing])
+def test_functional_passes_return_a_copy_of_the_input(
+    make_xor_chain_aig: Callable[[int], Aig], cancelled_token: CancellationToken, optimize: Callable[..., Aig]
+) -> None:
+    aig = make_xor_chain_aig(8)
+
+    for stopped in (optimize(aig, cancellation_token=cancelled_token), optimize(aig, time_limit=1e-9)):
+        assert stopped.num_gates == aig.num_gates
+        assert stopped.num_pis == aig.num_pis
+        assert stopped.num_pos == aig.num_pos
+        assert equivalence_checking(stopped, aig)
+
+    stopped.create_po(stopped.create_pi())
+    assert stopped.num_pos == aig.num_pos + 1
+
+    size_before = aig.size
+    assert optimize(aig, inplace=True, cancellation_token=cancelled_token) is None
+    assert aig.size == size_before
+
+
+def test_equivalence_checking_is_undecided_once_stopped(
+    implicant_reduction_aig: Aig, cancelled_token: CancellationToken
+) -> None:
+    spec = implicant_reduction_aig
+    impl = sop_refactoring(spec)
+    assert impl is not None
+
+    assert equivalence_checking(spec, impl, cancellation_token=cancelled_token) is None
+    assert equivalence_checking(spec, impl, functional_reduction=False, cancellation_token=cancelled_token) is None
+    assert equivalence_checking(spec, impl, time_limit=1e-9) is None
+    assert equivalence_checking(spec, impl, time_limit=60.0)
+
+    result = per_output_equivalence_checking(spec, impl, cancellation_token=cancelled_token)
+    assert result.verdicts == [None]
+    assert result.equivalent is None
+
+
+def test_stopped_equivalence_checking_still_reports_simulated_counterexamples(
+    aig_and_negated_copy_pair: tuple[Aig, Aig], cancelled_token: CancellationToken
+) -> None:
+    spec, impl = aig_and_negated_copy_pair
+
+    assert equivalence_checking(spec, impl, cancellation_token=cancelled_token) is False
+
+    result = per_output_equivalence_checking(spec, impl, cancellation_token=cancelled_token)
+    assert result.equivalent is False
+
+
+@pytest.mark.parametrize(
+    "run", [aig_resubstitution, sop_refactoring, aig_cut_rewriting, balancing, equivalence_checking]
+)
+@pytest.mark.parametrize("limit", [0.0, -1.0, float("nan")])
+def test_non_positive_time_limit_is_rejected(
+    implicant_reduction_aig: Aig, run: Callable[..., object], limit: float
+) -> None:
+    arguments = (
+        (implicant_reduction_aig, implicant_reduction_aig)
+        if run is equivalence_checking
+        else (implicant_reduction_aig,)
+    )
+    with pytest.raises(ValueError, match="time_limit must be positive"):
+        run(*arguments, time_limit=limit)
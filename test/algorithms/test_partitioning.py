@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import (
+    PartitionedResult,
+    StatisticsCollector,
+    equivalence_checking,
+    run_partitioned,
+)
+from aigverse.networks import Aig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_small_network_forms_one_partition(implicant_reduction_aig: Aig) -> None:
+    result = run_partitioned(implicant_reduction_aig, ["sop_refactoring"])
+
+    assert isinstance(result, PartitionedResult)
+    assert result.num_partitions == 1
+    assert result.network.num_gates == 0
+    assert result.runtime >= 0.0
+    assert equivalence_checking(result.network, implicant_reduction_aig)
+
+
+@pytest.mark.parametrize(
+    "recipe",
+    [
+        ["aig_resubstitution"],
+        ["sop_refactoring"],
+        ["aig_cut_rewriting"],
+        ["balancing"],
+        ["aig_resubstitution", ("sop_refactoring", {"allow_zero_gain": True}), "balancing"],
+    ],
+)
+def test_partitions_are_optimized_and_stitched(
+    make_xor_chain_aig: Callable[[int], Aig], recipe: list[str | tuple[str, dict[str, object]]]
+) -> None:
+    aig = make_xor_chain_aig(32)
+
+    result = run_partitioned(aig, recipe, max_partition_size=8, workers=4)
+
+    assert result.num_partitions >= aig.num_gates // 8
+    assert result.network.num_pis == aig.num_pis
+    assert result.network.num_pos == aig.num_pos
+    assert equivalence_checking(result.network, aig)
+
+
+def test_boundary_size_is_bounded(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(16)
+
+    unbounded = run_partitioned(aig, ["aig_resubstitution"], max_partition_inputs=1000)
+    bounded = run_partitioned(aig, ["aig_resubstitution"], max_partition_inputs=2)
+
+    assert unbounded.num_partitions == 1
+    assert bounded.num_partitions > 1
+    assert equivalence_checking(bounded.network, aig)
+
+
+def test_outputs_of_every_kind_are_stitched() -> None:
+    aig = Aig()
+    a, b, c = (aig.create_pi() for _ in range(3))
+    n0 = aig.create_and(a, b)
+    n1 = aig.create_and(~n0, c)
+    n2 = aig.create_and(n0, n1)
+    aig.create_po(n2)
+    aig.create_po(~n1)
+    aig.create_po(n0)
+    aig.create_po(b)
+    aig.create_po(aig.get_constant(True))
+
+    result = run_partitioned(aig, ["aig_resubstitution"], max_partition_size=1)
+
+    assert result.num_partitions == 3
+    assert result.network.num_pos == aig.num_pos
+    assert equivalence_checking(result.network, aig)
+
+
+def test_input_is_left_unchanged(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+    before = aig.clone()
+
+    run_partitioned(aig, ["aig_resubstitution", "sop_refactoring"], max_partition_size=4)
+
+    assert aig.size == before.size
+    assert equivalence_checking(aig, before)
+
+
+def test_empty_network() -> None:
+    aig = Aig()
+    aig.create_pi()
+
+    result = run_partitioned(aig, ["balancing"])
+
+    assert result.num_partitions == 0
+    assert result.network.num_pis == 1
+    assert result.network.num_gates == 0
+
+
+def test_every_partition_is_recorded(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    with StatisticsCollector() as collector:
+        result = run_partitioned(make_xor_chain_aig(16), ["sop_refactoring"], max_partition_size=8)
+
+    assert len(collector) == result.num_partitions
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_partition_size": 0}, "max_partition_size"),
+        ({"max_partition_inputs": 1}, "max_partition_inputs"),
+        ({"workers": 0}, "workers"),
+        ({"recipe": ["rewrite"]}, "unknown pass 'rewrite'"),
+        ({"recipe": [("cleanup_dangling", {"remove_dangling_pis": True})]}, "must not remove"),
+    ],
+)
+def test_invalid_arguments_are_rejected(implicant_reduction_aig: Aig, kwargs: dict[str, object], match: str) -> None:
+    arguments: dict[str, object] = {"recipe": ["balancing"], **kwargs}
+    with pytest.raises(ValueError, match=match):
+        run_partitioned(implicant_reduction_aig, **arguments)  # ty: ignore[invalid-argument-type]
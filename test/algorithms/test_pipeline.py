@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import (
+    PipelineResult,
+    aig_resubstitution,
+    cleanup_dangling,
+    equivalence_checking,
+    run_pipeline,
+    sop_refactoring,
+)
+from aigverse.networks import Aig, DepthAig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_empty_recipe_returns_a_copy(implicant_reduction_aig: Aig) -> None:
+    result = run_pipeline(implicant_reduction_aig, [])
+
+    assert isinstance(result, PipelineResult)
+    assert len(result) == 0
+    assert result.steps == []
+    assert result.network.num_gates == implicant_reduction_aig.num_gates
+
+    result.network.create_po(result.network.create_pi())
+    assert result.network.num_pos != implicant_reduction_aig.num_pos
+
+
+def test_input_is_left_unchanged(implicant_reduction_aig: Aig) -> None:
+    before = implicant_reduction_aig.clone()
+
+    result = run_pipeline(implicant_reduction_aig, ["aig_resubstitution", "sop_refactoring"])
+
+    assert implicant_reduction_aig.size == before.size
+    assert result.network.size == before.size - 2
+    assert equivalence_checking(result.network, before)
+
+
+def test_input_is_left_unchanged_when_cut_rewriting_returns_it(cut_rewriting_resistant_aig: Aig) -> None:
+    aig = cut_rewriting_resistant_aig
+    before = aig.clone()
+
+    result = run_pipeline(aig, ["aig_cut_rewriting", "aig_resubstitution"])
+
+    assert result.network.num_gates == 0
+    assert aig.num_gates == before.num_gates
+    assert aig.to_index_list().raw() == before.to_index_list().raw()
+
+    result = run_pipeline(aig, ["aig_cut_rewriting"])
+    assert result.network.num_gates == before.num_gates
+    result.network.create_po(result.network.create_pi())
+    assert aig.num_pos == before.num_pos
+    assert aig.num_pis == before.num_pis
+
+
+def test_matches_chained_calls(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+
+    chained = cleanup_dangling(sop_refactoring(aig_resubstitution(aig)))
+    result = run_pipeline(aig, ["aig_resubstitution", "sop_refactoring"])
+
+    assert result.network.num_gates == chained.num_gates
+    assert equivalence_checking(result.network, aig)
+
+
+def test_params_accept_any_mapping(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+
+    from_dict = run_pipeline(aig, [("aig_resubstitution", {"max_pis": 6})])
+    from_mapping = run_pipeline(aig, [("aig_resubstitution", MappingProxyType({"max_pis": 6}))])
+
+    assert from_mapping.network.to_index_list().raw() == from_dict.network.to_index_list().raw()
+    with pytest.raises(ValueError, match="unexpected parameter 'cut_size'"):
+        run_pipeline(aig, [("aig_resubstitution", MappingProxyType({"cut_size": 4}))])
+
+
+def test_steps_record_every_pass(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+    recipe = [
+        "aig_cut_rewriting",
+        ("aig_resubstitution", {"max_pis": 6}),
+        ("sop_refactoring", {"allow_zero_gain": True}),
+        ("balancing", {"rebalance_function": "esop"}),
+        "cleanup_dangling",
+    ]
+
+    result = run_pipeline(aig, recipe)
+
+    assert len(result) == len(recipe)
+    assert [step.name for step in result.steps] == [
+        "aig_cut_rewriting",
+        "aig_resubstitution",
+        "sop_refactoring",
+        "balancing",
+        "cleanup_dangling",
+    ]
+    assert all(step.runtime >= 0.0 for step in result.steps)
+    assert result.runtime >= sum(step.runtime for step in result.steps)
+    assert result.steps[-1].num_gates == result.network.num_gates
+    assert result.steps[-1].depth == DepthAig(result.network).num_levels
+    assert equivalence_checking(result.network, aig)
+
+
+def test_final_network_has_no_dangling_nodes(implicant_reduction_aig: Aig) -> None:
+    result = run_pipeline(implicant_reduction_aig, ["sop_refactoring"])
+
+    assert result.steps[0].num_gates == result.network.num_gates
+    assert result.network.size == cleanup_dangling(result.network).size
+
+
+def test_unknown_pass_is_rejected(implicant_reduction_aig: Aig) -> None:
+    with pytest.raises(ValueError, match="unknown pass 'rewrite'"):
+        run_pipeline(implicant_reduction_aig, ["rewrite"])
+
+
+def test_unknown_parameter_is_rejected(implicant_reduction_aig: Aig) -> None:
+    with pytest.raises(ValueError, match="unexpected parameter 'inplace'"):
+        run_pipeline(implicant_reduction_aig, [("sop_refactoring", {"inplace": True})])
+
+
+def test_unknown_rebalance_function_is_rejected(implicant_reduction_aig: Aig) -> None:
+    with pytest.raises(ValueError, match="unknown rebalance function 'aig'"):
+        run_pipeline(implicant_reduction_aig, [("balancing", {"rebalance_function": "aig"})])
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [42, ("balancing",), ("balancing", {"cut_size": "four"}), ("balancing", [("cut_size", 4)])],
+)
+def test_malformed_entries_are_rejected(implicant_reduction_aig: Aig, entry: object) -> None:
+    with pytest.raises(TypeError, match="recipe entry 0"):
+        run_pipeline(implicant_reduction_aig, [entry])  # ty: ignore[invalid-argument-type]
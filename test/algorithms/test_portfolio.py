@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import PortfolioResult, equivalence_checking, run_pipeline, run_portfolio
+from aigverse.networks import DepthAig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aigverse.networks import Aig
+
+
+def test_best_recipe_wins(complex_unbalanced_balancing_aig: Aig) -> None:
+    aig = complex_unbalanced_balancing_aig
+
+    result = run_portfolio(aig, [["sop_refactoring"], ["balancing"]], cost="depth", workers=2)
+
+    assert isinstance(result, PortfolioResult)
+    assert len(result) == 2
+    assert result.best == 1
+    assert DepthAig(result.network).num_levels < DepthAig(aig).num_levels
+    assert [candidate.index for candidate in result.candidates] == [0, 1]
+    assert not any(candidate.cancelled for candidate in result.candidates)
+    assert equivalence_checking(result.network, aig)
+
+
+def test_matches_run_pipeline(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+    recipes = [
+        [("balancing", {"rebalance_function": "sop"})],
+        [("balancing", {"rebalance_function": "esop"})],
+        ["aig_resubstitution", "aig_cut_rewriting"],
+    ]
+
+    result = run_portfolio(aig, recipes, cost="depth_then_size")
+
+    for candidate, recipe in zip(result.candidates, recipes, strict=True):
+        expected = run_pipeline(aig, recipe).network
+        assert candidate.num_gates == expected.num_gates
+        assert candidate.depth == DepthAig(expected).num_levels
+        assert len(candidate.steps) == len(recipe)
+
+    best = result.candidates[result.best]
+    assert all((best.depth, best.num_gates) <= (other.depth, other.num_gates) for other in result.candidates)
+    assert equivalence_checking(result.network, aig)
+
+
+def test_ties_go_to_the_first_recipe(implicant_reduction_aig: Aig) -> None:
+    result = run_portfolio(implicant_reduction_aig, [["sop_refactoring"]] * 4, cost="size", workers=4)
+
+    assert result.best == 0
+
+
+def test_input_is_left_unchanged(implicant_reduction_aig: Aig) -> None:
+    before = implicant_reduction_aig.clone()
+
+    run_portfolio(implicant_reduction_aig, [["aig_resubstitution"], ["sop_refactoring"]])
+
+    assert implicant_reduction_aig.size == before.size
+
+
+def test_hopeless_candidates_are_cancelled(complex_unbalanced_balancing_aig: Aig) -> None:
+    # a single worker runs the candidates in order, so the first one has finished by the time
+    # the second one is measured against it
+    result = run_portfolio(
+        complex_unbalanced_balancing_aig,
+        [["balancing"], ["sop_refactoring", "aig_resubstitution", "sop_refactoring"]],
+        cost="depth",
+        margin=0.0,
+        workers=1,
+    )
+
+    assert result.best == 0
+    assert not result.candidates[0].cancelled
+    assert result.candidates[1].cancelled
+    assert len(result.candidates[1].steps) == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"recipes": []}, "at least one recipe"),
+        ({"cost": "area"}, "Unknown cost"),
+        ({"margin": -0.5}, "margin"),
+        ({"workers": 0}, "workers"),
+        ({"recipes": [[], ["rewrite"]]}, "recipe 1: .*unknown pass 'rewrite'"),
+    ],
+)
+def test_invalid_arguments_are_rejected(implicant_reduction_aig: Aig, kwargs: dict[str, object], match: str) -> None:
+    arguments: dict[str, object] = {"recipes": [["balancing"]], **kwargs}
+    with pytest.raises(ValueError, match=match):
+        run_portfolio(implicant_reduction_aig, **arguments)  # ty: ignore[invalid-argument-type]
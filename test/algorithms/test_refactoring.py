@@ -138,3 +138,17 @@ def test_return_new_does_not_mutate_input(implicant_reduction_aig: Aig) -> None:
 
     assert equivalence_checking(aig, aig_before)
     assert equivalence_checking(result, aig_before)
+
+
+def test_cleanup_can_be_skipped(implicant_reduction_aig: Aig) -> None:
+    aig = implicant_reduction_aig
+
+    kept = sop_refactoring(aig, cleanup=False)
+    cleaned = sop_refactoring(aig)
+
+    assert kept is not None
+    assert cleaned is not None
+    assert kept.size == aig.size
+    assert cleaned.size < kept.size
+    assert cleanup_dangling(kept).size == cleaned.size
+    assert equivalence_checking(kept, aig)
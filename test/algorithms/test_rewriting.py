@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from aigverse.algorithms import aig_cut_rewriting, equivalence_checking
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from aigverse.algorithms import aig_cut_rewriting, equivalence_checking, npn_database_info, prewarm_npn_database
 from aigverse.networks import Aig
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def test_empty_aigs() -> None:
     aig1 = Aig()
@@ -99,3 +105,39 @@ def test_return_new_does_not_mutate_input(implicant_reduction_aig: Aig) -> None:
     assert result is not None
     assert result.to_index_list().raw() == aig_before_index_list
     assert equivalence_checking(result, aig_before)
+
+
+def test_prewarm_builds_the_shared_database() -> None:
+    info = prewarm_npn_database()
+
+    assert info.built
+    # all 222 NPN classes of four-input functions
+    assert info.num_classes == 222
+    assert info.num_nodes > 0
+    assert info.build_time > 0.0
+    assert info.memory > 0
+
+    again = npn_database_info()
+    assert again.built
+    assert again.build_time == info.build_time
+    assert again.memory == info.memory
+
+
+def test_concurrent_rewriting_shares_the_database(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aigs = [make_xor_chain_aig(num_pis) for num_pis in range(2, 10)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rewritten = list(pool.map(aig_cut_rewriting, aigs))
+
+    for aig, result in zip(aigs, rewritten, strict=True):
+        assert equivalence_checking(aig, result)
+
+
+def test_inplace_replaces_the_input(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+    aig_before = aig.clone()
+    expected = aig_cut_rewriting(aig)
+
+    assert aig_cut_rewriting(aig, inplace=True) is None
+    assert aig.to_index_list().raw() == expected.to_index_list().raw()
+    assert equivalence_checking(aig, aig_before)
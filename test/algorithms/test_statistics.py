@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import (
+    PassStatistics,
+    StatisticsCollector,
+    aig_cut_rewriting,
+    aig_resubstitution,
+    balancing,
+    run_pipeline,
+    set_statistics_collector,
+    sop_refactoring,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from aigverse.networks import Aig
+
+
+@pytest.fixture(autouse=True)
+def no_active_collector() -> Iterator[None]:
+    yield
+    set_statistics_collector(None)
+
+
+def test_empty_statistics() -> None:
+    statistics = PassStatistics()
+
+    assert not statistics.name
+    assert statistics.num_runs == 0
+    assert statistics.times == {}
+    assert statistics.counts == {}
+
+
+@pytest.mark.parametrize(
+    ("optimize", "times", "counts"),
+    [
+        (
+            aig_resubstitution,
+            {"cuts", "mffc", "divisor_collection", "simulation", "dont_cares", "resynthesis", "substitution"},
+            {
+                "leaves",
+                "divisors",
+                "estimated_gain",
+                "accepted",
+                "accepted_constant",
+                "accepted_0_resub",
+                "accepted_1_resub",
+                "accepted_12_resub",
+                "accepted_2_resub",
+                "accepted_3_resub",
+            },
+        ),
+        (sop_refactoring, {"mffc", "simulation", "resynthesis"}, {"candidates"}),
+        (aig_cut_rewriting, {"cut_enumeration", "resynthesis"}, {"candidates"}),
+        (balancing, {"cut_enumeration", "truth_tables"}, {"candidates"}),
+    ],
+)
+def test_passes_fill_statistics(
+    make_xor_chain_aig: Callable[[int], Aig],
+    optimize: Callable[..., Aig | None],
+    times: set[str],
+    counts: set[str],
+) -> None:
+    aig = make_xor_chain_aig(6)
+    statistics = PassStatistics()
+
+    optimized = optimize(aig, statistics=statistics)
+
+    assert optimized is not None
+    assert statistics.name == optimize.__name__
+    assert statistics.num_runs == 1
+    assert statistics.runtime >= 0.0
+    assert statistics.num_gates_before == aig.num_gates
+    assert statistics.num_gates_after >= optimized.num_gates
+    assert set(statistics.times) == times
+    assert all(time >= 0.0 for time in statistics.times.values())
+    assert set(statistics.counts) == counts
+
+
+def test_resubstitution_counts_accepted_substitutions(implicant_reduction_aig: Aig) -> None:
+    statistics = PassStatistics()
+
+    aig_resubstitution(implicant_reduction_aig, statistics=statistics)
+
+    assert statistics.num_gates_before == 2
+    assert statistics.num_gates_after == 0
+    assert statistics.counts["accepted"] >= 1
+    assert statistics.counts["estimated_gain"] >= 1
+
+
+def test_candidates_are_counted(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    statistics = PassStatistics()
+
+    aig_cut_rewriting(make_xor_chain_aig(6), statistics=statistics)
+
+    assert statistics.counts["candidates"] > 0
+
+
+def test_collector_records_passes_while_active(implicant_reduction_aig: Aig) -> None:
+    collector = StatisticsCollector()
+    aig_resubstitution(implicant_reduction_aig)
+    assert len(collector) == 0
+
+    with collector as active:
+        assert active is collector
+        aig_resubstitution(implicant_reduction_aig)
+        run_pipeline(implicant_reduction_aig, ["sop_refactoring", "balancing", "cleanup_dangling"])
+
+    aig_resubstitution(implicant_reduction_aig)
+
+    assert [record.name for record in collector.records] == ["aig_resubstitution", "sop_refactoring", "balancing"]
+    assert repr(collector) == "StatisticsCollector(num_records=3)"
+
+    collector.clear()
+    assert len(collector) == 0
+
+
+def test_collectors_nest(implicant_reduction_aig: Aig) -> None:
+    outer = StatisticsCollector()
+    inner = StatisticsCollector()
+
+    with outer:
+        with inner:
+            sop_refactoring(implicant_reduction_aig)
+        sop_refactoring(implicant_reduction_aig)
+
+    assert len(inner) == 1
+    assert len(outer) == 1
+
+
+def test_set_statistics_collector(implicant_reduction_aig: Aig) -> None:
+    collector = StatisticsCollector()
+
+    set_statistics_collector(collector)
+    aig_cut_rewriting(implicant_reduction_aig)
+    set_statistics_collector(None)
+    aig_cut_rewriting(implicant_reduction_aig)
+
+    assert len(collector) == 1
+
+
+def test_summary_aggregates_per_pass(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+
+    with StatisticsCollector() as collector:
+        for _ in range(3):
+            balancing(aig)
+        aig_cut_rewriting(aig)
+
+    summary = collector.summary()
+
+    assert set(summary) == {"balancing", "aig_cut_rewriting"}
+    records = [record for record in collector.records if record.name == "balancing"]
+    aggregate = summary["balancing"]
+    assert aggregate.num_runs == 3
+    assert aggregate.num_gates_before == 3 * aig.num_gates
+    assert aggregate.runtime == pytest.approx(sum(record.runtime for record in records))
+    assert aggregate.counts["candidates"] == sum(record.counts["candidates"] for record in records)
+
+
+def test_collector_is_thread_safe(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aigs = [make_xor_chain_aig(6) for _ in range(16)]
+
+    with StatisticsCollector() as collector, ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(aig_resubstitution, aigs))
+
+    assert len(collector) == len(aigs)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from aigverse.algorithms import (
+    aig_resubstitution,
+    critical_path,
+    node_levels,
+    sop_refactoring,
+    topological_order,
+    transitive_fanin,
+    transitive_fanout,
+)
+from aigverse.networks import Aig, DepthAig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _roots(*nodes: int) -> np.ndarray:
+    return np.array(nodes, dtype=np.int64)
+
+
+def _aig_with_dead_nodes() -> Aig:
+    aig = Aig()
+    a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    redundant = aig.create_or(aig.create_and(a, b), aig.create_and(a, ~b))
+    aig.create_po(aig.create_and(redundant, c))
+    aig.create_po(b)
+    return aig_resubstitution(aig, cleanup=False)
+
+
+def _aig_with_reordered_gates() -> Aig:
+    aig = Aig()
+    a, b, c, d = (aig.create_pi() for _ in range(4))
+    aig.create_po(a)
+    aig.create_po(aig.create_and(c, ~d))
+    aig.create_po(aig.create_and(~c, ~aig.create_and(~d, aig.create_and(b, c))))
+    return sop_refactoring(aig, cleanup=False)
+
+
+def _depends_on_higher_index(aig: Aig) -> bool:
+    return any(aig.get_node(f) > n for n in aig.gates() for f in aig.fanins(n))
+
+
+def test_topological_order(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(4)
+    assert topological_order(aig).tolist() == aig.nodes()
+
+    aig = _aig_with_reordered_gates()
+    assert _depends_on_higher_index(aig)
+
+    order = topological_order(aig)
+
+    assert order.dtype == np.int64
+    assert sorted(order.tolist()) == aig.nodes()
+    positions = {node: position for position, node in enumerate(order.tolist())}
+    for n in aig.gates():
+        assert all(positions[aig.get_node(f)] < positions[n] for f in aig.fanins(n))
+
+
+def test_traversals_of_reordered_gates() -> None:
+    aig = _aig_with_reordered_gates()
+    fanouts: dict[int, set[int]] = {n: set() for n in aig.nodes()}
+    for n in aig.gates():
+        for f in aig.fanins(n):
+            fanouts[aig.get_node(f)].add(n)
+
+    for root in aig.nodes():
+        expected, stack = {root}, [root]
+        while stack:
+            for fanout in fanouts[stack.pop()] - expected:
+                expected.add(fanout)
+                stack.append(fanout)
+        assert set(transitive_fanout(aig, _roots(root))["nodes"].tolist()) == expected
+
+    depth = DepthAig(aig)
+    nodes = critical_path(aig)["nodes"].tolist()
+    assert len(nodes) == depth.num_levels + 1
+    assert [depth.level(n) for n in nodes] == list(range(len(nodes)))
+
+
+def test_transitive_fanin_of_a_chain(make_and_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_and_chain_aig(4)
+    gates = aig.gates()
+
+    tfi = transitive_fanin(aig, _roots(gates[1]))
+
+    assert tfi.dtype == np.int64
+    # the chain is right-associative, so the second gate depends on the last three inputs only
+    assert tfi.tolist() == [2, 3, 4, gates[0], gates[1]]
+    assert transitive_fanin(aig, _roots(gates[-1])).tolist() == [1, 2, 3, 4, *gates]
+
+
+def test_transitive_fanin_reaches_the_constant() -> None:
+    aig = Aig()
+    a = aig.create_pi()
+    aig.create_po(aig.get_constant(True))
+
+    assert transitive_fanin(aig, _roots(aig.po_at(0).index)).tolist() == [0]
+    assert transitive_fanin(aig, _roots(a.index, 0)).tolist() == [0, a.index]
+    assert transitive_fanin(aig, _roots()).tolist() == []
+
+
+def test_transitive_fanout_includes_outputs() -> None:
+    aig = Aig()
+    a, b, c = (aig.create_pi() for _ in range(3))
+    n0 = aig.create_and(a, b)
+    n1 = aig.create_and(n0, c)
+    aig.create_po(b)
+    aig.create_po(~n1)
+    aig.create_po(c)
+
+    fanout = transitive_fanout(aig, _roots(a.index))
+
+    assert set(fanout) == {"nodes", "outputs"}
+    assert fanout["nodes"].tolist() == [a.index, n0.index, n1.index]
+    assert fanout["outputs"].tolist() == [1]
+    assert transitive_fanout(aig, _roots(b.index))["outputs"].tolist() == [0, 1]
+
+
+def test_transitive_fanout_skips_dead_gates() -> None:
+    aig = _aig_with_dead_nodes()
+    live = set(aig.nodes())
+    assert len(live) < aig.size
+
+    for pi in aig.pis():
+        assert set(transitive_fanout(aig, _roots(pi))["nodes"].tolist()) <= live
+
+
+def test_node_levels_include_dangling_gates(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(4)
+    depth = DepthAig(aig)
+    assert node_levels(aig).tolist() == [depth.level(n) for n in range(aig.size)]
+
+    aig = Aig()
+    x, y, z = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    xy = aig.create_and(x, y)
+    aig.create_po(xy)
+    dangling = aig.create_and(aig.create_and(xy, z), ~x)
+
+    levels = node_levels(aig)
+    assert levels.dtype == np.int64
+    assert levels.tolist() == [0, 0, 0, 0, 1, 2, 3]
+    assert levels[dangling.index] == 3
+
+    aig = _aig_with_reordered_gates()
+    levels = node_levels(aig)
+    for n in aig.gates():
+        assert levels[n] == 1 + max(levels[aig.get_node(f)] for f in aig.fanins(n))
+
+    aig = _aig_with_dead_nodes()
+    dead = set(range(aig.size)) - set(aig.nodes())
+    assert dead
+    assert all(node_levels(aig)[n] == 0 for n in dead)
+
+
+def test_critical_path_follows_the_deepest_output(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(5)
+    depth = DepthAig(aig)
+
+    path = critical_path(aig)
+
+    assert set(path) == {"nodes", "output"}
+    assert path["output"] == 0
+    nodes = path["nodes"].tolist()
+    assert len(nodes) == depth.num_levels + 1
+    assert [depth.level(n) for n in nodes] == list(range(len(nodes)))
+    for fanin, node in itertools.pairwise(nodes):
+        assert fanin in {aig.get_node(f) for f in aig.fanins(node)}
+    assert nodes[-1] == aig.po_at(0).index
+
+
+def test_critical_path_without_outputs() -> None:
+    aig = Aig()
+    a, b = aig.create_pi(), aig.create_pi()
+    aig.create_and(a, b)
+    aig.create_and(a, ~b)
+
+    path = critical_path(aig)
+
+    assert path["nodes"].tolist() == [a.index, 3]
+    assert path["output"] == -1
+
+    path = critical_path(Aig())
+
+    assert path["nodes"].tolist() == [0]
+    assert path["output"] == -1
+
+
+def test_invalid_roots_are_rejected(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+
+    with pytest.raises(IndexError):
+        transitive_fanin(aig, _roots(aig.size))
+    with pytest.raises(IndexError):
+        transitive_fanout(aig, _roots(-1))
+
+    aig = _aig_with_dead_nodes()
+    dead = next(n for n in range(aig.size) if n not in set(aig.nodes()))
+    with pytest.raises(ValueError, match="dead"):
+        transitive_fanin(aig, _roots(dead))
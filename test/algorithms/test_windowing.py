@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from aigverse.algorithms import aig_resubstitution, compute_windows, mffc_sizes
+from aigverse.networks import Aig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _window(windows: dict[str, np.ndarray], part: str, offsets: str, w: int) -> list[int]:
+    return windows[part][windows[offsets][w] : windows[offsets][w + 1]].tolist()
+
+
+def test_mffc_sizes_of_a_chain(make_and_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_and_chain_aig(5)
+
+    sizes = mffc_sizes(aig)
+
+    assert sizes.dtype == np.int64
+    assert sizes.shape == (aig.size,)
+    assert sizes[: 1 + aig.num_pis].tolist() == [0] * (1 + aig.num_pis)
+    assert [sizes[gate] for gate in aig.gates()] == [1, 2, 3, 4]
+
+
+def test_shared_gates_are_not_in_the_mffc() -> None:
+    aig = Aig()
+    a, b, c = (aig.create_pi() for _ in range(3))
+    shared = aig.create_and(a, b)
+    n0 = aig.create_and(shared, c)
+    n1 = aig.create_and(~shared, c)
+    aig.create_po(n0)
+    aig.create_po(n1)
+
+    sizes = mffc_sizes(aig)
+
+    assert sizes[shared.index] == 1
+    assert sizes[n0.index] == 1
+    assert sizes[n1.index] == 1
+
+
+def test_windows_are_packed(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(8)
+
+    windows = compute_windows(aig, max_pis=4)
+
+    assert set(windows) == {
+        "roots",
+        "leaves",
+        "leaf_offsets",
+        "divisors",
+        "divisor_offsets",
+        "mffcs",
+        "mffc_offsets",
+    }
+    assert all(values.dtype == np.int64 for values in windows.values())
+    num_windows = windows["roots"].shape[0]
+    assert num_windows > 0
+    for offsets, part in (("leaf_offsets", "leaves"), ("divisor_offsets", "divisors"), ("mffc_offsets", "mffcs")):
+        assert windows[offsets].shape == (num_windows + 1,)
+        assert int(windows[offsets][-1]) == windows[part].shape[0]
+
+    sizes = mffc_sizes(aig)
+    for w, root in enumerate(windows["roots"].tolist()):
+        leaves = _window(windows, "leaves", "leaf_offsets", w)
+        divisors = _window(windows, "divisors", "divisor_offsets", w)
+        mffc = _window(windows, "mffcs", "mffc_offsets", w)
+        assert 0 < len(leaves) <= 4
+        assert divisors[: len(leaves)] == leaves
+        assert mffc[-1] == root
+        assert not set(mffc) & set(divisors)
+        assert len(mffc) <= sizes[root]
+
+
+def test_windows_of_explicit_roots(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(4)
+    roots = np.array([max(aig.gates())], dtype=np.int64)
+
+    windows = compute_windows(aig, roots)
+
+    assert windows["roots"].tolist() == roots.tolist()
+    assert sorted(_window(windows, "leaves", "leaf_offsets", 0)) == aig.pis()
+
+
+def test_network_remains_usable(make_xor_chain_aig: Callable[[int], Aig]) -> None:
+    aig = make_xor_chain_aig(6)
+    expected = aig.clone()
+    aig_resubstitution(expected)
+
+    fanout_sizes = [aig.fanout_size(n) for n in aig.nodes()]
+    compute_windows(aig)
+    # the MFFCs are dereferenced in place, so the fanout counts must have been restored
+    assert [aig.fanout_size(n) for n in aig.nodes()] == fanout_sizes
+    aig_resubstitution(aig)
+
+    assert aig.num_gates == expected.num_gates
+
+
+def test_invalid_roots_are_rejected(implicant_reduction_aig: Aig) -> None:
+    with pytest.raises(IndexError):
+        compute_windows(implicant_reduction_aig, np.array([1000], dtype=np.int64))
+    with pytest.raises(ValueError, match="not a gate"):
+        compute_windows(implicant_reduction_aig, np.array([1], dtype=np.int64))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_pis": 0}, "max_pis"),
+        ({"max_pis": 8, "max_divisors": 4}, "max_divisors"),
+    ],
+)
+def test_invalid_arguments_are_rejected(implicant_reduction_aig: Aig, kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        compute_windows(implicant_reduction_aig, **kwargs)  # ty: ignore[invalid-argument-type]
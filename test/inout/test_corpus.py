@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aigverse.algorithms import equivalence_checking
+from aigverse.io import CorpusReader, CorpusWriter
+from aigverse.networks import Aig, NamedAig, SequentialAig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _xor_aig() -> Aig:
+    aig = Aig()
+    a, b = aig.create_pi(), aig.create_pi()
+    aig.create_po(aig.create_xor(a, b))
+    return aig
+
+
+def test_corpus_round_trip(three_input_and_chain_aig: Aig, tmp_path: Path) -> None:
+    path = tmp_path / "corpus.aigc"
+    named = NamedAig(_xor_aig())
+    named.set_network_name("xor")
+
+    with CorpusWriter(path) as writer:
+        assert writer.append(three_input_and_chain_aig) == 0
+        assert writer.append(named) == 1
+        assert writer.append(Aig(), name="empty") == 2
+        assert len(writer) == 3
+    assert writer.closed
+    assert (tmp_path / "corpus.aigc.idx").exists()
+
+    with CorpusReader(path) as reader:
+        assert len(reader) == 3
+        assert equivalence_checking(reader[0], three_input_and_chain_aig)
+        assert equivalence_checking(reader[-2], named)
+        assert reader[2].size == 1
+        assert reader.index_list(1).raw() == named.to_index_list().raw()
+        assert reader.metadata(0) == {
+            "name": None,
+            "num_pis": three_input_and_chain_aig.num_pis,
+            "num_pos": three_input_and_chain_aig.num_pos,
+            "num_gates": three_input_and_chain_aig.num_gates,
+            "truth_table_hash": None,
+        }
+        assert reader.metadata(1)["name"] == "xor"
+        assert reader.metadata(2)["name"] == "empty"
+        with pytest.raises(IndexError):
+            _ = reader[3]
+        with pytest.raises(IndexError):
+            reader.metadata(-4)
+
+    with pytest.raises(ValueError, match="closed"):
+        _ = reader[0]
+
+
+def test_corpus_truth_table_hashes(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.aigc"
+    xor = _xor_aig()
+    # the same function with a different structure
+    xnor = Aig()
+    a, b = xnor.create_pi(), xnor.create_pi()
+    xnor.create_po(~xnor.create_xnor(a, b))
+    wide = Aig()
+    pis = [wide.create_pi() for _ in range(17)]
+    wide.create_po(wide.create_and(pis[0], pis[16]))
+
+    with CorpusWriter(path, truth_table_hashes=True) as writer:
+        for aig in (xor, xnor, Aig(), wide):
+            writer.append(aig)
+
+    reader = CorpusReader(path)
+    hashes = [reader.metadata(i)["truth_table_hash"] for i in range(len(reader))]
+    assert hashes[0] == hashes[1]
+    assert hashes[0] != hashes[2]
+    assert hashes[3] is None
+
+
+def test_corpus_append_while_reading(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.aigc"
+    writer = CorpusWriter(path)
+    writer.append(_xor_aig())
+    writer.flush()
+
+    reader = CorpusReader(path)
+    assert len(reader) == 1
+
+    # a second writer appends to the existing corpus
+    writer.close()
+    writer = CorpusWriter(path)
+    assert len(writer) == 1
+    assert writer.append(_xor_aig()) == 1
+    assert len(reader) == 1
+    writer.flush()
+    assert reader.refresh() == 2
+    assert reader[1].num_pis == 2
+    writer.close()
+
+    # an index entry that a writer did not finish is dropped on opening
+    with (tmp_path / "corpus.aigc.idx").open("ab") as index:
+        index.write(b"\x01" * 7)
+    assert len(CorpusReader(path)) == 2
+    with CorpusWriter(path) as writer:
+        assert writer.append(Aig()) == 2
+    assert reader.refresh() == 3
+    assert reader[2].size == 1
+
+
+def test_corpus_reader_pickling(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.aigc"
+    with CorpusWriter(path) as writer:
+        writer.append(_xor_aig())
+
+    reader = pickle.loads(pickle.dumps(CorpusReader(path)))
+
+    assert reader.filename == path
+    assert equivalence_checking(reader[0], _xor_aig())
+
+
+def test_corpus_errors(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.aigc"
+
+    with CorpusWriter(path) as writer:
+        with pytest.raises(TypeError, match="SequentialAig"):
+            writer.append(SequentialAig())
+
+        late_pi = Aig()
+        late_pi.create_and(late_pi.create_pi(), late_pi.create_pi())
+        late_pi.create_pi()
+        with pytest.raises(ValueError, match="normalized index order"):
+            writer.append(late_pi)
+        assert len(writer) == 0
+    with pytest.raises(ValueError, match="closed"):
+        writer.append(Aig())
+
+    (tmp_path / "other.aigc").write_bytes(b"not a corpus")
+    with pytest.raises(ValueError, match="exists, but"):
+        CorpusWriter(tmp_path / "other.aigc")
+    (tmp_path / "other.aigc.idx").write_bytes(b"not a corpus")
+    with pytest.raises(ValueError, match="not an aigverse corpus file"):
+        CorpusWriter(tmp_path / "other.aigc")
+    with pytest.raises(ValueError, match="not an aigverse corpus file"):
+        CorpusReader(tmp_path / "other.aigc")
+    with pytest.raises(RuntimeError, match="cannot open"):
+        CorpusReader(tmp_path / "missing.aigc")
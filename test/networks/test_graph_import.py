@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from aigverse.networks import Aig, EdgeTensorEncoding, NodeTensorEncoding, from_graph_tensors
+
+
+@pytest.fixture
+def mixed_polarity_aig() -> Aig:
+    """Create an AIG with inverted fanins, an inverted output, and a constant output.
+
+    Returns:
+        A small AIG with three PIs, two gates, and three POs.
+    """
+    aig = Aig()
+    a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    n0 = aig.create_and(a, ~b)
+    n1 = aig.create_or(n0, c)
+    aig.create_po(~n1)
+    aig.create_po(n0)
+    aig.create_po(aig.get_constant(True))
+    return aig
+
+
+def _import(aig: Aig, node_encoding: NodeTensorEncoding, edge_encoding: EdgeTensorEncoding) -> dict:
+    tensors = aig.to_graph_tensors(node_encoding, edge_encoding, levels=True, fanouts=True)
+    return from_graph_tensors(
+        tensors["edge_index"], tensors["edge_attr"], tensors["node_attr"], node_encoding, edge_encoding
+    )
+
+
+@pytest.mark.parametrize("node_encoding", [NodeTensorEncoding.INTEGER, NodeTensorEncoding.ONE_HOT])
+@pytest.mark.parametrize(
+    "edge_encoding", [EdgeTensorEncoding.BINARY, EdgeTensorEncoding.SIGNED, EdgeTensorEncoding.ONE_HOT]
+)
+def test_round_trip(
+    mixed_polarity_aig: Aig, node_encoding: NodeTensorEncoding, edge_encoding: EdgeTensorEncoding
+) -> None:
+    imported = _import(mixed_polarity_aig, node_encoding, edge_encoding)
+
+    assert imported["problems"] == []
+    assert imported["ntk"].to_index_list().raw() == mixed_polarity_aig.to_index_list().raw()
+    assert imported["literals"].dtype == np.int64
+    assert imported["literals"].tolist() == [2 * node for node in mixed_polarity_aig.nodes()] + [-1] * 3
+
+
+def test_rows_in_any_order_are_ordered_topologically(mixed_polarity_aig: Aig) -> None:
+    tensors = mixed_polarity_aig.to_graph_tensors()
+    # move the gates to the end, in reverse order
+    perm = np.array([0, 1, 2, 3, 6, 7, 8, 5, 4])
+    rows = np.argsort(perm)
+
+    imported = from_graph_tensors(
+        np.ascontiguousarray(rows[tensors["edge_index"]]), tensors["edge_attr"], tensors["node_attr"][perm]
+    )
+
+    assert imported["problems"] == []
+    ntk = imported["ntk"]
+    assert (ntk.num_pis, ntk.num_pos, ntk.num_gates) == (3, 3, 2)
+    assert ntk.to_index_list().raw() == mixed_polarity_aig.to_index_list().raw()
+
+
+def test_structural_hashing_merges_duplicate_gates() -> None:
+    # two identical gates over the same inputs, each driving an output
+    edge_index = np.array([[1, 2, 1, 2, 3, 4], [3, 3, 4, 4, 5, 6]], dtype=np.int64)
+    edge_attr = np.zeros((6, 1), dtype=np.float32)
+    node_attr = np.array([[0], [1], [1], [2], [2], [3], [3]], dtype=np.float32)
+
+    imported = from_graph_tensors(edge_index, edge_attr, node_attr)
+
+    assert imported["ntk"].num_gates == 1
+    assert imported["literals"][3] == imported["literals"][4]
+
+
+def test_scores_are_decoded() -> None:
+    edge_index = np.array([[1, 2, 3], [3, 3, 4]], dtype=np.int64)
+    edge_attr = np.array([[0.9, 0.1], [0.2, 0.7], [0.6, 0.4]], dtype=np.float32)
+    node_attr = np.array(
+        [[0.7, 0.1, 0.1, 0.1], [0.1, 0.8, 0.0, 0.1], [0.0, 0.6, 0.3, 0.1], [0.1, 0.1, 0.5, 0.3], [0.0, 0.1, 0.2, 0.7]],
+        dtype=np.float32,
+    )
+
+    imported = from_graph_tensors(
+        edge_index, edge_attr, node_attr, NodeTensorEncoding.ONE_HOT, EdgeTensorEncoding.ONE_HOT
+    )
+
+    assert imported["problems"] == []
+    assert imported["ntk"].to_index_list().raw() == [2, 1, 1, 2, 5, 6]
+
+
+@pytest.mark.parametrize(
+    ("edge_index", "node_attr", "problems"),
+    [
+        ([[1, 3], [3, 3]], [[0], [1], [2], [2]], [("fanin_count", 2), ("cycle", 3)]),
+        ([[1, 2, 3, 9], [3, 3, 4, 3]], [[0], [1], [1], [2], [3]], [("edge_out_of_range", 3)]),
+        ([[1, 2], [3, 3]], [[0], [1], [1], [2], [3]], [("fanin_count", 4)]),
+        ([[1, 1, 2], [3, 3, 3]], [[0], [1], [1], [2]], [("fanin_count", 3)]),
+        (
+            [[1, 2, 3, 4], [3, 3, 4, 1]],
+            [[0], [1], [5], [2], [3]],
+            [("fanin_count", 1), ("node_type", 2), ("po_fanout", 4), ("cycle", 1), ("cycle", 3), ("cycle", 4)],
+        ),
+    ],
+)
+def test_structural_problems_are_reported(
+    edge_index: list[list[int]], node_attr: list[list[int]], problems: list[tuple[str, int]]
+) -> None:
+    imported = from_graph_tensors(
+        np.array(edge_index, dtype=np.int64),
+        np.zeros((len(edge_index[0]), 1), dtype=np.float32),
+        np.array(node_attr, dtype=np.float32),
+    )
+
+    assert imported["ntk"] is None
+    assert imported["literals"] is None
+    assert imported["problems"] == problems
+
+
+def test_only_nodes_on_cycles_are_reported() -> None:
+    # gates 3 and 4 feed each other, and gate 5 lies behind the cycle
+    edge_index = np.array([[1, 4, 2, 3, 3, 2, 5], [3, 3, 4, 4, 5, 5, 6]], dtype=np.int64)
+    node_attr = np.array([[0], [1], [1], [2], [2], [2], [3]], dtype=np.float32)
+
+    imported = from_graph_tensors(edge_index, np.zeros((7, 1), dtype=np.float32), node_attr)
+
+    assert imported["problems"] == [("cycle", 3), ("cycle", 4)]
+
+
+@pytest.mark.parametrize(
+    ("edge_index", "edge_attr", "node_attr", "kwargs", "match"),
+    [
+        (np.zeros((3, 0), dtype=np.int64), np.zeros((0, 1)), np.zeros((1, 1)), {}, "edge_index"),
+        (np.zeros((2, 1), dtype=np.int64), np.zeros((2, 1)), np.zeros((1, 1)), {}, "one row per edge"),
+        (
+            np.zeros((2, 1), dtype=np.int64),
+            np.zeros((1, 1)),
+            np.zeros((1, 1)),
+            {"edge_encoding": EdgeTensorEncoding.ONE_HOT},
+            "edge_attr must have at least 2",
+        ),
+        (
+            np.zeros((2, 0), dtype=np.int64),
+            np.zeros((0, 1)),
+            np.zeros((1, 1)),
+            {"node_encoding": NodeTensorEncoding.ONE_HOT},
+            "node_attr must have at least 4",
+        ),
+    ],
+)
+def test_malformed_arrays_are_rejected(
+    edge_index: np.ndarray, edge_attr: np.ndarray, node_attr: np.ndarray, kwargs: dict[str, object], match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        from_graph_tensors(edge_index, edge_attr, node_attr, **kwargs)  # ty: ignore[invalid-argument-type]
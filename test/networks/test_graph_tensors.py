@@ -3,7 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from aigverse.networks import Aig, EdgeTensorEncoding, NodeTensorEncoding
+from aigverse.algorithms import aig_resubstitution
+from aigverse.networks import Aig, EdgeTensorEncoding, NodeTensorEncoding, SparseLayout
 
 
 @pytest.fixture
@@ -337,3 +338,116 @@ def test_to_graph_tensors_fanout_feature_values() -> None:
     assert node_attr[left_node, 1] == pytest.approx(1.0)
     assert node_attr[right_node, 1] == pytest.approx(1.0)
     assert np.allclose(po_rows[:, 1], 0.0)
+
+
+def _dense_adjacency(adjacency: dict, layout: SparseLayout) -> np.ndarray:
+    """Expands a compressed sparse adjacency export into a dense matrix.
+
+    Returns:
+        The dense adjacency matrix.
+    """
+    dense = np.zeros(adjacency["shape"], dtype=np.float32)
+    indptr, indices, data = adjacency["indptr"], adjacency["indices"], adjacency["data"]
+    for major in range(len(indptr) - 1):
+        for entry in range(indptr[major], indptr[major + 1]):
+            if layout == SparseLayout.CSR:
+                dense[major, indices[entry]] = data[entry]
+            else:
+                dense[indices[entry], major] = data[entry]
+    return dense
+
+
+def _dense_from_graph_tensors(aig: Aig) -> np.ndarray:
+    """Builds the dense adjacency matrix from the COO graph tensors.
+
+    Returns:
+        The dense adjacency matrix.
+    """
+    tensors = aig.to_graph_tensors(edge_encoding=EdgeTensorEncoding.SIGNED, levels=False)
+    dense = np.zeros((aig.size + aig.num_pos,) * 2, dtype=np.float32)
+    dense[tensors["edge_index"][0], tensors["edge_index"][1]] = tensors["edge_attr"][:, 0]
+    return dense
+
+
+def test_sparse_layout_enum_exposed() -> None:
+    """Checks that the sparse layout enum is available in Python."""
+    assert SparseLayout.CSR.value == 0
+    assert SparseLayout.CSC.value == 1
+
+
+@pytest.mark.parametrize("layout", [SparseLayout.CSR, SparseLayout.CSC])
+def test_to_sparse_adjacency_matches_graph_tensors(large_aig: Aig, layout: SparseLayout) -> None:
+    """Checks both compressed layouts against the COO edge index."""
+    adjacency = large_aig.to_sparse_adjacency(layout)
+    dim = large_aig.size + large_aig.num_pos
+
+    assert adjacency["shape"] == (dim, dim)
+    assert adjacency["indptr"].shape == (dim + 1,)
+    assert adjacency["indptr"].dtype == np.int64
+    assert adjacency["indices"].dtype == np.int64
+    assert adjacency["data"].dtype == np.float32
+    assert adjacency["indptr"][-1] == len(adjacency["indices"]) == 2 * large_aig.num_gates + large_aig.num_pos
+    assert np.array_equal(_dense_adjacency(adjacency, layout), _dense_from_graph_tensors(large_aig))
+
+
+@pytest.mark.parametrize("layout", [SparseLayout.CSR, SparseLayout.CSC])
+def test_to_sparse_adjacency_indices_are_sorted(large_aig: Aig, layout: SparseLayout) -> None:
+    """Checks that the indices of every compressed row or column are strictly ascending."""
+    adjacency = large_aig.to_sparse_adjacency(layout)
+    indptr, indices = adjacency["indptr"], adjacency["indices"]
+
+    for major in range(len(indptr) - 1):
+        assert np.all(np.diff(indices[indptr[major] : indptr[major + 1]]) > 0)
+
+
+def test_to_sparse_adjacency_fanin_and_fanout_lists() -> None:
+    """Checks that CSC columns are fanin lists and CSR rows are fanout lists."""
+    aig = Aig()
+    a = aig.create_pi()
+    b = aig.create_pi()
+    gate = aig.create_and(~a, b)
+    aig.create_po(a)
+    aig.create_po(~gate)
+
+    csc = aig.to_sparse_adjacency(SparseLayout.CSC, EdgeTensorEncoding.BINARY)
+    column = slice(csc["indptr"][gate.index], csc["indptr"][gate.index + 1])
+    assert csc["indices"][column].tolist() == [a.index, b.index]
+    assert csc["data"][column].tolist() == [1.0, 0.0]
+
+    csr = aig.to_sparse_adjacency(SparseLayout.CSR)
+    row = slice(csr["indptr"][a.index], csr["indptr"][a.index + 1])
+    assert csr["indices"][row].tolist() == [gate.index, aig.size]
+    assert csr["data"][row].tolist() == [-1.0, 1.0]
+    assert csr["indices"][csr["indptr"][gate.index] : csr["indptr"][gate.index + 1]].tolist() == [aig.size + 1]
+
+
+def test_to_sparse_adjacency_leaves_dead_nodes_empty() -> None:
+    """Checks that dead nodes keep their index but have no entries."""
+    aig = Aig()
+    a, b, c = aig.create_pi(), aig.create_pi(), aig.create_pi()
+    redundant = aig.create_or(aig.create_and(a, b), aig.create_and(a, ~b))
+    aig.create_po(aig.create_and(redundant, c))
+    aig = aig_resubstitution(aig, cleanup=False)
+    dead = [n for n in range(aig.size) if n not in set(aig.nodes())]
+    assert dead
+
+    for layout in (SparseLayout.CSR, SparseLayout.CSC):
+        dense = _dense_adjacency(aig.to_sparse_adjacency(layout), layout)
+        assert not dense[dead].any()
+        assert not dense[:, dead].any()
+        assert np.count_nonzero(dense) == 2 * aig.num_gates + aig.num_pos
+
+
+def test_to_sparse_adjacency_empty_aig_edge_case() -> None:
+    """Checks the export of an AIG that consists of the constant only."""
+    adjacency = Aig().to_sparse_adjacency()
+
+    assert adjacency["shape"] == (1, 1)
+    assert adjacency["indptr"].tolist() == [0, 0]
+    assert adjacency["indices"].shape == (0,)
+
+
+def test_to_sparse_adjacency_one_hot_raises(sample_aig: Aig) -> None:
+    """Checks that one-hot edge values are rejected."""
+    with pytest.raises(ValueError, match="BINARY or SIGNED"):
+        sample_aig.to_sparse_adjacency(edge_encoding=EdgeTensorEncoding.ONE_HOT)
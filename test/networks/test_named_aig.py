@@ -147,3 +147,43 @@ def test_named_aig_complex_circuit(
     assert aig.get_name(cout) == "cout"
     assert aig.get_output_name(sum_idx) == "sum"
     assert aig.get_output_name(cout_idx) == "carry_out"
+
+
+def test_named_aig_bulk_name_lookups(
+    named_aig_full_adder: tuple[
+        NamedAig,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        AigSignal,
+        int,
+        int,
+    ],
+) -> None:
+    """Test that bulk name lookups agree with per-signal lookups."""
+    aig, a, _, _, _, sum_out, _, _, cout, sum_idx, cout_idx = named_aig_full_adder
+
+    signal_names = aig.get_signal_names()
+
+    expected = {
+        s: aig.get_name(s) for n in aig.nodes() for s in (aig.make_signal(n), ~aig.make_signal(n)) if aig.has_name(s)
+    }
+    assert signal_names == expected
+    assert signal_names[a] == "a"
+    assert signal_names[sum_out] == "sum"
+    assert signal_names[cout] == "cout"
+    assert aig.get_output_names() == {sum_idx: "sum", cout_idx: "carry_out"}
+
+
+def test_named_aig_bulk_name_lookups_without_names() -> None:
+    """Test that bulk name lookups on an unnamed network are empty."""
+    aig = NamedAig()
+    a = aig.create_pi()
+    aig.create_po(a)
+
+    assert aig.get_signal_names() == {}
+    assert aig.get_output_names() == {}
@@ -144,6 +144,8 @@ def test_sequential_aig_to_graph_tensors_raises() -> None:
 
     with pytest.raises(TypeError, match="register state"):
         saig.to_graph_tensors()
+    with pytest.raises(TypeError, match="register state"):
+        saig.to_sparse_adjacency()
 
 
 def test_sequential_aig_clone_and_copy_preserve_wrapper_type(
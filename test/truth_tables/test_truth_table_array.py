@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from aigverse.utils import TruthTable, TruthTableArray, cofactor0, cofactor1, ternary_majority
+
+
+def _random_tables(num_vars: int, size: int, seed: int = 0) -> list[TruthTable]:
+    rng = np.random.default_rng(seed)
+    return [TruthTable.from_bits(rng.random(2**num_vars) < 0.5) for _ in range(size)]
+
+
+def test_construction_and_access() -> None:
+    tts = _random_tables(7, 3)
+    array = TruthTableArray(tts)
+
+    assert len(array) == 3
+    assert (array.num_vars(), array.num_blocks(), array.num_bits()) == (7, 2, 128)
+    assert repr(array) == "TruthTableArray <vars=7, size=3>"
+    assert array[0] == tts[0]
+    assert array[-1] == tts[2]
+    assert array.blocks.shape == (3, 2)
+    assert np.array_equal(array.blocks[1], tts[1].blocks)
+    assert np.array_equal(np.asarray(array), np.stack([tts[i].to_numpy() for i in range(3)]))
+    assert np.array_equal(TruthTableArray.from_blocks(array.to_numpy(bits=False)).blocks, array.blocks)
+
+    # the blocks view reflects assignments
+    view = array.blocks
+    array[0] = tts[2]
+    assert np.array_equal(view[0], view[2])
+    with pytest.raises(ValueError, match="read-only"):
+        view[0, 0] = 0
+
+    zeros = TruthTableArray(3, 4)
+    assert zeros.count_ones().tolist() == [0, 0, 0, 0]
+    assert len(TruthTableArray(3)) == 0
+
+    unpickled = pickle.loads(pickle.dumps(array))
+    assert np.array_equal(unpickled.blocks, array.blocks)
+
+
+def test_construction_errors() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        TruthTableArray([])
+    with pytest.raises(ValueError, match="truth table 1 has 3 variables"):
+        TruthTableArray([TruthTable(4), TruthTable(3)])
+    with pytest.raises(ValueError, match="power of two"):
+        TruthTableArray.from_blocks(np.zeros((2, 3), dtype=np.uint64))
+    with pytest.raises(ValueError, match="2\\*\\*1 blocks"):
+        TruthTableArray.from_blocks(np.zeros((2, 4), dtype=np.uint64), num_vars=7)
+
+    array = TruthTableArray(4, 2)
+    with pytest.raises(IndexError):
+        _ = array[2]
+    with pytest.raises(IndexError):
+        array[-3] = TruthTable(4)
+    with pytest.raises(ValueError, match="5 variables"):
+        array[0] = TruthTable(5)
+    with pytest.raises(ValueError, match="copy"):
+        array.__array__(copy=False)
+
+
+def test_small_tables_are_masked() -> None:
+    array = TruthTableArray.from_blocks(np.full((2, 1), 0xFFFF, dtype=np.uint64), num_vars=3)
+
+    assert array.blocks.tolist() == [[0xFF], [0xFF]]
+    assert (~array).count_ones().tolist() == [0, 0]
+    assert array.count_zeroes().tolist() == [0, 0]
+
+
+@pytest.mark.parametrize("num_vars", [3, 8])
+def test_operators_match_truth_tables(num_vars: int) -> None:
+    left, right = _random_tables(num_vars, 5), _random_tables(num_vars, 5, seed=10)
+    a, b = TruthTableArray(left), TruthTableArray(right)
+
+    for i in range(5):
+        assert (a & b)[i] == (left[i] & right[i])
+        assert (a | b)[i] == (left[i] | right[i])
+        assert (a ^ b)[i] == (left[i] ^ right[i])
+        assert (~a)[i] == ~left[i]
+    assert a.count_ones().tolist() == [tt.count_ones() for tt in left]
+    assert a.count_zeroes().tolist() == [tt.count_zeroes() for tt in left]
+
+
+def test_broadcasting() -> None:
+    tts = _random_tables(4, 3)
+    array = TruthTableArray(tts)
+    single = _random_tables(4, 1, seed=42)[0]
+
+    for result in (array & single, single & array, array & TruthTableArray([single])):
+        assert [result[i] for i in range(3)] == [tt & single for tt in tts]
+    assert (single ^ array)[1] == (single ^ tts[1])
+    assert len(array | TruthTableArray(4, 1)) == 3
+    assert len(TruthTableArray(4, 1) & TruthTableArray(4, 0)) == 0
+
+    with pytest.raises(ValueError, match="sizes 3 and 2"):
+        _ = array & TruthTableArray(4, 2)
+    with pytest.raises(ValueError, match="4 and 5 variables"):
+        _ = array | TruthTable(5)
+
+
+def test_majority_and_cofactors() -> None:
+    a, b, c = (_random_tables(8, 4, seed=seed) for seed in (0, 10, 20))
+
+    majority = ternary_majority(TruthTableArray(a), TruthTableArray(b), c[0])
+    assert [majority[i] for i in range(4)] == [ternary_majority(a[i], b[i], c[0]) for i in range(4)]
+    # single truth tables still produce a single truth table
+    assert isinstance(ternary_majority(a[0], b[0], c[0]), TruthTable)
+
+    array = TruthTableArray(a)
+    for var_index in range(8):
+        assert [cofactor0(array, var_index)[i] for i in range(4)] == [cofactor0(tt, var_index) for tt in a]
+        assert [cofactor1(array, var_index)[i] for i in range(4)] == [cofactor1(tt, var_index) for tt in a]
+    with pytest.raises(ValueError, match="var_index out of range"):
+        cofactor0(array, 8)
+
+
+def test_hashes_and_unique() -> None:
+    tts = _random_tables(7, 3)
+    array = TruthTableArray([tts[0], tts[1], tts[0], tts[2], tts[1]])
+
+    hashes = array.hashes()
+    assert hashes.dtype == np.uint64
+    assert hashes[0] == hashes[2]
+    assert hashes[1] == hashes[4]
+    assert hashes[0] == TruthTableArray([tts[0]]).hashes()[0]
+
+    unique = array.unique()
+    assert [unique["tables"][i] for i in range(3)] == tts
+    assert unique["indices"].tolist() == [0, 1, 3]
+    assert unique["inverse"].tolist() == [0, 1, 0, 2, 1]
+    assert len(TruthTableArray(7).unique()["tables"]) == 0